@@ -1,6 +1,9 @@
 # coding: utf-8
 # pytest -s --disable-pytest-warnings  test_btkTools.py::Test_Btk::test_btkReaderWriter
 # from __future__ import unicode_literals
+import numpy as np
+import threading
+
 import pyCGM2
 from pyCGM2.Utils import files
 from pyCGM2.Tools import btkTools
@@ -69,6 +72,96 @@ class Test_Btk:
         btkTools.smartGetMetadata(acq,"SUBJECTS","USED")
         btkTools.smartSetMetadata(acq,"SUBJECTS","USED",0,"Hän")
 
+    def test_acquisitionArrays(self):
+        filename = pyCGM2.TEST_DATA_PATH +"LowLevel\\IO\\Hannibal_c3d\\gait1.c3d"
+        acq= btkTools.smartReader(filename, translators=None)
+        markers = ["LASI","RASI","LPSI","RPSI"]
+
+        flag = list()
+        for i in range(0,acq.GetPointFrameNumber()):
+            flag.append(all([acq.GetPoint(marker).GetResidual(i) >= 0 for marker in markers]))
+        assert btkTools.getValidFrames(acq,markers) == flag
+
+        # update of an existing point
+        values = acq.GetPoint("LASI").GetValues()
+        values[10,:] = 0
+        btkTools.smartAppendPoint(acq,"LASI",values)
+        assert "LASI" not in btkTools.getVisibleMarkersAtFrame(acq,markers,10)
+
+        # new point
+        btkTools.smartAppendPoint(acq,"LASI2",values)
+        assert btkTools.getMarkerArray(acq,["LASI2"]).shape == (acq.GetPointFrameNumber(),1,3)
+
+        # direct btk change
+        residuals = acq.GetPoint("RASI").GetResiduals()
+        residuals[10] = -1
+        acq.GetPoint("RASI").SetResiduals(residuals)
+        assert not btkTools.getVisibilityMask(acq,["RASI"])[10,0]
+
+    def test_c3dCache(self):
+        DATA_PATH = pyCGM2.TEST_DATA_PATH +"LowLevel\\IO\\Hannibal_c3d\\"
+        btkTools.clearC3dCache()
+
+        acq0 = btkTools.smartReader(DATA_PATH+"gait1.c3d", cached=True)
+        acq1 = btkTools.smartReader(DATA_PATH+"gait1.c3d", cached=True)
+        assert acq0 is acq1
+        assert btkTools.smartReader(DATA_PATH+"gait1.c3d") is not acq0
+
+        acqs,filenames = btkTools.buildTrials(DATA_PATH,["gait1.c3d"])
+        assert acqs[0] is not acq0
+        acqs,filenames = btkTools.buildTrials(DATA_PATH,["gait1.c3d"],cached=True)
+        assert acqs[0] is acq0
+        assert len(btkTools._C3D_CACHE) == 1
+
     def test_btkReader_forcePlateType5(self):
         filename = pyCGM2.TEST_DATA_PATH +"LowLevel\\IO\\forcePlateType5\\hugGait.c3d"
         acq= btkTools.smartReader(filename, translators=None)
+
+
+class Test_acquisitionArrays:
+    def test_directWrite(self):
+        acq = btk.btkAcquisition()
+        acq.Init(0,50)
+        values = np.random.RandomState(0).normal(size=(50,3))
+        btkTools.smartAppendPoint(acq,"LASI",values)
+        btkTools.smartAppendPoint(acq,"RASI",values+1.0)
+
+        np.testing.assert_equal(btkTools.getMarkerArray(acq,["LASI"])[:,0,:],values)
+
+        # writes through btk, without smartAppendPoint
+        acq.GetPoint("LASI").SetValues(values*2.0)
+        np.testing.assert_equal(btkTools.getMarkerArray(acq,["LASI"])[:,0,:],values*2.0)
+
+        residuals = acq.GetPoint("RASI").GetResiduals()
+        residuals[5] = -1
+        acq.GetPoint("RASI").SetResiduals(residuals)
+        assert not btkTools.getVisibilityMask(acq,["RASI"])[5,0]
+        assert btkTools.getVisibleMarkersAtFrame(acq,["LASI","RASI"],5) == ["LASI"]
+        assert btkTools.getVisibleMarkersAtFrame(acq,["RASI","LASI"],6) == ["RASI","LASI"]
+
+        # smartAppendPoint keeps the cached arrays
+        arrays = btkTools.getAcquisitionArrays(acq)
+        btkTools.smartAppendPoint(acq,"LASI",values*3.0)
+        assert btkTools.getAcquisitionArrays(acq) is arrays
+        np.testing.assert_equal(btkTools.getMarkerArray(acq,["LASI"])[:,0,:],values*3.0)
+
+    def test_threads(self):
+        acqs = list()
+        for i in range(0,8):
+            acq = btk.btkAcquisition()
+            acq.Init(0,20)
+            btkTools.smartAppendPoint(acq,"LASI",np.ones((20,3))*i)
+            acqs.append(acq)
+
+        errors = list()
+        def read(acq,i):
+            for j in range(0,50):
+                if not np.all(btkTools.getMarkerArray(acq,["LASI"]) == i):
+                    errors.append(i)
+
+        threads = [threading.Thread(target=read,args=(acq,i)) for i,acq in enumerate(acqs)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
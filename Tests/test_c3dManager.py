@@ -0,0 +1,53 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_c3dManager.py::Test_c3dManager::test_uniqueC3dSet
+
+import pytest
+
+from pyCGM2.Processing import c3dManager
+
+
+class Acquisition(object):
+    def __init__(self,filename):
+        self.m_filename = filename
+
+    def Clone(self):
+        return Acquisition(self.m_filename)
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    reads = list()
+    monkeypatch.setattr(c3dManager.btkTools,"smartReader",lambda filename: reads.append(filename) or Acquisition(filename))
+    monkeypatch.setattr(c3dManager.btkTools,"sortedEvents",lambda acq: None)
+    monkeypatch.setattr(c3dManager.btkTools,"isKineticFlag",lambda acq: (acq.m_filename != "DATA/gait2.c3d",None,None,None))
+    return reads
+
+
+def acquisitions(manager):
+    return [manager.spatioTemporal["Acqs"],manager.kinematic["Acqs"],manager.kinetic["Acqs"],manager.emg["Acqs"]]
+
+
+class Test_c3dManager:
+    def test_uniqueC3dSet(self,reads):
+        manager = c3dManager.C3dManagerFilter(c3dManager.UniqueC3dSetProcedure("DATA/",["gait1.c3d","gait2.c3d"])).generate()
+
+        assert reads == ["DATA/gait1.c3d","DATA/gait2.c3d"]
+        assert manager.kinetic["Filenames"] == ["gait1.c3d"]
+
+        # one copy per modality
+        acqs = [acq for modality in acquisitions(manager) for acq in modality]
+        assert len(acqs) == 7
+        assert len(set(id(acq) for acq in acqs)) == 7
+
+    def test_distinctC3dSet(self,reads):
+        procedure = c3dManager.DistinctC3dSetProcedure("DATA/",["gait1.c3d"],["gait1.c3d","gait2.c3d"],["gait2.c3d","gait3.c3d"],["emg.c3d","emg.c3d"])
+        manager = c3dManager.C3dManagerFilter(procedure).generate()
+
+        assert sorted(reads) == ["DATA/emg.c3d","DATA/gait1.c3d","DATA/gait2.c3d","DATA/gait3.c3d"]
+        assert manager.kinetic["Filenames"] == ["gait3.c3d"]
+        assert manager.emg["Acqs"][0] is not manager.emg["Acqs"][1]
+        assert manager.spatioTemporal["Acqs"][0] is not manager.kinematic["Acqs"][0]
+
+        # a new generation reads the files again
+        c3dManager.C3dManagerFilter(procedure).generate()
+        assert len(reads) == 8
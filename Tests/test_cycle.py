@@ -0,0 +1,106 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_cycle.py::Test_descriptiveStats::test_points_descriptiveStats
+
+import pytest
+import numpy as np
+
+import pyCGM2; LOGGER = pyCGM2.LOGGER
+try:
+    from pyCGM2 import btk
+except:
+    LOGGER.logger.info("[pyCGM2] pyCGM2-embedded btk not imported")
+    import btk
+
+from pyCGM2.Tools import btkTools
+from pyCGM2.Processing import cycle
+from pyCGM2.Processing import analysis
+
+
+class StpCycle(cycle.Cycle):
+    # cycle with spatio-temporal parameters set by the test
+    getSpatioTemporalParameter = cycle.GaitCycle.getSpatioTemporalParameter
+
+
+def pointAcquisition(labels,seed):
+    rng = np.random.RandomState(seed)
+    acq = btk.btkAcquisition()
+    acq.Init(0,300)
+    acq.SetPointFrequency(100.0)
+    for label in labels:
+        values = np.cumsum(rng.normal(size=(300,3)),axis=0)
+        values[rng.randint(0,300,size=20),:] = 0 # missing frames
+        btkTools.smartAppendPoint(acq,label,values,PointType=btk.btkPoint.Angle)
+    return acq
+
+
+def cycleSet():
+    acq0 = pointAcquisition(["LHipAngles","RHipAngles","LKneeAngles"],0)
+    acq1 = pointAcquisition(["LHipAngles","RHipAngles"],1)
+
+    cycles = [StpCycle(acq0,1,101,"Left"),
+              StpCycle(acq0,51,160,"Right"),
+              StpCycle(acq0,101,220,"Left"),
+              StpCycle(acq1,11,95,"Left"),
+              StpCycle(acq1,30,150,"Right"),
+              StpCycle(acq1,95,200,"Left",enableFlag=False)]
+
+    rng = np.random.RandomState(2)
+    for it in cycles:
+        it.stps = dict((label,rng.uniform(0.5,1.5)) for label in cycle.GaitCycle.STP_LABELS)
+    return cycles
+
+
+def gaitAnalysisBuilder(cycles):
+    cyclesInstance = cycle.Cycles()
+    cyclesInstance.setSpatioTemporalCycles(cycles)
+    cyclesInstance.setKinematicCycles(cycles)
+    return analysis.GaitAnalysisBuilder(cyclesInstance,
+                                        kinematicLabelsDict={"Left":["LHipAngles","LKneeAngles"],"Right":["RHipAngles"]},
+                                        kineticLabelsDict=None)
+
+
+class Test_descriptiveStats:
+    def test_points_descriptiveStats(self):
+        cycles = cycleSet()
+        labels = ["LHipAngles","LKneeAngles","RHipAngles","LAnkleAngles"]
+
+        acquisitionArrays = dict()
+        for context in ["Left","Right"]:
+            stats = cycle.points_descriptiveStats(cycles,labels,context,acquisitionArrays=acquisitionArrays)
+
+            for label in labels:
+                expected = cycle.point_descriptiveStats(cycles,label,context)
+                for key in ["mean","std","median","values"]:
+                    np.testing.assert_allclose(stats[label][key],expected[key],atol=1e-10)
+
+    def test_stpStats(self):
+        cycles = cycleSet()
+        builder = gaitAnalysisBuilder(cycles)
+
+        stpStats = builder._getStpStats(cycles,"Left")
+        assert builder._getStpStats(list(cycles),"Left") is stpStats
+
+        out = builder.computeSpatioTemporel()
+        kinematics,kinematicPst = builder.computeKinematics()
+        for context in ["Left","Right"]:
+            for label in cycle.GaitCycle.STP_LABELS:
+                expected = cycle.spatioTemporelParameter_descriptiveStats(cycles,label,context)
+                for stats in [out[label,context],kinematicPst[label,context]]:
+                    for key in ["mean","std","median","values"]:
+                        np.testing.assert_allclose(stats[key],expected[key])
+
+    def test_stpStats_missingParameter(self):
+        cycles = cycleSet()
+        del cycles[2].stps["speed"]
+        builder = gaitAnalysisBuilder(cycles)
+
+        # spatio-temporal analysis : the parameter is skipped with a warning
+        out = builder.computeSpatioTemporel()
+        assert ("speed","Left") not in out
+        assert ("speed","Right") in out
+
+        # kinematic analysis : KeyError, as spatioTemporelParameter_descriptiveStats
+        with pytest.raises(KeyError):
+            cycle.spatioTemporelParameter_descriptiveStats(cycles,"speed","Left")
+        with pytest.raises(KeyError):
+            builder.computeKinematics()
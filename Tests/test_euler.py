@@ -0,0 +1,34 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_euler.py::Test_eulerArray::test_decomposition
+
+import numpy as np
+from scipy.spatial.transform import Rotation
+
+from pyCGM2.Math import euler
+
+
+class Test_eulerArray:
+    def test_decomposition(self):
+        rotations = Rotation.random(200,random_state=0).as_matrix()
+        rotations[0] = np.zeros((3,3)) # missing frame
+        rotations[1] = np.eye(3)
+        rotations[2] = np.array([[0,0,1],[0,1,0],[-1,0,0]]) # gimbal lock (xyz)
+
+        for sequence in ["xyz","xzy","yxz","yzx","zxy","zyx"]:
+            values = np.array(getattr(euler,"euler_"+sequence+"Array")(rotations)).T
+            for i in range(0,200):
+                np.testing.assert_almost_equal(values[i],getattr(euler,"euler_"+sequence)(rotations[i]))
+
+    def test_wrap(self):
+        rng = np.random.RandomState(1)
+        t = np.linspace(0,20,1000)
+        angles = np.stack([np.sin(t)*4, np.cos(1.3*t)*2.5, t*0.9],axis=1) + rng.normal(size=(1000,3))*0.3
+        angles = (angles+np.pi)%(2*np.pi)-np.pi
+
+        dest = np.zeros(3)
+        expected = np.zeros(angles.shape)
+        for i in range(0,1000):
+            expected[i,:] = euler.wrapEulerTo(angles[i,:], dest)
+            dest = expected[i,:]
+
+        np.testing.assert_almost_equal(euler.wrapEulerToArray(angles,np.zeros(3)),expected)
@@ -0,0 +1,81 @@
+# coding: utf-8
+# pytest -s --log-cli-level=INFO --disable-pytest-warnings  test_frame.py::Test_MotionTrajectory::test_listBehaviour
+
+
+import pickle
+import numpy as np
+from scipy.spatial.transform import Rotation
+
+from pyCGM2.Model import frame
+
+
+class Test_MotionTrajectory:
+    def test_listBehaviour(self):
+        rotations = Rotation.random(10,random_state=0).as_matrix()
+        translations = np.arange(30,dtype=float).reshape(10,3)
+
+        motion = frame.MotionTrajectory()
+        csFrame = frame.Frame()
+        for i in range(0,10):
+            csFrame.update(rotations[i],translations[i])
+            motion.append(csFrame)
+
+        assert len(motion) == 10
+        np.testing.assert_equal(motion[3].getRotation(),rotations[3])
+        np.testing.assert_equal(motion[-1].getTranslation(),translations[9])
+        np.testing.assert_equal(motion[4].m_axisY,rotations[4][:,1])
+        np.testing.assert_equal(motion.getRotations(),rotations)
+
+        motion[2].update(np.eye(3),np.zeros(3))
+        np.testing.assert_equal(motion.getRotations()[2],np.eye(3))
+
+    def test_globalPositions(self):
+        rotations = Rotation.random(20,random_state=0).as_matrix()
+        translations = np.random.RandomState(1).normal(size=(20,3))
+        motion = frame.MotionTrajectory(rotations,translations)
+
+        local = np.array([10.0,-5.0,2.0])
+        expected = np.array([np.dot(rotations[i],local)+translations[i] for i in range(0,20)])
+        np.testing.assert_almost_equal(motion.getGlobalPositions(local),expected)
+
+    def test_pickle(self):
+        motion = frame.MotionTrajectory.fromFrames([frame.Frame() for i in range(0,3)])
+        motion.append(frame.Frame())
+        copied = pickle.loads(pickle.dumps(motion))
+
+        assert len(copied) == 4
+        assert copied.getRotations().shape == (4,3,3)
+
+    def test_version(self):
+        motion = frame.MotionTrajectory(Rotation.random(5,random_state=0).as_matrix(),np.zeros((5,3)))
+        version = motion.version
+
+        motion[2].setTranslation(np.ones(3))
+        assert motion.version > version
+
+        version = motion.version
+        motion.append(frame.Frame())
+        assert motion.version > version
+
+
+class Test_setFrameDataArray:
+    def test_sameAsSetFrameData(self):
+        rng = np.random.RandomState(2)
+        pt1 = rng.normal(size=(15,3))
+        pt2 = rng.normal(size=(15,3))
+        pt3 = rng.normal(size=(15,3))
+        pt1[5] = pt2[5] = pt3[5] = 0.0 # occluded frame
+
+        for sequence in ["XYZ","XYiZ","XZY","XZiY","YXZ","YXiZ","YZX","YZiX","ZXY","ZXiY","ZYX","ZYiX"]:
+            x,y,z,R = frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,sequence)
+            for i in range(0,15):
+                a1=(pt2[i]-pt1[i])
+                a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
+                v=(pt3[i]-pt1[i])
+                v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
+                a2=np.cross(a1,v)
+                a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
+
+                xi,yi,zi,Ri = frame.setFrameData(a1,a2,sequence)
+                np.testing.assert_almost_equal(R[i],Ri)
+                np.testing.assert_almost_equal(x[i],xi)
@@ -0,0 +1,178 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_gapFilling.py::Test_lowDimensionalKalmanFilter::test_smooth
+# pytest -s --disable-pytest-warnings  test_gapFilling.py::Test_lowDimensionalKalmanFilter::test_smooth_trialStart
+# pytest -s --disable-pytest-warnings  test_gapFilling.py::Test_gapFillingProcedures::test_rigidBody
+# pytest -s --disable-pytest-warnings  test_gapFilling.py::Test_gapFillingFilter::test_automatic
+
+import numpy as np
+
+import pyCGM2; LOGGER = pyCGM2.LOGGER
+try:
+    from pyCGM2 import btk
+except:
+    LOGGER.logger.info("[pyCGM2] pyCGM2-embedded btk not imported")
+    import btk
+
+from pyCGM2.Gap import gapFilling
+from pyCGM2.Tools import btkTools
+
+
+def lowRankData(nFrames,nColumns):
+    rng = np.random.RandomState(0)
+    time = np.linspace(0,10,nFrames)
+    basis = np.array([np.sin(time*freq+phase) for freq,phase in rng.uniform(0.5,3,(5,2))]).T
+    return np.dot(basis,rng.normal(size=(5,nColumns)))*100 + rng.normal(size=(nFrames,nColumns))*0.5
+
+
+class Test_lowDimensionalKalmanFilter:
+    def test_smooth(self):
+        truth = lowRankData(1000,30)
+        rawdata = truth.copy()
+        rawdata[100:110,0:3] = np.nan
+        rawdata[500:540,9:15] = np.nan
+        rawdata[700,:] = np.nan
+
+        procedure = gapFilling.LowDimensionalKalmanFilterProcedure()
+        y = procedure._smooth(rawdata,tol=1e-2,sigR=1e-3,keepOriginal=True)
+
+        observed = ~np.isnan(rawdata)
+        np.testing.assert_equal(y[observed],rawdata[observed])
+        assert not np.isnan(y).any()
+        assert np.abs(y-truth).max() < 0.1*np.ptp(truth)
+
+        # deterministic
+        np.testing.assert_equal(procedure._smooth(rawdata,tol=1e-2,sigR=1e-3,keepOriginal=True),y)
+
+    def test_smooth_trialStart(self):
+        # the filter starts from the mean pose with a diffuse covariance, not from a random state :
+        # the first frames have no transient ( about 20 to 40 mm with a random initial state)
+        truth = lowRankData(1000,30)
+        rawdata = truth.copy()
+        rawdata[100:110,0:3] = np.nan
+
+        procedure = gapFilling.LowDimensionalKalmanFilterProcedure()
+
+        y = procedure._smooth(rawdata,keepOriginal=False)
+        assert np.abs(y[0:5]-truth[0:5]).max() < np.abs(y[5:]-truth[5:]).max()
+
+        # a gap at the start of the trial is filled about as well as a gap in the middle
+        rawdata[0:5,0:3] = np.nan
+        y = procedure._smooth(rawdata,keepOriginal=True)
+        assert np.abs(y[0:5,0:3]-truth[0:5,0:3]).max() < 2.0*np.abs(y[100:110,0:3]-truth[100:110,0:3]).max()
+
+        # frame 0 is smoothed : with a diffuse prior, the smoother gives the same output on the reversed trial,
+        # whose last frame is the filter output
+        y = procedure._smooth(rawdata,keepOriginal=False)
+        yReversed = procedure._smooth(rawdata[::-1],keepOriginal=False)[::-1]
+        np.testing.assert_allclose(y[0],yReversed[0],atol=1e-6)
+        np.testing.assert_allclose(y,yReversed,atol=1e-6)
+
+
+def rigidCluster(nFrames):
+    time = np.linspace(0,5,nFrames)
+    angle = 0.5*time
+    R = np.zeros((nFrames,3,3))
+    R[:,0,0] = np.cos(angle); R[:,0,1] = -np.sin(angle)
+    R[:,1,0] = np.sin(angle); R[:,1,1] = np.cos(angle)
+    R[:,2,2] = 1.0
+    local = np.array([[0,0,0],[100,0,0],[0,80,0],[30,30,120.]])
+    translation = np.array([1000*time,50*np.sin(3*time),900+20*np.cos(3*time)]).T
+    return np.einsum("nij,mj->nmi",R,local) + translation[:,np.newaxis,:]
+
+
+class Test_gapFillingProcedures:
+    def test_getGaps(self):
+        assert gapFilling.getGaps(np.array([0,0,1,1,0,1,0],dtype=bool)) == [(0,2),(4,5),(6,7)]
+
+    def test_spline(self):
+        values = rigidCluster(200)
+        visibility = np.ones((200,4),dtype=bool)
+        visibility[50:56,0] = False
+
+        procedure = gapFilling.SplineGapFillingProcedure(maxGapLength=10)
+        np.testing.assert_allclose(procedure.fillGap(values,visibility,["A","B","C","D"],0,50,56),values[50:56,0,:],atol=1e-2)
+        assert procedure.fillGap(values,visibility,["A","B","C","D"],0,0,56) is None
+        assert gapFilling.SplineGapFillingProcedure(maxGapLength=5).fillGap(values,visibility,["A","B","C","D"],0,50,56) is None
+
+    def test_rigidBody(self):
+        values = rigidCluster(200)
+        visibility = np.ones((200,4),dtype=bool)
+        visibility[80:150,1] = False
+        visibility[0:20,3] = False
+
+        procedure = gapFilling.RigidBodyGapFillingProcedure(clusters=[["A","B","C","D"]])
+        np.testing.assert_allclose(procedure.fillGap(values,visibility,["A","B","C","D"],1,80,150),values[80:150,1,:],atol=1e-8)
+        np.testing.assert_allclose(procedure.fillGap(values,visibility,["A","B","C","D"],3,0,20),values[0:20,3,:],atol=1e-8)
+
+        visibility[100,0] = False
+        assert procedure.fillGap(values,visibility,["A","B","C","D"],1,80,150) is None
+
+    def test_pattern(self):
+        values = rigidCluster(200)
+        values[:,3,:] = values[:,0,:] + np.array([10.0,20.0,30.0])
+        visibility = np.ones((200,4),dtype=bool)
+        visibility[80:150,3] = False
+
+        procedure = gapFilling.PatternGapFillingProcedure()
+        np.testing.assert_allclose(procedure.fillGap(values,visibility,["A","B","C","D"],3,80,150),values[80:150,3,:],atol=1e-8)
+
+
+def clusterAcquisition(values,visibility):
+    acq = btk.btkAcquisition()
+    acq.Init(0,values.shape[0])
+    for j,label in enumerate(["A","B","C","D"]):
+        btkTools.smartAppendPoint(acq,label,np.where(visibility[:,j,np.newaxis],values[:,j,:],0.0),
+                                  residuals=np.where(visibility[:,j],0.0,-1.0))
+    return acq
+
+
+class Test_gapFillingFilter:
+    def test_fill(self):
+        values = rigidCluster(200)
+        visibility = np.ones((200,4),dtype=bool)
+        visibility[80:150,1] = False
+        acq = clusterAcquisition(values,visibility)
+
+        gff = gapFilling.GapFillingFilter(gapFilling.RigidBodyGapFillingProcedure(clusters=[["A","B","C","D"]]),acq)
+        gff.fill()
+
+        assert gff.getFilledMarkers() == ["B"]
+        np.testing.assert_allclose(acq.GetPoint("B").GetValues(),values[:,1,:],atol=1e-8)
+        assert (acq.GetPoint("B").GetResiduals() != -1).all()
+
+    def test_fill_directWrite(self):
+        values = rigidCluster(200)
+        visibility = np.ones((200,4),dtype=bool)
+        visibility[80:150,1] = False
+        acq = clusterAcquisition(values,visibility)
+
+        # btk write after the cached arrays were built
+        btkTools.getMarkerArray(acq,["A","B","C","D"])
+        written = acq.GetPoint("B").GetValues()
+        written[0:80] += 1.0
+        acq.GetPoint("B").SetValues(written)
+
+        gapFilling.GapFillingFilter(gapFilling.SplineGapFillingProcedure(maxGapLength=100),acq).fill()
+
+        np.testing.assert_equal(acq.GetPoint("B").GetValues()[0:80],written[0:80])
+        np.testing.assert_equal(acq.GetPoint("B").GetValues()[150:],written[150:])
+
+    def test_automatic(self):
+        values = rigidCluster(300)
+        visibility = np.ones((300,4),dtype=bool)
+        visibility[50:55,0] = False     # short gap : spline
+        visibility[100:200,1] = False   # long gap : rigid body
+        visibility[220:240,2:4] = False # two markers of the cluster missing : pattern or Kalman
+        acq = clusterAcquisition(values,visibility)
+
+        procedure = gapFilling.AutomaticGapFillingProcedure(clusters=[["A","B","C","D"]])
+        acq,filledMarkers = procedure.fill(acq)
+
+        assert sorted(filledMarkers) == ["A","B","C","D"]
+        for j,label in enumerate(["A","B","C","D"]):
+            assert (acq.GetPoint(label).GetResiduals() != -1).all()
+            np.testing.assert_equal(acq.GetPoint(label).GetValues()[visibility[:,j]],values[visibility[:,j],j,:])
+
+        np.testing.assert_allclose(acq.GetPoint("A").GetValues()[50:55],values[50:55,0,:],atol=1e-1)
+        np.testing.assert_allclose(acq.GetPoint("B").GetValues()[100:200],values[100:200,1,:],atol=1e-8)
+        assert np.abs(acq.GetPoint("C").GetValues()[220:240]-values[220:240,2,:]).max() < 20.0
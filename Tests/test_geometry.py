@@ -0,0 +1,30 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_geometry.py::Test_geometryArray::test_LineLineIntersectArray
+
+import numpy as np
+
+from pyCGM2.Math import geometry
+
+
+class Test_geometryArray:
+    def test_LineLineIntersectArray(self):
+        rng = np.random.RandomState(0)
+        p1,p2,p3,p4 = rng.normal(size=(4,50,3))
+        p4[10] = p3[10]
+
+        pa,pb = geometry.LineLineIntersectArray(p1,p2,p3,p4)
+
+        assert np.isnan(pa[10]).all()
+        for i in range(0,50):
+            if i != 10:
+                pai,pbi = geometry.LineLineIntersect(p1[i],p2[i],p3[i],p4[i])
+                np.testing.assert_allclose(pa[i],pai)
+                np.testing.assert_allclose(pb[i],pbi)
+
+    def test_pointsInPolygon(self):
+        square = np.array([[0,0],[1,0],[1,1],[0,1.]])
+        bowtie = np.array([[0,0],[1,1],[1,0],[0,1.]])
+        vertices = np.array([square,square,bowtie,bowtie,square])
+        points = np.array([[0.5,0.5],[1.5,0.5],[0.5,0.2],[0.2,0.5],[np.nan,np.nan]])
+
+        np.testing.assert_equal(geometry.pointsInPolygon(points,vertices),[True,False,False,True,False])
@@ -0,0 +1,259 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_inverseDynamicFilter.py::Test_inverseDynamicFilter::test_projections
+# pytest -s --disable-pytest-warnings  test_inverseDynamicFilter.py::Test_lowerLimbInverseDynamicProcedure::test_twoSegmentChain
+
+import numpy as np
+from scipy.spatial.transform import Rotation
+
+import pyCGM2; LOGGER = pyCGM2.LOGGER
+try:
+    from pyCGM2 import btk
+except:
+    LOGGER.logger.info("[pyCGM2] pyCGM2-embedded btk not imported")
+    import btk
+
+from pyCGM2 import enums
+from pyCGM2.Model import frame
+from pyCGM2.Model import modelFilters
+
+
+class Values(object):
+    def __init__(self,values):
+        self.m_values = values
+    def GetValues(self):
+        return self.m_values
+
+
+class Wrench(object):
+    def __init__(self,force,moment,position=None):
+        self.m_force = Values(force)
+        self.m_moment = Values(moment)
+        self.m_position = Values(position)
+    def GetForce(self):
+        return self.m_force
+    def GetMoment(self):
+        return self.m_moment
+    def GetPosition(self):
+        return self.m_position
+
+
+class AnatomicalFrame(object):
+    def __init__(self,rotations):
+        self.motion = frame.MotionTrajectory(rotations,np.zeros((rotations.shape[0],3)))
+
+
+class Segment(object):
+    def __init__(self,rotations,wrench=None):
+        self.anatomicalFrame = AnatomicalFrame(rotations)
+        self.m_proximalWrench = wrench
+
+
+class Joint(object):
+    def __init__(self,label,proximalLabel,distalLabel,sequence):
+        self.m_label = label
+        self.m_proximalLabel = proximalLabel
+        self.m_distalLabel = distalLabel
+        self.m_sequence = sequence
+
+
+class Model(object):
+    # thigh-shank model with a clinical descriptor on the distal projection only
+    def __init__(self,nFrames):
+        rng = np.random.RandomState(0)
+        t = np.linspace(0,2,nFrames)
+        thigh = Rotation.from_rotvec(np.c_[0.2*np.sin(t),0.1*t,0.3*np.cos(t)]).as_matrix()
+        shank = np.einsum("nij,njk->nik",thigh,Rotation.from_rotvec(np.c_[0.05*t,-0.8*np.sin(2*t),0.1*t]).as_matrix())
+
+        self.mp = {"Bodymass" : 70.0}
+        self.m_jointCollection = [Joint("LKnee","Left Thigh","Left Shank","YXZ")]
+        self.m_segments = {"Left Thigh" : Segment(thigh),
+                           "Left Shank" : Segment(shank,Wrench(rng.normal(size=(nFrames,3))*100,rng.normal(size=(nFrames,3))*10))}
+
+    def getSegment(self,label):
+        return self.m_segments[label]
+
+    def getClinicalDescriptor(self,dataType,jointLabel,projection=None):
+        if projection != enums.MomentProjection.Distal:
+            return False
+        return {"SaggitalCoeff":-1.0, "SaggitalIndex":1, "SaggitalOffset":0.0,
+                "CoronalCoeff":1.0, "CoronalIndex":0, "CoronalOffset":0.0,
+                "TransversalCoeff":-1.0, "TransversalIndex":2, "TransversalOffset":0.0}
+
+
+class RigidSegment(object):
+    # segment with kinematics set by the test
+    def __init__(self,nFrames,seed,externalWrench=None):
+        rng = np.random.RandomState(seed)
+        t = np.linspace(0,1,nFrames)
+        rotations = Rotation.from_rotvec(np.c_[0.3*np.sin(2*t+seed),0.5*t,-0.2*np.cos(3*t)]).as_matrix()
+        translations = np.c_[100*t,50*np.sin(t),800-200*t+100*seed]
+
+        self.anatomicalFrame = AnatomicalFrame(rotations)
+        self.anatomicalFrame.motion = frame.MotionTrajectory(rotations,translations)
+        self.m_bsp = {"mass" : rng.uniform(2,8),
+                      "com" : rng.normal(size=3)*100,
+                      "inertia" : np.diag(rng.uniform(0.01,0.1,3))*1e6}
+        self.m_externalDeviceWrenchs = [] if externalWrench is None else [externalWrench]
+        self.m_proximalWrench = None
+        self.m_proximalMomentContribution = dict()
+
+        self.m_comAcceleration = rng.normal(size=(nFrames,3))*1000
+        self.m_angularVelocity = rng.normal(size=(nFrames,3))*5
+        self.m_angularAcceleration = rng.normal(size=(nFrames,3))*50
+
+    def zeroingProximalWrench(self):
+        self.m_proximalWrench = None
+
+    def isExternalDeviceWrenchsConnected(self):
+        return self.m_externalDeviceWrenchs != []
+
+    def getComAcceleration(self,pointFrequency,**options):
+        return self.m_comAcceleration
+
+    def getAngularVelocity(self,sampleFrequency):
+        return self.m_angularVelocity
+
+    def getAngularAcceleration(self,sampleFrequency):
+        return self.m_angularAcceleration
+
+
+class Chain(object):
+    # shank loaded by a ground reaction wrench, thigh loaded by the shank
+    def __init__(self,nFrames):
+        rng = np.random.RandomState(2)
+        grf = Wrench(rng.normal(size=(nFrames,3))*300,rng.normal(size=(nFrames,3))*1000,rng.normal(size=(nFrames,3))*100)
+        self.m_segments = {"Left Shank" : RigidSegment(nFrames,0,externalWrench=grf),
+                           "Left Thigh" : RigidSegment(nFrames,1)}
+
+    def getSegment(self,label):
+        return self.m_segments[label]
+
+
+def skew(v):
+    return np.array([[0,-v[2],v[1]],[v[2],0,-v[0]],[-v[1],v[0],0]])
+
+
+def perFrameSegmental(segment,distalWrench,gravity,scaleToMeter):
+    # frame by frame formulation of the Newton-Euler equations
+    Ti = segment.anatomicalFrame.motion
+    mi = segment.m_bsp["mass"]
+    ci = segment.m_bsp["com"]*scaleToMeter
+    Ii = segment.m_bsp["inertia"]*np.power(scaleToMeter,2)
+    g = np.asarray(gravity)
+
+    nFrames = len(Ti)
+    force = np.zeros((nFrames,3))
+    moment = np.zeros((nFrames,3))
+    distalForceContribution = np.zeros((nFrames,3))
+    distalMomentContribution = np.zeros((nFrames,3))
+    for i in range(0,nFrames):
+        Ri = Ti[i].getRotation()
+        Oi = Ti[i].getTranslation()
+        ai = segment.m_comAcceleration[i]*scaleToMeter
+        omegai = segment.m_angularVelocity[i]
+        Ii_global = np.dot(np.dot(Ri,Ii),Ri.T)
+
+        force[i] = mi*ai - mi*g
+        moment[i] = np.dot(Ii_global,segment.m_angularAcceleration[i]) + np.dot(skew(omegai),np.dot(Ii_global,omegai)) \
+                    - mi*np.dot(skew(ai),np.dot(Ri,ci)) + mi*np.dot(skew(g),np.dot(Ri,ci))
+
+        for wrench in segment.m_externalDeviceWrenchs:
+            di = (wrench.GetPosition().GetValues()[i] - Oi)*scaleToMeter
+            force[i] = force[i] - wrench.GetForce().GetValues()[i]
+            moment[i] = moment[i] - wrench.GetMoment().GetValues()[i]*scaleToMeter - np.dot(skew(di),wrench.GetForce().GetValues()[i])
+
+        if distalWrench is not None:
+            di = (distalWrench.GetPosition().GetValues()[i] - Oi)*scaleToMeter
+            distalForceContribution[i] = -1.0*np.dot(skew(di),distalWrench.GetForce().GetValues()[i])
+            distalMomentContribution[i] = -1.0*distalWrench.GetMoment().GetValues()[i]*scaleToMeter
+            force[i] = force[i] + distalWrench.GetForce().GetValues()[i]
+            moment[i] = moment[i] - distalForceContribution[i] - distalMomentContribution[i]
+
+    return force, moment, distalForceContribution, distalMomentContribution
+
+
+class Procedure(object):
+    def compute(self,model,acq,gravity,scaleToMeter):
+        pass
+
+
+def inverseDynamics(model,projection,pointLabelSuffix=None):
+    acq = btk.btkAcquisition()
+    acq.Init(0,100)
+    acq.SetPointFrequency(100.0)
+    modelFilters.InverseDynamicFilter(model,acq,procedure=Procedure(),projection=projection).compute(pointLabelSuffix=pointLabelSuffix)
+    return acq
+
+
+class Test_inverseDynamicFilter:
+    def test_projections(self):
+        model = Model(100)
+
+        # the single projection path is the reference
+        single = dict()
+        for projection in enums.MomentProjection:
+            acq = inverseDynamics(model,projection,pointLabelSuffix="cgm")
+            single[projection] = (acq.GetPoint("LKneeForce_cgm").GetValues(),acq.GetPoint("LKneeMoment_cgm").GetValues())
+
+        # distal projection : moment in the shank frame, then the clinical descriptor
+        shank = model.getSegment("Left Shank")
+        moment = np.einsum("nji,nj->ni",shank.anatomicalFrame.motion.getRotations(),shank.m_proximalWrench.GetMoment().GetValues()/70.0)
+        np.testing.assert_allclose(single[enums.MomentProjection.Distal][1],np.c_[-moment[:,1],moment[:,0],-moment[:,2]])
+
+        # list : projection names as suffixes
+        acq = inverseDynamics(model,[enums.MomentProjection.Distal,enums.MomentProjection.JCS],pointLabelSuffix="cgm")
+        assert acq.GetPointNumber() == 4
+        for projection in [enums.MomentProjection.Distal,enums.MomentProjection.JCS]:
+            np.testing.assert_allclose(acq.GetPoint("LKneeForce_cgm_"+projection.value).GetValues(),single[projection][0])
+            np.testing.assert_allclose(acq.GetPoint("LKneeMoment_cgm_"+projection.value).GetValues(),single[projection][1])
+
+        # dict : user suffixes
+        projections = {enums.MomentProjection.Global : "global",
+                       enums.MomentProjection.Proximal : "prox",
+                       enums.MomentProjection.JCS_Dual : "dual"}
+        acq = inverseDynamics(model,projections)
+        assert acq.GetPointNumber() == 6
+        for projection,suffix in projections.items():
+            np.testing.assert_allclose(acq.GetPoint("LKneeForce_"+suffix).GetValues(),single[projection][0])
+            np.testing.assert_allclose(acq.GetPoint("LKneeMoment_"+suffix).GetValues(),single[projection][1])
+
+        # single projection without suffix
+        acq = inverseDynamics(model,enums.MomentProjection.Distal)
+        np.testing.assert_allclose(acq.GetPoint("LKneeMoment").GetValues(),single[enums.MomentProjection.Distal][1])
+
+
+class Test_lowerLimbInverseDynamicProcedure:
+    def test_twoSegmentChain(self):
+        nFrames = 50
+        gravity = [0,0,-9.81]
+        scaleToMeter = 0.001
+
+        model = Chain(nFrames)
+        acq = btk.btkAcquisition()
+        acq.Init(0,nFrames)
+        acq.SetPointFrequency(100.0)
+
+        procedure = modelFilters.CGMLowerlimbInverseDynamicProcedure()
+        procedure.computeSegmental(model,"Left Shank",acq,gravity,scaleToMeter)
+        procedure.computeSegmental(model,"Left Thigh",acq,gravity,scaleToMeter,distalSegmentLabel="Left Shank")
+
+        shank = model.getSegment("Left Shank")
+        thigh = model.getSegment("Left Thigh")
+
+        force,moment,distalForce,distalMoment = perFrameSegmental(shank,None,gravity,scaleToMeter)
+        np.testing.assert_allclose(shank.m_proximalWrench.GetForce().GetValues(),force)
+        np.testing.assert_allclose(shank.m_proximalWrench.GetMoment().GetValues(),moment/scaleToMeter)
+        np.testing.assert_allclose(shank.m_proximalWrench.GetPosition().GetValues(),shank.anatomicalFrame.motion.getTranslations())
+
+        force,moment,distalForce,distalMoment = perFrameSegmental(thigh,shank.m_proximalWrench,gravity,scaleToMeter)
+        np.testing.assert_allclose(thigh.m_proximalWrench.GetForce().GetValues(),force)
+        np.testing.assert_allclose(thigh.m_proximalWrench.GetMoment().GetValues(),moment/scaleToMeter)
+        np.testing.assert_allclose(thigh.m_proximalMomentContribution["distalSegmentForces"],-distalForce/scaleToMeter)
+        np.testing.assert_allclose(thigh.m_proximalMomentContribution["distalSegmentMoments"],-distalMoment/scaleToMeter)
+
+        # distal contribution : total, force and moment parts
+        total,forcePart,momentPart = procedure._distalMomentContribution(shank.m_proximalWrench,thigh.anatomicalFrame.motion,scaleToMeter)
+        np.testing.assert_allclose(forcePart,distalForce)
+        np.testing.assert_allclose(momentPart,distalMoment)
+        np.testing.assert_allclose(total,forcePart+momentPart)
+        np.testing.assert_allclose(thigh.m_proximalMomentContribution["distalSegments"],-total/scaleToMeter)
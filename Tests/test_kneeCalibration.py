@@ -0,0 +1,135 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_kneeCalibration.py::Test_functionalCalibrationSession::test_bothSides
+
+import pytest
+
+from pyCGM2.Lib.CGM import kneeCalibration
+
+
+class Acquisition(object):
+    def GetFirstFrame(self):
+        return 1
+
+    def GetLastFrame(self):
+        return 100
+
+
+class Model(object):
+    version = "CGM2.3"
+    m_staticFilename = "static.c3d"
+
+    def __init__(self):
+        self.mp_computed = {"LeftKneeFuncCalibrationOffset" : 5.0, "RightKneeFuncCalibrationOffset" : 0}
+        self.m_properties = {"CalibrationParameters" : {"leftFlatFoot" : True, "rightFlatFoot" : True,
+                                                        "headFlat" : True, "markerDiameter" : 14}}
+
+    def getTrackingMarkers(self,acq):
+        return ["LKNE"]
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    calls = list()
+
+    class CalibrationFilter(object):
+        def __init__(self,*args,**kwargs):
+            pass
+        def compute(self):
+            calls.append("calibration")
+
+    class MotionFilter(object):
+        def __init__(self,*args,**kwargs):
+            pass
+        def segmentalCompute(self,segments):
+            calls.append(("motion",tuple(segments)))
+
+    class Decorator(object):
+        def __init__(self,model):
+            pass
+        def sara(self,side,**kwargs):
+            calls.append(("sara",side))
+        def calibrate2dof(self,side,**kwargs):
+            calls.append(("2dof",side))
+        def score(self,side,**kwargs):
+            calls.append(("score",side))
+
+    monkeypatch.setattr(kneeCalibration.btkTools,"smartReader",lambda filename: calls.append(("read",filename)) or Acquisition())
+    monkeypatch.setattr(kneeCalibration.btkTools,"checkMultipleSubject",lambda acq: None)
+    monkeypatch.setattr(kneeCalibration.btkTools,"applyTranslators",lambda acq,translators: acq)
+    monkeypatch.setattr(kneeCalibration.btkTools,"getStartEndEvents",lambda acq,side: (None,None))
+    monkeypatch.setattr(kneeCalibration.signal_processing,"markerFiltering",
+                        lambda acq,markers,order=2,fc=6: calls.append(("filtering",fc,order)))
+    monkeypatch.setattr(kneeCalibration.modelFilters,"StaticCalibrationProcedure",lambda model: None)
+    monkeypatch.setattr(kneeCalibration.modelFilters,"ModelCalibrationFilter",CalibrationFilter)
+    monkeypatch.setattr(kneeCalibration.modelFilters,"ModelMotionFilter",MotionFilter)
+    monkeypatch.setattr(kneeCalibration.modelDecorator,"KneeCalibrationDecorator",Decorator)
+    monkeypatch.setattr(kneeCalibration.modelDecorator,"HipJointCenterDecorator",Decorator)
+
+    return calls
+
+
+class Test_functionalCalibrationSession:
+    def test_bothSides(self,calls):
+        model = Model()
+        session = kneeCalibration.FunctionalCalibrationSession(model,"DATA/",None,fc_lowPass_marker=6)
+
+        session.hipScore("func.c3d","both",None,None)
+        acq,side = session.sara("func.c3d","both",None,None)
+        session.finalize()
+
+        assert side == "both"
+        assert calls == [("read","DATA/static.c3d"),
+                         ("read","DATA/func.c3d"),("filtering",6,4),
+                         "calibration",
+                         ("motion",("Pelvis","Left Thigh","Right Thigh")),("score","Left"),("score","Right"),
+                         "calibration",
+                         ("motion",("Left Thigh","Left Shank","Right Thigh","Right Shank")),("sara","Left"),("sara","Right"),
+                         "calibration"]
+        assert model.mp_computed["LeftKneeFuncCalibrationOffset"] == 0
+
+    def test_reuse(self,calls):
+        model = Model()
+        model.mp_computed["LeftKneeFuncCalibrationOffset"] = 0
+        session = kneeCalibration.FunctionalCalibrationSession(model,"DATA/",None)
+
+        session.calibrate()
+        del calls[:]
+
+        # offsets already zero : no new static calibration
+        acq0,side = session.sara("func.c3d","Left",None,None)
+        assert calls == [("read","DATA/func.c3d"),("motion",("Left Thigh","Left Shank")),("sara","Left")]
+
+        # cached acquisition, recalibration after the previous decorator
+        del calls[:]
+        acq1,side = session.calibration2Dof("func.c3d","Right",None,None,None)
+        assert acq1 is acq0
+        assert calls == ["calibration",("motion",("Right Thigh","Right Shank")),("2dof","Right")]
+
+        del calls[:]
+        session.finalize()
+        session.finalize()
+        assert calls == ["calibration"]
+
+    def test_forcedAcquisition(self,calls):
+        session = kneeCalibration.FunctionalCalibrationSession(Model(),"DATA/",None)
+
+        acq0 = Acquisition()
+        acq1 = Acquisition()
+        assert session.getAcquisition("func.c3d",forceBtkAcq=acq0) is acq0
+        assert session.getAcquisition("func.c3d",forceBtkAcq=acq1) is acq1
+        assert session.getAcquisition("func.c3d",forceBtkAcq=acq0) is acq0
+
+        with pytest.raises(Exception):
+            session.getAcquisition("func.c3d",forceBtkAcq=acq0,fc_lowPass_marker=6)
+
+    def test_wrappers(self,calls):
+        model = Model()
+        session = kneeCalibration.FunctionalCalibrationSession(model,"DATA/",None)
+
+        kneeCalibration.sara(model,"DATA/","left.c3d",None,"Left",None,None,session=session)
+        kneeCalibration.sara(model,"DATA/","right.c3d",None,"Right",None,None,session=session,fc_lowPass_marker=6)
+        session.finalize()
+
+        assert calls.count(("read","DATA/static.c3d")) == 1
+        assert calls.count("calibration") == 3
+        assert ("filtering",6,4) in calls
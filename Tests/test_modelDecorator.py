@@ -0,0 +1,164 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_modelDecorator.py::Test_VCMJointCentre::test_arrayVsScalar
+
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation
+
+from pyCGM2.Model import modelDecorator
+from pyCGM2.Model import frame
+
+
+def chordInputs(n, seed=0):
+    rng = np.random.RandomState(seed)
+    kne = rng.normal(size=(n,3))*10.0
+    hjc = kne + np.array([0,0,400.0]) + rng.normal(size=(n,3))*10.0
+    thi = kne + np.array([60.0,0,100.0]) + rng.normal(size=(n,3))*10.0
+    return kne,hjc,thi
+
+
+class Test_VCMJointCentre:
+    def test_arrayVsScalar(self):
+        kne,hjc,thi = chordInputs(100)
+        kne[10,:] = 0.0 # missing marker
+        validFrames = [True]*100
+        validFrames[20] = False
+
+        for beta in [0.0, 7.0, -15.0]:
+            values = modelDecorator.VCMJointCentreArray(50.0,kne,hjc,thi,beta=beta,validFrames=validFrames)
+            for i in range(0,100):
+                if validFrames[i]:
+                    np.testing.assert_almost_equal(values[i],modelDecorator.VCMJointCentre(50.0,kne[i],hjc[i],thi[i],beta=beta))
+                else:
+                    np.testing.assert_equal(values[i],np.zeros(3))
+
+    def test_chordArrayVsScalar(self):
+        kne,hjc,thi = chordInputs(30,seed=1)
+
+        for beta in [0.0, 5.0, -10.0]:
+            values = modelDecorator.chord(50.0,kne,hjc,thi,beta=beta)
+            for i in range(0,30):
+                np.testing.assert_almost_equal(values[i],modelDecorator.chord(50.0,kne[i],hjc[i],thi[i],beta=beta))
+
+
+class Test_calibration2Dof:
+    def test_offsetRecovery(self):
+        n = 1000
+        rng = np.random.RandomState(0)
+        t = np.linspace(0,10,n)
+        prox = Rotation.from_rotvec(np.c_[0.1*np.sin(t),0.2*np.cos(t),0.3*t]).as_matrix()
+
+        # flexion about an axis tilted of 7 degrees about the proximal z-axis
+        tilt = np.deg2rad(7.0)
+        axis = np.array([np.sin(tilt),np.cos(tilt),0.0])
+        joint = Rotation.from_rotvec(np.outer(0.5*(1-np.cos(2*t)),axis)+rng.normal(size=(n,3))*0.01).as_matrix()
+        dist = np.einsum("nij,njk->nik",prox,joint)
+
+        proxMotion = frame.MotionTrajectory(prox,np.zeros((n,3)))
+        distMotion = frame.MotionTrajectory(dist,np.zeros((n,3)))
+
+        value = modelDecorator.calibration2Dof(proxMotion,distMotion,None,None,None,sequence="YXZ",index=1,flexInd=0)
+        assert abs(value+7.0) < 1.0
+
+        value = modelDecorator.calibration2Dof(proxMotion,distMotion,10,n-20,[5,40],sequence="YXZ",index=1,flexInd=0)
+        assert abs(value+7.0) < 1.0
+
+        with pytest.raises(Exception):
+            modelDecorator.calibration2Dof(proxMotion,distMotion,None,None,[100,120],sequence="YXZ",index=1,flexInd=0)
+
+    def test_eulerAngleDerivative(self):
+        rng = np.random.RandomState(1)
+        M = Rotation.from_euler("zyx",rng.uniform(-1,1,(20,3))).as_matrix()
+
+        def relative(angle):
+            return np.einsum("ji,njk->nik",Rotation.from_euler("z",angle).as_matrix(),M)
+
+        h = 1e-6
+        for sequence,(eulerFunction,terms) in modelDecorator._EULER_SEQUENCES.items():
+            R = relative(0.3)
+            dR = np.zeros(R.shape)
+            dR[:,0,:] = R[:,1,:]
+            dR[:,1,:] = -R[:,0,:]
+            for k in range(0,3):
+                numeric = (eulerFunction(relative(0.3+h))[k]-eulerFunction(relative(0.3-h))[k])/(2*h)
+                np.testing.assert_allclose(modelDecorator._eulerAngleDerivative(R,dR,terms[k]),numeric,atol=1e-6)
+
+
+def hingeMotions(n, seed=0):
+    rng = np.random.RandomState(seed)
+    t = np.linspace(0,10,n)
+    prox = Rotation.from_rotvec(np.c_[0.1*np.sin(t),0.2*np.cos(t),0.3*t]).as_matrix()
+    tprox = rng.normal(size=(n,3))*100.0
+
+    axis = np.array([0.1,0.99,0.05])/np.linalg.norm([0.1,0.99,0.05])
+    dist = np.einsum("nij,njk->nik",prox,Rotation.from_rotvec(np.outer(0.5*(1-np.cos(2*t)),axis)).as_matrix())
+
+    # the centre is fixed in both referentials
+    centreProx = np.array([10.0,20.0,-400.0])
+    centreDist = np.array([5.0,-3.0,60.0])
+    tdist = np.einsum("nij,j->ni",prox,centreProx) + tprox - np.einsum("nij,j->ni",dist,centreDist)
+
+    return frame.MotionTrajectory(prox,tprox),frame.MotionTrajectory(dist,tdist),axis
+
+
+class Test_saraCalibration:
+    def test_hinge(self):
+        proxMotion,distMotion,axis = hingeMotions(500)
+
+        for method in ["1","2"]:
+            outputs = modelDecorator.saraCalibration(proxMotion,distMotion,None,None,method=method,returnResiduals=True)
+            prox_origin,prox_axisLim,dist_origin,dist_axisLim,prox_axisNorm,dist_axisNorm,coeffDet,residuals = outputs
+
+            np.testing.assert_almost_equal(np.abs(np.dot(prox_axisNorm,axis)),1.0)
+            np.testing.assert_almost_equal(np.abs(np.dot(dist_axisNorm,axis)),1.0)
+            np.testing.assert_almost_equal(np.linalg.norm(prox_origin-prox_axisLim),200.0)
+
+            assert residuals.shape == (500,3)
+
+        # method 1 inverts the null singular value of a perfect hinge, its centre is not accurate
+        np.testing.assert_allclose(residuals,0.0,atol=1e-6)
+
+    def test_visibility(self):
+        proxMotion,distMotion,axis = hingeMotions(300,seed=1)
+        # corrupted frames
+        distMotion.getTranslations()[50:80] += 30.0
+        visibility = np.ones(300,dtype=bool)
+        visibility[50:80] = False
+
+        outputs = modelDecorator.saraCalibration(proxMotion,distMotion,10,None,method="2",visibility=visibility,returnResiduals=True)
+
+        # residuals of the selected frames only : the corrupted and first frames are excluded
+        assert outputs[7].shape == (260,3)
+        np.testing.assert_allclose(outputs[7],0.0,atol=1e-6)
+
+        with pytest.raises(Exception):
+            modelDecorator.saraCalibration(proxMotion,distMotion,None,None,visibility=np.zeros(300,dtype=bool))
+
+
+class Test_scoreCalibration:
+    def test_ballJoint(self):
+        n = 400
+        rng = np.random.RandomState(2)
+        t = np.linspace(0,10,n)
+        prox = Rotation.from_rotvec(np.c_[0.1*np.sin(t),0.2*np.cos(t),0.3*t]).as_matrix()
+        tprox = rng.normal(size=(n,3))*100.0
+        dist = np.einsum("nij,njk->nik",prox,Rotation.from_rotvec(np.c_[0.6*np.sin(t),0.4*np.cos(1.3*t),0.2*np.sin(0.7*t)]).as_matrix())
+
+        centreProx = np.array([-60.0,80.0,-20.0])
+        centreDist = np.array([0.0,10.0,250.0])
+        tdist = np.einsum("nij,j->ni",prox,centreProx) + tprox - np.einsum("nij,j->ni",dist,centreDist)
+
+        proxMotion = frame.MotionTrajectory(prox,tprox)
+        distMotion = frame.MotionTrajectory(dist,tdist)
+
+        prox_centre,dist_centre,residuals = modelDecorator.scoreCalibration(proxMotion,distMotion,None,None,returnResiduals=True)
+
+        np.testing.assert_allclose(prox_centre,centreProx,atol=1e-6)
+        np.testing.assert_allclose(dist_centre,centreDist,atol=1e-6)
+        np.testing.assert_allclose(residuals,0.0,atol=1e-6)
+
+        visibility = np.zeros(n,dtype=bool)
+        visibility[100:200] = True
+        prox_centre,dist_centre,residuals = modelDecorator.scoreCalibration(proxMotion,distMotion,None,None,visibility=visibility,returnResiduals=True)
+        np.testing.assert_allclose(prox_centre,centreProx,atol=1e-6)
+        assert residuals.shape == (100,3)
@@ -0,0 +1,43 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_motion.py::Test_segmentalLeastSquareArray::test_arrayVsScalar
+
+import numpy as np
+
+from pyCGM2.Model import motion
+
+
+class Test_segmentalLeastSquareArray:
+    def test_arrayVsScalar(self):
+        rng = np.random.RandomState(0)
+        static = rng.normal(size=(4,3))*100.0
+
+        n = 50
+        dynamic = np.zeros((n,4,3))
+        for i in range(0,n):
+            u,s,vt = np.linalg.svd(rng.normal(size=(3,3)))
+            rot = np.dot(u,vt) if np.linalg.det(np.dot(u,vt))>0 else -1.0*np.dot(u,vt)
+            dynamic[i] = np.dot(static,rot.T) + rng.normal(size=3)*500.0 + rng.normal(size=(4,3))
+
+        R,L,RMSE,Am,Bm = motion.segmentalLeastSquareArray(static,dynamic)
+
+        for i in range(0,n):
+            Ri,Li,RMSEi,Ami,Bmi = motion.segmentalLeastSquare(static,dynamic[i])
+            np.testing.assert_almost_equal(R[i],Ri,decimal=8)
+            np.testing.assert_almost_equal(L[i],Li,decimal=6)
+            np.testing.assert_almost_equal(RMSE[i],RMSEi,decimal=8)
+
+    def test_visibility(self):
+        rng = np.random.RandomState(1)
+        static = rng.normal(size=(4,3))*100.0
+        dynamic = np.tile(static+10.0,(3,1,1))
+        dynamic[1,3,:] = 1.0e6 # outlier flagged as invisible
+
+        visibility = np.ones((3,4),dtype=bool)
+        visibility[1,3] = False
+        visibility[2,:] = False
+
+        R,L,RMSE,Am,Bm = motion.segmentalLeastSquareArray(static,dynamic,visibility=visibility)
+
+        np.testing.assert_almost_equal(R[1],np.eye(3),decimal=8)
+        np.testing.assert_almost_equal(L[1],np.ones(3)*10.0,decimal=6)
+        assert RMSE[2] == -1
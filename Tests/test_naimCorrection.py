@@ -0,0 +1,50 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_naimCorrection.py::Test_naim2019::test_correct
+
+import numpy as np
+
+from pyCGM2 import enums
+from pyCGM2.Model import model, modelFilters
+
+
+def rotationsY(angles):
+    R = np.zeros((angles.shape[0],3,3))
+    R[:,0,0] = np.cos(angles); R[:,0,2] = np.sin(angles)
+    R[:,1,1] = 1.0
+    R[:,2,0] = -np.sin(angles); R[:,2,2] = np.cos(angles)
+    return R
+
+
+def leftLegModel(nFrames):
+    time = np.linspace(0,10,nFrames)
+    mod = model.Model()
+    mod.addSegment("Left Thigh",1,enums.SegmentSide.Left,calibration_markers=[],tracking_markers=[])
+    mod.addSegment("Left Shank",2,enums.SegmentSide.Left,calibration_markers=[],tracking_markers=[])
+    thigh = mod.getSegment("Left Thigh")
+    shank = mod.getSegment("Left Shank")
+
+    thigh.anatomicalFrame.static.addNode("LHJC",np.array([0,0,0.]),positionType="Local")
+    thigh.anatomicalFrame.static.addNode("LKJC",np.array([0,0,-400.]),positionType="Local")
+    shank.anatomicalFrame.static.addNode("LAJC",np.array([0,0,-380.]),positionType="Local")
+
+    thigh.anatomicalFrame.setMotion(rotationsY(0.6*np.sin(time)),np.array([1000*time,np.full(nFrames,100.),np.full(nFrames,900.)]).T)
+    shank.anatomicalFrame.setMotion(rotationsY(0.6*np.sin(time)-0.8),thigh.anatomicalFrame.getNodeTrajectory("LKJC"))
+    return mod
+
+
+class Test_naim2019:
+    def test_correct(self):
+        mod = leftLegModel(500)
+        hjc = mod.getSegment("Left Thigh").anatomicalFrame.getNodeTrajectory("LHJC")
+        kjc = mod.getSegment("Left Thigh").anatomicalFrame.getNodeTrajectory("LKJC")
+
+        procedure = modelFilters.Naim2019ThighMisaligmentCorrectionProcedure(mod,"Left",threshold=20)
+        modelFilters.ModelMotionCorrectionFilter(procedure).correct()
+
+        motion = mod.getSegment("Left Thigh").anatomicalFrame.motion
+        R = motion.getRotations()
+        np.testing.assert_allclose(motion.getTranslations(),hjc)
+        np.testing.assert_allclose(np.einsum("nji,njk->nik",R,R),np.tile(np.eye(3),(500,1,1)),atol=1e-12)
+        # z axis along the femur, y axis along the mean flexion axis
+        np.testing.assert_allclose(R[:,:,2],(hjc-kjc)/400.0,atol=1e-12)
+        np.testing.assert_allclose(np.abs(R[:,1,1]),1.0,atol=1e-12)
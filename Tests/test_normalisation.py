@@ -0,0 +1,30 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_normalisation.py::Test_timeSequencesNormalisation::test_batch
+
+import numpy as np
+
+from pyCGM2.Math import normalisation
+
+
+def interpolate(Nrow, data):
+    out = np.zeros((Nrow,data.shape[1]))
+    for i in range(0,data.shape[1]):
+        out[:,i] = np.interp(np.linspace(0, 100, Nrow), np.linspace(0, 100, data.shape[0]), data[:,i])
+    return out
+
+
+class Test_timeSequencesNormalisation:
+    def test_batch(self):
+        rng = np.random.RandomState(0)
+        sequences = [rng.normal(size=(n,3)) for n in [2,57,101,120,233]]
+
+        values = normalisation.timeSequencesNormalisation(101,sequences)
+
+        assert values.shape == (5,101,3)
+        for sequence,value in zip(sequences,values):
+            np.testing.assert_allclose(value, interpolate(101,sequence), atol=1e-10)
+
+    def test_single(self):
+        data = np.random.RandomState(1).normal(size=(87,1))
+
+        np.testing.assert_allclose(normalisation.timeSequenceNormalisation(101,data), interpolate(101,data), atol=1e-10)
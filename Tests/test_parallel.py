@@ -0,0 +1,41 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_parallel.py::Test_parallel::test_runJobs
+import pyCGM2; LOGGER = pyCGM2.LOGGER
+import logging
+
+from pyCGM2.Utils import parallel
+
+
+def _scale(sharedObject, value, label):
+    LOGGER.logger.info("job %s" % (label))
+    return sharedObject["factor"] * value
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super(_ListHandler, self).__init__()
+        self.messages = list()
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class Test_parallel:
+    def test_runJobs(self):
+        jobs = [{"value": i, "label": str(i)} for i in range(0, 6)]
+
+        handler = _ListHandler()
+        LOGGER.logger.addHandler(handler)
+        try:
+            serial = parallel.runJobs(_scale, jobs, nJobs=1, sharedObject={"factor": 2})
+            serialMessages = handler.messages[:]
+            handler.messages = list()
+
+            concurrent = parallel.runJobs(_scale, jobs, nJobs=3, sharedObject={"factor": 2})
+            concurrentMessages = [msg for msg in handler.messages if msg.startswith("job")]
+        finally:
+            LOGGER.logger.removeHandler(handler)
+
+        assert serial == [0, 2, 4, 6, 8, 10]
+        assert concurrent == serial
+        assert concurrentMessages == serialMessages
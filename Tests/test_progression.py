@@ -16,6 +16,12 @@ TODO : these cases are lacking :
 import numpy as np
 import pyCGM2; LOGGER = pyCGM2.LOGGER
 
+try:
+    from pyCGM2 import btk
+except:
+    LOGGER.logger.info("[pyCGM2] pyCGM2-embedded btk not imported")
+    import btk
+
 from pyCGM2.Tools import  btkTools
 from pyCGM2.Processing import progressionFrame
 from pyCGM2.Utils import utils
@@ -188,6 +194,70 @@ class Test_btkProgression():
         np.testing.assert_equal( pff.outputs["forwardProgression"] ,False)
         np.testing.assert_equal( pff.outputs["globalFrame"],"XYZ")
 
+class Test_progressionCache():
+
+    def test_cache(self):
+        MAIN_PATH = pyCGM2.TEST_DATA_PATH + "LowLevel\\ProgressionFrame\\sample 1\\"
+        acq = btkTools.smartReader(MAIN_PATH +  "gait_X_forward.c3d")
+
+        progressionFrame.clearProgressionFrameCache()
+        pff = progressionFrame.ProgressionFrameFilter(acq,progressionFrame.PelvisProgressionFrameProcedure())
+        pff.compute()
+        np.testing.assert_equal(len(progressionFrame._PROGRESSION_CACHE),1)
+
+        pff2 = progressionFrame.ProgressionFrameFilter(acq,progressionFrame.PelvisProgressionFrameProcedure())
+        pff2.compute()
+        np.testing.assert_equal(len(progressionFrame._PROGRESSION_CACHE),1)
+        np.testing.assert_equal( pff2.outputs["progressionAxis"],"X")
+        np.testing.assert_equal( pff2.outputs["forwardProgression"] ,True)
+
+        # in-place change of marker values invalidates the cached output
+        for label in ["LASI","RASI","LPSI","RPSI"]:
+            values = acq.GetPoint(label).GetValues()
+            values[:,0] = -values[:,0]
+            btkTools.smartAppendPoint(acq,label,values)
+
+        pff3 = progressionFrame.ProgressionFrameFilter(acq,progressionFrame.PelvisProgressionFrameProcedure())
+        pff3.compute()
+        np.testing.assert_equal( pff3.outputs["progressionAxis"],"X")
+        np.testing.assert_equal( pff3.outputs["forwardProgression"] ,False)
+
+        # precomputed progression
+        pff4 = progressionFrame.ProgressionFrameFilter(acq,progressionFrame.PelvisProgressionFrameProcedure(),progression=pff.outputs)
+        pff4.compute()
+        np.testing.assert_equal( pff4.outputs["forwardProgression"] ,True)
+
+    def test_cacheEntries(self):
+        calls = list()
+        class Procedure(object):
+            def compute(self,acq):
+                calls.append(acq)
+                return "X",True,"XYZ"
+
+        acq = btk.btkAcquisition()
+        acq.Init(0,100)
+        acq.SetPointFrequency(100.0)
+        btkTools.smartAppendPoint(acq,"LASI",np.ones((100,3)))
+
+        btkTools.clearAcquisitionArrays()
+        progressionFrame.clearProgressionFrameCache()
+        procedure = Procedure()
+        for i in range(0,2):
+            pff = progressionFrame.ProgressionFrameFilter(acq,procedure)
+            pff.compute()
+        np.testing.assert_equal(len(calls),1)
+
+        # no point arrays built and no acquisition stored
+        np.testing.assert_equal(len(btkTools._ACQUISITION_ARRAYS),0)
+        np.testing.assert_equal(list(progressionFrame._PROGRESSION_CACHE.values()),[("X",True,"XYZ")])
+
+        # direct btk write
+        acq.GetPoint("LASI").SetValues(np.zeros((100,3)))
+        pff = progressionFrame.ProgressionFrameFilter(acq,procedure)
+        pff.compute()
+        np.testing.assert_equal(len(calls),2)
+
+
 #--- static
 class Test_btkProgression_static():
 
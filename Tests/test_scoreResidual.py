@@ -0,0 +1,47 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_scoreResidual.py::Test_scoreResidual::test_compute
+
+import numpy as np
+
+import pyCGM2; LOGGER = pyCGM2.LOGGER
+try:
+    from pyCGM2 import btk
+except:
+    LOGGER.logger.info("[pyCGM2] pyCGM2-embedded btk not imported")
+    import btk
+
+from pyCGM2 import enums
+from pyCGM2.Model import model, modelQualityFilter
+
+
+class Test_scoreResidual:
+    def test_compute(self):
+        nFrames = 200
+        angles = np.linspace(0,np.pi,nFrames)
+        R = np.zeros((nFrames,3,3))
+        R[:,0,0] = np.cos(angles); R[:,0,1] = -np.sin(angles)
+        R[:,1,0] = np.sin(angles); R[:,1,1] = np.cos(angles)
+        R[:,2,2] = 1.0
+
+        mod = model.Model()
+        for label in ["Pelvis","Left Thigh"]:
+            mod.addSegment(label,0,enums.SegmentSide.Central,calibration_markers=[],tracking_markers=[])
+            mod.getSegment(label).addTechnicalReferential("TF")
+        mod.getSegment("Pelvis").getReferential("TF").setMotion(R,np.zeros((nFrames,3)))
+        mod.getSegment("Left Thigh").getReferential("TF").setMotion(np.tile(np.eye(3),(nFrames,1,1)),np.zeros((nFrames,3)))
+        mod.getSegment("Pelvis").getReferential("TF").static.addNode("LHJC",np.array([10.0,0,30.0]),positionType="Local")
+        mod.getSegment("Left Thigh").getReferential("TF").static.addNode("LHJC",np.array([10.0,0,30.0]),positionType="Local")
+
+        acq = btk.btkAcquisition()
+        acq.Init(0,nFrames)
+
+        procedure = modelQualityFilter.GeneralScoreResidualProcedure(mod)
+        procedure.setDefinition("LHJC","Pelvis","Left Thigh")
+        procedure.setDefinition("RHJC","Pelvis","Right Thigh")
+        residuals = modelQualityFilter.ScoreResidualFilter(acq,procedure).compute()
+
+        # the node rotates on a circle of radius 10 around the pelvic z-axis
+        expected = np.sqrt((10.0*(np.cos(angles)-1))**2 + (10.0*np.sin(angles))**2) / np.sqrt(3)
+        assert list(residuals.keys()) == ["LHJC"]
+        np.testing.assert_allclose(residuals["LHJC"],expected,atol=1e-10)
+        np.testing.assert_allclose(acq.GetPoint("LHJC_Score").GetValues()[:,0],expected,atol=1e-10)
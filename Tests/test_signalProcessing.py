@@ -0,0 +1,140 @@
+# coding: utf-8
+# pytest -s --disable-pytest-warnings  test_signalProcessing.py::Test_lowPassFiltering::test_zerosFiltering
+
+import pytest
+import numpy as np
+from scipy import signal
+
+import pyCGM2; LOGGER = pyCGM2.LOGGER
+try:
+    from pyCGM2 import btk
+except:
+    LOGGER.logger.info("[pyCGM2] pyCGM2-embedded btk not imported")
+    import btk
+
+from pyCGM2.Signal import signal_processing
+from pyCGM2.Signal import detect_changes
+from pyCGM2.Tools import btkTools
+from pyCGM2.EMG import emgFilters
+
+
+class Test_lowPassFiltering:
+    def test_zerosFiltering(self):
+        rng = np.random.RandomState(0)
+        values = np.cumsum(rng.normal(size=(500,6)),axis=0)+10.0
+        values[100:120,0:3] = 0
+        values[300,4] = 0
+
+        out = signal_processing.arrayLowPassFiltering(values,100.0,order=2,fc=6,zerosFiltering=True)
+
+        b, a = signal.butter(2, 6 / (100.0*0.5) , btype='lowpass')
+        np.testing.assert_equal(out[100:120,0:3],0)
+        np.testing.assert_allclose(out[0:100,0], signal.filtfilt(b, a, values[0:100,0]))
+        np.testing.assert_allclose(out[301:,4], signal.filtfilt(b, a, values[301:,4]))
+        np.testing.assert_allclose(out[:,5], signal.filtfilt(b, a, values[:,5]))
+
+    def test_nonZeroRuns(self):
+        values = np.ones((10,2))
+        values[3:5,0] = 0
+
+        runs = signal_processing.nonZeroRuns(values)
+
+        assert runs == {(0,3):[0],(5,10):[0],(0,10):[1]}
+
+    def test_markerFiltering_directWrite(self):
+        rng = np.random.RandomState(2)
+        acq = btk.btkAcquisition()
+        acq.Init(0,300)
+        acq.SetPointFrequency(100.0)
+        btkTools.smartAppendPoint(acq,"LASI",np.cumsum(rng.normal(size=(300,3)),axis=0)+10.0)
+        btkTools.getMarkerArray(acq,["LASI"]) # fill the cached arrays
+
+        values = np.cumsum(rng.normal(size=(300,3)),axis=0)+10.0
+        acq.GetPoint("LASI").SetValues(values)
+
+        signal_processing.markerFiltering(acq,["LASI"],order=2,fc=6)
+
+        b, a = signal.butter(2, 6 / (100.0*0.5) , btype='lowpass')
+        np.testing.assert_allclose(acq.GetPoint("LASI").GetValues(), signal.filtfilt(b, a, values, axis=0))
+
+
+class Test_emgFiltering:
+    def test_chunkedFiltfilt(self):
+        rng = np.random.RandomState(0)
+        values = rng.normal(size=(40000,4))
+
+        b, a = signal.butter(2, np.array([20, 200]) / (2000*0.5), 'bandpass')
+        out = signal_processing.chunkedFiltfilt(b, a, values, chunkSize=5000)
+
+        np.testing.assert_allclose(out, signal.filtfilt(b, a, values, axis=0), atol=1e-12)
+
+        # long impulse response of the notch filter, chunks shorter than the padding
+        b, a = signal.butter(2, np.array([49.9, 50.1]) / (2000*0.5), 'bandstop')
+        for chunkSize in [7,5000]:
+            out = signal_processing.chunkedFiltfilt(b, a, values, chunkSize=chunkSize)
+            np.testing.assert_allclose(out, signal.filtfilt(b, a, values, axis=0), atol=1e-12)
+
+    def test_highPass_multiChannel(self):
+        rng = np.random.RandomState(1)
+        values = rng.normal(size=(5000,3)) + np.array([1.0,5.0,-3.0])
+
+        out = signal_processing.highPass(values,20,200,2000)
+
+        for j in range(0,3):
+            np.testing.assert_allclose(out[:,j], signal_processing.highPass(values[:,j:j+1],20,200,2000)[:,0])
+
+
+class Test_emgProcessingFilter:
+    LABELS = ["EMG1","EMG2","EMG3"]
+
+    def emgAcquisition(self):
+        rng = np.random.RandomState(3)
+        acq = btk.btkAcquisition()
+        acq.Init(0,1000,3,2)
+        acq.SetPointFrequency(1000.0)
+        for i,label in enumerate(Test_emgProcessingFilter.LABELS):
+            acq.GetAnalog(i).SetLabel(label)
+            acq.GetAnalog(i).SetValues(rng.normal(size=(2000,1)))
+        return acq
+
+    def test_outputs(self):
+        acq = self.emgAcquisition()
+        values = np.stack([acq.GetAnalog(label).GetValues()[:,0] for label in Test_emgProcessingFilter.LABELS],axis=1)
+
+        emgf = emgFilters.EmgProcessingFilter(acq,Test_emgProcessingFilter.LABELS,outputs=["Env"])
+        emgf.run()
+
+        hpf = signal_processing.highPass(signal_processing.remove50hz(values,2000.0),20,200,2000.0)
+        hpf -= hpf.mean(axis=0)
+        env = signal_processing.enveloppe(np.abs(hpf),6.0,2000.0)
+        for j,label in enumerate(Test_emgProcessingFilter.LABELS):
+            assert not btkTools.isAnalogExist(acq,label+"_HPF")
+            assert not btkTools.isAnalogExist(acq,label+"_Rectify")
+            np.testing.assert_allclose(acq.GetAnalog(label+"_Rectify_Env").GetValues()[:,0], env[:,j])
+
+        acq = self.emgAcquisition()
+        emgf = emgFilters.EmgProcessingFilter(acq,Test_emgProcessingFilter.LABELS,outputs=["HPF","Rectify"])
+        emgf.setChunkSize(300)
+        emgf.run()
+        for j,label in enumerate(Test_emgProcessingFilter.LABELS):
+            np.testing.assert_allclose(acq.GetAnalog(label+"_HPF").GetValues()[:,0], hpf[:,j], atol=1e-12)
+            np.testing.assert_allclose(acq.GetAnalog(label+"_Rectify").GetValues()[:,0], np.abs(hpf[:,j]), atol=1e-12)
+            assert not btkTools.isAnalogExist(acq,label+"_Rectify_Env")
+
+        with pytest.raises(Exception):
+            emgFilters.EmgProcessingFilter(acq,Test_emgProcessingFilter.LABELS,outputs=["Envelope"])
+
+
+class Test_cusum:
+    def test_detect_cusum_array(self):
+        rng = np.random.RandomState(0)
+        values = np.cumsum(rng.normal(size=(1000,4)),axis=0)
+        values[600:,1] += 30.0
+        thresholds = np.array([5.0,10.0,20.0,8.0])
+
+        out = detect_changes.detect_cusum_array(values,thresholds,thresholds/2.0,True)
+
+        for j in range(0,4):
+            expected = detect_changes.detect_cusum(values[:,j],thresholds[j],thresholds[j]/2.0,True,False)
+            for it,ref in zip(out[j],expected):
+                np.testing.assert_equal(it,ref)
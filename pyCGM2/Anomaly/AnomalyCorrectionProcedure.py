@@ -93,4 +93,6 @@ class MarkerAnomalyCorrectionProcedure(object):
             else:
                 LOGGER.logger.debug("[pyCGM2] -  No anomalies detected for marker %s"%marker)
 
+        btkTools.clearAcquisitionArrays(acq)
+
         return acq
@@ -8,6 +8,7 @@ from pyCGM2.Model.CGM2 import cgm
 from pyCGM2.Lib.CGM import  cgm1_1
 from pyCGM2.Utils import files
 from pyCGM2.Utils import utils
+from pyCGM2.Utils import parallel
 from pyCGM2.qtm import qtmTools
 from pyCGM2 import enums
 from pyCGM2.Tools import btkTools
@@ -24,12 +25,23 @@ def command():
     parser = argparse.ArgumentParser(description='CGM11 workflow')
     parser.add_argument('--sessionFile', type=str, help='setting xml file from qtm', default="session.xml")
     parser.add_argument('-ae','--anomalyException', action='store_true', help='stop if anomaly detected ')
+    parser.add_argument('-j','--jobs', type=int, help='number of processes fitting the dynamic trials', default=1)
 
     args = parser.parse_args()
     sessionFilename = args.sessionFile
-    main(sessionFilename,anomalyException=args.anomalyException)
+    main(sessionFilename,anomalyException=args.anomalyException,nJobs=args.jobs)
 
-def main(sessionFilename,createPDFReport=True,checkEventsInMokka=True,anomalyException=False):
+def _fitting(model,DATA_PATH,reconstructFilenameLabelled,fittingArgs,fittingOptions):
+    LOGGER.logger.info("----Processing of [%s]-----"%(reconstructFilenameLabelled))
+    acqGait,detectAnomaly = cgm1_1.fitting(model,DATA_PATH, reconstructFilenameLabelled,*fittingArgs,**fittingOptions)
+
+    btkTools.smartWriter(acqGait, str(DATA_PATH + reconstructFilenameLabelled))
+
+    LOGGER.logger.info("----Processing of [%s]-----> DONE"%(reconstructFilenameLabelled))
+    return detectAnomaly
+
+
+def main(sessionFilename,createPDFReport=True,checkEventsInMokka=True,anomalyException=False,nJobs=1):
 
     detectAnomaly=False
     LOGGER.set_file_handler("pyCGM2-QTM-Workflow.log")
@@ -124,12 +136,12 @@ def main(sessionFilename,createPDFReport=True,checkEventsInMokka=True,anomalyExc
     dynamicMeasurements= qtmTools.findDynamic(sessionXML)
 
     modelledC3ds = list()
+    fittingJobs = list()
     eventInspectorStates = list()
     for dynamicMeasurement in dynamicMeasurements:
 
         reconstructFilenameLabelled = qtmTools.getFilename(dynamicMeasurement)
 
-        LOGGER.logger.info("----Processing of [%s]-----"%(reconstructFilenameLabelled))
         mfpa = qtmTools.getForcePlateAssigment(dynamicMeasurement)
         momentProjection_text = sessionXML.Moment_Projection.text
         if momentProjection_text == "Default":
@@ -145,7 +157,6 @@ def main(sessionFilename,createPDFReport=True,checkEventsInMokka=True,anomalyExc
 
 
 
-        acq = btkTools.smartReader(DATA_PATH+reconstructFilenameLabelled)
 
         # filtering
         # -----------------------
@@ -169,24 +180,21 @@ def main(sessionFilename,createPDFReport=True,checkEventsInMokka=True,anomalyExc
 
         # fitting operation
         # -----------------------
-
-        acqGait,detectAnomaly = cgm1_1.fitting(model,DATA_PATH, reconstructFilenameLabelled,
-            translators,
-            markerDiameter,
-            pointSuffix,
-            mfpa,momentProjection,
-            fc_lowPass_marker=fc_marker,
-            order_lowPass_marker=order_marker,
-            fc_lowPass_forcePlate = fc_fp,
-            order_lowPass_forcePlate = order_fp,
-            anomalyException=anomalyException,
-            frameInit= vff, frameEnd= vlf )
-
-        outFilename = reconstructFilenameLabelled
-        btkTools.smartWriter(acqGait, str(DATA_PATH + outFilename))
-        modelledC3ds.append(outFilename)
-
-        LOGGER.logger.info("----Processing of [%s]-----> DONE"%(reconstructFilenameLabelled))
+        fittingJobs.append({"DATA_PATH":DATA_PATH,
+            "reconstructFilenameLabelled":reconstructFilenameLabelled,
+            "fittingArgs":(translators,markerDiameter,pointSuffix,mfpa,momentProjection),
+            "fittingOptions":dict(fc_lowPass_marker = fc_marker,
+                order_lowPass_marker = order_marker,
+                fc_lowPass_forcePlate = fc_fp,
+                order_lowPass_forcePlate = order_fp,
+                anomalyException = anomalyException,
+                frameInit = vff,
+                frameEnd = vlf)})
+
+    detectAnomalies = parallel.runJobs(_fitting,fittingJobs,nJobs=nJobs,sharedObject=model)
+    for job,jobAnomaly in zip(fittingJobs,detectAnomalies):
+        detectAnomaly = jobAnomaly
+        modelledC3ds.append(job["reconstructFilenameLabelled"])
 
 
     LOGGER.logger.info("---------------------GAIT PROCESSING -----------------------")
@@ -9,6 +9,7 @@ from pyCGM2.Lib.CGM import  cgm2_5
 from pyCGM2.Lib.CGM import  kneeCalibration
 from pyCGM2.Utils import files
 from pyCGM2.Utils import utils
+from pyCGM2.Utils import parallel
 from pyCGM2.qtm import qtmTools
 from pyCGM2 import enums
 from pyCGM2.Tools import btkTools
@@ -28,13 +29,25 @@ def command():
     parser = argparse.ArgumentParser(description='CGM26 workflow')
     parser.add_argument('--sessionFile', type=str, help='setting xml file from qtm', default="session.xml")
     parser.add_argument('-ae','--anomalyException', action='store_true', help='stop if anomaly detected ')
+    parser.add_argument('-j','--jobs', type=int, help='number of processes fitting the dynamic trials', default=1)
 
     args = parser.parse_args()
     sessionFilename = args.sessionFile
-    main(sessionFilename,anomalyException=args.anomalyException)
+    main(sessionFilename,anomalyException=args.anomalyException,nJobs=args.jobs)
 
 
-def main(sessionFilename,createPDFReport=True,checkEventsInMokka=True,anomalyException=False):
+def _fitting(model,DATA_PATH,reconstructFilenameLabelled,fittingArgs,fittingOptions):
+    LOGGER.logger.info("----Processing of [%s]-----"%(reconstructFilenameLabelled))
+    LOGGER.logger.info("[pyCGM2] --- Fitting operation ---")
+    acqGait,detectAnomaly = cgm2_5.fitting(model,DATA_PATH, reconstructFilenameLabelled,*fittingArgs,**fittingOptions)
+
+    btkTools.smartWriter(acqGait, str(DATA_PATH + reconstructFilenameLabelled))
+
+    LOGGER.logger.info("----Processing of [%s]-----> DONE"%(reconstructFilenameLabelled))
+    return detectAnomaly
+
+
+def main(sessionFilename,createPDFReport=True,checkEventsInMokka=True,anomalyException=False,nJobs=1):
 
     detectAnomaly = False
     LOGGER.set_file_handler("pyCGM2-QTM-Workflow.log")
@@ -152,6 +165,9 @@ def main(sessionFilename,createPDFReport=True,checkEventsInMokka=True,anomalyExc
     # --------------------------Knee Calibration ----------------------------------
     LOGGER.logger.info("--------------------------Knee Calibration ----------------------------------")
 
+    # static c3d, functional c3d and static calibrations shared by both knees
+    if leftKneeFuncMeasurement is not None or rightKneeFuncMeasurement is not None:
+        functionalSession = kneeCalibration.FunctionalCalibrationSession(model,DATA_PATH,translators)
 
     if leftKneeFuncMeasurement is not None:
         reconstructFilenameLabelled = qtmTools.getFilename(leftKneeFuncMeasurement)
@@ -160,18 +176,16 @@ def main(sessionFilename,createPDFReport=True,checkEventsInMokka=True,anomalyExc
         fc_marker = float(leftKneeFuncMeasurement.Marker_lowpass_filter_frequency.text)
 
         if qtmTools.getKneeFunctionCalibMethod(leftKneeFuncMeasurement) =="Calibration2Dof":
-            model,acqFunc,side = kneeCalibration.calibration2Dof(model,
-                                  DATA_PATH,reconstructFilenameLabelled,translators,
+            acqFunc,side = functionalSession.calibration2Dof(reconstructFilenameLabelled,
                                   "Left",None,None,None,
-                                  fc_lowPass_marker = order_marker,
-                                  order_lowPass_marker = fc_marker)
+                                  fc_lowPass_marker = fc_marker,
+                                  order_lowPass_marker = order_marker)
 
         if qtmTools.getKneeFunctionCalibMethod(leftKneeFuncMeasurement) =="SARA":
-            model,acqFunc,side = kneeCalibration.Sara(model,
-                                  DATA_PATH,reconstructFilenameLabelled,translators,
-                                  "Left",None,None,None,
-                                  fc_lowPass_marker = order_marker,
-                                  order_lowPass_marker = fc_marker)
+            acqFunc,side = functionalSession.sara(reconstructFilenameLabelled,
+                                  "Left",None,None,
+                                  fc_lowPass_marker = fc_marker,
+                                  order_lowPass_marker = order_marker)
 
         LOGGER.logger.info("Left Knee functional Calibration ----> Done")
 
@@ -184,22 +198,23 @@ def main(sessionFilename,createPDFReport=True,checkEventsInMokka=True,anomalyExc
 
 
         if qtmTools.getKneeFunctionCalibMethod(rightKneeFuncMeasurement) =="Calibration2Dof":
-            model,acqFunc,side = kneeCalibration.calibration2Dof(model,
-                                  DATA_PATH,reconstructFilenameLabelled,translators,
+            acqFunc,side = functionalSession.calibration2Dof(reconstructFilenameLabelled,
                                   "Right",None,None,None,
-                                  fc_lowPass_marker = order_marker,
-                                  order_lowPass_marker = fc_marker)
+                                  fc_lowPass_marker = fc_marker,
+                                  order_lowPass_marker = order_marker)
 
         if qtmTools.getKneeFunctionCalibMethod(rightKneeFuncMeasurement) =="SARA":
-            model,acqFunc,side = kneeCalibration.Sara(model,
-                                  DATA_PATH,reconstructFilenameLabelled,translators,
-                                  "Right",None,None,None,
-                                  fc_lowPass_marker = order_marker,
-                                  order_lowPass_marker = fc_marker)
+            acqFunc,side = functionalSession.sara(reconstructFilenameLabelled,
+                                  "Right",None,None,
+                                  fc_lowPass_marker = fc_marker,
+                                  order_lowPass_marker = order_marker)
 
 
         LOGGER.logger.info("Right Knee functional Calibration ----> Done")
 
+    if leftKneeFuncMeasurement is not None or rightKneeFuncMeasurement is not None:
+        functionalSession.finalize()
+
 
     # --------------------------MODEL FITTING ----------------------------------
     LOGGER.logger.info("--------------------------MODEL FITTING ----------------------------------")
@@ -208,12 +223,12 @@ def main(sessionFilename,createPDFReport=True,checkEventsInMokka=True,anomalyExc
     ik_flag = True
 
     modelledC3ds = list()
+    fittingJobs = list()
     eventInspectorStates = list()
     for dynamicMeasurement in dynamicMeasurements:
 
         reconstructFilenameLabelled = qtmTools.getFilename(dynamicMeasurement)
 
-        LOGGER.logger.info("----Processing of [%s]-----"%(reconstructFilenameLabelled))
         mfpa = qtmTools.getForcePlateAssigment(dynamicMeasurement)
         momentProjection_text = sessionXML.Moment_Projection.text
         if momentProjection_text == "Default":
@@ -229,7 +244,6 @@ def main(sessionFilename,createPDFReport=True,checkEventsInMokka=True,anomalyExc
 
 
 
-        acq = btkTools.smartReader(DATA_PATH+reconstructFilenameLabelled)
 
 
 
@@ -259,27 +273,22 @@ def main(sessionFilename,createPDFReport=True,checkEventsInMokka=True,anomalyExc
 
         # fitting operation
         # -----------------------
-        LOGGER.logger.info("[pyCGM2] --- Fitting operation ---")
-        acqGait,detectAnomaly = cgm2_5.fitting(model,DATA_PATH, reconstructFilenameLabelled,
-            translators,settings,
-            ik_flag,markerDiameter,
-            pointSuffix,
-            mfpa,
-            momentProjection,
-            fc_lowPass_marker=fc_marker,
-            order_lowPass_marker=order_marker,
-            fc_lowPass_forcePlate = fc_fp,
-            order_lowPass_forcePlate = order_fp,
-            anomalyException=anomalyException,
-            ikAccuracy = ikAccuracy,
-            frameInit= vff, frameEnd= vlf )
-
-
-        outFilename = reconstructFilenameLabelled
-        btkTools.smartWriter(acqGait, str(DATA_PATH + outFilename))
-        modelledC3ds.append(outFilename)
-
-        LOGGER.logger.info("----Processing of [%s]-----> DONE"%(reconstructFilenameLabelled))
+        fittingJobs.append({"DATA_PATH":DATA_PATH,
+            "reconstructFilenameLabelled":reconstructFilenameLabelled,
+            "fittingArgs":(translators,settings,ik_flag,markerDiameter,pointSuffix,mfpa,momentProjection),
+            "fittingOptions":dict(fc_lowPass_marker = fc_marker,
+                order_lowPass_marker = order_marker,
+                fc_lowPass_forcePlate = fc_fp,
+                order_lowPass_forcePlate = order_fp,
+                anomalyException = anomalyException,
+                ikAccuracy = ikAccuracy,
+                frameInit = vff,
+                frameEnd = vlf)})
+
+    detectAnomalies = parallel.runJobs(_fitting,fittingJobs,nJobs=nJobs,sharedObject=model)
+    for job,jobAnomaly in zip(fittingJobs,detectAnomalies):
+        detectAnomaly = jobAnomaly
+        modelledC3ds.append(job["reconstructFilenameLabelled"])
 
 
 
@@ -6,37 +6,107 @@ from pyCGM2.Tools import btkTools
 from pyCGM2 import enums
 
 
-class BasicEmgProcessingFilter(object):
+def _getAnalogArray(acq,labels):
+    """ stack analog values as a numpy.array(n,len(labels)) """
+    return np.stack([acq.GetAnalog(label).GetValues().ravel() for label in labels],axis=1)
+
+
+def _appendAnalogArray(acq,labels,values,desc=""):
+    for j,label in enumerate(labels):
+        btkTools.smartAppendAnalog(acq,label,np.ascontiguousarray(values[:,j:j+1]), desc= desc )
+
+
+class EmgProcessingFilter(object):
     """
+        Multi-channel emg processing: 50Hz removal, band-pass filtering, rectification and envelope.
 
+        All channels are processed as a single numpy.array(n,channels).
+        Only the requested outputs are appended to the acquisition:
+
+            - *HPF* : band-pass filtered signal ( label_HPF)
+            - *Rectify* : rectified signal ( label_Rectify)
+            - *Env* : envelope of the rectified signal ( label_Rectify_Env)
     """
 
-    def __init__(self,acq, labels):
+    OUTPUTS = ["HPF","Rectify","Env"]
+
+    def __init__(self,acq, labels, outputs=None):
+        """
+            :Parameters:
+                - `acq` (btkAcquisition) - a btk acquisition inctance
+                - `labels` (list of str) - emg channel labels
+                - `outputs` (list of str) - [optional] requested outputs ( HPF, Rectify, Env). All outputs if None
+        """
 
         self.m_acq = acq
         self.m_labels = labels
+        self.m_outputs = EmgProcessingFilter.OUTPUTS if outputs is None else outputs
+        for output in self.m_outputs:
+            if output not in EmgProcessingFilter.OUTPUTS:
+                raise Exception("[pyCGM2] emg output (%s) not recognized ( must be HPF, Rectify or Env)"%(output))
+
+        self.m_hpf_low = 20
+        self.m_hpf_up = 200
+        self.m_fc = 6.0
+        self.m_chunkSize = None
 
     def setHighPassFrequencies(self,low,up):
         self.m_hpf_up = up
         self.m_hpf_low = low
 
+    def setCutoffFrequency(self,fc):
+        self.m_fc = fc
+
+    def setChunkSize(self,chunkSize):
+        """
+            filter chunk by chunk in order to bound memory ( see `signal_processing.chunkedFiltfilt`)
+
+            :Parameters:
+                - `chunkSize` (int) - number of analog samples of a chunk. None means the whole recording
+        """
+        self.m_chunkSize = chunkSize
+
     def run(self):
         fa=self.m_acq.GetAnalogFrequency()
-        for label in self.m_labels:
-            values =  self.m_acq.GetAnalog(label).GetValues()
-            # stop 50hz
-            value50= signal_processing.remove50hz(values,fa)
-            # high pass and compensation with mean
-            hpLower = self.m_hpf_low
-            hpUpper = self.m_hpf_up
-            valuesHp =  signal_processing.highPass(value50,hpLower,hpUpper,fa)
+        values = _getAnalogArray(self.m_acq,self.m_labels)
+
+        # stop 50hz
+        values = signal_processing.remove50hz(values,fa,chunkSize=self.m_chunkSize)
+        # high pass and compensation with mean
+        values = signal_processing.highPass(values,self.m_hpf_low,self.m_hpf_up,fa,chunkSize=self.m_chunkSize)
+        values -= values.mean(axis=0)
 
-            valuesHp = valuesHp - valuesHp.mean()
+        if "HPF" in self.m_outputs:
+            _appendAnalogArray(self.m_acq,[label+"_HPF" for label in self.m_labels],values, desc= "high Pass filter")
 
-            btkTools.smartAppendAnalog(self.m_acq,label+"_HPF",valuesHp, desc= "high Pass filter" )
+        # rectification
+        values = np.abs(values,out=values)
+        if "Rectify" in self.m_outputs:
+            _appendAnalogArray(self.m_acq,[label+"_Rectify" for label in self.m_labels],values, desc= "rectify")
 
-            # rectification
-            btkTools.smartAppendAnalog(self.m_acq,label+"_Rectify",np.abs(valuesHp), desc= "rectify" )
+        if "Env" in self.m_outputs:
+            values = signal_processing.enveloppe(values, self.m_fc,fa,chunkSize=self.m_chunkSize)
+            _appendAnalogArray(self.m_acq,[label+"_Rectify_Env" for label in self.m_labels],values, desc= "fc("+str(self.m_fc)+")")
+
+
+class BasicEmgProcessingFilter(object):
+    """
+
+    """
+
+    def __init__(self,acq, labels):
+
+        self.m_acq = acq
+        self.m_labels = labels
+
+    def setHighPassFrequencies(self,low,up):
+        self.m_hpf_up = up
+        self.m_hpf_low = low
+
+    def run(self):
+        emgf = EmgProcessingFilter(self.m_acq,self.m_labels,outputs=["HPF","Rectify"])
+        emgf.setHighPassFrequencies(self.m_hpf_low,self.m_hpf_up)
+        emgf.run()
 
 
 
@@ -56,21 +126,9 @@ class EmgEnvelopProcessingFilter(object):
 
     def run(self):
         fa=self.m_acq.GetAnalogFrequency()
-        for label in self.m_labels:
-            values =  self.m_acq.GetAnalog(label).GetValues()
-            valuesFilt = signal_processing.enveloppe(values, self.m_fc,fa)
-            btkTools.smartAppendAnalog(self.m_acq,label+"_Env",valuesFilt, desc= "fc("+str(self.m_fc)+")")
-
-
-        # for analog in btk.Iterate(self.m_acq.GetAnalogs()):
-        #
-        #     for label in self.m_labels:
-        #         if analog.GetLabel()==label :
-        #
-        #             values =  analog.GetValues()
-        #             valuesFilt = signal_processing.enveloppe(values, self.m_fc,fa)
-        #
-        #             btkTools.smartAppendAnalog(self.m_acq,label+"_Env",valuesFilt, desc= "fc("+str(self.m_fc)+")")
+        values =  _getAnalogArray(self.m_acq,self.m_labels)
+        valuesFilt = signal_processing.enveloppe(values, self.m_fc,fa)
+        _appendAnalogArray(self.m_acq,[label+"_Env" for label in self.m_labels],valuesFilt, desc= "fc("+str(self.m_fc)+")")
 
 class EmgNormalisationProcessingFilter(object):
     """
@@ -136,10 +194,7 @@ class EmgNormalisationProcessingFilter(object):
         for contextIt in ["Left","Right"]:
             if (self.m_label,contextIt) in self.m_analysis.emgStats.data:
                 values = self.m_analysis.emgStats.data[self.m_label,contextIt]["values"]
-                valuesNorm = list()
-
-                for val in values:
-                    valuesNorm.append( val / self.m_threshold)
+                valuesNorm = np.asarray(values) / self.m_threshold
 
                 self.m_analysis.emgStats.data[self.m_label+"_Norm",contextIt] = {
                         'mean':np.mean(valuesNorm,axis=0),
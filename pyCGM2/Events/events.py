@@ -24,6 +24,7 @@ class ZeniProcedure(object):
         self.description = "Zeni (2008)"
         self.footStrikeOffset = 0
         self.footOffOffset = 0
+        self.m_progression = None
 
     def setFootStrikeOffset(self,value):
         self.footStrikeOffset = value
@@ -31,6 +32,12 @@ class ZeniProcedure(object):
     def setFootOffOffset(self,value):
         self.footOffOffset = value
 
+    def setProgression(self,progression):
+        """
+            Set precomputed outputs of a `ProgressionFrameFilter` ( keys: progressionAxis, forwardProgression, globalFrame)
+        """
+        self.m_progression = progression
+
     def detect(self,acq):
         """
         """
@@ -39,7 +46,7 @@ class ZeniProcedure(object):
 
         if btkTools.isPointsExist(acq,["LPSI","RPSI","LHEE","LTOE","RHEE","RTOE"]):
             pfp = progressionFrame.PelvisProgressionFrameProcedure()
-            pff = progressionFrame.ProgressionFrameFilter(acq,pfp)
+            pff = progressionFrame.ProgressionFrameFilter(acq,pfp,progression=self.m_progression)
             pff.compute()
             progressionAxis = pff.outputs["progressionAxis"]
             globalFrame = pff.outputs["globalFrame"]
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 import pyCGM2; LOGGER = pyCGM2.LOGGER
 import numpy as np
+from scipy import linalg, interpolate
 
 from pyCGM2.Tools import  btkTools
+from pyCGM2.Model import motion
 
 
 #-------- EVENT PROCEDURES  ----------
@@ -19,60 +21,101 @@ class LowDimensionalKalmanFilterProcedure(object):
 
 
     def _smooth(self,rawdata,tol=0.0025,sigR=1e-3,keepOriginal=True):
+        """
+            Low dimensional Kalman smoother
+
+            :Parameters:
+                - `rawdata` (numpy.array(n,p)) - marker coordinates. Missing values are nan
+                - `tol` (double) - fraction of the singular value spectrum dropped from the subspace
+                - `sigR` (double) - measurement noise variance
+                - `keepOriginal` (bool) - keep the observed values in the output
+
+            :Return:
+                - `y` (numpy.array(n,p)) - smoothed coordinates
+
+            .. note:: the state is the projection of the pose on the subspace of the
+                      `d` first principal components. The filter starts from the mean pose with a
+                      diffuse covariance, so the output is deterministic and the first frames have no transient.
+
+        """
+        nFrames = rawdata.shape[0]
+        observed = ~np.isnan(rawdata)
 
-    	X = rawdata[~np.isnan(rawdata).any(axis=1)]
+        X = rawdata[observed.all(axis=1)]
 
-    	m = np.mean(X,axis=0)
+        m = np.mean(X,axis=0)
 
-    	LOGGER.logger.debug('Computing SVD...')
+        LOGGER.logger.debug('Computing SVD...')
 
-    	U, S, V = np.linalg.svd(X - m)
+        U, S, V = np.linalg.svd(X - m,full_matrices=False)
 
-    	LOGGER.logger.debug('done')
+        LOGGER.logger.debug('done')
 
-    	d = np.nonzero(np.cumsum(S)/np.sum(S)>(1-tol))[0][0]
+        d = np.nonzero(np.cumsum(S)/np.sum(S)>(1-tol))[0][0]
+        Vd = V[0:d,:]
+        Id = np.eye(d)
 
-    	Q = np.dot(np.dot(V[0:d,:],np.diag(np.std(np.diff(X,axis=0),axis=0))),V[0:d,:].T)
+        Q = np.dot(Vd*np.std(np.diff(X,axis=0),axis=0),Vd.T)
 
-    	LOGGER.logger.debug('Forward Pass')
-    	state = []
-    	state_pred = []
-    	cov_pred = []
-    	cov = []
-    	cov.insert(0,1e12*np.eye(d))
-    	state.insert(0,np.random.normal(0.0,1.0,d))
-    	cov_pred.insert(0,1e12*np.eye(d))
-    	state_pred.insert(0,np.random.normal(0.0,1.0,d))
-    	for i in range(1,rawdata.shape[0]+1):
+        # projection of the observed coordinates on the subspace ( ie Ht.(z-H.m) ) of all frames
+        projections = np.dot(np.where(observed,rawdata-m,0.0),Vd.T)
+        complete = observed.all(axis=1)
 
-    		z =  rawdata[i-1,~np.isnan(rawdata[i-1,:])]
-    		H = np.diag(~np.isnan(rawdata[i-1,:]))
-    		H = H[~np.all(H == 0, axis=1)]
-    		Ht = np.dot(H,V[0:d,:].T)
+        # Ht.H only depends on the missing coordinates. Gaps span several frames, so it is computed once per pattern
+        gramMatrices = dict()
 
-    		R = sigR*np.eye(H.shape[0])
+        LOGGER.logger.debug('Forward Pass')
+        state = np.zeros((nFrames,d))
+        cov = np.zeros((nFrames,d,d))
+        cov_pred = np.zeros((nFrames,d,d))
 
-    		state_pred.insert(i,state[i-1])
-    		cov_pred.insert(i,cov[i-1] + Q)
+        statePrior = np.zeros(d)
+        covPrior = 1e12*Id
+        for i in range(0,nFrames):
+            Ppred = covPrior + Q
+            cov_pred[i] = Ppred
 
-    		K = np.dot(np.dot(cov_pred[i],Ht.T),np.linalg.inv(np.dot(np.dot(Ht,cov_pred[i]),Ht.T) + R))
+            if complete[i]:
+                # fast path : Ht.H = I, a single cholesky of (Ppred + sigR.I)
+                factor = linalg.cho_factor(Ppred + sigR*Id,check_finite=False)
+                state[i] = statePrior + linalg.cho_solve(factor,np.dot(Ppred,projections[i]-statePrior),check_finite=False)
+                P = sigR*linalg.cho_solve(factor,Ppred,check_finite=False)
+                cov[i] = 0.5*(P+P.T)
 
-    		state.insert(i,state_pred[i] + np.dot(K,(z - (np.dot(Ht,state_pred[i])+np.dot(H,m)))))
-    		cov.insert(i,np.dot(np.eye(d) - np.dot(K,Ht),cov_pred[i]))
+            elif not observed[i].any():
+                state[i] = statePrior
+                cov[i] = Ppred
 
-    	LOGGER.logger.debug('Backward Pass')
-    	y = np.zeros(rawdata.shape)
-    	y[-1,:] = np.dot(V[0:d,:].T,state[-1]) + m
-    	for i in range(len(state)-2,0,-1):
-    		state[i] =  state[i] + np.dot(np.dot(cov[i],np.linalg.inv(cov_pred[i])),(state[i+1] - state_pred[i+1]))
-    		cov[i] =  cov[i] + np.dot(np.dot(np.dot(cov[i],np.linalg.inv(cov_pred[i])),(cov[i+1] - cov_pred[i+1])),cov[i])
+            else:
+                key = observed[i].tobytes()
+                if key not in gramMatrices:
+                    Vmissing = Vd[:,~observed[i]]
+                    gramMatrices[key] = Id - np.dot(Vmissing,Vmissing.T)
+                G = gramMatrices[key]
 
-    		y[i-1,:] = np.dot(V[0:d,:].T,state[i]) + m
+                # information form : P = L.( I + Lt.G.L/sigR )^-1.Lt with Ppred = L.Lt
+                L = np.linalg.cholesky(Ppred)
+                factor = linalg.cho_factor(Id + np.dot(np.dot(L.T,G),L)/sigR,check_finite=False)
+                P = np.dot(L,linalg.cho_solve(factor,L.T,check_finite=False))
+                P = 0.5*(P+P.T)
+                state[i] = statePrior + np.dot(P,projections[i]-np.dot(G,statePrior))/sigR
+                cov[i] = P
 
-    	if (keepOriginal):
-    		y[~np.isnan(rawdata)] = rawdata[~np.isnan(rawdata)]
+            statePrior = state[i]
+            covPrior = cov[i]
 
-    	return y
+        LOGGER.logger.debug('Backward Pass')
+        # smoother gains ( cov[i].cov_pred[i+1]^-1 ) of all frames with a single batched solve
+        gains = np.swapaxes(np.linalg.solve(cov_pred[1:],cov[0:-1]),1,2)
+        for i in range(nFrames-2,-1,-1):
+            state[i] = state[i] + np.dot(gains[i],state[i+1] - state[i])
+
+        y = np.dot(state,Vd) + m
+
+        if (keepOriginal):
+            y[observed] = rawdata[observed]
+
+        return y
 
 
     def fill(self,acq):
@@ -123,6 +166,356 @@ class LowDimensionalKalmanFilterProcedure(object):
         return acq, filledMarkers
 
 
+def getGaps(visibility):
+    """
+        Get the gaps of a marker
+
+        :Parameters:
+            - `visibility` (numpy.array(n) of bool) - True if the marker is visible
+
+        :Return:
+            - `gaps` (list of tuple) - first frame index and last frame index + 1 of each gap
+    """
+    missing = np.concatenate(([False],~np.asarray(visibility,dtype=bool),[False])).astype(int)
+    changes = np.diff(missing)
+    return list(zip(np.nonzero(changes==1)[0].tolist(),np.nonzero(changes==-1)[0].tolist()))
+
+
+def getSegmentClusters(model):
+    """
+        Get the tracking markers of the segments of a model
+
+        :Parameters:
+            - `model` (pyCGM2.Model.model.Model) - a model instance
+
+        :Return:
+            - `clusters` (list of list of str) - tracking markers of each segment
+    """
+    clusters = list()
+    for seg in model.m_segmentCollection:
+        cluster = [label for label in seg.m_tracking_markers if label != ""]
+        if len(cluster)>1 and cluster not in clusters:
+            clusters.append(cluster)
+    return clusters
+
+
+def _edgeWeights(begin,end,nFrames):
+    # linear weights of the edge before and after the gap
+    if begin>0 and end<nFrames:
+        after = np.arange(1,end-begin+1)/float(end-begin+1)
+    elif begin>0:
+        after = np.zeros(end-begin)
+    else:
+        after = np.ones(end-begin)
+    return 1.0-after, after
+
+
+def _fillGaps(acq,fillGap):
+    """
+        Fill the marker gaps of an acquisition gap by gap
+
+        :Parameters:
+            - `acq` (btkAcquisition) - a btk acquisition inctance
+            - `fillGap` (function) - function called as `fillGap(values,visibility,labels,index,begin,end)`.
+              It returns the trajectory (numpy.array(end-begin,3)) or None if the gap cannot be filled
+
+        :Return:
+            - `filledMarkers` (list of str) - filled markers
+            - `values` (numpy.array(n,m,3)) - marker trajectories
+            - `visibility` (numpy.array(n,m) of bool) - visibility after filling
+            - `residuals` (numpy.array(n,m)) - residuals after filling
+            - `labels` (list of str) - marker labels
+
+        .. note:: trajectories are read from btk ( see `btkTools.getAcquisitionArrays`)
+    """
+    labels = btkTools.GetMarkerNames(acq)
+    nFrames = acq.GetPointFrameNumber()
+    values = np.zeros((nFrames,len(labels),3))
+    residuals = np.zeros((nFrames,len(labels)))
+    for j,label in enumerate(labels):
+        values[:,j,:] = acq.GetPoint(label).GetValues()
+        residuals[:,j] = acq.GetPoint(label).GetResiduals().reshape(nFrames)
+    visibility = residuals != -1
+
+    filledMarkers = list()
+    for j in range(0,len(labels)):
+        for begin,end in getGaps(visibility[:,j]):
+            trajectory = fillGap(values,visibility,labels,j,begin,end)
+            if trajectory is not None:
+                values[begin:end,j,:] = trajectory
+                visibility[begin:end,j] = True
+                residuals[begin:end,j] = 0.0
+                if labels[j] not in filledMarkers:
+                    filledMarkers.append(labels[j])
+
+    return filledMarkers,values,visibility,residuals,labels
+
+
+def _writeFilledMarkers(acq,filledMarkers,values,residuals,labels):
+    for label in filledMarkers:
+        j = labels.index(label)
+        LOGGER.logger.info("marker (%s) --> filled"%(label))
+        btkTools.smartAppendPoint(acq,label,values[:,j,:],residuals=residuals[:,j])
+
+
+class SplineGapFillingProcedure(object):
+    """
+        Cubic spline interpolation of short gaps
+    """
+
+    def __init__(self,maxGapLength=10,support=10):
+        """
+            :Parameters:
+                - `maxGapLength` (int) - longest gap ( in frames) filled
+                - `support` (int) - number of frames used on each side of the gap
+        """
+        self.description = "Cubic spline"
+        self.m_maxGapLength = maxGapLength
+        self.m_support = support
+
+    def fillGap(self,values,visibility,labels,index,begin,end):
+        """
+            Fill a gap
+
+            :Parameters:
+                - `values` (numpy.array(n,m,3)) - marker trajectories
+                - `visibility` (numpy.array(n,m) of bool) - marker visibility
+                - `labels` (list of str) - marker labels
+                - `index` (int) - index of the gap marker
+                - `begin` (int) - first frame index of the gap
+                - `end` (int) - last frame index of the gap + 1
+
+            :Return:
+                - `trajectory` (numpy.array(end-begin,3)) - None if the gap is not interior or too long
+        """
+        if end-begin > self.m_maxGapLength or begin == 0 or end == values.shape[0]:
+            return None
+
+        before = np.arange(max(0,begin-self.m_support),begin)
+        after = np.arange(end,min(values.shape[0],end+self.m_support))
+        before = before[visibility[before,index]]
+        after = after[visibility[after,index]]
+        if before.shape[0]<2 or after.shape[0]<2:
+            return None
+
+        frames = np.concatenate((before,after))
+        spline = interpolate.CubicSpline(frames,values[frames,index,:],axis=0)
+        return spline(np.arange(begin,end))
+
+    def fill(self,acq):
+        LOGGER.logger.info("----Spline gap filling----")
+        filledMarkers,values,visibility,residuals,labels = _fillGaps(acq,self.fillGap)
+        _writeFilledMarkers(acq,filledMarkers,values,residuals,labels)
+        LOGGER.logger.info("----Spline gap filling [complete]----")
+
+        return acq, filledMarkers
+
+
+class RigidBodyGapFillingProcedure(object):
+    """
+        Reconstruction of a marker from the other markers of its segment cluster
+
+        The rigid transformation of the cluster between a gap edge and each frame of the gap
+        moves the marker position of the edge. Both edges are blended linearly.
+    """
+
+    def __init__(self,model=None,clusters=None,minimumMarkers=3):
+        """
+            :Parameters:
+                - `model` (pyCGM2.Model.model.Model) - [optional] model. Clusters are the tracking markers of its segments
+                - `clusters` (list of list of str) - [optional] marker clusters
+                - `minimumMarkers` (int) - minimum number of visible cluster markers at each frame
+
+            .. note:: without model and clusters, the procedure fills nothing
+        """
+        self.description = "Rigid body"
+        self.m_clusters = list() if clusters is None else [list(cluster) for cluster in clusters]
+        if model is not None:
+            self.m_clusters+=getSegmentClusters(model)
+        self.m_minimumMarkers = minimumMarkers
+
+    def _getDonors(self,label):
+        donors = list()
+        for cluster in self.m_clusters:
+            if label in cluster:
+                donors+=[it for it in cluster if it != label and it not in donors]
+        return donors
+
+    def fillGap(self,values,visibility,labels,index,begin,end):
+        """
+            Fill a gap ( see `SplineGapFillingProcedure.fillGap`)
+
+            :Return:
+                - `trajectory` (numpy.array(end-begin,3)) - None if the cluster is not visible enough
+        """
+        nFrames = values.shape[0]
+        donors = [labels.index(label) for label in self._getDonors(labels[index]) if label in labels]
+        if len(donors)<self.m_minimumMarkers or (begin == 0 and end == nFrames):
+            return None
+
+        gapVisibility = visibility[begin:end][:,donors]
+        if np.any(gapVisibility.sum(axis=1)<self.m_minimumMarkers):
+            return None
+
+        weightBefore,weightAfter = _edgeWeights(begin,end,nFrames)
+
+        trajectory = np.zeros((end-begin,3))
+        for edge,weight in [(begin-1,weightBefore),(end,weightAfter)]:
+            if edge<0 or edge==nFrames or not weight.any():
+                continue
+            edgeVisibility = gapVisibility & visibility[edge,donors]
+            if np.any(edgeVisibility.sum(axis=1)<self.m_minimumMarkers):
+                return None
+            R,L,RMSE,Am,Bm = motion.segmentalLeastSquareArray(values[edge,donors,:],values[begin:end][:,donors,:],edgeVisibility)
+            trajectory+= weight[:,np.newaxis] * (np.einsum("nij,j->ni",R,values[edge,index,:]) + L)
+
+        return trajectory
+
+    def fill(self,acq):
+        LOGGER.logger.info("----Rigid body gap filling----")
+        filledMarkers,values,visibility,residuals,labels = _fillGaps(acq,self.fillGap)
+        _writeFilledMarkers(acq,filledMarkers,values,residuals,labels)
+        LOGGER.logger.info("----Rigid body gap filling [complete]----")
+
+        return acq, filledMarkers
+
+
+class PatternGapFillingProcedure(object):
+    """
+        Pattern filling : the gap follows the trajectory of a donor marker.
+
+        The donor is the marker visible during the gap whose offset with the gap marker
+        varies the least around the gap. The offset is interpolated linearly between the gap edges.
+    """
+
+    def __init__(self,donors=None,window=100):
+        """
+            :Parameters:
+                - `donors` (dict) - [optional] candidate donor labels of each marker. All markers are candidates if None
+                - `window` (int) - number of frames on each side of the gap used to select the donor
+        """
+        self.description = "Pattern"
+        self.m_donors = donors
+        self.m_window = window
+
+    def fillGap(self,values,visibility,labels,index,begin,end):
+        """
+            Fill a gap ( see `SplineGapFillingProcedure.fillGap`)
+
+            :Return:
+                - `trajectory` (numpy.array(end-begin,3)) - None if no donor is visible during the gap
+        """
+        nFrames = values.shape[0]
+        edges = [edge for edge in [begin-1,end] if edge>=0 and edge<nFrames]
+        if edges == []:
+            return None
+
+        if self.m_donors is not None and labels[index] in self.m_donors:
+            candidates = [labels.index(label) for label in self.m_donors[labels[index]] if label in labels]
+        else:
+            candidates = [j for j in range(0,len(labels)) if j != index]
+        candidates = np.array(candidates,dtype=int)
+        if candidates.shape[0] == 0:
+            return None
+        candidates = candidates[visibility[begin:end][:,candidates].all(axis=0) & visibility[edges][:,candidates].all(axis=0)]
+        if candidates.shape[0] == 0:
+            return None
+
+        # variance of the offset over the frames where both markers are visible
+        window = slice(max(0,begin-self.m_window),min(nFrames,end+self.m_window))
+        mask = (visibility[window][:,candidates] & visibility[window,index][:,np.newaxis])[:,:,np.newaxis]
+        offsets = values[window,index,:][:,np.newaxis,:] - values[window][:,candidates,:]
+        count = mask.sum(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = (offsets*mask).sum(axis=0)/count
+            variance = ((((offsets-mean)*mask)**2).sum(axis=0)/count).sum(axis=1)
+        variance[count[:,0]<2] = np.inf
+        if np.all(np.isinf(variance)):
+            return None
+        donor = candidates[np.argmin(variance)]
+
+        weightBefore,weightAfter = _edgeWeights(begin,end,nFrames)
+        offset = np.zeros((end-begin,3))
+        for edge,weight in [(begin-1,weightBefore),(end,weightAfter)]:
+            if edge in edges:
+                offset+= weight[:,np.newaxis] * (values[edge,index,:] - values[edge,donor,:])
+
+        return values[begin:end,donor,:] + offset
+
+    def fill(self,acq):
+        LOGGER.logger.info("----Pattern gap filling----")
+        filledMarkers,values,visibility,residuals,labels = _fillGaps(acq,self.fillGap)
+        _writeFilledMarkers(acq,filledMarkers,values,residuals,labels)
+        LOGGER.logger.info("----Pattern gap filling [complete]----")
+
+        return acq, filledMarkers
+
+
+class AutomaticGapFillingProcedure(object):
+    """
+        Fill each gap with the cheapest valid procedure
+
+        Gaps are tried in order with the spline, the rigid body and the pattern procedures.
+        The remaining gaps are filled by the low dimensional Kalman smoother.
+    """
+
+    def __init__(self,model=None,clusters=None,maxSplineGapLength=10,kalmanFallback=True):
+        """
+            :Parameters:
+                - `model` (pyCGM2.Model.model.Model) - [optional] model defining the rigid body clusters
+                - `clusters` (list of list of str) - [optional] rigid body clusters
+                - `maxSplineGapLength` (int) - longest gap ( in frames) filled by spline interpolation
+                - `kalmanFallback` (bool) - fill the remaining gaps with the low dimensional Kalman smoother
+        """
+        self.description = "Automatic"
+        self.m_procedures = [SplineGapFillingProcedure(maxGapLength=maxSplineGapLength),
+                             RigidBodyGapFillingProcedure(model=model,clusters=clusters),
+                             PatternGapFillingProcedure()]
+        self.m_kalmanFallback = kalmanFallback
+
+    def setProcedures(self,procedures):
+        """
+            Set the procedures tried on each gap
+
+            :Parameters:
+                - `procedures` (list) - gap filling procedures with a `fillGap` method, from the cheapest
+        """
+        self.m_procedures = procedures
+
+    def fillGap(self,values,visibility,labels,index,begin,end):
+        """
+            Fill a gap ( see `SplineGapFillingProcedure.fillGap`)
+        """
+        for procedure in self.m_procedures:
+            trajectory = procedure.fillGap(values,visibility,labels,index,begin,end)
+            if trajectory is not None:
+                LOGGER.logger.debug("marker (%s) - frames [%i,%i[ filled with %s"%(labels[index],begin,end,procedure.description))
+                return trajectory
+        return None
+
+    def fill(self,acq):
+        LOGGER.logger.info("----Automatic gap filling----")
+        filledMarkers,values,visibility,residuals,labels = _fillGaps(acq,self.fillGap)
+
+        missing = ~visibility
+        columns = np.nonzero(~missing.all(axis=0))[0]
+        if self.m_kalmanFallback and missing[:,columns].any() and visibility[:,columns].all(axis=1).sum()>1:
+            LOGGER.logger.info("low dimensional Kalman smoother on %i remaining frames"%(missing[:,columns].any(axis=1).sum()))
+            rawdata = np.where(visibility[:,columns,np.newaxis],values[:,columns,:],np.nan).reshape((values.shape[0],-1))
+            smoothed = LowDimensionalKalmanFilterProcedure()._smooth(rawdata,tol=1e-2,sigR=1e-3,keepOriginal=True)
+            values[:,columns,:] = smoothed.reshape((values.shape[0],columns.shape[0],3))
+            for j in columns:
+                if missing[:,j].any():
+                    residuals[missing[:,j],j] = 0.0
+                    if labels[j] not in filledMarkers:
+                        filledMarkers.append(labels[j])
+
+        _writeFilledMarkers(acq,filledMarkers,values,residuals,labels)
+        LOGGER.logger.info("----Automatic gap filling [complete]----")
+
+        return acq, filledMarkers
+
+
 class GapFillingFilter(object):
     """
 
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 import numpy as np
-from matplotlib.path import Path
 import pyCGM2; LOGGER = pyCGM2.LOGGER
 
 try:
@@ -225,24 +224,27 @@ class SwappingMarkerQualityProcedure(object):
     def check(self):
 
         ff = self.acq.GetFirstFrame()
-        frameNumber = self.acq.GetPointFrameNumber()
-        freq = self.acq.GetPointFrequency()
 
-        for marker in self.markers:
-            markerList = list(self.markers)
-            markerList.remove(marker)
-            nearest,dist = btkTools.findNearestMarker(self.acq,1,marker,markerNames = markerList)
-            values = self.acq.GetPoint(marker).GetValues()
-            norms = np.linalg.norm(values,axis =1)
+        # nearest marker of all markers with a single KD-tree
+        nearests,dists = btkTools.findNearestMarkers(self.acq,1,markerNames = self.markers)
+
+        arrays = btkTools.getAcquisitionArrays(self.acq,self.markers)
+        norms = np.linalg.norm(arrays.getValues(self.markers),axis =2)
+        residuals = arrays.getResiduals(self.markers)
+
+        if self.plot:
+            changes = [detect_changes.detect_cusum(norms[:,j], dists[j], dists[j]/2.0, True, self.plot) for j in range(0,len(self.markers))]
+        else:
+            changes = detect_changes.detect_cusum_array(norms, dists, dists/2.0, True)
 
-            ta, tai, taf, amp = detect_changes.detect_cusum(norms, dist, dist/2.0, True, self.plot)
+        for j,marker in enumerate(self.markers):
+            ta, tai, taf, amp = changes[j]
 
             if ta.size != 0:
                 for index in tai:
-                    residual = self.acq.GetPoint(marker).GetResidual(int(index))
-                    if residual>=0.0:
+                    if residuals[int(index),j]>=0.0:
                         frame = index+ff
-                        LOGGER.logger.warning("[pyCGM2-Checking] marker [%s] - swapped at frame [%i] (nearest marker= %s - dist=%.2f) "%(marker,frame,nearest,dist))
+                        LOGGER.logger.warning("[pyCGM2-Checking] marker [%s] - swapped at frame [%i] (nearest marker= %s - dist=%.2f) "%(marker,frame,nearests[j],dists[j]))
 
 
 class MarkerPositionQualityProcedure(object):
@@ -264,93 +266,56 @@ class MarkerPositionQualityProcedure(object):
 
         frameNumber = self.acq.GetPointFrameNumber()
 
-
-        LASI_values = self.acq.GetPoint("LASI").GetValues()
-        RASI_values = self.acq.GetPoint("RASI").GetValues()
-        LPSI_values = self.acq.GetPoint("LPSI").GetValues()
-        RPSI_values = self.acq.GetPoint("RPSI").GetValues()
-        sacrum_values=(self.acq.GetPoint("LPSI").GetValues() + self.acq.GetPoint("RPSI").GetValues()) / 2.0
-        midAsis_values=(self.acq.GetPoint("LASI").GetValues() + self.acq.GetPoint("RASI").GetValues()) / 2.0
-
+        arrays = btkTools.getAcquisitionArrays(self.acq,["LASI","RASI","LPSI","RPSI"]+self.markers)
+        LASI_values,RASI_values,LPSI_values,RPSI_values = np.swapaxes(arrays.getValues(["LASI","RASI","LPSI","RPSI"]),0,1)
+        sacrum_values=(LPSI_values + RPSI_values) / 2.0
 
         projectedLASI = np.array([LASI_values[:,0],LASI_values[:,1],np.zeros((frameNumber))]).T
         projectedRASI = np.array([RASI_values[:,0],RASI_values[:,1],np.zeros((frameNumber))]).T
         projectedLPSI = np.array([LPSI_values[:,0],LPSI_values[:,1],np.zeros((frameNumber))]).T
         projectedRPSI = np.array([RPSI_values[:,0],RPSI_values[:,1],np.zeros((frameNumber))]).T
 
-
-        for i  in range(0,frameNumber):
-            verts = [
-                projectedLASI[i,0:2], # left, bottom
-                projectedRASI[i,0:2], # left, top
-                projectedRPSI[i,0:2], # right, top
-                projectedLPSI[i,0:2], # right, bottom
-                projectedLASI[i,0:2], # right, top
-                ]
-
-            codes = [Path.MOVETO,
-                     Path.LINETO,
-                     Path.LINETO,
-                     Path.LINETO,
-                     Path.CLOSEPOLY,
-                     ]
-
-            path = Path(verts, codes)
-
-            intersection = geometry.LineLineIntersect(projectedLASI[i,:],projectedLPSI[i,:],projectedRASI[i,:],projectedRPSI[i,:])
-
-
-            if path.contains_point(intersection[0]):
+        # crossed pelvic quadrilateral : the intersection of the lateral lines lies inside
+        verts = np.stack((projectedLASI[:,0:2],projectedRASI[:,0:2],projectedRPSI[:,0:2],projectedLPSI[:,0:2]),axis=1)
+        intersection = geometry.LineLineIntersectArray(projectedLASI,projectedLPSI,projectedRASI,projectedRPSI)
+        wrongPelvis = geometry.pointsInPolygon(intersection[0][:,0:2],verts)
+
+        # check marker side : lateral coordinate of all markers in the pelvic frames
+        with np.errstate(divide='ignore', invalid='ignore'):
+            a1=(LASI_values-RASI_values)
+            a1=np.divide(a1,np.linalg.norm(a1,axis=1)[:,np.newaxis])
+            v=(sacrum_values-RASI_values)
+            v=np.divide(v,np.linalg.norm(v,axis=1)[:,np.newaxis])
+            a2=np.cross(a1,v)
+            a2=np.divide(a2,np.linalg.norm(a2,axis=1)[:,np.newaxis])
+
+        x,y,z,R=frame.setFrameDataArray(a1,a2,"YZX")
+
+        values = arrays.getValues(self.markers)
+        residuals = arrays.getResiduals(self.markers)
+        sides = np.array([marker[0] for marker in self.markers])
+
+        # the left markers are expressed from RASI and the right markers from LASI
+        origins = np.where((sides == "L")[np.newaxis,:,np.newaxis],RASI_values[:,np.newaxis,:],LASI_values[:,np.newaxis,:])
+        with np.errstate(invalid='ignore'):
+            lateral = np.einsum("ni,nmi->nm",y,values-origins)
+            wrongSide = ((sides == "L") & (lateral<0)) | ((sides == "R") & (lateral>0))
+        wrongSide = wrongSide & (residuals>0.0) & ~wrongPelvis[:,np.newaxis]
+
+        for i in np.nonzero(wrongPelvis | wrongSide.any(axis=1))[0]:
+            if wrongPelvis[i]:
                 LOGGER.logger.error("[pyCGM2-Checking] wrong Labelling of pelvic markers at frame [%i]"%(i))
                 if self.exceptionMode:
                     raise Exception("[pyCGM2-Checking] wrong Labelling of pelvic markers at frame [%i]"%(i))
 
                 self.state = False
             else:
-                # check marker side
-                pt1=RASI_values[i,:]
-                pt2=LASI_values[i,:]
-                pt3=sacrum_values[i,:]
-                ptOrigin=midAsis_values[i,:]
-
-                a1=(pt2-pt1)
-                a1=np.divide(a1,np.linalg.norm(a1))
-                v=(pt3-pt1)
-                v=np.divide(v,np.linalg.norm(v))
-                a2=np.cross(a1,v)
-                a2=np.divide(a2,np.linalg.norm(a2))
-
-                x,y,z,R=frame.setFrameData(a1,a2,"YZX")
-
-                csFrame_L=frame.Frame()
-                csFrame_L.setRotation(R)
-                csFrame_L.setTranslation(RASI_values[i,:])
-
-                csFrame_R=frame.Frame()
-                csFrame_R.setRotation(R)
-                csFrame_R.setTranslation(LASI_values[i,:])
-
-
-                for marker in self.markers:
-                    residual = self.acq.GetPoint(marker).GetResidual(i)
-
-                    if marker[0] == "L":
-                        local = np.dot(csFrame_L.getRotation().T,self.acq.GetPoint(marker).GetValues()[i,:]-csFrame_L.getTranslation())
-                    if marker[0] == "R":
-                        local = np.dot(csFrame_R.getRotation().T,self.acq.GetPoint(marker).GetValues()[i,:]-csFrame_R.getTranslation())
-                    if residual >0.0:
-                        if marker[0] == "L" and local[1]<0:
-                            LOGGER.logger.error("[pyCGM2-Checking] check location of the marker [%s] at frame [%i]"%(marker,i))
-                            self.state = False
-                            if self.exceptionMode:
-                                raise Exception("[pyCGM2-Checking] check location of the marker [%s] at frame [%i]"%(marker,i))
-
-                        if marker[0] == "R" and local[1]>0:
-                            LOGGER.logger.error("[pyCGM2-Checking] check location of the marker [%s] at frame [%i]"%(marker,i))
-                            self.state = False
-                            if self.exceptionMode:
-                                raise Exception("[pyCGM2-Checking] check location of the marker [%s] at frame [%i]"%(marker,i))
-                                self.state = False
+                for j in np.nonzero(wrongSide[i])[0]:
+                    marker = self.markers[j]
+                    LOGGER.logger.error("[pyCGM2-Checking] check location of the marker [%s] at frame [%i]"%(marker,i))
+                    self.state = False
+                    if self.exceptionMode:
+                        raise Exception("[pyCGM2-Checking] check location of the marker [%s] at frame [%i]"%(marker,i))
 
 
 class ForcePlateQualityProcedure(object):
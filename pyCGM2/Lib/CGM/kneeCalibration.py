@@ -22,40 +22,12 @@ def detectSide(acq,left_markerLabel,right_markerLabel):
 
     return side
 
-def calibration2Dof(model, DATA_PATH, reconstructFilenameLabelled, translators,
-    side, beginFrame, endFrame, jointRange,
-    **kwargs):
-
-    # --- btk acquisition ----
-    if "forceBtkAcq" in kwargs.keys():
-        acqFunc = kwargs["forceBtkAcq"]
-    else:
-        acqFunc = btkTools.smartReader((DATA_PATH + reconstructFilenameLabelled))
-
-
-    btkTools.checkMultipleSubject(acqFunc)
-    acqFunc =  btkTools.applyTranslators(acqFunc,translators)
-
-    # filtering
-    # -----------------------
-    if "fc_lowPass_marker" in kwargs.keys() and kwargs["fc_lowPass_marker"]!=0 :
-        trackingMarkers = model.getTrackingMarkers(acqFunc)
-        fc = kwargs["fc_lowPass_marker"]
-        order = 4
-        if "order_lowPass_marker" in kwargs.keys():
-            order = kwargs["order_lowPass_marker"]
-        signal_processing.markerFiltering(acqFunc,trackingMarkers,order=order, fc =fc)
-
-    #---get frame range of interest---
-    ff = acqFunc.GetFirstFrame()
-    lf = acqFunc.GetLastFrame()
+def _getFrameRange(acq,side,beginFrame,endFrame):
+    # frame indexes of the motion of a side, from events or from the inputed frames
+    ff = acq.GetFirstFrame()
+    lf = acq.GetLastFrame()
 
-    # motion
-    if side is None:
-        side = detectSide(acqFunc,"LANK","RANK")
-        LOGGER.logger.info("Detected motion side : %s" %(side) )
-
-    start,end = btkTools.getStartEndEvents(acqFunc,side)
+    start,end = btkTools.getStartEndEvents(acq,side)
 
     if start is not None:
         LOGGER.logger.info("Start event detected")
@@ -69,83 +41,291 @@ def calibration2Dof(model, DATA_PATH, reconstructFilenameLabelled, translators,
     else:
         endFrame = endFrame if endFrame is not None else lf
 
-    iff=initFrame-ff
-    ilf=endFrame-ff
-
-
-
-    if model.version in  ["CGM1.0","CGM1.1","CGM2.1","CGM2.2"]:
-        validFrames,vff,vlf = btkTools.findValidFrames(acqFunc,cgm.CGM1.LOWERLIMB_TRACKING_MARKERS)
-
-    # --------------------------RESET OF THE STATIC File---------
-    # load btkAcq from static file
-    staticFilename = model.m_staticFilename
-    acqStatic = btkTools.smartReader((DATA_PATH+staticFilename))
-    btkTools.checkMultipleSubject(acqStatic)
-    acqStatic =  btkTools.applyTranslators(acqStatic,translators)
-
-    # initial calibration ( i.e calibration from Calibration operation)
-    leftFlatFoot = model.m_properties["CalibrationParameters"]["leftFlatFoot"]
-    rightFlatFoot = model.m_properties["CalibrationParameters"]["rightFlatFoot"]
-    headFlat = model.m_properties["CalibrationParameters"]["headFlat"]
-
-    markerDiameter = model.m_properties["CalibrationParameters"]["markerDiameter"]
-
-    if side == "Left":
-        # remove other functional calibration
-        model.mp_computed["LeftKneeFuncCalibrationOffset"] = 0
-
-    if side == "Right":
-        # remove other functional calibration
-        model.mp_computed["RightKneeFuncCalibrationOffset"] = 0
+    return initFrame-ff, endFrame-ff
 
-    # no rotation on both thigh - re init anatonical frame
-    scp=modelFilters.StaticCalibrationProcedure(model)
-    modelFilters.ModelCalibrationFilter(scp,acqStatic,model,
-                           leftFlatFoot = leftFlatFoot, rightFlatFoot = rightFlatFoot,
-                           headFlat = headFlat,
-                           markerDiameter=markerDiameter).compute()
+
+class FunctionalCalibrationSession(object):
+    """
+        Functional calibrations of a model sharing the static and the functional acquisitions.
+
+        The static acquisition is read and translated once. Each functional acquisition is read, translated and
+        filtered once, whatever the number of calibrations run on it. The static calibration of the model is only
+        computed again once a calibration has altered the model.
+
+        :Parameters:
+            - `model` (pyCGM2.Model.CGM2.cgm.CGM) - a calibrated CGM instance
+            - `DATA_PATH` (str) - folder of the c3d files
+            - `translators` (dict) - marker translators
+            - `fc_lowPass_marker` (double) - [optional] cut-off frequency of the marker low-pass filter. 0 for no filtering
+            - `order_lowPass_marker` (int) - [optional] order of the marker low-pass filter
+            - `forceBtkAcqStatic` (btkAcquisition) - [optional] static acquisition used instead of the static c3d of the model
+
+        .. note:: `side` of the calibration methods is *Left*, *Right*, *both* or None ( side detected from the
+                  ankle markers). Both sides are calibrated from the same motion computation.
+
+    """
+
+    def __init__(self,model,DATA_PATH,translators,fc_lowPass_marker=0,order_lowPass_marker=4,forceBtkAcqStatic=None):
+
+        self.m_model = model
+        self.m_dataPath = DATA_PATH
+        self.m_translators = translators
+        self.m_fc = fc_lowPass_marker
+        self.m_order = order_lowPass_marker
+
+        # functional acquisitions
+        self.m_acquisitions = dict()
+
+        # static acquisition
+        if forceBtkAcqStatic is not None:
+            acqStatic = forceBtkAcqStatic
+        else:
+            acqStatic = btkTools.smartReader((DATA_PATH+model.m_staticFilename))
+        btkTools.checkMultipleSubject(acqStatic)
+        self.m_acqStatic =  btkTools.applyTranslators(acqStatic,translators)
+
+        self.m_calibrationParameters = {
+            "leftFlatFoot" : model.m_properties["CalibrationParameters"]["leftFlatFoot"],
+            "rightFlatFoot" : model.m_properties["CalibrationParameters"]["rightFlatFoot"],
+            "headFlat" : model.m_properties["CalibrationParameters"]["headFlat"],
+            "markerDiameter" : model.m_properties["CalibrationParameters"]["markerDiameter"]}
+
+        self.m_scp = modelFilters.StaticCalibrationProcedure(model)
+        self.m_calibrated = False
+
+    def getAcquisition(self,reconstructFilenameLabelled,forceBtkAcq=None,fc_lowPass_marker=None,order_lowPass_marker=None):
+        """
+            Get a translated and filtered functional acquisition
+
+            :Parameters:
+                - `reconstructFilenameLabelled` (str) - filename of the functional c3d
+                - `forceBtkAcq` (btkAcquisition) - [optional] acquisition used instead of the c3d
+                - `fc_lowPass_marker` (double) - [optional] cut-off frequency of the marker low-pass filter. Session value if None
+                - `order_lowPass_marker` (int) - [optional] order of the marker low-pass filter. Session value if None
+
+            .. note:: acquisitions are cached by filename, or by instance if `forceBtkAcq` is given.
+                      A cached acquisition cannot be requested again with other filter settings.
+        """
+        fc = self.m_fc if fc_lowPass_marker is None else fc_lowPass_marker
+        order = self.m_order if order_lowPass_marker is None else order_lowPass_marker
+        filterSettings = (fc,order) if fc is not None and fc!=0 else None
+
+        key = reconstructFilenameLabelled if forceBtkAcq is None else id(forceBtkAcq)
+
+        if key not in self.m_acquisitions:
+            if forceBtkAcq is not None:
+                acqFunc = forceBtkAcq
+            else:
+                acqFunc = btkTools.smartReader((self.m_dataPath + reconstructFilenameLabelled))
+
+            btkTools.checkMultipleSubject(acqFunc)
+            acqFunc =  btkTools.applyTranslators(acqFunc,self.m_translators)
+
+            # filtering
+            if filterSettings is not None:
+                trackingMarkers = self.m_model.getTrackingMarkers(acqFunc)
+                signal_processing.markerFiltering(acqFunc,trackingMarkers,order=order, fc =fc)
+
+            # the forced acquisition is kept in the entry, its id cannot be reused
+            self.m_acquisitions[key] = (forceBtkAcq,acqFunc,filterSettings)
+
+        elif self.m_acquisitions[key][2] != filterSettings:
+            raise Exception("[pyCGM2] functional acquisition (%s) already filtered with other settings" %(reconstructFilenameLabelled))
+
+        return self.m_acquisitions[key][1]
+
+    def calibrate(self):
+        """
+            Static calibration of the model, only if the model has been altered since the last calibration
+        """
+        if not self.m_calibrated:
+            modelFilters.ModelCalibrationFilter(self.m_scp,self.m_acqStatic,self.m_model,
+                                   **self.m_calibrationParameters).compute()
+            self.m_calibrated = True
+
+    def finalize(self):
+        """
+            Final static calibration of the model
+
+            :Return:
+                - `model` (pyCGM2.Model.CGM2.cgm.CGM) - the calibrated model
+        """
+        self.calibrate()
+        return self.m_model
+
+    def _getSides(self,acqFunc,side):
+        if side is None:
+            side = detectSide(acqFunc,"LANK","RANK")
+            LOGGER.logger.info("Detected motion side : %s" %(side) )
+
+        sides = ["Left","Right"] if side == "both" else [side]
+        return side,sides
+
+    def _resetKneeOffsets(self,sides):
+        # remove other functional calibration of the knee
+        for side in sides:
+            label = side+"KneeFuncCalibrationOffset"
+            if label not in self.m_model.mp_computed or self.m_model.mp_computed[label] != 0:
+                self.m_model.mp_computed[label] = 0
+                self.m_calibrated = False
+
+    def _segmentalMotion(self,acqFunc,segmentLabels):
+        modMotion=modelFilters.ModelMotionFilter(self.m_scp,acqFunc,self.m_model,enums.motionMethod.Sodervisk)
+        modMotion.segmentalCompute(segmentLabels)
+
+    def calibration2Dof(self,reconstructFilenameLabelled,side,beginFrame,endFrame,jointRange,forceBtkAcq=None,fc_lowPass_marker=None,order_lowPass_marker=None):
+        """
+            Knee functional calibration from the 2Dof method
+
+            :Parameters:
+                - `reconstructFilenameLabelled` (str) - filename of the functional c3d
+                - `side` (str) - lower limb side
+                - `beginFrame` (int) - first frame. Ignored if a start event exists
+                - `endFrame` (int) - last frame. Ignored if an end event exists
+                - `jointRange` (list of double) - flexion range in degree of the frames used
+                - `forceBtkAcq` (btkAcquisition) - [optional] acquisition used instead of the c3d
+                - `fc_lowPass_marker` (double) - [optional] cut-off frequency of the marker low-pass filter. Session value if None
+                - `order_lowPass_marker` (int) - [optional] order of the marker low-pass filter. Session value if None
+
+            :Return:
+                - `acqFunc` (btkAcquisition) - the functional acquisition
+                - `side` (str) - the calibrated side
+        """
+        acqFunc = self.getAcquisition(reconstructFilenameLabelled,forceBtkAcq=forceBtkAcq,
+                                      fc_lowPass_marker=fc_lowPass_marker,order_lowPass_marker=order_lowPass_marker)
+        side,sides = self._getSides(acqFunc,side)
+
+        # no rotation on both thigh - re init anatonical frame
+        self._resetKneeOffsets(sides)
+        self.calibrate()
+
+        if self.m_model.version in  ["CGM1.0","CGM1.1","CGM2.1","CGM2.2"]:
+            modMotion=modelFilters.ModelMotionFilter(self.m_scp,acqFunc,self.m_model,enums.motionMethod.Determinist)
+            modMotion.compute()
+
+        elif self.m_model.version in  ["CGM2.3","CGM2.4","CGM2.5"]:
+            segmentLabels = list()
+            for it in sides:
+                segmentLabels += [it+" Thigh",it+" Shank"]
+            self._segmentalMotion(acqFunc,segmentLabels)
+
+        # calibration decorators
+        for it in sides:
+            iff,ilf = _getFrameRange(acqFunc,it,beginFrame,endFrame)
+            modelDecorator.KneeCalibrationDecorator(self.m_model).calibrate2dof(it,
+                                                                indexFirstFrame = iff,
+                                                                indexLastFrame = ilf,
+                                                                jointRange =  jointRange)
+        self.m_calibrated = False
+
+        return acqFunc,side
+
+    def sara(self,reconstructFilenameLabelled,side,beginFrame,endFrame,forceBtkAcq=None,fc_lowPass_marker=None,order_lowPass_marker=None):
+        """
+            Knee functional calibration from the SARA method
+
+            :Parameters:
+                - `reconstructFilenameLabelled` (str) - filename of the functional c3d
+                - `side` (str) - lower limb side
+                - `beginFrame` (int) - first frame. Ignored if a start event exists
+                - `endFrame` (int) - last frame. Ignored if an end event exists
+                - `forceBtkAcq` (btkAcquisition) - [optional] acquisition used instead of the c3d
+                - `fc_lowPass_marker` (double) - [optional] cut-off frequency of the marker low-pass filter. Session value if None
+                - `order_lowPass_marker` (int) - [optional] order of the marker low-pass filter. Session value if None
+
+            :Return:
+                - `acqFunc` (btkAcquisition) - the functional acquisition
+                - `side` (str) - the calibrated side
+        """
+        acqFunc = self.getAcquisition(reconstructFilenameLabelled,forceBtkAcq=forceBtkAcq,
+                                      fc_lowPass_marker=fc_lowPass_marker,order_lowPass_marker=order_lowPass_marker)
+        side,sides = self._getSides(acqFunc,side)
+
+        # initial calibration ( zero previous KneeFunc offset on considered side )
+        self._resetKneeOffsets(sides)
+        self.calibrate()
+
+        if self.m_model.version in  ["CGM2.3","CGM2.4","CGM2.5"]:
+            segmentLabels = list()
+            for it in sides:
+                segmentLabels += [it+" Thigh",it+" Shank"]
+            self._segmentalMotion(acqFunc,segmentLabels)
+
+            for it in sides:
+                iff,ilf = _getFrameRange(acqFunc,it,beginFrame,endFrame)
+                modelDecorator.KneeCalibrationDecorator(self.m_model).sara(it,
+                                                                indexFirstFrame = iff,
+                                                                indexLastFrame = ilf )
+            self.m_calibrated = False
+
+        return acqFunc,side
+
+    def hipScore(self,reconstructFilenameLabelled,side,beginFrame,endFrame,forceBtkAcq=None,fc_lowPass_marker=None,order_lowPass_marker=None):
+        """
+            Hip joint centre from the SCoRE method
+
+            :Parameters:
+                - `reconstructFilenameLabelled` (str) - filename of the functional c3d
+                - `side` (str) - lower limb side
+                - `beginFrame` (int) - first frame. Ignored if a start event exists
+                - `endFrame` (int) - last frame. Ignored if an end event exists
+                - `forceBtkAcq` (btkAcquisition) - [optional] acquisition used instead of the c3d
+                - `fc_lowPass_marker` (double) - [optional] cut-off frequency of the marker low-pass filter. Session value if None
+                - `order_lowPass_marker` (int) - [optional] order of the marker low-pass filter. Session value if None
+
+            :Return:
+                - `acqFunc` (btkAcquisition) - the functional acquisition
+                - `side` (str) - the calibrated side
+
+            .. warning :: only for the CGM2.3 and later. The thigh technical frame of former CGM versions depends on the hip joint centre.
+        """
+        if self.m_model.version not in  ["CGM2.3","CGM2.4","CGM2.5"]:
+            raise Exception("[pyCGM2] SCoRE calibration of the hip not available for the model version %s" %(self.m_model.version))
+
+        acqFunc = self.getAcquisition(reconstructFilenameLabelled,forceBtkAcq=forceBtkAcq,
+                                      fc_lowPass_marker=fc_lowPass_marker,order_lowPass_marker=order_lowPass_marker)
+        side,sides = self._getSides(acqFunc,side)
+
+        self.calibrate()
+        self._segmentalMotion(acqFunc,["Pelvis"]+[it+" Thigh" for it in sides])
+
+        for it in sides:
+            iff,ilf = _getFrameRange(acqFunc,it,beginFrame,endFrame)
+            modelDecorator.HipJointCenterDecorator(self.m_model).score(it,
+                                                                indexFirstFrame = iff,
+                                                                indexLastFrame = ilf )
+        self.m_calibrated = False
+
+        return acqFunc,side
 
 
-    if model.version in  ["CGM1.0","CGM1.1","CGM2.1","CGM2.2"]:
-
-        modMotion=modelFilters.ModelMotionFilter(scp,acqFunc,model,enums.motionMethod.Determinist)
-        modMotion.compute()
-
-    elif model.version in  ["CGM2.3","CGM2.4","CGM2.5"]:
-        if side == "Left":
-            thigh_markers = model.getSegment("Left Thigh").m_tracking_markers
-            shank_markers = model.getSegment("Left Shank").m_tracking_markers
-
-        elif side == "Right":
-            thigh_markers = model.getSegment("Right Thigh").m_tracking_markers
-            shank_markers = model.getSegment("Right Shank").m_tracking_markers
-
-        validFrames,vff,vlf = btkTools.findValidFrames(acqFunc,thigh_markers+shank_markers)
-
-        proximalSegmentLabel=(side+" Thigh")
-        distalSegmentLabel=(side+" Shank")
-
-        # Motion
-        modMotion=modelFilters.ModelMotionFilter(scp,acqFunc,model,enums.motionMethod.Sodervisk)
-        modMotion.segmentalCompute([proximalSegmentLabel,distalSegmentLabel])
-
-
-    # calibration decorators
-    modelDecorator.KneeCalibrationDecorator(model).calibrate2dof(side,
-                                                        indexFirstFrame = iff,
-                                                        indexLastFrame = ilf,
-                                                        jointRange =  jointRange)
-
+def calibration2Dof(model, DATA_PATH, reconstructFilenameLabelled, translators,
+    side, beginFrame, endFrame, jointRange,
+    **kwargs):
+    """
+        2Dof knee functional calibration
+
+        .. note:: a single calibration reads the static c3d and calibrates the model twice. Use a
+                  `FunctionalCalibrationSession`, or the keyword argument `session`, to share them between calibrations.
+                  The model is not finally calibrated if a session is given ( see `FunctionalCalibrationSession.finalize`).
+    """
+    fc = kwargs["fc_lowPass_marker"] if "fc_lowPass_marker" in kwargs.keys() else None
+    order = kwargs["order_lowPass_marker"] if "order_lowPass_marker" in kwargs.keys() else None
+    acq = kwargs["forceBtkAcq"] if "forceBtkAcq" in kwargs.keys() else None
+    session = kwargs["session"] if "session" in kwargs.keys() else None
+
+    if session is None:
+        session = FunctionalCalibrationSession(model,DATA_PATH,translators)
+        finalCalibration = True
+    else:
+        finalCalibration = False
 
+    acqFunc,side = session.calibration2Dof(reconstructFilenameLabelled,side,beginFrame,endFrame,jointRange,
+                                forceBtkAcq=acq,fc_lowPass_marker=fc,order_lowPass_marker=order)
 
     # --------------------------FINAL CALIBRATION OF THE STATIC File---------
-
-    # ----  Calibration
-    modelFilters.ModelCalibrationFilter(scp,acqStatic,model,
-                       leftFlatFoot = leftFlatFoot, rightFlatFoot = rightFlatFoot,
-                       headFlat = headFlat,
-                       markerDiameter=markerDiameter).compute()
+    if finalCalibration:
+        session.finalize()
 
     return model,acqFunc,side
 
@@ -153,113 +333,29 @@ def calibration2Dof(model, DATA_PATH, reconstructFilenameLabelled, translators,
 def sara(model,
     DATA_PATH,reconstructFilenameLabelled,translators,
     side,beginFrame,endFrame,**kwargs):
-
-    # --- btk acquisition ----
-    if "forceBtkAcq" in kwargs.keys():
-        acqFunc = kwargs["forceBtkAcq"]
-    else:
-        acqFunc = btkTools.smartReader((DATA_PATH + reconstructFilenameLabelled))
-
-    btkTools.checkMultipleSubject(acqFunc)
-    acqFunc =  btkTools.applyTranslators(acqFunc,translators)
-
-    # filtering
-    # -----------------------
-    if "fc_lowPass_marker" in kwargs.keys() and kwargs["fc_lowPass_marker"]!=0 :
-        trackingMarkers = model.getTrackingMarkers(acqFunc)
-        fc = kwargs["fc_lowPass_marker"]
-        order = 4
-        if "order_lowPass_marker" in kwargs.keys():
-            order = kwargs["order_lowPass_marker"]
-        signal_processing.markerFiltering(acqFunc,trackingMarkers,order=order, fc =fc)
-
-    #---get frame range of interest---
-    ff = acqFunc.GetFirstFrame()
-    lf = acqFunc.GetLastFrame()
-
-    #---motion side of the lower limb---
-    if side is None:
-        side = detectSide(acqFunc,"LANK","RANK")
-        LOGGER.logger.info("Detected motion side : %s" %(side) )
-
-    start,end = btkTools.getStartEndEvents(acqFunc,side)
-
-    if start is not None:
-        LOGGER.logger.info("Start event detected")
-        initFrame=start
-    else:
-        initFrame = beginFrame if beginFrame is not None else ff
-
-    if end is not None:
-        LOGGER.logger.info("End event detected")
-        endFrame=end
+    """
+        SARA knee functional calibration
+
+        .. note:: a single calibration reads the static c3d and calibrates the model twice. Use a
+                  `FunctionalCalibrationSession`, or the keyword argument `session`, to share them between calibrations.
+                  The model is not finally calibrated if a session is given ( see `FunctionalCalibrationSession.finalize`).
+    """
+    fc = kwargs["fc_lowPass_marker"] if "fc_lowPass_marker" in kwargs.keys() else None
+    order = kwargs["order_lowPass_marker"] if "order_lowPass_marker" in kwargs.keys() else None
+    acq = kwargs["forceBtkAcq"] if "forceBtkAcq" in kwargs.keys() else None
+    session = kwargs["session"] if "session" in kwargs.keys() else None
+
+    if session is None:
+        session = FunctionalCalibrationSession(model,DATA_PATH,translators)
+        finalCalibration = True
     else:
-        endFrame = endFrame if endFrame is not None else lf
-
-    iff=initFrame-ff
-    ilf=endFrame-ff
-
-
+        finalCalibration = False
 
+    acqFunc,side = session.sara(reconstructFilenameLabelled,side,beginFrame,endFrame,
+                                forceBtkAcq=acq,fc_lowPass_marker=fc,order_lowPass_marker=order)
 
-    # --------------------------RESET OF THE STATIC File---------
-
-    # load btkAcq from static file
-    staticFilename = model.m_staticFilename
-    acqStatic = btkTools.smartReader((DATA_PATH+staticFilename))
-    btkTools.checkMultipleSubject(acqStatic)
-    acqStatic =  btkTools.applyTranslators(acqStatic,translators)
-
-    # initial calibration ( i.e calibration from Calibration operation)
-    leftFlatFoot = model.m_properties["CalibrationParameters"]["leftFlatFoot"]
-    rightFlatFoot = model.m_properties["CalibrationParameters"]["rightFlatFoot"]
-    markerDiameter = model.m_properties["CalibrationParameters"]["markerDiameter"]
-    headFlat = model.m_properties["CalibrationParameters"]["headFlat"]
-
-    if side == "Left":
-        model.mp_computed["LeftKneeFuncCalibrationOffset"] = 0
-    if side == "Right":
-        model.mp_computed["RightKneeFuncCalibrationOffset"] = 0
-
-
-
-    # initial calibration ( zero previous KneeFunc offset on considered side )
-    scp=modelFilters.StaticCalibrationProcedure(model)
-    modelFilters.ModelCalibrationFilter(scp,acqStatic,model,
-                           leftFlatFoot = leftFlatFoot, rightFlatFoot = rightFlatFoot,
-                           headFlat = headFlat,
-                           markerDiameter=markerDiameter).compute()
-
-
-    if model.version in  ["CGM2.3","CGM2.4","CGM2.5"]:
-        if side == "Left":
-            thigh_markers = model.getSegment("Left Thigh").m_tracking_markers
-            shank_markers = model.getSegment("Left Shank").m_tracking_markers
-
-        elif side == "Right":
-            thigh_markers = model.getSegment("Right Thigh").m_tracking_markers
-            shank_markers = model.getSegment("Right Shank").m_tracking_markers
-
-        validFrames,vff,vlf = btkTools.findValidFrames(acqFunc,thigh_markers+shank_markers)
-
-        proximalSegmentLabel=(side+" Thigh")
-        distalSegmentLabel=(side+" Shank")
-
-        # segment Motion
-        modMotion=modelFilters.ModelMotionFilter(scp,acqFunc,model,enums.motionMethod.Sodervisk)
-        modMotion.segmentalCompute([proximalSegmentLabel,distalSegmentLabel])
-
-        # decorator
-
-        modelDecorator.KneeCalibrationDecorator(model).sara(side,
-                                                            indexFirstFrame = iff,
-                                                            indexLastFrame = ilf )
-
-        # --------------------------FINAL CALIBRATION OF THE STATIC File---------
-
-        modelFilters.ModelCalibrationFilter(scp,acqStatic,model,
-                           leftFlatFoot = leftFlatFoot, rightFlatFoot = rightFlatFoot,
-                           headFlat = headFlat,
-                           markerDiameter=markerDiameter).compute()
+    # --------------------------FINAL CALIBRATION OF THE STATIC File---------
+    if finalCalibration:
+        session.finalize()
 
     return model,acqFunc,side
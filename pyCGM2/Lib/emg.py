@@ -9,7 +9,8 @@ from pyCGM2 import enums
 
 
 
-def processEMG(DATA_PATH, gaitTrials, emgChannels, highPassFrequencies=[20,200],envelopFrequency=6.0, fileSuffix=None,outDataPath=None):
+def processEMG(DATA_PATH, gaitTrials, emgChannels, highPassFrequencies=[20,200],envelopFrequency=6.0, fileSuffix=None,outDataPath=None,
+               outputs=None,chunkSize=None):
 
     """
     processEMG_fromC3dFiles : filters emg channels from a list of c3d files
@@ -23,6 +24,8 @@ def processEMG(DATA_PATH, gaitTrials, emgChannels, highPassFrequencies=[20,200],
     :param highPassFrequencies [list of float]: boundaries of the bandpass filter
     :param envelopFrequency [float]: cut-off frequency for creating an emg envelop
     :param fileSuffix [string]: suffix added to your ouput c3d files
+    :param outputs [string list]: signals written in the c3d ( HPF, Rectify, Env). All by default
+    :param chunkSize [int]: number of analog samples filtered at once. Bounds memory for long recordings
 
     """
     if fileSuffix is None: fileSuffix=""
@@ -38,13 +41,11 @@ def processEMG(DATA_PATH, gaitTrials, emgChannels, highPassFrequencies=[20,200],
         if flag:
             raise Exception ("[pyCGM2] One label has not been detected as analog. see above")
 
-        bf = emgFilters.BasicEmgProcessingFilter(acq,emgChannels)
-        bf.setHighPassFrequencies(highPassFrequencies[0],highPassFrequencies[1])
-        bf.run()
-
-        envf = emgFilters.EmgEnvelopProcessingFilter(acq,emgChannels)
-        envf.setCutoffFrequency(envelopFrequency)
-        envf.run()
+        emgf = emgFilters.EmgProcessingFilter(acq,emgChannels,outputs=outputs)
+        emgf.setHighPassFrequencies(highPassFrequencies[0],highPassFrequencies[1])
+        emgf.setCutoffFrequency(envelopFrequency)
+        emgf.setChunkSize(chunkSize)
+        emgf.run()
 
         outFilename = gaitTrial if fileSuffix=="" else gaitTrial[0:gaitTrial.rfind(".")]+"_"+fileSuffix+".c3d"
 
@@ -53,7 +54,7 @@ def processEMG(DATA_PATH, gaitTrials, emgChannels, highPassFrequencies=[20,200],
         else:
             btkTools.smartWriter(acq,outDataPath+outFilename)
 
-def processEMG_fromBtkAcq(acq, emgChannels, highPassFrequencies=[20,200],envelopFrequency=6.0):
+def processEMG_fromBtkAcq(acq, emgChannels, highPassFrequencies=[20,200],envelopFrequency=6.0,outputs=None,chunkSize=None):
     """
     processEMG_fromBtkAcq : filt emg from a btk acq
 
@@ -64,17 +65,16 @@ def processEMG_fromBtkAcq(acq, emgChannels, highPassFrequencies=[20,200],envelop
 
     :param highPassFrequencies [list of float]: boundaries of the bandpass filter
     :param envelopFrequency [float]: cut-off frequency for creating an emg envelop
+    :param outputs [string list]: signals appended to the acquisition ( HPF, Rectify, Env). All by default
+    :param chunkSize [int]: number of analog samples filtered at once. Bounds memory for long recordings
 
     """
 
-
-    bf = emgFilters.BasicEmgProcessingFilter(acq,emgChannels)
-    bf.setHighPassFrequencies(highPassFrequencies[0],highPassFrequencies[1])
-    bf.run()
-
-    envf = emgFilters.EmgEnvelopProcessingFilter(acq,emgChannels)
-    envf.setCutoffFrequency(envelopFrequency)
-    envf.run()
+    emgf = emgFilters.EmgProcessingFilter(acq,emgChannels,outputs=outputs)
+    emgf.setHighPassFrequencies(highPassFrequencies[0],highPassFrequencies[1])
+    emgf.setCutoffFrequency(envelopFrequency)
+    emgf.setChunkSize(chunkSize)
+    emgf.run()
 
     return acq
 
@@ -49,7 +49,7 @@ def plotTemporalKinematic(DATA_PATH, modelledFilenames,bodyPart, pointLabelSuffi
         acq = btkAcq
         btkTools.sortedEvents(acq)
     else:
-        acq =btkTools.smartReader(DATA_PATH + modelledFilenames)
+        acq =btkTools.smartReader(DATA_PATH + modelledFilenames,cached=True)
 
     kv = plotViewers.TemporalKinematicsPlotViewer(acq,pointLabelSuffix=pointLabelSuffix,bodyPart = bodyPart)
     # # filter
@@ -111,7 +111,7 @@ def plotTemporalKinetic(DATA_PATH, modelledFilenames,bodyPart,pointLabelSuffix=N
         btkTools.sortedEvents(acq)
 
     else:
-        acq =btkTools.smartReader(DATA_PATH+modelledFilenames)
+        acq =btkTools.smartReader(DATA_PATH+modelledFilenames,cached=True)
 
     kv = plotViewers.TemporalKineticsPlotViewer(acq,pointLabelSuffix=pointLabelSuffix,bodyPart = bodyPart)
     # # filter
@@ -160,7 +160,7 @@ def plotTemporalEMG(DATA_PATH, processedEmgfile, emgChannels, muscles, contexts,
     if btkAcq is not None:
         acq = btkAcq
     else:
-        acq =btkTools.smartReader(DATA_PATH+processedEmgfile)
+        acq =btkTools.smartReader(DATA_PATH+processedEmgfile,cached=True)
 
 
     emgChannels_list=  [emgChannels[i:i+10] for i in range(0, len(emgChannels), 10)]
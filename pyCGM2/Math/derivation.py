@@ -80,25 +80,15 @@ def firstOrderFiniteDifference(values,sampleFrequency):
         :Return:
             - `out` (numpy.array(m,n)) - derivated values
 
-    """
-
-    n,m = values.shape
-    out = np.zeros((n,m))
-
-    i=0
-    out[i,:] = (-3.0*values[i,:] +\
-                    4.0*values[i+1,:] + \
-                    -1.0*values[i+2,:]) / (2*1/sampleFrequency)
+        .. note:: differentiation is along the first axis, so values can be an array(m,n,...)
 
-    for i in range(1,n-1):
-        postValue = values[i-1,:]
-        nextValue = values[i+1,:]
-        out[i,:]=( nextValue - postValue ) / (2*1/sampleFrequency);
+    """
+    values = np.asarray(values,dtype=float)
+    out = np.zeros(values.shape)
 
-    i=n-1
-    out[i,:] = (3.0*values[i,:] +\
-                    -4.0*values[i-1,:] + \
-                    1.0*values[i-2,:]) / (2*1/sampleFrequency)
+    out[0] = (-3.0*values[0] + 4.0*values[1] - 1.0*values[2]) / (2*1/sampleFrequency)
+    out[1:-1] = (values[2:] - values[0:-2]) / (2*1/sampleFrequency)
+    out[-1] = (3.0*values[-1] - 4.0*values[-2] + 1.0*values[-3]) / (2*1/sampleFrequency)
 
     return out
 
@@ -115,87 +105,57 @@ def secondOrderFiniteDifference(values,sampleFrequency):
         :Return:
             - `out` (numpy.array(m,n)) - derivated values
 
-    """
-
+        .. note:: differentiation is along the first axis, so values can be an array(m,n,...)
 
-    n,m = values.shape
-    out = np.zeros((n,m))
+    """
+    values = np.asarray(values,dtype=float)
+    out = np.zeros(values.shape)
 
-    i=0
-    out[i,:] = (-5.0*values[i+1,:] +\
-                    4.0*values[i+2,:] + \
-                    -1.0*values[i+3,:]) / (np.power(1/sampleFrequency,2))
+    out[0] = (-5.0*values[1] + 4.0*values[2] - 1.0*values[3]) / (np.power(1/sampleFrequency,2))
+    out[1:-1] = (values[0:-2] - 2.0*values[1:-1] + values[2:]) / (np.power(1/sampleFrequency,2))
+    out[-1] = (-5.0*values[-2] + 4.0*values[-3] - 1.0*values[-4]) / (np.power(1/sampleFrequency,2))
 
-    for i in range(1,n-1):
-        out[i,:] = (1.0*values[i-1,:] +\
-                    -2.0*values[i,:] + \
-                    1.0*values[i+1,:]) / (np.power(1/sampleFrequency,2))
+    return out
 
-    i=n-1
-    out[i,:] = (-5.0*values[i-1,:] +\
-                    4.0*values[i-2,:] + \
-                    -1.0*values[i-3,:]) / (np.power(1/sampleFrequency,2))
 
-    return out
+def _rotationArray(motion):
+    if hasattr(motion,"getRotations"):
+        return motion.getRotations()
+    elif isinstance(motion,np.ndarray):
+        return motion
+    else:
+        return np.array([it.getRotation() for it in motion])
 
 
 def matrixFirstDerivation(motionList, sampleFrequency):
 
     """
-        First-order differentiation of a list of array
+        First-order differentiation of rotation matrices
 
         :Parameters:
-            - `values` (list of numpy.array(m,n)) - array of values
+            - `motionList` (pyCGM2.Model.frame.MotionTrajectory, list of Frame or numpy.array(n,3,3)) - motion
             - `sampleFrequency` (double) - sample frequency
 
         :Return:
-            - `out` (list numpy.array(m,n)) - derivated values
+            - `out` (numpy.array(n,3,3)) - derivated matrices
 
     """
 
-    nf = len(motionList)
-    matrixList=[]
-
-    #matrixList.append(np.zeros((3,3)))
-    i=0
-    matrixList.append( (-3.0*motionList[i].getRotation() + 4.0*motionList[i+1].getRotation()-motionList[i+2].getRotation())/(2*1/sampleFrequency))
-
-    for i  in range(1,nf-1):
-        matrixList.append( (motionList[i+1].getRotation()-motionList[i-1].getRotation())/(2*1/sampleFrequency))
-
-    #matrixList.append(np.zeros((3,3)))
-    i=nf-1
-    matrixList.append( (3.0*motionList[i].getRotation() - 4.0*motionList[i-1].getRotation() + motionList[i-2].getRotation())/(2*1/sampleFrequency))
-    return matrixList
+    return firstOrderFiniteDifference(_rotationArray(motionList),sampleFrequency)
 
 
 
 def matrixSecondDerivation(motionList,sampleFrequency):
     """
-        Second-order differentiation of a list of array
+        Second-order differentiation of rotation matrices
 
         :Parameters:
-            - `values` (list of numpy.array(m,n)) - array of values
+            - `motionList` (pyCGM2.Model.frame.MotionTrajectory, list of Frame or numpy.array(n,3,3)) - motion
             - `sampleFrequency` (double) - sample frequency
 
         :Return:
-            - `out` (list numpy.array(m,n)) - derivated values
+            - `out` (numpy.array(n,3,3)) - derivated matrices
 
     """
 
-    nf = len(motionList)
-    matrixList=[]
-
-    #matrixList.append(np.zeros((3,3)))
-    i=0
-    matrixList.append( (-5.0*motionList[i+1].getRotation() + 4.0*motionList[i+2].getRotation()-motionList[i+3].getRotation())/(pow(1/sampleFrequency,2)))
-    for i  in range(1,nf-1):
-        matrixList.append(
-                    (motionList[i-1].getRotation()
-                    -2.0*motionList[i].getRotation()
-                    +1*motionList[i+1].getRotation() )/(pow(1/sampleFrequency,2))
-                    )
-    #matrixList.append(np.zeros((3,3)))
-    i = nf-1
-    matrixList.append( (-5.0*motionList[i-1].getRotation() + 4.0*motionList[i-2].getRotation()-motionList[i-3].getRotation())/(pow(1/sampleFrequency,2)))
-    return matrixList
+    return secondOrderFiniteDifference(_rotationArray(motionList),sampleFrequency)
@@ -228,3 +228,231 @@ def euler_zyx(Matrix, similarOrder = True):
         return Euler3,Euler2,Euler1
     else:
         return Euler1,Euler2,Euler3
+
+
+# ---- array versions ----
+
+def wrapEulerToArray(inputAngles, Dest):
+    """
+        Vectorized version of `wrapEulerTo` for a sequence of angles
+
+        Each frame is wrapped with the previous wrapped frame as destination,
+        as a frame-by-frame call of `wrapEulerTo` would do.
+
+        :Parameters:
+           - `inputAngles` (numpy.array(n,3)) - euler angles in radian
+           - `Dest` (numpy.array(3)) - destination of the first frame
+
+        :Return:
+            - `OutputAngles` (numpy.array(n,3)) - wrapped angles in radian
+    """
+    an = np.array(inputAngles,dtype=float)
+    bn = an * np.array([ 1, -1, 1 ]) + np.pi
+    nFrames = an.shape[0]
+
+    if nFrames == 0:
+        return an
+
+    # choice between the two equivalent representations.
+    # distances are independent of the 2pi offsets, so they can be computed
+    # relatively to the previous frame before offsetting.
+    first = FixEulerArray( Dest, bn[0] )[0] < FixEulerArray( Dest, an[0] )[0]
+
+    fromA = FixEulerArray( an[:-1], bn[1:] )[0] < FixEulerArray( an[:-1], an[1:] )[0]
+    fromB = FixEulerArray( bn[:-1], bn[1:] )[0] < FixEulerArray( bn[:-1], an[1:] )[0]
+
+    # a frame is independent of the previous one if both previous choices lead to the same representation
+    determined = np.concatenate(( [True], fromA == fromB ))
+    choice = np.concatenate(( [first], fromA ))
+    toggle = np.concatenate(( [False], fromA & ~determined[1:] )).astype(int)
+
+    lastDetermined = np.maximum.accumulate(np.where(determined, np.arange(nFrames), 0))
+    parity = np.cumsum(toggle)
+    useB = np.logical_xor(choice[lastDetermined], (parity - parity[lastDetermined]) % 2 == 1)
+
+    Curr = np.where(useB[:,np.newaxis], bn, an)
+
+    # 2pi offsets
+    offsets = np.zeros(Curr.shape)
+    offsets[0] = np.floor( (Dest - Curr[0] + np.pi)/(np.pi*2) )
+    offsets[1:] = np.floor( (Curr[:-1] - Curr[1:] + np.pi)/(np.pi*2) )
+
+    return Curr + np.pi*2 * np.cumsum(offsets,axis=0)
+
+def FixEulerArray( Dest, Curr ):
+    Changed = Curr + np.pi*2 * np.floor( (Dest - Curr + np.pi)/(np.pi*2) )
+    Distance = np.max( abs( Dest - Changed ), axis=-1 )
+
+    return Distance,Changed
+
+
+def safeArcsinArray( Values):
+    return np.arcsin(np.clip(Values,-1,1))
+
+
+def euler_xyzArray(Matrices, similarOrder = True):
+    """
+        Decomposition of rotation matrices according the sequence XYZ
+
+        :Parameters:
+           - `Matrices` (numpy.array(n,3,3)) - Rotation matrices
+           - `similarOrder` (bool) - return in same order than sequence
+
+        :Return:
+            - `euler1` (numpy.array(n)) - angle for X-axis
+            - `euler2` (numpy.array(n)) - angle for Y-axis
+            - `euler3` (numpy.array(n)) - angle for Z-axis
+    """
+    M = Matrices
+
+    Euler2= safeArcsinArray( M[:,0,2] )
+    regular = np.abs( np.cos( Euler2 ) ) > np.spacing(np.single(1))*10
+
+    Euler1 = np.where(regular, np.arctan2( -M[:,1,2], M[:,2,2] ),
+                      np.where( Euler2 > 0, np.arctan2( M[:,1,0], M[:,1,1] ), -np.arctan2( M[:,0,1], M[:,1,1] ) ))
+    Euler3 = np.where(regular, np.arctan2( -M[:,0,1], M[:,0,0] ), 0.0)
+
+    if similarOrder:
+        return Euler1,Euler2,Euler3
+    else:
+        return Euler1,Euler2,Euler3
+
+
+def euler_xzyArray(Matrices, similarOrder = True):
+    """
+        Decomposition of rotation matrices according the sequence XZY
+
+        :Parameters:
+           - `Matrices` (numpy.array(n,3,3)) : Rotation matrices
+           - `similarOrder` (bool) : return in same order than sequence
+
+        :Return:
+            - `euler1` (numpy.array(n)) - angle for X-axis
+            - `euler2` (numpy.array(n)) - angle for Y-axis
+            - `euler3` (numpy.array(n)) - angle for Z-axis
+    """
+    M = Matrices
+
+    Euler3= safeArcsinArray( -M[:,0,1] )
+    regular = np.abs( np.cos( Euler3 ) ) > np.spacing(np.single(1))*10
+
+    Euler1 = np.where(regular, np.arctan2( M[:,2,1], M[:,1,1] ),
+                      np.where( Euler3 > 0, np.arctan2( -M[:,2,0], M[:,2,2] ), -np.arctan2( -M[:,2,0], M[:,2,2] ) ))
+    Euler2 = np.where(regular, np.arctan2( M[:,0,2], M[:,0,0] ), 0.0)
+
+    if similarOrder:
+        return Euler1,Euler3,Euler2
+    else:
+        return Euler1,Euler2,Euler3
+
+
+def euler_yxzArray(Matrices, similarOrder = True ):
+    """
+        Decomposition of rotation matrices according the sequence YXZ
+
+        :Parameters:
+           - `Matrices` (numpy.array(n,3,3)) : Rotation matrices
+           - `similarOrder` (bool) : return in same order than sequence
+
+        :Return:
+            - `euler1` (numpy.array(n)) - angle for X-axis
+            - `euler2` (numpy.array(n)) - angle for Y-axis
+            - `euler3` (numpy.array(n)) - angle for Z-axis
+    """
+    M = Matrices
+
+    Euler1= safeArcsinArray( -M[:,1,2] )
+    regular = np.abs( np.cos( Euler1 ) ) > np.spacing(np.single(1))*10
+
+    Euler2 = np.where(regular, np.arctan2( M[:,0,2], M[:,2,2] ),
+                      np.where( Euler1 > 0, np.arctan2( -M[:,0,1], M[:,0,0] ), -np.arctan2( -M[:,0,1], M[:,0,0] ) ))
+    Euler3 = np.where(regular, np.arctan2( M[:,1,0], M[:,1,1] ), 0.0)
+
+    if similarOrder:
+        return Euler2,Euler1,Euler3
+    else:
+        return Euler1,Euler2,Euler3
+
+
+def euler_yzxArray(Matrices, similarOrder = True):
+    """
+        Decomposition of rotation matrices according the sequence YZX
+
+        :Parameters:
+           - `Matrices` (numpy.array(n,3,3)) : Rotation matrices
+           - `similarOrder` (bool) : return in same order than sequence
+
+        :Return:
+            - `euler1` (numpy.array(n)) - angle for X-axis
+            - `euler2` (numpy.array(n)) - angle for Y-axis
+            - `euler3` (numpy.array(n)) - angle for Z-axis
+    """
+    M = Matrices
+
+    Euler3= safeArcsinArray( M[:,1,0] )
+    regular = np.abs( np.cos( Euler3 ) ) > np.spacing(np.single(1))*10
+
+    Euler1 = np.where(regular, np.arctan2( -M[:,1,2], M[:,1,1] ), 0.0)
+    Euler2 = np.where(regular, np.arctan2( -M[:,2,0], M[:,0,0] ),
+                      np.where( Euler3 > 0, np.arctan2( M[:,2,1], M[:,2,2] ), -np.arctan2( M[:,2,1], M[:,2,2] ) ))
+
+    if similarOrder:
+        return Euler2,Euler3,Euler1
+    else:
+        return Euler1,Euler2,Euler3
+
+
+def euler_zxyArray(Matrices, similarOrder = True):
+    """
+        Decomposition of rotation matrices according the sequence ZXY
+
+        :Parameters:
+           - `Matrices` (numpy.array(n,3,3)) : Rotation matrices
+           - `similarOrder` (bool) : return in same order than sequence
+
+        :Return:
+            - `euler1` (numpy.array(n)) - angle for X-axis
+            - `euler2` (numpy.array(n)) - angle for Y-axis
+            - `euler3` (numpy.array(n)) - angle for Z-axis
+    """
+    M = Matrices
+
+    Euler1= safeArcsinArray( M[:,2,1] )
+    regular = np.abs( np.cos( Euler1 ) ) > np.spacing(np.single(1))*10
+
+    Euler2 = np.where(regular, np.arctan2( -M[:,2,0], M[:,2,2] ), 0.0)
+    Euler3 = np.where(regular, np.arctan2( -M[:,0,1], M[:,1,1] ),
+                      np.where( Euler1 > 0, np.arctan2( M[:,0,2], M[:,0,0] ), -np.arctan2( M[:,0,2], M[:,0,0] ) ))
+
+    if similarOrder:
+        return Euler3,Euler1,Euler2
+    else:
+        return Euler1,Euler2,Euler3
+
+
+def euler_zyxArray(Matrices, similarOrder = True):
+    """
+        Decomposition of rotation matrices according the sequence ZYX
+
+        :Parameters:
+           - `Matrices` (numpy.array(n,3,3)) : Rotation matrices
+           - `similarOrder` (bool) : return in same order than sequence
+
+        :Return:
+            - `euler1` (numpy.array(n)) - angle for X-axis
+            - `euler2` (numpy.array(n)) - angle for Y-axis
+            - `euler3` (numpy.array(n)) - angle for Z-axis
+    """
+    M = Matrices
+
+    Euler2= safeArcsinArray( -M[:,2,0] )
+    regular = np.abs( np.cos( Euler2 ) ) > np.spacing(np.single(1))*10
+
+    Euler1 = np.where(regular, np.arctan2( M[:,2,1], M[:,2,2] ), 0.0)
+    Euler3 = np.where(regular, np.arctan2( M[:,1,0], M[:,0,0] ),
+                      np.where( Euler2 > 0, np.arctan2( -M[:,0,1], M[:,0,2] ), -np.arctan2( -M[:,0,1], M[:,0,2] ) ))
+
+    if similarOrder:
+        return Euler3,Euler2,Euler1
+    else:
+        return Euler1,Euler2,Euler3
@@ -102,3 +102,70 @@ def LineLineIntersect(p1,p2,p3,p4):
     pb[2] = p3[2] + mub * p43[2];
 
     return pa,pb
+
+
+def LineLineIntersectArray(p1,p2,p3,p4):
+    """
+        Array version of `LineLineIntersect`. Shortest segments pa_pb between lines p1_p2 and p3_p4 of all frames
+
+        :parameters:
+            - p1 ('np.array(n,3)') : 3d coordinates
+            - p2 ('np.array(n,3)') : 3d coordinates
+            - p3 ('np.array(n,3)') : 3d coordinates
+            - p4 ('np.array(n,3)') : 3d coordinates
+
+        :Return:
+            - pa ('np.array(n,3)') : point of line p1_p2
+            - pb ('np.array(n,3)') : point of line p3_p4
+
+        .. note:: rows are nan where `LineLineIntersect` raises an exception ( null or parallel lines)
+
+    """
+    p13 = p1 - p3
+    p43 = p4 - p3
+    p21 = p2 - p1
+
+    d1343 = np.einsum("ij,ij->i",p13,p43)
+    d4321 = np.einsum("ij,ij->i",p43,p21)
+    d1321 = np.einsum("ij,ij->i",p13,p21)
+    d4343 = np.einsum("ij,ij->i",p43,p43)
+    d2121 = np.einsum("ij,ij->i",p21,p21)
+
+    denom = d2121 * d4343 - d4321 * d4321
+    invalid = np.all(np.abs(p43) < np.spacing(1),axis=1) | np.all(np.abs(p21) < np.spacing(1),axis=1) | (np.abs(denom) < np.spacing(1))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mua = (d1343 * d4321 - d1321 * d4343) / denom
+        mub = (d1343 + d4321 * mua) / d4343
+    mua[invalid] = np.nan
+    mub[invalid] = np.nan
+
+    pa = p1 + mua[:,np.newaxis] * p21
+    pb = p3 + mub[:,np.newaxis] * p43
+
+    return pa,pb
+
+
+def pointsInPolygon(points,vertices):
+    """
+        Check if 2d points are inside polygons ( even-odd rule)
+
+        :parameters:
+            - points ('np.array(n,2)') : 2d coordinates of the points
+            - vertices ('np.array(n,k,2)') : 2d coordinates of the k vertices of the polygon associated with each point
+
+        :Return:
+            - inside ('np.array(n) of bool') : True if the point is inside the polygon. False for nan points
+
+    """
+    x = points[:,0,np.newaxis]
+    y = points[:,1,np.newaxis]
+    xi = vertices[:,:,0]
+    yi = vertices[:,:,1]
+    xj = np.roll(xi,1,axis=1)
+    yj = np.roll(yi,1,axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        crossings = ((yi > y) != (yj > y)) & (x < (xj - xi) * (y - yi) / (yj - yi) + xi)
+
+    return np.logical_xor.reduce(crossings,axis=1)
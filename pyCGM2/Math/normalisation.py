@@ -12,9 +12,35 @@ def timeSequenceNormalisation(Nrow,data):
 
     """
 
-    ncol = data.shape[1]
-    out=np.zeros((Nrow,ncol))
-    for i in range(0,ncol):
-        out[:,i] = np.interp(np.linspace(0, 100, Nrow), np.linspace(0, 100, data.shape[0]), data[:,i])
+    return timeSequencesNormalisation(Nrow,[data])[0]
 
-    return out
+
+def timeSequencesNormalisation(Nrow,sequences):
+    """
+        Normalisation of several arrays of different lengths with a single linear interpolation
+
+        :parameters:
+            - `Nrow` (double) : number of interval
+            - `sequences` (list of numpy.array(m_i,n)) : arrays with the same number of columns
+
+        :Return:
+            - `out` (numpy.array(len(sequences),Nrow,n)) : normalised arrays
+
+    """
+    lengths = np.array([sequence.shape[0] for sequence in sequences],dtype=int)
+    if lengths.shape[0] == 0:
+        return np.zeros((0,Nrow,0))
+
+    data = np.concatenate([np.asarray(sequence,dtype=float).reshape((sequence.shape[0],-1)) for sequence in sequences],axis=0)
+    offsets = np.concatenate(([0],np.cumsum(lengths)[:-1]))
+
+    # fractional position of each normalised sample in its sequence
+    positions = np.linspace(0,1,Nrow)[np.newaxis,:] * (lengths[:,np.newaxis]-1)
+    lower = np.clip(np.floor(positions).astype(int),0,np.maximum(lengths-2,0)[:,np.newaxis])
+    weights = (positions - lower)[:,:,np.newaxis]
+    upper = np.minimum(lower+1,(lengths-1)[:,np.newaxis])
+
+    lower = lower + offsets[:,np.newaxis]
+    upper = upper + offsets[:,np.newaxis]
+
+    return data[lower]*(1.0-weights) + data[upper]*weights
@@ -60,4 +60,22 @@ def skewMatrix(vector):
         out[2,0]= -vector[1]
         out[2,1]= vector[0]
     
-        return out
\ No newline at end of file
+        return out
+
+
+def normalizeArray(values):
+    """
+        normalize each row of an array
+
+        :Parameters:
+            - `values` (numpy.array(n,3)) : array
+
+        :Return:
+            - `na` (numpy.array(n,3)) : array of unit vectors.
+
+        .. note:: a null row remains null
+
+    """
+    values = np.asarray(values)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.nan_to_num(np.divide(values,np.linalg.norm(values,axis=-1)[...,np.newaxis]))
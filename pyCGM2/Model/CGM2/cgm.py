@@ -11,7 +11,7 @@ except:
 
 from pyCGM2 import enums
 from pyCGM2.Model import model, modelDecorator, frame, motion
-from pyCGM2.Math import euler, geometry
+from pyCGM2.Math import euler, geometry, numeric
 from pyCGM2.Tools import btkTools
 from pyCGM2.Nexus import nexusTools
 
@@ -2428,15 +2428,12 @@ class CGM1(CGM):
             self._anatomical_motion(aqui,"Pelvis",originLabel = str(dictAnat["Pelvis"]['labels'][3]))
 
 
-            TopLumbar5=np.zeros((aqui.GetPointFrameNumber(),3))
-
-            for i in range(0,aqui.GetPointFrameNumber()):
-                lhjc = aqui.GetPoint("LHJC").GetValues()[i,:]
-                rhjc =  aqui.GetPoint("RHJC").GetValues()[i,:]
-                pelvisScale = np.linalg.norm(lhjc-rhjc)
-                offset = (lhjc+rhjc)/2.0
-                R = self.getSegment("Pelvis").anatomicalFrame.motion[i].getRotation()
-                TopLumbar5[i,:] = offset +  np.dot(R,(np.array([ 0, 0, 0.925]))* pelvisScale)
+            lhjc = aqui.GetPoint("LHJC").GetValues()
+            rhjc =  aqui.GetPoint("RHJC").GetValues()
+            pelvisScale = np.linalg.norm(lhjc-rhjc,axis=1)
+            offset = (lhjc+rhjc)/2.0
+            R = self.getSegment("Pelvis").anatomicalFrame.motion.getRotations()
+            TopLumbar5 = offset +  np.einsum("nij,j->ni",R,np.array([ 0, 0, 0.925]))* pelvisScale[:,np.newaxis]
 
 
             self._TopLumbar5 = TopLumbar5
@@ -2512,33 +2509,13 @@ class CGM1(CGM):
         validFrames = btkTools.getValidFrames(aqui,seg.m_tracking_markers)
         seg.setExistFrames(validFrames)
 
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef["Pelvis"]["TF"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictRef["Pelvis"]["TF"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictRef["Pelvis"]["TF"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictRef["Pelvis"]["TF"]['labels'][3])).GetValues()[i,:]
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
+        pt1=aqui.GetPoint(str(dictRef["Pelvis"]["TF"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictRef["Pelvis"]["TF"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictRef["Pelvis"]["TF"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictRef["Pelvis"]["TF"]['labels'][3])).GetValues()
 
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Pelvis"]["TF"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictRef["Pelvis"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
 
         # --- HJCs
@@ -2548,10 +2525,9 @@ class CGM1(CGM):
         values_LHJCnode=seg.getReferential('TF').getNodeTrajectory("LHJC")
         values_RHJCnode=seg.getReferential('TF').getNodeTrajectory("RHJC")
 
-        for i in range(0,aqui.GetPointFrameNumber()):
-            if not validFrames[i]:
-                values_LHJCnode[i,:] = np.zeros(3)
-                values_RHJCnode[i,:] = np.zeros(3)
+        invalidFrames = np.logical_not(np.asarray(validFrames,dtype=bool))
+        values_LHJCnode[invalidFrames,:] = 0.0
+        values_RHJCnode[invalidFrames,:] = 0.0
 
 
         btkTools.smartAppendPoint(aqui,"LHJC",values_LHJCnode, desc=desc_L)
@@ -2561,48 +2537,26 @@ class CGM1(CGM):
         # --- motion of the anatomical referential
 
         seg.anatomicalFrame.motion=[]
-        TopLumbar5=np.zeros((aqui.GetPointFrameNumber(),3))
 
         # additional markers
         val=(aqui.GetPoint("LHJC").GetValues() + aqui.GetPoint("RHJC").GetValues()) / 2.0
         btkTools.smartAppendPoint(aqui,"midHJC",val,desc="")
 
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictAnat["Pelvis"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictAnat["Pelvis"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictAnat["Pelvis"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictAnat["Pelvis"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat["Pelvis"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
+        pt1=aqui.GetPoint(str(dictAnat["Pelvis"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictAnat["Pelvis"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictAnat["Pelvis"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictAnat["Pelvis"]['labels'][3])).GetValues()
 
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictAnat["Pelvis"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
-            # length
-            lhjc = aqui.GetPoint("LHJC").GetValues()[i,:]
-            rhjc =  aqui.GetPoint("RHJC").GetValues()[i,:]
-            pelvisScale = np.linalg.norm(lhjc-rhjc)
-            offset = (lhjc+rhjc)/2.0
+        # length
+        lhjc = aqui.GetPoint("LHJC").GetValues()
+        rhjc =  aqui.GetPoint("RHJC").GetValues()
+        pelvisScale = np.linalg.norm(lhjc-rhjc,axis=1)
+        offset = (lhjc+rhjc)/2.0
 
-            TopLumbar5[i,:] = offset +  np.dot(R,(np.array([ 0, 0, 0.925]))* pelvisScale)
-            #seg.anatomicalFrame.static.addNode("TL5",TopLumbar5,positionType="Local")
+        TopLumbar5 = offset +  np.einsum("nij,j->ni",R,np.array([ 0, 0, 0.925]))* pelvisScale[:,np.newaxis]
 
         self._TopLumbar5 = TopLumbar5
 
@@ -2643,37 +2597,15 @@ class CGM1(CGM):
 
         # computation
                 # --- LKJC
-        LKJCvalues=np.zeros((aqui.GetPointFrameNumber(),3))
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef["Left Thigh"]["TF"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictRef["Left Thigh"]["TF"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictRef["Left Thigh"]["TF"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictRef["Left Thigh"]["TF"]['labels'][3])).GetValues()[i,:]
+        pt1=aqui.GetPoint(str(dictRef["Left Thigh"]["TF"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictRef["Left Thigh"]["TF"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictRef["Left Thigh"]["TF"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictRef["Left Thigh"]["TF"]['labels'][3])).GetValues()
 
+        x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictRef["Left Thigh"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Left Thigh"]["TF"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
-
-            if validFrames[i]:
-                LKJCvalues[i,:] = modelDecorator.VCMJointCentre( (self.mp["LeftKneeWidth"]+ markerDiameter)/2.0 ,pt1,pt2,pt3, beta=-self.mp_computed["LeftThighRotationOffset"] )
+        LKJCvalues = modelDecorator.VCMJointCentreArray( (self.mp["LeftKneeWidth"]+ markerDiameter)/2.0 ,pt1,pt2,pt3, beta=-self.mp_computed["LeftThighRotationOffset"], validFrames=validFrames )
 
         if  "useLeftKJCmarker" in options.keys() and options["useLeftKJCmarker"] is not "LKJC":
             LOGGER.logger.info("[pyCGM2] - LKJC marker forced to use %s"%(options["useLeftKJCmarker"]))
@@ -2691,34 +2623,13 @@ class CGM1(CGM):
         # additional markers
         # NA
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
+        pt1=aqui.GetPoint(str(dictAnat["Left Thigh"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictAnat["Left Thigh"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictAnat["Left Thigh"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictAnat["Left Thigh"]['labels'][3])).GetValues()
 
-            pt1=aqui.GetPoint(str(dictAnat["Left Thigh"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictAnat["Left Thigh"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictAnat["Left Thigh"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictAnat["Left Thigh"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat["Left Thigh"]['sequence'])
-
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictAnat["Left Thigh"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
     def _right_thigh_motion(self,aqui, dictRef,dictAnat,options=None):
         """
@@ -2755,38 +2666,16 @@ class CGM1(CGM):
         # additional markers
 
 
-        RKJCvalues=np.zeros((aqui.GetPointFrameNumber(),3))
-
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef["Right Thigh"]["TF"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictRef["Right Thigh"]["TF"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictRef["Right Thigh"]["TF"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictRef["Right Thigh"]["TF"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Right Thigh"]["TF"]['sequence'])
 
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
+        pt1=aqui.GetPoint(str(dictRef["Right Thigh"]["TF"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictRef["Right Thigh"]["TF"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictRef["Right Thigh"]["TF"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictRef["Right Thigh"]["TF"]['labels'][3])).GetValues()
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictRef["Right Thigh"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
-            if validFrames[i]:
-                RKJCvalues[i,:] = modelDecorator.VCMJointCentre( (self.mp["RightKneeWidth"]+ markerDiameter)/2.0 ,pt1,pt2,pt3, beta=self.mp_computed["RightThighRotationOffset"] )
+        RKJCvalues = modelDecorator.VCMJointCentreArray( (self.mp["RightKneeWidth"]+ markerDiameter)/2.0 ,pt1,pt2,pt3, beta=self.mp_computed["RightThighRotationOffset"], validFrames=validFrames )
 
 
         if  "useRightKJCmarker" in options.keys() and options["useRightKJCmarker"] is not "RKJC":
@@ -2812,33 +2701,13 @@ class CGM1(CGM):
         # computation
         seg.anatomicalFrame.motion=[]
 
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictAnat["Right Thigh"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictAnat["Right Thigh"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictAnat["Right Thigh"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictAnat["Right Thigh"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat["Right Thigh"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
+        pt1=aqui.GetPoint(str(dictAnat["Right Thigh"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictAnat["Right Thigh"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictAnat["Right Thigh"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictAnat["Right Thigh"]['labels'][3])).GetValues()
 
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictAnat["Right Thigh"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
     def _left_shank_motion(self,aqui, dictRef,dictAnat,options=None):
@@ -2879,43 +2748,21 @@ class CGM1(CGM):
 
         # --- LAJC
         # computation
-        LAJCvalues=np.zeros((aqui.GetPointFrameNumber(),3))
-
-
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef["Left Shank"]["TF"]['labels'][0])).GetValues()[i,:] #ANK
-            pt2=aqui.GetPoint(str(dictRef["Left Shank"]["TF"]['labels'][1])).GetValues()[i,:] #KJC
-            pt3=aqui.GetPoint(str(dictRef["Left Shank"]["TF"]['labels'][2])).GetValues()[i,:] #TIB
-            ptOrigin=aqui.GetPoint(str(dictRef["Left Shank"]["TF"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Left Shank"]["TF"]['sequence'])
 
 
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
+        pt1=aqui.GetPoint(str(dictRef["Left Shank"]["TF"]['labels'][0])).GetValues() #ANK
+        pt2=aqui.GetPoint(str(dictRef["Left Shank"]["TF"]['labels'][1])).GetValues() #KJC
+        pt3=aqui.GetPoint(str(dictRef["Left Shank"]["TF"]['labels'][2])).GetValues() #TIB
+        ptOrigin=aqui.GetPoint(str(dictRef["Left Shank"]["TF"]['labels'][3])).GetValues()
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictRef["Left Shank"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
-            if validFrames[i]:
-                LAJCvalues[i,:] = modelDecorator.VCMJointCentre( (self.mp["LeftAnkleWidth"]+ markerDiameter)/2.0 ,pt1,pt2,pt3, beta=-self.mp_computed["LeftShankRotationOffset"] )
+        LAJCvalues = modelDecorator.VCMJointCentreArray( (self.mp["LeftAnkleWidth"]+ markerDiameter)/2.0 ,pt1,pt2,pt3, beta=-self.mp_computed["LeftShankRotationOffset"], validFrames=validFrames )
 
-                # update of the AJC location with rotation around abdAddAxis
-                LAJCvalues[i,:] = self._rotateAjc(LAJCvalues[i,:],pt2,pt1,self.mp_computed["LeftAnkleAbAddOffset"])
+        # update of the AJC location with rotation around abdAddAxis
+        valid = np.asarray(validFrames,dtype=bool)
+        LAJCvalues[valid,:] = self._rotateAjc(LAJCvalues[valid,:],pt2[valid,:],pt1[valid,:],self.mp_computed["LeftAnkleAbAddOffset"])
 
 
         if  "useLeftAJCmarker" in options.keys() and options["useLeftAJCmarker"] is not "LAJC":
@@ -2941,33 +2788,13 @@ class CGM1(CGM):
         # NA
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][3])).GetValues()[i,:]
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat["Left Shank"]['sequence'])
-            csFrame=frame.Frame()
+        pt1=aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][3])).GetValues()
 
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictAnat["Left Shank"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
 
@@ -3015,17 +2842,13 @@ class CGM1(CGM):
         rotZ_tibRot[0,1] = np.sin(tibialTorsion)
         rotZ_tibRot[1,0] = - np.sin(tibialTorsion)
         rotZ_tibRot[1,1] = np.cos(tibialTorsion)
-        LKJC = aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][3]))
-
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-            ptOrigin=LKJC.GetValues()[i,:]
-            segProx.getReferential("TF").addMotionFrame(seg.getReferential("TF").motion[i]) # copy technical shank
+        ptOrigin=aqui.GetPoint(str(dictAnat["Left Shank"]['labels'][3])).GetValues()
 
-            R = np.dot(seg.anatomicalFrame.motion[i].getRotation(),rotZ_tibRot) # affect Tibial torsion to anatomical shank
+        segProx.getReferential("TF").setMotion(seg.getReferential("TF").motion.getRotations(),
+                                               seg.getReferential("TF").motion.getTranslations()) # copy technical shank
 
-            csFrame.update(R,ptOrigin)
-            segProx.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        R = np.einsum("nij,jk->nik",seg.anatomicalFrame.motion.getRotations(),rotZ_tibRot) # affect Tibial torsion to anatomical shank
+        segProx.anatomicalFrame.setMotion(R,ptOrigin)
 
 
 
@@ -3064,42 +2887,20 @@ class CGM1(CGM):
         # NA
 
 
-        RAJCvalues=np.zeros((aqui.GetPointFrameNumber(),3))
-
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef["Right Shank"]["TF"]['labels'][0])).GetValues()[i,:] #ank
-            pt2=aqui.GetPoint(str(dictRef["Right Shank"]["TF"]['labels'][1])).GetValues()[i,:] #kjc
-            pt3=aqui.GetPoint(str(dictRef["Right Shank"]["TF"]['labels'][2])).GetValues()[i,:] #tib
-            ptOrigin=aqui.GetPoint(str(dictRef["Right Shank"]["TF"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
 
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Right Shank"]["TF"]['sequence'])
+        pt1=aqui.GetPoint(str(dictRef["Right Shank"]["TF"]['labels'][0])).GetValues() #ank
+        pt2=aqui.GetPoint(str(dictRef["Right Shank"]["TF"]['labels'][1])).GetValues() #kjc
+        pt3=aqui.GetPoint(str(dictRef["Right Shank"]["TF"]['labels'][2])).GetValues() #tib
+        ptOrigin=aqui.GetPoint(str(dictRef["Right Shank"]["TF"]['labels'][3])).GetValues()
 
+        x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictRef["Right Shank"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
-
-            # ajc position from chord modified by shank offset
-            if validFrames[i]:
-                RAJCvalues[i,:] = modelDecorator.VCMJointCentre( (self.mp["RightAnkleWidth"]+ markerDiameter)/2.0 ,pt1,pt2,pt3, beta=self.mp_computed["RightShankRotationOffset"] )
-            # update of the AJC location with rotation around abdAddAxis
-                RAJCvalues[i,:] = self._rotateAjc(RAJCvalues[i,:],pt2,pt1,   self.mp_computed["RightAnkleAbAddOffset"])
+        # ajc position from chord modified by shank offset
+        RAJCvalues = modelDecorator.VCMJointCentreArray( (self.mp["RightAnkleWidth"]+ markerDiameter)/2.0 ,pt1,pt2,pt3, beta=self.mp_computed["RightShankRotationOffset"], validFrames=validFrames )
+        # update of the AJC location with rotation around abdAddAxis
+        valid = np.asarray(validFrames,dtype=bool)
+        RAJCvalues[valid,:] = self._rotateAjc(RAJCvalues[valid,:],pt2[valid,:],pt1[valid,:],   self.mp_computed["RightAnkleAbAddOffset"])
 
         # --- LAJC
 
@@ -3126,33 +2927,13 @@ class CGM1(CGM):
         # NA
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][3])).GetValues()[i,:]
-
+        pt1=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][3])).GetValues()
 
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat["Right Shank"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictAnat["Right Shank"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
     def _right_shankProximal_motion(self,aqui,dictAnat,options=None):
         """
@@ -3192,16 +2973,13 @@ class CGM1(CGM):
         rotZ_tibRot[1,0] = - np.sin(tibialTorsion)
         rotZ_tibRot[1,1] = np.cos(tibialTorsion)
 
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-            ptOrigin=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][3])).GetValues()[i,:]
-
-            segProx.getReferential("TF").addMotionFrame(seg.getReferential("TF").motion[i]) # copy technical shank
+        ptOrigin=aqui.GetPoint(str(dictAnat["Right Shank"]['labels'][3])).GetValues()
 
-            R = np.dot(seg.anatomicalFrame.motion[i].getRotation(),rotZ_tibRot)
+        segProx.getReferential("TF").setMotion(seg.getReferential("TF").motion.getRotations(),
+                                               seg.getReferential("TF").motion.getTranslations()) # copy technical shank
 
-            csFrame.update(R,ptOrigin)
-            segProx.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        R = np.einsum("nij,jk->nik",seg.anatomicalFrame.motion.getRotations(),rotZ_tibRot)
+        segProx.anatomicalFrame.setMotion(R,ptOrigin)
 
 
 
@@ -3237,45 +3015,29 @@ class CGM1(CGM):
         # NA
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][0])).GetValues()[i,:] #toe
-            pt2=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][1])).GetValues()[i,:] #ajc
+        pt1=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][0])).GetValues() #toe
+        pt2=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][1])).GetValues() #ajc
 
-            if dictRef["Left Foot"]["TF"]['labels'][2] is not None:
-                pt3=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][2])).GetValues()[i,:]
-                v=(pt3-pt1)
-            else:
-                v=self.getSegment("Left Shank Proximal").anatomicalFrame.motion[i].m_axisY
-
-            ptOrigin=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Left Foot"]["TF"]['sequence'])
+        if dictRef["Left Foot"]["TF"]['labels'][2] is not None:
+            pt3=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][2])).GetValues()
+            v=(pt3-pt1)
+        else:
+            v=self.getSegment("Left Shank Proximal").anatomicalFrame.motion.getAxisY()
 
+        ptOrigin=aqui.GetPoint(str(dictRef["Left Foot"]["TF"]['labels'][3])).GetValues()
 
-            if "viconCGM1compatible" in options.keys() and options["viconCGM1compatible"]:
-                R2 = R
-            else:
-                R2 = np.dot(R,self._R_leftUnCorrfoot_dist_prox)
+        a1=numeric.normalizeArray(pt2-pt1)
+        v=numeric.normalizeArray(v)
+        a2=numeric.normalizeArray(np.cross(a1,v))
 
+        x,y,z,R=frame.setFrameDataArray(a1,a2,dictRef["Left Foot"]["TF"]['sequence'])
 
-            csFrame.m_axisX=R2[:,0]
-            csFrame.m_axisY=R2[:,1]
-            csFrame.m_axisZ=R2[:,2]
-            csFrame.setRotation(R2)
-            csFrame.setTranslation(ptOrigin)
+        if "viconCGM1compatible" in options.keys() and options["viconCGM1compatible"]:
+            R2 = R
+        else:
+            R2 = np.einsum("nij,jk->nik",R,self._R_leftUnCorrfoot_dist_prox)
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        seg.getReferential("TF").setMotion(R2,ptOrigin)
 
 
         # --- motion of the anatomical referential
@@ -3286,14 +3048,10 @@ class CGM1(CGM):
         # NA
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-            ptOrigin=aqui.GetPoint(str(dictAnat["Left Foot"]['labels'][3])).GetValues()[i,:]
+        ptOrigin=aqui.GetPoint(str(dictAnat["Left Foot"]['labels'][3])).GetValues()
 
-            R = np.dot(seg.getReferential("TF").motion[i].getRotation(), seg.getReferential("TF").relativeMatrixAnatomic)
-
-            csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        R = np.einsum("nij,jk->nik",seg.getReferential("TF").motion.getRotations(), seg.getReferential("TF").relativeMatrixAnatomic)
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
 
@@ -3320,43 +3078,29 @@ class CGM1(CGM):
         # NA
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][0])).GetValues()[i,:] #toe
-            pt2=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][1])).GetValues()[i,:] #ajc
-
-            if dictRef["Right Foot"]["TF"]['labels'][2] is not None:
-                pt3=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][2])).GetValues()[i,:]
-                v=(pt3-pt1)
-            else:
-                v=self.getSegment("Right Shank Proximal").anatomicalFrame.motion[i].m_axisY
+        pt1=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][0])).GetValues() #toe
+        pt2=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][1])).GetValues() #ajc
 
-            ptOrigin=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][3])).GetValues()[i,:]
+        if dictRef["Right Foot"]["TF"]['labels'][2] is not None:
+            pt3=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][2])).GetValues()
+            v=(pt3-pt1)
+        else:
+            v=self.getSegment("Right Shank Proximal").anatomicalFrame.motion.getAxisY()
 
+        ptOrigin=aqui.GetPoint(str(dictRef["Right Foot"]["TF"]['labels'][3])).GetValues()
 
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
+        a1=numeric.normalizeArray(pt2-pt1)
+        v=numeric.normalizeArray(v)
+        a2=numeric.normalizeArray(np.cross(a1,v))
 
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
+        x,y,z,R=frame.setFrameDataArray(a1,a2,dictRef["Right Foot"]["TF"]['sequence'])
 
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Right Foot"]["TF"]['sequence'])
-
-            if "viconCGM1compatible" in options.keys() and options["viconCGM1compatible"]:
-                R2 = R # e.g from proximal shank
-            else:
-                R2 = np.dot(R,self._R_rightUnCorrfoot_dist_prox) # e.g from distal shank Y axis
-
-            csFrame.m_axisX=R2[:,0]
-            csFrame.m_axisY=R2[:,1]
-            csFrame.m_axisZ=R2[:,2]
-            csFrame.setRotation(R2)
-            csFrame.setTranslation(ptOrigin)
+        if "viconCGM1compatible" in options.keys() and options["viconCGM1compatible"]:
+            R2 = R # e.g from proximal shank
+        else:
+            R2 = np.einsum("nij,jk->nik",R,self._R_rightUnCorrfoot_dist_prox) # e.g from distal shank Y axis
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        seg.getReferential("TF").setMotion(R2,ptOrigin)
 
 
         # --- motion of the anatomical referential
@@ -3367,14 +3111,10 @@ class CGM1(CGM):
         # computation
         seg.anatomicalFrame.motion=[]
 
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-            ptOrigin=aqui.GetPoint(str(dictAnat["Right Foot"]['labels'][3])).GetValues()[i,:]
-
-            R = np.dot(seg.getReferential("TF").motion[i].getRotation(), seg.getReferential("TF").relativeMatrixAnatomic)
+        ptOrigin=aqui.GetPoint(str(dictAnat["Right Foot"]['labels'][3])).GetValues()
 
-            csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        R = np.einsum("nij,jk->nik",seg.getReferential("TF").motion.getRotations(), seg.getReferential("TF").relativeMatrixAnatomic)
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
     # ---- static PIG -----
 
@@ -3397,36 +3137,27 @@ class CGM1(CGM):
 
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aquiStatic.GetPointFrameNumber()):
-            ptOrigin=aquiStatic.GetPoint(str(dictAnat["Left Foot"]['labels'][3])).GetValues()[i,:]
-
-
-            pt1=aquiStatic.GetPoint(str(dictAnat["Left Foot"]['labels'][0])).GetValues()[i,:] #toe
-            pt2=aquiStatic.GetPoint(str(dictAnat["Left Foot"]['labels'][1])).GetValues()[i,:] #hee
+        ptOrigin=aquiStatic.GetPoint(str(dictAnat["Left Foot"]['labels'][3])).GetValues()
 
-            if ("leftFlatFoot" in options.keys() and options["leftFlatFoot"]):
-                pt2[2] = pt1[2]+self.mp['LeftSoleDelta']
+        pt1=aquiStatic.GetPoint(str(dictAnat["Left Foot"]['labels'][0])).GetValues() #toe
+        pt2=aquiStatic.GetPoint(str(dictAnat["Left Foot"]['labels'][1])).GetValues() #hee
 
-            if dictAnat["Left Foot"]['labels'][2] is not None:
-                pt3=aquiStatic.GetPoint(str(dictAnat["Left Foot"]['labels'][2])).GetValues()[i,:]
-                v=(pt3-pt1)
-            else:
-                v=self.getSegment("Left Shank").anatomicalFrame.motion[i].m_axisY # distal segment
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
+        if ("leftFlatFoot" in options.keys() and options["leftFlatFoot"]):
+            pt2 = pt2.copy()
+            pt2[:,2] = pt1[:,2]+self.mp['LeftSoleDelta']
 
+        if dictAnat["Left Foot"]['labels'][2] is not None:
+            pt3=aquiStatic.GetPoint(str(dictAnat["Left Foot"]['labels'][2])).GetValues()
+            v=(pt3-pt1)
+        else:
+            v=self.getSegment("Left Shank").anatomicalFrame.motion.getAxisY() # distal segment
 
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat["Left Foot"]['sequence'])
+        a1=numeric.normalizeArray(pt2-pt1)
+        v=numeric.normalizeArray(v)
+        a2=numeric.normalizeArray(np.cross(a1,v))
 
-            csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        x,y,z,R=frame.setFrameDataArray(a1,a2,dictAnat["Left Foot"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
     def _right_foot_motion_static(self,aquiStatic, dictAnat,options=None):
@@ -3444,37 +3175,27 @@ class CGM1(CGM):
         # NA
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aquiStatic.GetPointFrameNumber()):
-            ptOrigin=aquiStatic.GetPoint(str(dictAnat["Right Foot"]['labels'][3])).GetValues()[i,:]
-
-
-            pt1=aquiStatic.GetPoint(str(dictAnat["Right Foot"]['labels'][0])).GetValues()[i,:] #toe
-            pt2=aquiStatic.GetPoint(str(dictAnat["Right Foot"]['labels'][1])).GetValues()[i,:] #hee
+        ptOrigin=aquiStatic.GetPoint(str(dictAnat["Right Foot"]['labels'][3])).GetValues()
 
-            if ("rightFlatFoot" in options.keys() and options["rightFlatFoot"]):
-                pt2[2] = pt1[2]+self.mp['RightSoleDelta']
-
-
-            if dictAnat["Right Foot"]['labels'][2] is not None:
-                pt3=aquiStatic.GetPoint(str(dictAnat["Right Foot"]['labels'][2])).GetValues()[i,:]
-                v=(pt3-pt1)
-            else:
-                v=self.getSegment("Right Shank").anatomicalFrame.motion[i].m_axisY # distal segment
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
+        pt1=aquiStatic.GetPoint(str(dictAnat["Right Foot"]['labels'][0])).GetValues() #toe
+        pt2=aquiStatic.GetPoint(str(dictAnat["Right Foot"]['labels'][1])).GetValues() #hee
 
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
+        if ("rightFlatFoot" in options.keys() and options["rightFlatFoot"]):
+            pt2 = pt2.copy()
+            pt2[:,2] = pt1[:,2]+self.mp['RightSoleDelta']
 
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat["Right Foot"]['sequence'])
+        if dictAnat["Right Foot"]['labels'][2] is not None:
+            pt3=aquiStatic.GetPoint(str(dictAnat["Right Foot"]['labels'][2])).GetValues()
+            v=(pt3-pt1)
+        else:
+            v=self.getSegment("Right Shank").anatomicalFrame.motion.getAxisY() # distal segment
 
+        a1=numeric.normalizeArray(pt2-pt1)
+        v=numeric.normalizeArray(v)
+        a2=numeric.normalizeArray(np.cross(a1,v))
 
-            csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        x,y,z,R=frame.setFrameDataArray(a1,a2,dictAnat["Right Foot"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
     # ----- least-square Segmental motion ------
     def _pelvis_motion_optimize(self,aqui, dictRef, motionMethod,anatomicalFrameMotionEnable=True):
@@ -3507,29 +3228,15 @@ class CGM1(CGM):
                 i+=1
 
         # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
-
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
+        if motionMethod == enums.motionMethod.Sodervisk :
+            dynPos = btkTools.getMarkerArray(aqui,seg.m_tracking_markers)
 
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArray(staticPos,dynPos)
+            R=np.einsum("nij,jk->nik",Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.einsum("nij,j->ni",Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
+            seg.getReferential("TF").additionalInfos["RMSE"] = RMSE
 
 
         # --- HJC
@@ -3597,31 +3304,15 @@ class CGM1(CGM):
 
 
         # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
+        if motionMethod == enums.motionMethod.Sodervisk :
+            dynPos = btkTools.getMarkerArray(aqui,seg.m_tracking_markers)
 
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArray(staticPos,dynPos)
+            R=np.einsum("nij,jk->nik",Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.einsum("nij,j->ni",Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
-
-
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
-
-                seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
+            seg.getReferential("TF").additionalInfos["RMSE"] = RMSE
 
         # --- LKJC
         desc = seg.getReferential('TF').static.getNode_byLabel("LKJC").m_desc
@@ -3680,31 +3371,15 @@ class CGM1(CGM):
                 i+=1
 
         # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
-
+        if motionMethod == enums.motionMethod.Sodervisk :
+            dynPos = btkTools.getMarkerArray(aqui,seg.m_tracking_markers)
 
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArray(staticPos,dynPos)
+            R=np.einsum("nij,jk->nik",Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.einsum("nij,j->ni",Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
-
-                seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
+            seg.getReferential("TF").additionalInfos["RMSE"] = RMSE
 
         # --- RKJC
         desc = seg.getReferential('TF').static.getNode_byLabel("RKJC").m_desc
@@ -3759,30 +3434,15 @@ class CGM1(CGM):
                 i+=1
 
         # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
-
+        if motionMethod == enums.motionMethod.Sodervisk :
+            dynPos = btkTools.getMarkerArray(aqui,seg.m_tracking_markers)
 
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArray(staticPos,dynPos)
+            R=np.einsum("nij,jk->nik",Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.einsum("nij,j->ni",Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
-
-                seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
+            seg.getReferential("TF").additionalInfos["RMSE"] = RMSE
 
 
         # --- LAJC
@@ -3843,31 +3503,15 @@ class CGM1(CGM):
                 i+=1
 
         # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
-
-
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
+        if motionMethod == enums.motionMethod.Sodervisk :
+            dynPos = btkTools.getMarkerArray(aqui,seg.m_tracking_markers)
 
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArray(staticPos,dynPos)
+            R=np.einsum("nij,jk->nik",Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.einsum("nij,j->ni",Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
-
-                seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
+            seg.getReferential("TF").additionalInfos["RMSE"] = RMSE
 
         # RAJC
         desc = seg.getReferential('TF').static.getNode_byLabel("RAJC").m_desc
@@ -3914,30 +3558,15 @@ class CGM1(CGM):
                 i+=1
 
         # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
-
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm= motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
-
+        if motionMethod == enums.motionMethod.Sodervisk :
+            dynPos = btkTools.getMarkerArray(aqui,seg.m_tracking_markers)
 
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArray(staticPos,dynPos)
+            R=np.einsum("nij,jk->nik",Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.einsum("nij,j->ni",Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
+            seg.getReferential("TF").additionalInfos["RMSE"] = RMSE
 
 
         # --- AJC from Foot
@@ -3978,30 +3607,15 @@ class CGM1(CGM):
                 i+=1
 
         # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
-
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm= motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
+        if motionMethod == enums.motionMethod.Sodervisk :
+            dynPos = btkTools.getMarkerArray(aqui,seg.m_tracking_markers)
 
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArray(staticPos,dynPos)
+            R=np.einsum("nij,jk->nik",Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.einsum("nij,j->ni",Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
+            seg.getReferential("TF").additionalInfos["RMSE"] = RMSE
 
 
         # --- AJC from Foot
@@ -4025,12 +3639,9 @@ class CGM1(CGM):
 
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-            ptOrigin=aqui.GetPoint(originLabel).GetValues()[i,:]
-            R = np.dot(seg.getReferential("TF").motion[i].getRotation(), seg.getReferential("TF").relativeMatrixAnatomic)
-            csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        ptOrigin=aqui.GetPoint(originLabel).GetValues()
+        R = np.einsum("nij,jk->nik",seg.getReferential("TF").motion.getRotations(), seg.getReferential("TF").relativeMatrixAnatomic)
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
     def _rotate_anatomical_motion(self,segmentLabel,angle,aqui,options=None):
@@ -4062,13 +3673,11 @@ class CGM1(CGM):
         rotZ[1,0] =  np.sin(angle)
         rotZ[1,1] = np.cos(angle)
 
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            ptOrigin=seg.anatomicalFrame.motion[i].getTranslation()
+        ptOrigin=seg.anatomicalFrame.motion.getTranslations()
 
-            R = np.dot(seg.anatomicalFrame.motion[i].getRotation(),rotZ)
+        R = np.einsum("nij,jk->nik",seg.anatomicalFrame.motion.getRotations(),rotZ)
 
-            seg.anatomicalFrame.motion[i].update(R,ptOrigin)
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
 
@@ -4079,43 +3688,33 @@ class CGM1(CGM):
             get AJC from abd/add rotation offset
 
             :Parameters:
-               - `ajc` (numpy.array(1,3)) - global location of the ankle joint centre
-               - `kjc` (numpy.array(1,3)) - global location of the knee joint centre
-               - `ank` (numpy.array(1,3)) - global location of the lateral ankle marker
+               - `ajc` (numpy.array(3) or numpy.array(n,3)) - global location of the ankle joint centre
+               - `kjc` (numpy.array(3) or numpy.array(n,3)) - global location of the knee joint centre
+               - `ank` (numpy.array(3) or numpy.array(n,3)) - global location of the lateral ankle marker
                - `offset` (double) - abd/add rotation offset
 
             :return:
                 - final location of AJC after offset rotation
         """
+        arrayDim = np.ndim(ajc)
 
+        ajc = np.atleast_2d(ajc)
+        kjc = np.atleast_2d(kjc)
+        ank = np.atleast_2d(ank)
 
-        a1=(kjc-ajc)
-        a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
+        x,y,z,R=frame.setFrameDataArrayFromPoints(ajc,kjc,ank,"ZXY")
 
-        v=(ank-ajc)
-        v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-        a2=np.cross(a1,v)
-        a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-        x,y,z,R=frame.setFrameData(a1,a2,"ZXY")
-        csFrame=frame.Frame()
-
-        csFrame.m_axisX=x
-        csFrame.m_axisY=y
-        csFrame.m_axisZ=z
-        csFrame.setRotation(R)
-        csFrame.setTranslation(ank)
-
-        loc=np.dot(R.T,ajc-ank)
+        loc=np.einsum("nji,nj->ni",R,ajc-ank)
 
         abAdangle = np.deg2rad(offset)
 
         rotAbdAdd = np.array([[1, 0, 0],[0, np.cos(abAdangle), -1.0*np.sin(abAdangle)], [0, np.sin(abAdangle), np.cos(abAdangle) ]])
 
-        finalRot= np.dot(R,rotAbdAdd)
+        finalRot= np.einsum("nij,jk->nik",R,rotAbdAdd)
+
+        out = np.einsum("nij,nj->ni",finalRot,loc)+ank
 
-        return  np.dot(finalRot,loc)+ank
+        return out[0] if arrayDim == 1 else out
 
 
 # ---- Technical Referential Calibration
@@ -5087,53 +4686,31 @@ class CGM1(CGM):
         btkTools.smartAppendPoint(aqui,"midFront",valFront,desc="")
 
         # computation
-        LSJCvalues=np.zeros((aqui.GetPointFrameNumber(),3))
-        RSJCvalues=np.zeros((aqui.GetPointFrameNumber(),3))
-        LVWMvalues=np.zeros((aqui.GetPointFrameNumber(),3))
-        RVWMvalues=np.zeros((aqui.GetPointFrameNumber(),3))
-        OTvalues=np.zeros((aqui.GetPointFrameNumber(),3))
-
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef["Thorax"]["TF"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictRef["Thorax"]["TF"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictRef["Thorax"]["TF"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictRef["Thorax"]["TF"]['labels'][3])).GetValues()[i,:]
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
+        pt1=aqui.GetPoint(str(dictRef["Thorax"]["TF"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictRef["Thorax"]["TF"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictRef["Thorax"]["TF"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictRef["Thorax"]["TF"]['labels'][3])).GetValues()
 
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Thorax"]["TF"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
+        x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictRef["Thorax"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        OT = ptOrigin + -1.0*(markerDiameter/2.0)*x
 
-            OT = ptOrigin + -1.0*(markerDiameter/2.0)*csFrame.m_axisX
+        LSHO = aqui.GetPoint(str("LSHO")).GetValues()
+        LVWM = np.cross((LSHO - OT ), x ) + LSHO
+        RSHO = aqui.GetPoint(str("RSHO")).GetValues()
+        RVWM = np.cross((RSHO - OT ), x ) + RSHO
 
-            LSHO = aqui.GetPoint(str("LSHO")).GetValues()[i,:]
-            LVWM = np.cross((LSHO - OT ), csFrame.m_axisX ) + LSHO
-            RSHO = aqui.GetPoint(str("RSHO")).GetValues()[i,:]
-            RVWM = np.cross((RSHO - OT ), csFrame.m_axisX ) + RSHO
+        invalid = np.logical_not(np.asarray(validFrames,dtype=bool))
+        OTvalues = OT.copy()
+        OTvalues[invalid,:] = 0.0
+        LVWMvalues = LVWM.copy()
+        LVWMvalues[invalid,:] = 0.0
+        RVWMvalues = RVWM.copy()
+        RVWMvalues[invalid,:] = 0.0
 
-            if validFrames[i]:
-                OTvalues[i,:] = OT
-                LSJCvalues[i,:] = modelDecorator.VCMJointCentre( -1.0*(self.mp["LeftShoulderOffset"]+ markerDiameter/2.0) ,LSHO,OT,LVWM, beta=0 )
-                LVWMvalues[i,:] = LVWM
-                RSJCvalues[i,:] = modelDecorator.VCMJointCentre( 1.0*(self.mp["RightShoulderOffset"]+ markerDiameter/2.0) ,RSHO,OT,RVWM, beta=0 )
-                RVWMvalues[i,:] = RVWM
+        LSJCvalues = modelDecorator.VCMJointCentreArray( -1.0*(self.mp["LeftShoulderOffset"]+ markerDiameter/2.0) ,LSHO,OT,LVWM, beta=0, validFrames=validFrames )
+        RSJCvalues = modelDecorator.VCMJointCentreArray( 1.0*(self.mp["RightShoulderOffset"]+ markerDiameter/2.0) ,RSHO,OT,RVWM, beta=0, validFrames=validFrames )
 
         btkTools.smartAppendPoint(aqui,"OT",OTvalues,desc="")
         btkTools.smartAppendPoint(aqui,"LVWM",LVWMvalues,desc="")
@@ -5159,55 +4736,29 @@ class CGM1(CGM):
         # --- motion of the anatomical referential
         seg.anatomicalFrame.motion=[]
 
-        T5inThorax = np.zeros((aqui.GetPointFrameNumber(),3))
-        C7inThorax = np.zeros((aqui.GetPointFrameNumber(),3))
-        T10inThorax = np.zeros((aqui.GetPointFrameNumber(),3))
-
         # additional markers
         # NA
         # computation
 
         #self._TopLumbar5
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
+        pt1=aqui.GetPoint(str(dictAnat["Thorax"]['labels'][0])).GetValues() #midTop
+        pt2=aqui.GetPoint(str(dictAnat["Thorax"]['labels'][1])).GetValues() #midBottom
+        pt3=aqui.GetPoint(str(dictAnat["Thorax"]['labels'][2])).GetValues() #midFront
+        ptOrigin=aqui.GetPoint(str(dictAnat["Thorax"]['labels'][3])).GetValues() #OT
 
-            pt1=aqui.GetPoint(str(dictAnat["Thorax"]['labels'][0])).GetValues()[i,:] #midTop
-            pt2=aqui.GetPoint(str(dictAnat["Thorax"]['labels'][1])).GetValues()[i,:] #midBottom
-            pt3=aqui.GetPoint(str(dictAnat["Thorax"]['labels'][2])).GetValues()[i,:] #midFront
-            ptOrigin=aqui.GetPoint(str(dictAnat["Thorax"]['labels'][3])).GetValues()[i,:] #OT
-
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat["Thorax"]['sequence'])
-
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
-
-            if hasattr(self,"_TopLumbar5"):
-                T5inThorax[i,:] = np.dot(R.T,self._TopLumbar5[i,:]-ptOrigin)
+        x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictAnat["Thorax"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
+        if hasattr(self,"_TopLumbar5"):
+            T5inThorax = np.einsum("nji,nj->ni",R,self._TopLumbar5-ptOrigin)
 
-            offset =( ptOrigin + np.dot(R,np.array([-markerDiameter/2.0,0,0])) - ptOrigin)*1.05
+        offset = np.einsum("nij,j->ni",R,np.array([-markerDiameter/2.0,0,0]))*1.05
 
-            C7Global= aqui.GetPoint(str("C7")).GetValues()[i,:] + offset
-            C7inThorax[i,:] = np.dot(R.T,C7Global-ptOrigin)
+        C7Global= aqui.GetPoint(str("C7")).GetValues() + offset
+        C7inThorax = np.einsum("nji,nj->ni",R,C7Global-ptOrigin)
 
-            T10Global= aqui.GetPoint(str("T10")).GetValues()[i,:] + offset
-            T10inThorax[i,:] = np.dot(R.T,T10Global-ptOrigin)
+        T10Global= aqui.GetPoint(str("T10")).GetValues() + offset
+        T10inThorax = np.einsum("nji,nj->ni",R,T10Global-ptOrigin)
 
 
         if hasattr(self,"_TopLumbar5"):
@@ -5259,33 +4810,13 @@ class CGM1(CGM):
         # additional markers
 
 
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef[side+" Clavicle"]["TF"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictRef[side+" Clavicle"]["TF"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictRef[side+" Clavicle"]["TF"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictRef[side+" Clavicle"]["TF"]['labels'][3])).GetValues()[i,:]
+        pt1=aqui.GetPoint(str(dictRef[side+" Clavicle"]["TF"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictRef[side+" Clavicle"]["TF"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictRef[side+" Clavicle"]["TF"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictRef[side+" Clavicle"]["TF"]['labels'][3])).GetValues()
 
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef[side+" Clavicle"]["TF"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictRef[side+" Clavicle"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
 
         # --- motion of the anatomical referential
@@ -5295,33 +4826,13 @@ class CGM1(CGM):
         # additional markers
         # NA
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictAnat[side+" Clavicle"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictAnat[side+" Clavicle"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictAnat[side+" Clavicle"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictAnat[side+" Clavicle"]['labels'][3])).GetValues()[i,:]
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat[side+" Clavicle"]['sequence'])
-
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
+        pt1=aqui.GetPoint(str(dictAnat[side+" Clavicle"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictAnat[side+" Clavicle"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictAnat[side+" Clavicle"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictAnat[side+" Clavicle"]['labels'][3])).GetValues()
 
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictAnat[side+" Clavicle"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
     def _upperArm_motion(self,side,aqui, dictRef,dictAnat,options=None,frameReconstruction="Both"):
@@ -5378,43 +4889,16 @@ class CGM1(CGM):
             # btkTools.smartAppendPoint(aqui,prefix+"CVM", CVMvalues, desc="")
 
             # computation
-            EJCvalues=np.zeros((aqui.GetPointFrameNumber(),3))
+            pt1=aqui.GetPoint(str(dictRef[side+" UpperArm"]["TF"]['labels'][0])).GetValues()
+            pt2=aqui.GetPoint(str(dictRef[side+" UpperArm"]["TF"]['labels'][1])).GetValues()
+            pt3=aqui.GetPoint(str(dictRef[side+" UpperArm"]["TF"]['labels'][2])).GetValues()
+            ptOrigin=aqui.GetPoint(str(dictRef[side+" UpperArm"]["TF"]['labels'][3])).GetValues()
 
-            csFrame=frame.Frame()
-            for i in range(0,aqui.GetPointFrameNumber()):
+            x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictRef[side+" UpperArm"]["TF"]['sequence'])
+            seg.getReferential("TF").setMotion(R,ptOrigin)
 
-                pt1=aqui.GetPoint(str(dictRef[side+" UpperArm"]["TF"]['labels'][0])).GetValues()[i,:]
-                pt2=aqui.GetPoint(str(dictRef[side+" UpperArm"]["TF"]['labels'][1])).GetValues()[i,:]
-                pt3=aqui.GetPoint(str(dictRef[side+" UpperArm"]["TF"]['labels'][2])).GetValues()[i,:]
-                ptOrigin=aqui.GetPoint(str(dictRef[side+" UpperArm"]["TF"]['labels'][3])).GetValues()[i,:]
-
-
-                a1=(pt2-pt1)
-                a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-                v=(pt3-pt1)
-                v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-                a2=np.cross(a1,v)
-                a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-                x,y,z,R=frame.setFrameData(a1,a2,dictRef[side+" UpperArm"]["TF"]['sequence'])
-
-                csFrame.m_axisX=x
-                csFrame.m_axisY=y
-                csFrame.m_axisZ=z
-                csFrame.setRotation(R)
-                csFrame.setTranslation(ptOrigin)
-
-                seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
-
-                SJC = aqui.GetPoint(prefix+"SJC").GetValues()[i,:]
-                LHE=aqui.GetPoint(prefix+"ELB").GetValues()[i,:]
-                CVM = aqui.GetPoint(prefix+"CVM").GetValues()[i,:]
-
-                #EJCvalues[i,:] =  modelDecorator.VCMJointCentre( (self.mp[side+"ElbowWidth"]+ markerDiameter)/2.0 ,LHE,SJC,CVM, beta=0 )
-                if validFrames[i]:
-                    EJCvalues[i,:] =  modelDecorator.VCMJointCentre( (self.mp[side+"ElbowWidth"]+ markerDiameter)/2.0 ,pt1,pt2,pt3, beta=0 )
+            #EJCvalues =  modelDecorator.VCMJointCentreArray( (self.mp[side+"ElbowWidth"]+ markerDiameter)/2.0 ,LHE,SJC,CVM, beta=0 )
+            EJCvalues =  modelDecorator.VCMJointCentreArray( (self.mp[side+"ElbowWidth"]+ markerDiameter)/2.0 ,pt1,pt2,pt3, beta=0, validFrames=validFrames )
 
 
             #btkTools.smartAppendPoint(aqui,"LKJC_Chord",LKJCvalues,desc="chord")
@@ -5448,34 +4932,13 @@ class CGM1(CGM):
             # additional markers
             # NA
             # computation
-            csFrame=frame.Frame()
-            for i in range(0,aqui.GetPointFrameNumber()):
-
-                pt1=aqui.GetPoint(str(dictAnat[side+" UpperArm"]['labels'][0])).GetValues()[i,:]
-                pt2=aqui.GetPoint(str(dictAnat[side+" UpperArm"]['labels'][1])).GetValues()[i,:]
-                pt3=aqui.GetPoint(str(dictAnat[side+" UpperArm"]['labels'][2])).GetValues()[i,:]
-                ptOrigin=aqui.GetPoint(str(dictAnat[side+" UpperArm"]['labels'][3])).GetValues()[i,:]
-
-
-                a1=(pt2-pt1)
-                a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-                v=(pt3-pt1)
-                v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
+            pt1=aqui.GetPoint(str(dictAnat[side+" UpperArm"]['labels'][0])).GetValues()
+            pt2=aqui.GetPoint(str(dictAnat[side+" UpperArm"]['labels'][1])).GetValues()
+            pt3=aqui.GetPoint(str(dictAnat[side+" UpperArm"]['labels'][2])).GetValues()
+            ptOrigin=aqui.GetPoint(str(dictAnat[side+" UpperArm"]['labels'][3])).GetValues()
 
-                a2=np.cross(a1,v)
-                a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-                x,y,z,R=frame.setFrameData(a1,a2,dictAnat[side+" UpperArm"]['sequence'])
-
-
-                csFrame.m_axisX=x
-                csFrame.m_axisY=y
-                csFrame.m_axisZ=z
-                csFrame.setRotation(R)
-                csFrame.setTranslation(ptOrigin)
-
-                seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+            x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictAnat[side+" UpperArm"]['sequence'])
+            seg.anatomicalFrame.setMotion(R,ptOrigin)
 
     def _foreArm_motion(self,side,aqui, dictRef,dictAnat,options=None, frameReconstruction="both"):
         """
@@ -5521,50 +4984,24 @@ class CGM1(CGM):
             # computation
             WJCvalues=np.zeros((aqui.GetPointFrameNumber(),3))
 
-            csFrame=frame.Frame()
-            for i in range(0,aqui.GetPointFrameNumber()):
-
-                pt1=aqui.GetPoint(str(dictRef[side+" ForeArm"]["TF"]['labels'][0])).GetValues()[i,:]#
-                pt2=aqui.GetPoint(str(dictRef[side+" ForeArm"]["TF"]['labels'][1])).GetValues()[i,:]
-                pt3=aqui.GetPoint(str(dictRef[side+" ForeArm"]["TF"]['labels'][2])).GetValues()[i,:]
-                ptOrigin=aqui.GetPoint(str(dictRef[side+" ForeArm"]["TF"]['labels'][3])).GetValues()[i,:]
-
-
-                a1=(pt2-pt1)
-                a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-                v=(pt3-pt1)
-                v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-                a2=np.cross(a1,v)
-                a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-                x,y,z,R=frame.setFrameData(a1,a2,dictRef[side+" ForeArm"]["TF"]['sequence'])
-
-                csFrame.m_axisX=x
-                csFrame.m_axisY=y
-                csFrame.m_axisZ=z
-                csFrame.setRotation(R)
-                csFrame.setTranslation(ptOrigin)
-
-                seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            pt1=aqui.GetPoint(str(dictRef[side+" ForeArm"]["TF"]['labels'][0])).GetValues()#
+            pt2=aqui.GetPoint(str(dictRef[side+" ForeArm"]["TF"]['labels'][1])).GetValues()
+            pt3=aqui.GetPoint(str(dictRef[side+" ForeArm"]["TF"]['labels'][2])).GetValues()
+            ptOrigin=aqui.GetPoint(str(dictRef[side+" ForeArm"]["TF"]['labels'][3])).GetValues()
 
-                EJC = pt2
-                US=pt3
-                RS=pt1
+            x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictRef[side+" ForeArm"]["TF"]['sequence'])
+            seg.getReferential("TF").setMotion(R,ptOrigin)
 
-                MWP=aqui.GetPoint(prefix+"MWP").GetValues()[i,:]
+            EJC = pt2
+            US=pt3
+            RS=pt1
 
-                WJCaxis = np.cross((US-RS),(EJC-MWP))
-                WJCaxis = WJCaxis / np.linalg.norm(WJCaxis)
-                if validFrames[i]:
-                    WJCvalues[i,:] =MWP +  (s*(self.mp[side +"WristWidth"]+markerDiameter)/2.0)*WJCaxis
+            MWP=aqui.GetPoint(prefix+"MWP").GetValues()
 
-
-                EJC=aqui.GetPoint(prefix+"EJC").GetValues()[i,:]
-                US=aqui.GetPoint(prefix+"WRB").GetValues()[i,:]
-                RS=aqui.GetPoint(prefix+"WRA").GetValues()[i,:]
-                MWP=aqui.GetPoint(prefix+"MWP").GetValues()[i,:]
+            WJCaxis = np.cross((US-RS),(EJC-MWP))
+            WJCaxis = WJCaxis / np.linalg.norm(WJCaxis,axis=1)[:,np.newaxis]
+            valid = np.asarray(validFrames,dtype=bool)
+            WJCvalues[valid,:] =MWP[valid,:] +  (s*(self.mp[side +"WristWidth"]+markerDiameter)/2.0)*WJCaxis[valid,:]
 
 
             #btkTools.smartAppendPoint(aqui,"LKJC_Chord",LKJCvalues,desc="chord")
@@ -5594,38 +5031,22 @@ class CGM1(CGM):
 
 
             # computation
-            csFrame=frame.Frame()
-            for i in range(0,aqui.GetPointFrameNumber()):
-
-                pt1=aqui.GetPoint(str(dictAnat[side+" ForeArm"]['labels'][0])).GetValues()[i,:]
-                pt2=aqui.GetPoint(str(dictAnat[side+" ForeArm"]['labels'][1])).GetValues()[i,:]
-                if dictAnat[side+" ForeArm"]['labels'][2] is not None:
-                    pt3=aqui.GetPoint(str(dictAnat[side+" ForeArm"]['labels'][2])).GetValues()[i,:]
-
-                ptOrigin=aqui.GetPoint(str(dictAnat[side+" ForeArm"]['labels'][3])).GetValues()[i,:]
-
-
-                a1=(pt2-pt1)
-                a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-                if dictAnat[side+" ForeArm"]['labels'][2] is not None:
-                    v=(pt3-pt1)
-                    v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-                else:
-                    v=self.getSegment(side+" UpperArm").anatomicalFrame.motion[i].m_axisY
+            pt1=aqui.GetPoint(str(dictAnat[side+" ForeArm"]['labels'][0])).GetValues()
+            pt2=aqui.GetPoint(str(dictAnat[side+" ForeArm"]['labels'][1])).GetValues()
+            ptOrigin=aqui.GetPoint(str(dictAnat[side+" ForeArm"]['labels'][3])).GetValues()
 
-                a2=np.cross(a1,v)
-                a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
+            a1=numeric.normalizeArray(pt2-pt1)
 
-                x,y,z,R=frame.setFrameData(a1,a2,dictAnat[side+" ForeArm"]['sequence'])
+            if dictAnat[side+" ForeArm"]['labels'][2] is not None:
+                pt3=aqui.GetPoint(str(dictAnat[side+" ForeArm"]['labels'][2])).GetValues()
+                v=numeric.normalizeArray(pt3-pt1)
+            else:
+                v=self.getSegment(side+" UpperArm").anatomicalFrame.motion.getAxisY()
 
-                csFrame.m_axisX=x
-                csFrame.m_axisY=y
-                csFrame.m_axisZ=z
-                csFrame.setRotation(R)
-                csFrame.setTranslation(ptOrigin)
+            a2=numeric.normalizeArray(np.cross(a1,v))
 
-                seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+            x,y,z,R=frame.setFrameDataArray(a1,a2,dictAnat[side+" ForeArm"]['sequence'])
+            seg.anatomicalFrame.setMotion(R,ptOrigin)
 
     def _hand_motion(self,side,aqui, dictRef,dictAnat,options=None):
         """
@@ -5670,40 +5091,18 @@ class CGM1(CGM):
 
 
         # computation
-        HOvalues=np.zeros((aqui.GetPointFrameNumber(),3))
-
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictRef[side+" Hand"]["TF"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictRef[side+" Hand"]["TF"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictRef[side+" Hand"]["TF"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictRef[side+" Hand"]["TF"]['labels'][3])).GetValues()[i,:]
+        pt1=aqui.GetPoint(str(dictRef[side+" Hand"]["TF"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictRef[side+" Hand"]["TF"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictRef[side+" Hand"]["TF"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictRef[side+" Hand"]["TF"]['labels'][3])).GetValues()
 
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
+        x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictRef[side+" Hand"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef[side+" Hand"]["TF"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
-
-            WJC=aqui.GetPoint(prefix+"WJC").GetValues()[i,:]
-            MH2=aqui.GetPoint(prefix+"FIN").GetValues()[i,:]
-            MWP=aqui.GetPoint(prefix+"MWP").GetValues()[i,:]
-            if validFrames[i]:
-                HOvalues[i,:] =  modelDecorator.VCMJointCentre( (self.mp[side+"HandThickness"]+ markerDiameter)/2.0 ,MH2, WJC, MWP, beta=0 )
+        WJC=aqui.GetPoint(prefix+"WJC").GetValues()
+        MH2=aqui.GetPoint(prefix+"FIN").GetValues()
+        MWP=aqui.GetPoint(prefix+"MWP").GetValues()
+        HOvalues =  modelDecorator.VCMJointCentreArray( (self.mp[side+"HandThickness"]+ markerDiameter)/2.0 ,MH2, WJC, MWP, beta=0, validFrames=validFrames )
 
 
         if  "useLeftHOmarker" in options.keys():
@@ -5729,33 +5128,13 @@ class CGM1(CGM):
         # additional markers
         # NA
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            pt1=aqui.GetPoint(str(dictAnat[side+" Hand"]['labels'][0])).GetValues()[i,:]
-            pt2=aqui.GetPoint(str(dictAnat[side+" Hand"]['labels'][1])).GetValues()[i,:]
-            pt3=aqui.GetPoint(str(dictAnat[side+" Hand"]['labels'][2])).GetValues()[i,:]
-            ptOrigin=aqui.GetPoint(str(dictAnat[side+" Hand"]['labels'][3])).GetValues()[i,:]
+        pt1=aqui.GetPoint(str(dictAnat[side+" Hand"]['labels'][0])).GetValues()
+        pt2=aqui.GetPoint(str(dictAnat[side+" Hand"]['labels'][1])).GetValues()
+        pt3=aqui.GetPoint(str(dictAnat[side+" Hand"]['labels'][2])).GetValues()
+        ptOrigin=aqui.GetPoint(str(dictAnat[side+" Hand"]['labels'][3])).GetValues()
 
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictAnat[side+" Hand"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictAnat[side+" Hand"]['sequence'])
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
     def _head_motion(self,aqui, dictRef,dictAnat,options=None):
         """
@@ -5791,32 +5170,13 @@ class CGM1(CGM):
         btkTools.smartAppendPoint(aqui,"HC",valmHC,desc="")
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
+        pt1=aqui.GetPoint(str(dictRef["Head"]["TF"]['labels'][0])).GetValues() #toe
+        pt2=aqui.GetPoint(str(dictRef["Head"]["TF"]['labels'][1])).GetValues() #ajc
+        pt3=aqui.GetPoint(str(dictRef["Head"]["TF"]['labels'][2])).GetValues() #ajc
+        ptOrigin=aqui.GetPoint(str(dictRef["Head"]["TF"]['labels'][3])).GetValues()
 
-            pt1=aqui.GetPoint(str(dictRef["Head"]["TF"]['labels'][0])).GetValues()[i,:] #toe
-            pt2=aqui.GetPoint(str(dictRef["Head"]["TF"]['labels'][1])).GetValues()[i,:] #ajc
-            pt3=aqui.GetPoint(str(dictRef["Head"]["TF"]['labels'][2])).GetValues()[i,:] #ajc
-            ptOrigin=aqui.GetPoint(str(dictRef["Head"]["TF"]['labels'][3])).GetValues()[i,:]
-
-            a1=(pt2-pt1)
-            a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-            v=(pt3-pt1)
-            v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-            a2=np.cross(a1,v)
-            a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-            x,y,z,R=frame.setFrameData(a1,a2,dictRef["Head"]["TF"]['sequence'])
-
-            csFrame.m_axisX=x
-            csFrame.m_axisY=y
-            csFrame.m_axisZ=z
-            csFrame.setRotation(R)
-            csFrame.setTranslation(ptOrigin)
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+        x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,dictRef["Head"]["TF"]['sequence'])
+        seg.getReferential("TF").setMotion(R,ptOrigin)
 
 
         # --- motion of the anatomical referential
@@ -5827,13 +5187,9 @@ class CGM1(CGM):
         # NA
 
         # computation
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-            ptOrigin=aqui.GetPoint(str(dictAnat["Head"]['labels'][3])).GetValues()[i,:]
-            R = np.dot(seg.getReferential("TF").motion[i].getRotation(), seg.getReferential("TF").relativeMatrixAnatomic)
-
-            csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        ptOrigin=aqui.GetPoint(str(dictAnat["Head"]['labels'][3])).GetValues()
+        R = np.einsum("nij,jk->nik",seg.getReferential("TF").motion.getRotations(), seg.getReferential("TF").relativeMatrixAnatomic)
+        seg.anatomicalFrame.setMotion(R,ptOrigin)
 
 
     # --- opensim --------
@@ -1521,7 +1521,7 @@ class CGM2_4(CGM2_3):
             csFrame.setRotation(R)
             csFrame.setTranslation(ptOrigin)
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").addMotionFrame(csFrame)
 
         # --- FJC
         # btkTools.smartAppendPoint(aqui,"LFJC",seg.getReferential("TF").getNodeTrajectory("LFJC"),desc="from hindFoot" ) # put in ForefootMotion
@@ -1536,7 +1536,7 @@ class CGM2_4(CGM2_3):
             #R = np.dot(seg.getReferential("TF").motion[i].getRotation(),relativeSegTech )
             R = np.dot(seg.getReferential("TF").motion[i].getRotation(), seg.getReferential("TF").relativeMatrixAnatomic)
             csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+            seg.anatomicalFrame.addMotionFrame(csFrame)
 
 
     def _left_foreFoot_motion(self,aqui, dictRef,dictAnat,options=None):
@@ -1589,7 +1589,7 @@ class CGM2_4(CGM2_3):
             csFrame.setRotation(R)
             csFrame.setTranslation(ptOrigin)
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").addMotionFrame(csFrame)
 
         # --- motion of new markers
         btkTools.smartAppendPoint(aqui,"LvSMH",seg.getReferential("TF").getNodeTrajectory("LvSMH") )
@@ -1602,7 +1602,7 @@ class CGM2_4(CGM2_3):
             #R = np.dot(seg.getReferential("TF").motion[i].getRotation(),relativeSegTech )
             R = np.dot(seg.getReferential("TF").motion[i].getRotation(), seg.getReferential("TF").relativeMatrixAnatomic)
             csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+            seg.anatomicalFrame.addMotionFrame(csFrame)
 
 
 
@@ -1660,7 +1660,7 @@ class CGM2_4(CGM2_3):
             csFrame.setRotation(R)
             csFrame.setTranslation(ptOrigin)
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").addMotionFrame(csFrame)
 
         # --- RvTOE
         btkTools.smartAppendPoint(aqui,"RFJC-HindFoot",seg.getReferential("TF").getNodeTrajectory("RFJC"),desc="from hindFoot" )
@@ -1674,7 +1674,7 @@ class CGM2_4(CGM2_3):
             #R = np.dot(seg.getReferential("TF").motion[i].getRotation(),relativeSegTech )
             R = np.dot(seg.getReferential("TF").motion[i].getRotation(), seg.getReferential("TF").relativeMatrixAnatomic)
             csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+            seg.anatomicalFrame.addMotionFrame(csFrame)
 
 
     def _right_foreFoot_motion(self,aqui, dictRef,dictAnat,options=None):
@@ -1727,7 +1727,7 @@ class CGM2_4(CGM2_3):
             csFrame.setRotation(R)
             csFrame.setTranslation(ptOrigin)
 
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").addMotionFrame(csFrame)
 
 
         # --- motion of new markers
@@ -1742,7 +1742,7 @@ class CGM2_4(CGM2_3):
             #R = np.dot(seg.getReferential("TF").motion[i].getRotation(),relativeSegTech )
             R = np.dot(seg.getReferential("TF").motion[i].getRotation(), seg.getReferential("TF").relativeMatrixAnatomic)
             csFrame.update(R,ptOrigin)
-            seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+            seg.anatomicalFrame.addMotionFrame(csFrame)
 
 
     # ----- least-square Segmental motion ------
@@ -1771,30 +1771,15 @@ class CGM2_4(CGM2_3):
                 i+=1
 
         # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
-
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm= motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
+        if motionMethod == enums.motionMethod.Sodervisk :
+            dynPos = btkTools.getMarkerArray(aqui,seg.m_tracking_markers)
 
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArray(staticPos,dynPos)
+            R=np.einsum("nij,jk->nik",Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.einsum("nij,j->ni",Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
+            seg.getReferential("TF").additionalInfos["RMSE"] = RMSE
 
         # --- vTOE and AJC
         btkTools.smartAppendPoint(aqui,"LAJC-HindFoot",seg.getReferential("TF").getNodeTrajectory("LAJC"),desc="opt from hindfoot" )
@@ -1830,29 +1815,15 @@ class CGM2_4(CGM2_3):
                 i+=1
 
         # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
+        if motionMethod == enums.motionMethod.Sodervisk :
+            dynPos = btkTools.getMarkerArray(aqui,seg.m_tracking_markers)
 
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArray(staticPos,dynPos)
+            R=np.einsum("nij,jk->nik",Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.einsum("nij,j->ni",Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
+            seg.getReferential("TF").additionalInfos["RMSE"] = RMSE
 
 
         # --- motion of new markers
@@ -1891,29 +1862,15 @@ class CGM2_4(CGM2_3):
                 i+=1
 
         # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
+        if motionMethod == enums.motionMethod.Sodervisk :
+            dynPos = btkTools.getMarkerArray(aqui,seg.m_tracking_markers)
 
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm= motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArray(staticPos,dynPos)
+            R=np.einsum("nij,jk->nik",Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.einsum("nij,j->ni",Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
+            seg.getReferential("TF").additionalInfos["RMSE"] = RMSE
 
         # --- vTOE and AJC
         btkTools.smartAppendPoint(aqui,"RAJC-HindFoot",seg.getReferential("TF").getNodeTrajectory("RAJC"),desc="opt from hindfoot" )
@@ -1949,29 +1906,15 @@ class CGM2_4(CGM2_3):
                 i+=1
 
         # part 2 : get dynamic position ( look out i pick up value in the btkAcquisition)
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
+        if motionMethod == enums.motionMethod.Sodervisk :
+            dynPos = btkTools.getMarkerArray(aqui,seg.m_tracking_markers)
+
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArray(staticPos,dynPos)
+            R=np.einsum("nij,jk->nik",Ropt,seg.getReferential("TF").static.getRotation())
+            tOri=np.einsum("nij,j->ni",Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
 
-            if seg.m_tracking_markers != []: # work with traking markers
-                dynPos = np.zeros((len(seg.m_tracking_markers),3)) # use
-                k=0
-                for label in seg.m_tracking_markers:
-                    dynPos[k,:] = aqui.GetPoint(label).GetValues()[i,:]
-                    k+=1
-
-            if motionMethod == enums.motionMethod.Sodervisk :
-                Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(staticPos,
-                                                              dynPos)
-                R=np.dot(Ropt,seg.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,seg.getReferential("TF").static.getTranslation())+Lopt
-
-                csFrame.setRotation(R)
-                csFrame.setTranslation(tOri)
-                csFrame.m_axisX=R[:,0]
-                csFrame.m_axisY=R[:,1]
-                csFrame.m_axisZ=R[:,2]
-
-            seg.getReferential("TF").addMotionFrame(copy.deepcopy(csFrame))
+            seg.getReferential("TF").setMotion(R,tOri)
+            seg.getReferential("TF").additionalInfos["RMSE"] = RMSE
 
         # --- motion of new markers
         # --- LvSMH
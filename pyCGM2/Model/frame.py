@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import numpy as np
 import pyCGM2; LOGGER = pyCGM2.LOGGER
+from pyCGM2.Math import numeric
 
 
 
@@ -128,14 +129,6 @@ def setFrameData(a1,a2,sequence):
         rot=np.array([axisX,axisY,axisZ]).T
 
 
-    if sequence == "YXZ" or sequence == "YXiZ" :
-        if sequence == "YXiZ":
-            a2=a2*-1.0
-        axisY=a1
-        axisX=a2
-        axisZ=np.cross(a2,a1)
-        rot=np.array([axisX,axisY,axisZ]).T
-
 
     if sequence == "ZXY" or sequence == "ZXiY" :
         if sequence == "ZXiY":
@@ -155,6 +148,85 @@ def setFrameData(a1,a2,sequence):
 
     return axisX, axisY, axisZ, rot
 
+def setFrameDataArray(a1,a2,sequence):
+    """
+        set Frames of a coordinate system over several frames accoring two vector arrays and a sequence.
+        Array version of `setFrameData`
+
+        :Parameters:
+           - `a1` (numy.array(n,3)) - first vectors
+           - `a2` (numy.array(n,3)) - second vectors
+           - `sequence` (str) - construction sequence (XYZ, XYiZ)
+
+        :Return:
+            - `axisX` (numy.array(n,3)) - x-axis of the coordinate system
+            - `axisY` (numy.array(n,3)) - y-axis of the coordinate system
+            - `axisZ` (numy.array(n,3)) - z-axis of the coordinate system
+            - `rot` (numy.array(n,3,3)) - rotation matrices of the coordinate system
+
+        .. note:: if sequence includes a *i* ( ex: XYiZ), opposite of vector a2 is considered
+
+    """
+    a1 = np.asarray(a1,dtype=float)
+    a2 = np.asarray(a2,dtype=float)
+
+    if sequence in ["XYiZ","XZiY","YZiX","YXiZ","ZXiY","ZYiX"]:
+        a2=a2*-1.0
+        sequence = sequence.replace("i","")
+
+    if sequence == "XYZ":
+        axisX=a1
+        axisY=a2
+        axisZ=np.cross(a1,a2)
+    elif sequence == "XZY":
+        axisX=a1
+        axisZ=a2
+        axisY=np.cross(a2,a1)
+    elif sequence == "YZX":
+        axisY=a1
+        axisZ=a2
+        axisX=np.cross(a1,a2)
+    elif sequence == "YXZ":
+        axisY=a1
+        axisX=a2
+        axisZ=np.cross(a2,a1)
+    elif sequence == "ZXY":
+        axisZ=a1
+        axisX=a2
+        axisY=np.cross(a1,a2)
+    elif sequence == "ZYX":
+        axisZ=a1
+        axisY=a2
+        axisX=np.cross(a2,a1)
+    else:
+        raise Exception("[pyCGM2] sequence (%s) not recognized"%(sequence))
+
+    rot=np.stack((axisX,axisY,axisZ),axis=-1)
+
+    return axisX, axisY, axisZ, rot
+
+def setFrameDataArrayFromPoints(pt1,pt2,pt3,sequence):
+    """
+        set Frames of a coordinate system over several frames from 3 point trajectories.
+
+        a1 is the unit vector from pt1 to pt2, a2 is normal to the plane (pt1,pt2,pt3)
+
+        :Parameters:
+           - `pt1` (numy.array(n,3)) - first point
+           - `pt2` (numy.array(n,3)) - second point
+           - `pt3` (numy.array(n,3)) - third point
+           - `sequence` (str) - construction sequence (XYZ, XYiZ)
+
+        :Return:
+            - `axisX`, `axisY`, `axisZ`, `rot` - see `setFrameDataArray`
+
+    """
+    a1=numeric.normalizeArray(pt2-pt1)
+    v=numeric.normalizeArray(pt3-pt1)
+    a2=numeric.normalizeArray(np.cross(a1,v))
+
+    return setFrameDataArray(a1,a2,sequence)
+
 class Node(object):
     """
         A node is a local position of a point in a Frame
@@ -482,3 +554,214 @@ class Frame(object):
         node = self.getNode_byLabel(nodeLabel)
 
         return np.dot(self.getRotation(),node.getLocal())+ self.getTranslation()
+
+
+
+class MotionFrame(Frame):
+    """
+        A `MotionFrame` is a view on one frame of a `MotionTrajectory`.
+
+        It exposes the `Frame` accessors (getRotation, getTranslation, update,...).
+        Rotation and translation are read from and written into the arrays of the trajectory.
+
+        .. note:: nodes are not stored. Nodes must be attached to the static Frame of a referential
+
+    """
+
+    def __init__(self,trajectory,index):
+        """
+            :Parameters:
+               - `trajectory` (pyCGM2.Model.frame.MotionTrajectory) - the trajectory
+               - `index` (int) - frame index
+        """
+        self._trajectory = trajectory
+        self._index = index
+        self._nodes=[]
+
+    def _getMatrixRot(self):
+        return self._trajectory._rotations[self._index]
+
+    def _setMatrixRot(self,R):
+        self._trajectory._rotations[self._index] = R
+        self._trajectory._version+=1
+
+    def _getTranslation(self):
+        return self._trajectory._translations[self._index]
+
+    def _setTranslation(self,t):
+        self._trajectory._translations[self._index] = np.asarray(t).reshape(3)
+        self._trajectory._version+=1
+
+    def _getAxis(self,column):
+        return self._trajectory._rotations[self._index,:,column]
+
+    def _setAxis(self,column,axis):
+        self._trajectory._rotations[self._index,:,column] = np.asarray(axis).reshape(3)
+        self._trajectory._version+=1
+
+    _matrixRot = property(_getMatrixRot,_setMatrixRot)
+    _translation = property(_getTranslation,_setTranslation)
+
+    m_axisX = property(lambda self: self._getAxis(0), lambda self,axis: self._setAxis(0,axis))
+    m_axisY = property(lambda self: self._getAxis(1), lambda self,axis: self._setAxis(1,axis))
+    m_axisZ = property(lambda self: self._getAxis(2), lambda self,axis: self._setAxis(2,axis))
+
+
+class MotionTrajectory(object):
+    """
+        A `MotionTrajectory` stores the pose of a coordinate system over frames.
+
+        Rotations are stored as a numpy.array(n,3,3) and translations as a numpy.array(n,3).
+        The object behaves as the former list of `Frame` ( len, indexing, iteration, append ),
+        i.e `motion[i].getRotation()` is still valid.
+
+        .. note:: `version` is incremented on every change made through the trajectory api.
+                  It lets caches ( ie, angular velocity of a segment) detect an out-of-date motion state.
+
+    """
+
+    def __init__(self, rotations = None, translations= None):
+        """
+            :Parameters:
+               - `rotations` (numpy.array(n,3,3)) - [optional] rotation matrices
+               - `translations` (numpy.array(n,3)) - [optional] translation vectors
+        """
+        self._rotations = np.zeros((0,3,3))
+        self._translations = np.zeros((0,3))
+        self._n = 0
+        self._version = 0
+
+        if rotations is not None:
+            self.setArrays(rotations,translations)
+
+    @classmethod
+    def fromFrames(cls,frames):
+        """
+            Construct a trajectory from a sequence of `Frame`
+
+            :Parameters:
+               - `frames` (list of pyCGM2.Model.frame.Frame) - frames
+        """
+        trajectory = cls()
+        n = len(frames)
+        if n != 0:
+            trajectory.setArrays(np.array([it.getRotation() for it in frames]),
+                                 np.array([np.asarray(it.getTranslation()).reshape(3) for it in frames]))
+        return trajectory
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self,index):
+        if isinstance(index,slice):
+            return MotionTrajectory(self.getRotations()[index].copy(),self.getTranslations()[index].copy())
+
+        if index < 0:
+            index = index + self._n
+        if index < 0 or index >= self._n:
+            raise IndexError("[pyCGM2] motion frame index out of range")
+
+        return MotionFrame(self,index)
+
+    def __iter__(self):
+        for i in range(0,self._n):
+            yield MotionFrame(self,i)
+
+    def __getstate__(self):
+        # only the used part of the buffers is pickled
+        return {"_rotations": self.getRotations().copy(),
+                "_translations": self.getTranslations().copy(),
+                "_n": self._n,
+                "_version": self._version}
+
+    def __setstate__(self,state):
+        self._version = 0
+        self.__dict__.update(state)
+
+    @property
+    def version(self):
+        """ counter of changes of the trajectory """
+        return self._version
+
+    def _reserve(self,capacity):
+        if capacity > self._rotations.shape[0]:
+            capacity = max(capacity,2*self._rotations.shape[0])
+            rotations = np.zeros((capacity,3,3))
+            translations = np.zeros((capacity,3))
+            rotations[0:self._n] = self._rotations[0:self._n]
+            translations[0:self._n] = self._translations[0:self._n]
+            self._rotations = rotations
+            self._translations = translations
+
+    def append(self,frame):
+        """
+            Append the pose of a `Frame`. Values are copied.
+
+            :Parameters:
+               - `frame` (pyCGM2.Model.frame.Frame) - a frame instance
+        """
+        self._reserve(self._n+1)
+        self._rotations[self._n] = frame.getRotation()
+        self._translations[self._n] = np.asarray(frame.getTranslation()).reshape(3)
+        self._n+=1
+        self._version+=1
+
+    def setArrays(self,rotations,translations):
+        """
+            Set all poses at once
+
+            :Parameters:
+               - `rotations` (numpy.array(n,3,3)) - rotation matrices
+               - `translations` (numpy.array(n,3)) - translation vectors
+        """
+        rotations = np.asarray(rotations,dtype=float)
+        translations = np.asarray(translations,dtype=float)
+
+        if rotations.ndim != 3 or rotations.shape[1:] != (3,3):
+            raise Exception("[pyCGM2] rotations must be an array(n,3,3)")
+        if translations.shape != (rotations.shape[0],3):
+            raise Exception("[pyCGM2] translations must be an array(n,3) with n the number of rotations")
+
+        self._rotations = np.array(rotations)
+        self._translations = np.array(translations)
+        self._n = rotations.shape[0]
+        self._version+=1
+
+    def getRotations(self):
+        """
+            Get rotation matrices
+
+            :Return:
+                - `na` (numpy.array(n,3,3)) - rotation matrices
+        """
+        return self._rotations[0:self._n]
+
+    def getTranslations(self):
+        """
+            Get translation vectors
+
+            :Return:
+                - `na` (numpy.array(n,3)) - translation vectors
+        """
+        return self._translations[0:self._n]
+
+    def getAxisX(self):
+        return self._rotations[0:self._n,:,0]
+
+    def getAxisY(self):
+        return self._rotations[0:self._n,:,1]
+
+    def getAxisZ(self):
+        return self._rotations[0:self._n,:,2]
+
+    def getGlobalPositions(self,localPosition):
+        """
+            Get global trajectory of a local position
+
+            :Parameters:
+               - `localPosition` (numpy.array(3,)) - local position
+
+            :Return:
+                - `na` (numpy.array(n,3)) - global trajectory
+        """
+        return np.einsum("nij,j->ni",self.getRotations(),np.asarray(localPosition).reshape(3)) + self.getTranslations()
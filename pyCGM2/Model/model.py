@@ -387,20 +387,15 @@ class Model(object):
 
     def displayMotionCoordinateSystem(self,acqui,  segmentLabel, targetPointLabel, referential = "Anatomic" ):
         seg=self.getSegment(segmentLabel)
-        valX=np.zeros((acqui.GetPointFrameNumber(),3))
-        valY=np.zeros((acqui.GetPointFrameNumber(),3))
-        valZ=np.zeros((acqui.GetPointFrameNumber(),3))
-
 
         if referential == "Anatomic":
             ref =seg.anatomicalFrame
         else:
             ref = seg.getReferential("TF")
 
-        for i in range(0,acqui.GetPointFrameNumber()):
-            valX[i,:]= np.dot(ref.motion[i].getRotation() , np.array([100.0,0.0,0.0])) + ref.motion[i].getTranslation()
-            valY[i,:]= np.dot(ref.motion[i].getRotation() , np.array([0.0,100.0,0.0])) + ref.motion[i].getTranslation()
-            valZ[i,:]= np.dot(ref.motion[i].getRotation() , np.array([0.0,0.0,100.0])) + ref.motion[i].getTranslation()
+        valX = ref.motion.getGlobalPositions(np.array([100.0,0.0,0.0]))
+        valY = ref.motion.getGlobalPositions(np.array([0.0,100.0,0.0]))
+        valZ = ref.motion.getGlobalPositions(np.array([0.0,0.0,100.0]))
 
         btkTools.smartAppendPoint(acqui,targetPointLabel+"_X",valX,desc="")
         btkTools.smartAppendPoint(acqui,targetPointLabel+"_Y",valY,desc="")
@@ -410,22 +405,15 @@ class Model(object):
     def displayMotionViconCoordinateSystem(self,acqui,  segmentLabel,targetPointLabelO,targetPointLabelX,targetPointLabelY,targetPointLabelZ, referential = "Anatomic" ):
         seg=self.getSegment(segmentLabel)
 
-        origin=np.zeros((acqui.GetPointFrameNumber(),3))
-        valX=np.zeros((acqui.GetPointFrameNumber(),3))
-        valY=np.zeros((acqui.GetPointFrameNumber(),3))
-        valZ=np.zeros((acqui.GetPointFrameNumber(),3))
-
-
         if referential == "Anatomic":
             ref =seg.anatomicalFrame
         else:
             ref = seg.getReferential("TF")
 
-        for i in range(0,acqui.GetPointFrameNumber()):
-            origin[i,:] = ref.motion[i].getTranslation()
-            valX[i,:]= np.dot(ref.motion[i].getRotation() , np.array([100.0,0.0,0.0])) + ref.motion[i].getTranslation()
-            valY[i,:]= np.dot(ref.motion[i].getRotation() , np.array([0.0,100.0,0.0])) + ref.motion[i].getTranslation()
-            valZ[i,:]= np.dot(ref.motion[i].getRotation() , np.array([0.0,0.0,100.0])) + ref.motion[i].getTranslation()
+        origin = ref.motion.getTranslations()
+        valX = ref.motion.getGlobalPositions(np.array([100.0,0.0,0.0]))
+        valY = ref.motion.getGlobalPositions(np.array([0.0,100.0,0.0]))
+        valZ = ref.motion.getGlobalPositions(np.array([0.0,0.0,100.0]))
 
         btkTools.smartAppendPoint(acqui,targetPointLabelO,origin,desc="")
         btkTools.smartAppendPoint(acqui,targetPointLabelX,valX,desc="")
@@ -561,31 +549,18 @@ class Model6Dof(Model):
         segPicked.getReferential("TF").motion =[]
         if method == enums.motionMethod.Sodervisk :
             tms= segPicked.m_tracking_markers
-            for i in range(0,aqui.GetPointFrameNumber()):
-                visibleMarkers = btkTools.getVisibleMarkersAtFrame(aqui,tms,i)
-
-                # constructuion of the input of sodervisk
-                arrayStatic = np.zeros((len(visibleMarkers),3))
-                arrayDynamic = np.zeros((len(visibleMarkers),3))
-
-                j=0
-                for vm in visibleMarkers:
-                    arrayStatic[j,:] = segPicked.getReferential("TF").static.getNode_byLabel(vm).m_global
-                    arrayDynamic[j,:] = aqui.GetPoint(vm).GetValues()[i,:]
-                    j+=1
-
-                Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(arrayStatic,arrayDynamic)
-                R=np.dot(Ropt,segPicked.getReferential("TF").static.getRotation())
-                tOri=np.dot(Ropt,segPicked.getReferential("TF").static.getTranslation())+Lopt
-
-                cframe=frame.Frame()
-                cframe.setRotation(R)
-                cframe.setTranslation(tOri)
-                cframe.m_axisX=R[:,0]
-                cframe.m_axisY=R[:,1]
-                cframe.m_axisZ=R[:,2]
-
-                segPicked.getReferential("TF").addMotionFrame(copy.deepcopy(cframe) )
+
+            # constructuion of the input of sodervisk
+            arrayStatic = np.array([segPicked.getReferential("TF").static.getNode_byLabel(tm).m_global for tm in tms]).reshape((len(tms),3))
+            arrayDynamic = btkTools.getMarkerArray(aqui,tms)
+            visibility = btkTools.getVisibilityMask(aqui,tms)
+
+            Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArray(arrayStatic,arrayDynamic,visibility)
+            R=np.einsum("nij,jk->nik",Ropt,segPicked.getReferential("TF").static.getRotation())
+            tOri=np.einsum("nij,j->ni",Ropt,segPicked.getReferential("TF").static.getTranslation())+Lopt
+
+            segPicked.getReferential("TF").setMotion(R,tOri)
+            segPicked.getReferential("TF").additionalInfos["RMSE"] = RMSE
         else:
             raise Exception("[pyCGM2] : motion method doesn t exist")
 
@@ -598,11 +573,8 @@ class Model6Dof(Model):
         ndO = str(dictAnatomic[segName]['labels'][3])
         ptO = segPicked.getReferential("TF").getNodeTrajectory(ndO)
 
-        csFrame=frame.Frame()
-        for i in range(0,aqui.GetPointFrameNumber()):
-            R = np.dot(segPicked.getReferential("TF").motion[i].getRotation(), segPicked.getReferential("TF").relativeMatrixAnatomic)
-            csFrame.update(R,ptO)
-            segPicked.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+        R = np.einsum("nij,jk->nik",segPicked.getReferential("TF").motion.getRotations(), segPicked.getReferential("TF").relativeMatrixAnatomic)
+        segPicked.anatomicalFrame.setMotion(R,ptO)
 
 
 # --------  MODEL COMPONANTS ---------
@@ -612,10 +584,32 @@ class Referential(object):
     """
     def __init__(self):
         self.static=frame.Frame()
-        self.motion=[]
+        self.motion=frame.MotionTrajectory()
         self.relativeMatrixAnatomic = np.zeros((3,3))
         self.additionalInfos = dict()
 
+    @property
+    def motion(self):
+        """
+            motion of the referential (pyCGM2.Model.frame.MotionTrajectory)
+
+            .. note:: a list of `Frame` ( ie, motion =[] ) is converted into a `MotionTrajectory`
+        """
+        return self._motion
+
+    @motion.setter
+    def motion(self,value):
+        if isinstance(value,frame.MotionTrajectory):
+            self._motion = value
+        else:
+            self._motion = frame.MotionTrajectory.fromFrames(value)
+
+    def __setstate__(self,state):
+        # model pickled before the MotionTrajectory stored motion as a list of Frame
+        if "motion" in state:
+            state["_motion"] = frame.MotionTrajectory.fromFrames(state.pop("motion"))
+        self.__dict__.update(state)
+
     def setStaticFrame(self,Frame):
         """
             Set a `Frame` to the member Static of the `Referential`
@@ -633,9 +627,22 @@ class Referential(object):
             :Parameters:
                 - `Frame` (pyCGM2.Model.CGM2.frame.Frame) - pyCGM2-Frame instance
 
+            .. note:: rotation and translation are copied. The `Frame` instance can be reused
+
         """
         self.motion.append(Frame)
 
+    def setMotion(self,rotations,translations):
+        """
+             Set the whole motion of the `Referential`
+
+            :Parameters:
+                - `rotations` (numpy.array(n,3,3)) - rotation matrices
+                - `translations` (numpy.array(n,3)) - translation vectors
+
+        """
+        self.motion = frame.MotionTrajectory(rotations,translations)
+
     def getNodeTrajectory(self,label):
         """
             Get trajectory of a node
@@ -649,12 +656,8 @@ class Referential(object):
         """
 
         node=self.static.getNode_byLabel(label)
-        nFrames=len(self.motion)
-        pt=np.zeros((nFrames,3))
-        for i in range(0,nFrames):
-            pt[i,:]=np.dot(self.motion[i].getRotation(),node.m_local)+ self.motion[i].getTranslation()
 
-        return pt
+        return self.motion.getGlobalPositions(node.m_local)
 
 
 
@@ -756,6 +759,8 @@ class Segment(object):
 
         self.m_existFrames = None
 
+        self._kinematicCache = dict()
+
     def setExistFrames(self,lstdata):
         self.m_existFrames = lstdata
     def getExistFrames(self):
@@ -988,10 +993,7 @@ class Segment(object):
                 - `values` (numpy.array(n,3)) - values of the com trajectory
         """
 
-        frameNumber = len(self.anatomicalFrame.motion)
-        values = np.zeros((frameNumber,3))
-        for i in range(0,frameNumber):
-            values[i,:] = np.dot(self.anatomicalFrame.motion[i].getRotation() ,self.m_bsp["com"]) + self.anatomicalFrame.motion[i].getTranslation()
+        values = self.anatomicalFrame.motion.getGlobalPositions(self.m_bsp["com"])
 
         if exportBtkPoint:
             if btkAcq != None:
@@ -1087,46 +1089,48 @@ class Segment(object):
 
                 The *conventional* method computes angular velocity through this statement :math:`\dot{R}R^t`
 
-        """
+                Values are cached and computed again only if the anatomical motion changed.
 
+        """
+        key = ("angularVelocity",method,sampleFrequency)
+        values = self._getCachedKinematics(key)
+        if values is not None:
+            return values.copy()
 
-        frameNumber = len(self.anatomicalFrame.motion)
+        rotations = self.anatomicalFrame.motion.getRotations()
+        frameNumber = rotations.shape[0]
         AngularVelocValues = np.zeros((frameNumber,3))
 
         # pig method0
         if method == "pig":
-            for i in range(1,frameNumber-1):
-                omegaX=(np.dot( self.anatomicalFrame.motion[i+1].m_axisY,
-                                          self.anatomicalFrame.motion[i-1].m_axisZ))/(2*1/sampleFrequency)
-
-                omegaY=(np.dot( self.anatomicalFrame.motion[i+1].m_axisZ,
-                                          self.anatomicalFrame.motion[i-1].m_axisX))/(2*1/sampleFrequency)
-
-                omegaZ=(np.dot( self.anatomicalFrame.motion[i+1].m_axisX,
-                                self.anatomicalFrame.motion[i-1].m_axisY))/(2*1/sampleFrequency)
-
-                omega = np.array([[omegaX,omegaY,omegaZ]]).transpose()
+            nextRot = rotations[2:]
+            prevRot = rotations[0:-2]
+            omega = np.zeros((frameNumber-2,3))
+            omega[:,0] = np.sum(nextRot[:,:,1]*prevRot[:,:,2],axis=1)/(2*1/sampleFrequency)
+            omega[:,1] = np.sum(nextRot[:,:,2]*prevRot[:,:,0],axis=1)/(2*1/sampleFrequency)
+            omega[:,2] = np.sum(nextRot[:,:,0]*prevRot[:,:,1],axis=1)/(2*1/sampleFrequency)
 
-                AngularVelocValues[i,:] = np.dot(self.anatomicalFrame.motion[i].getRotation(),  omega).transpose()
+            AngularVelocValues[1:-1,:] = np.einsum("nij,nj->ni",rotations[1:-1],omega)
 
         # conventional method
         if method == "conventional":
-            rdot = derivation.matrixFirstDerivation(self.anatomicalFrame.motion, sampleFrequency)
-            for i in range(1,frameNumber-1):
-                tmp =np.dot(rdot[i],self.anatomicalFrame.motion[i].getRotation().transpose())
-                AngularVelocValues[i,0]=tmp[2,1]
-                AngularVelocValues[i,1]=tmp[0,2]
-                AngularVelocValues[i,2]=tmp[1,0]
+            rdot = derivation.matrixFirstDerivation(rotations, sampleFrequency)
+            tmp = np.einsum("nij,nkj->nik",rdot[1:-1],rotations[1:-1])
+            AngularVelocValues[1:-1,0]=tmp[:,2,1]
+            AngularVelocValues[1:-1,1]=tmp[:,0,2]
+            AngularVelocValues[1:-1,2]=tmp[:,1,0]
 
-        return AngularVelocValues
+        self._setCachedKinematics(key,AngularVelocValues)
+        return AngularVelocValues.copy()
 
 
-    def getAngularAcceleration(self,sampleFrequency):
+    def getAngularAcceleration(self,sampleFrequency,method="conventional"):
         """
             Get angular acceleration
 
             :Parameters:
                 - `sampleFrequency` (double) - point frequency
+                - `method` (str) - method used for computing the angular velocity
 
             :Return:
                 - `values` (numpy.array(n,3)) - values of the angular accelration
@@ -1134,9 +1138,37 @@ class Segment(object):
 
             .. note:: A first order differention of the angular velocity is used
         """
+        key = ("angularAcceleration",method,sampleFrequency)
+        values = self._getCachedKinematics(key)
+        if values is None:
+            values = derivation.firstOrderFiniteDifference(self.getAngularVelocity(sampleFrequency,method=method),sampleFrequency)
+            self._setCachedKinematics(key,values)
 
-        values = derivation.firstOrderFiniteDifference(self.getAngularVelocity(sampleFrequency),sampleFrequency)
-        return values
+        return values.copy()
+
+    def _getCachedKinematics(self,key):
+        cache = self.__dict__.get("_kinematicCache",dict())
+        if key in cache:
+            motion,version,values = cache[key]
+            if motion is self.anatomicalFrame.motion and version == motion.version:
+                return values
+        return None
+
+    def _setCachedKinematics(self,key,values):
+        if "_kinematicCache" not in self.__dict__:
+            self._kinematicCache = dict()
+        motion = self.anatomicalFrame.motion
+        self._kinematicCache[key] = (motion,motion.version,values)
+
+    def clearKinematicCache(self):
+        """
+            Clear cached angular velocity and acceleration
+
+            .. note:: the cache is invalidated automatically when the anatomical motion changes
+                      through the `Referential` or `MotionTrajectory` api.
+                      Call this method after an in-place change of the rotation array.
+        """
+        self._kinematicCache = dict()
 
 class Joint(object):
     """
@@ -139,6 +139,106 @@ def VCMJointCentre(HalfJoint, JointMarker, TopJoint, StickMarker, beta = 0 ):
         return JointMarker + E * HalfJoint;
 
 
+def VCMJointCentreArray(HalfJoint, JointMarker, TopJoint, StickMarker, beta = 0, validFrames = None ):
+    """
+        Vectorized version of `VCMJointCentre` for whole trajectories
+
+        :Parameters:
+            - `HalfJoint` (double) - joint radius
+            - `JointMarker` (numpy.array(n,3)) - base marker trajectory
+            - `TopJoint` (numpy.array(n,3)) - top joint centre trajectory
+            - `StickMarker` (numpy.array(n,3)) - lateral marker trajectory
+            - `beta` (double) - angle offset in degree
+            - `validFrames` (list or numpy.array(n) of bool) - frames to compute. Other frames are returned null
+
+        :Return:
+            - `values` (numpy.array(n,3)) - joint centre trajectory
+
+        .. note:: frames where one of the markers is null are returned null, as with `VCMJointCentre`
+
+    """
+    JointMarker = np.asarray(JointMarker,dtype=float)
+    TopJoint = np.asarray(TopJoint,dtype=float)
+    StickMarker = np.asarray(StickMarker,dtype=float)
+
+    OffsetAngle = np.deg2rad(beta)
+    eps = np.spacing(np.single(1))
+
+    mask = np.any(JointMarker!=0,axis=1) & np.any(TopJoint!=0,axis=1) & np.any(StickMarker!=0,axis=1)
+    if validFrames is not None:
+        mask = mask & np.asarray(validFrames,dtype=bool)
+
+    values = np.zeros(JointMarker.shape)
+    if not np.any(mask):
+        return values
+
+    J = JointMarker[mask]
+    X = TopJoint[mask] - J
+    T = StickMarker[mask] - J
+    P = np.cross( X, T )
+    E = np.cross( X, P )
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        E = E / np.linalg.norm(E,axis=1)[:,np.newaxis]
+
+        x2 = np.einsum("ij,ij->i", X, X )
+        l = HalfJoint / x2
+        m = 1 - HalfJoint * l
+
+        out = J + E * HalfJoint
+
+        pos = m > 0
+        if np.abs( OffsetAngle ) > eps :
+            cosTheta = np.cos( OffsetAngle )
+            sinTheta = np.sin( OffsetAngle )
+            r2 = HalfJoint * HalfJoint
+            r2cos2th = cosTheta * cosTheta * r2
+            r2cos2th_h2 = r2cos2th / (x2-r2)
+            TdotX = np.einsum("ij,ij->i", T, X )
+            EdotT = np.einsum("ij,ij->i", E, T )
+
+            P = P / np.linalg.norm(P,axis=1)[:,np.newaxis]
+
+            # solve quadratic
+            a = 1 + r2cos2th_h2
+            b = 2*(r2cos2th-TdotX*r2cos2th_h2-r2)
+            c = r2*r2+r2cos2th_h2*TdotX*TdotX-r2cos2th*( np.einsum("ij,ij->i", T, T )+r2 )
+
+            disc = b*b-4*a*c
+            disc = np.where((disc < 0) & (disc >= -np.abs(b)/1e6), 0.0, disc)
+            disc = np.where(disc >= 0, np.sqrt(np.abs(disc)), disc)
+
+            Solutions = np.stack([ -b+disc, -b-disc ],axis=1)
+            absSolutions = np.abs(Solutions)
+            single = (np.abs( a ) * 1e8 <= np.abs(c)) & (np.min(absSolutions,axis=1) < 1e-8*np.max(absSolutions,axis=1))
+            Solutions = Solutions / (2*a)[:,np.newaxis]
+            Solutions[single,0] = -c[single]/b[single]
+            Solutions[single,1] = np.nan
+
+            JointCentre = X * (l * HalfJoint)[:,np.newaxis]
+            lxt = l * HalfJoint * TdotX
+            r1l = r2 * m
+
+            # fallback if no solution to the quadratic equation
+            fallback = J + (X*l[:,np.newaxis] + E*(np.sqrt(np.abs(m))*cosTheta)[:,np.newaxis] - P*sinTheta)*HalfJoint
+            solved = np.zeros(len(J),dtype=bool)
+            for k in [1,0]: # same order as the scalar solver
+                mu = ( Solutions[:,k] - lxt ) / EdotT
+                nu = r1l - mu*mu
+                found = ((Solutions[:,k] < r2) == ( cosTheta > 0 )) & (nu > eps) & ~solved
+                nu = np.sqrt( np.abs(nu) )
+                if sinTheta > 0 :
+                    nu = -nu
+                fallback[found] = (JointCentre + E*mu[:,np.newaxis] + P*nu[:,np.newaxis])[found] + J[found]
+                solved = solved | found
+
+            out[pos] = fallback[pos]
+        else:
+            out[pos] = (J + X*(l*HalfJoint)[:,np.newaxis] + E*(np.sqrt(np.abs(m))*HalfJoint)[:,np.newaxis])[pos]
+
+    values[mask] = out
+    return values
+
 def chord (offset,A1,A2,A3,beta=0.0, epsilon =0.001):
     """
         Modified Chord method
@@ -161,147 +261,247 @@ def chord (offset,A1,A2,A3,beta=0.0, epsilon =0.001):
     if (len(A1) != len(A2) or len(A1) != len(A3) or len(A2) != len(A3)):
         raise Exception ("length of input argument of chord function different")
 
+    arrayDim = len(A1.shape) # si 1 = array1d si 2 = array2d
+
+    if arrayDim == 2:
+        return chordArray(offset,A1,A2,A3,beta=beta, epsilon =epsilon)
+
     if np.all(A1==0) or np.all(A3==0) or np.all(A3==0):
         return np.zeros((3))
 
-    arrayDim = len(A1.shape) # si 1 = array1d si 2 = array2d
+    I = A1
+    J = A2
+    K = A3
+
+    if beta == 0.0:
+        y=np.nan_to_num(np.divide((J-I),np.linalg.norm(J-I)))
+        x=np.cross(y,K-I)
+        x=np.nan_to_num(np.divide((x),np.linalg.norm(x)))
+        z=np.cross(x,y)
+
+        matR=np.array([x,y,z]).T
+        ori=(J+I)/2.0
+
+        d=np.linalg.norm(I-J)
+        theta=np.arcsin(offset/d)*2.0
+        v_r=np.array([0, -d/2.0, 0])
+
+        rot=np.array([[1,0,0],[0,np.cos(theta),-1.0*np.sin(theta)],[0,np.sin(theta),np.cos(theta)] ])
+
+        P = np.dot(np.dot(matR,rot),v_r)+ori
 
-    if arrayDim == 2:
-        nrow = len(A1)
-        returnValues = np.zeros((nrow,3))
     else:
-        nrow =1
-        returnValues = np.zeros((1,3))
 
+        A=J
+        B=I
+        C=K
+        L=offset
 
-    for i in range(0,nrow):
-        I = A1[i,:] if arrayDim==2 else A1
-        J = A2[i,:] if arrayDim==2 else A2
-        K = A3[i,:] if arrayDim==2 else A3
+        eps =  epsilon
 
-        if beta == 0.0:
-            y=np.nan_to_num(np.divide((J-I),np.linalg.norm(J-I)))
-            x=np.cross(y,K-I)
-            x=np.nan_to_num(np.divide((x),np.linalg.norm(x)))
-            z=np.cross(x,y)
+        AB = np.linalg.norm(A-B)
+        alpha = np.arcsin(L/AB)
+        AO = np.sqrt(AB*AB-L*L*(1+np.cos(alpha)*np.cos(alpha)))
 
-            matR=np.array([x,y,z]).T
-            ori=(J+I)/2.0
+        # chord avec beta nul
+        #P = chord(L,B,A,C,beta=0.0) # attention ma methode . attention au arg input
 
-            d=np.linalg.norm(I-J)
-            theta=np.arcsin(offset/d)*2.0
-            v_r=np.array([0, -d/2.0, 0])
+        y=np.nan_to_num(np.divide((J-I),np.linalg.norm(J-I)))
+        x=np.cross(y,K-I)
+        x=np.nan_to_num(np.divide((x),np.linalg.norm(x)))
+        z=np.cross(x,y)
 
-            rot=np.array([[1,0,0],[0,np.cos(theta),-1.0*np.sin(theta)],[0,np.sin(theta),np.cos(theta)] ])
+        matR=np.array([x,y,z]).T
+        ori=(J+I)/2.0
 
-            P = np.dot(np.dot(matR,rot),v_r)+ori
+        d=np.linalg.norm(I-J)
+        theta=np.arcsin(offset/d)*2.0
+        v_r=np.array([0, -d/2.0, 0])
 
-        else:
+        rot=np.array([[1,0,0],[0,np.cos(theta),-1.0*np.sin(theta)],[0,np.sin(theta),np.cos(theta)] ])
+
+
+        P= np.dot(np.dot(matR,rot),v_r)+ori
+        # fin chord 0
 
-            A=J
-            B=I
-            C=K
-            L=offset
 
-            eps =  epsilon
+        Salpha = 0
+        diffBeta = np.abs(beta)
+        alphaincr = beta # in degree
 
-            AB = np.linalg.norm(A-B)
-            alpha = np.arcsin(L/AB)
-            AO = np.sqrt(AB*AB-L*L*(1+np.cos(alpha)*np.cos(alpha)))
 
-            # chord avec beta nul
-            #P = chord(L,B,A,C,beta=0.0) # attention ma methode . attention au arg input
+        # define P research circle in T plan
+        n = np.nan_to_num(np.divide((A-B),AB))
+        O = A - np.dot(n, AO)
+        r = L*np.cos(alpha) #OK
 
-            y=np.nan_to_num(np.divide((J-I),np.linalg.norm(J-I)))
-            x=np.cross(y,K-I)
-            x=np.nan_to_num(np.divide((x),np.linalg.norm(x)))
-            z=np.cross(x,y)
 
-            matR=np.array([x,y,z]).T
-            ori=(J+I)/2.0
+        # build segment
+        #T = BuildSegment(O,n,P-O,'zyx');
+        Z=np.nan_to_num(np.divide(n,np.linalg.norm(n)))
+        Y=np.nan_to_num(np.divide(np.cross(Z,P-O),np.linalg.norm(np.cross(Z,P-O))))
+        X=np.nan_to_num(np.divide(np.cross(Y,Z),np.linalg.norm(np.cross(Y,Z))))
+        Origin= O
 
-            d=np.linalg.norm(I-J)
-            theta=np.arcsin(offset/d)*2.0
-            v_r=np.array([0, -d/2.0, 0])
+        # erreur ici, il manque les norm
+        T=np.array([[ X[0],Y[0],Z[0],Origin[0] ],
+                    [ X[1],Y[1],Z[1],Origin[1] ],
+                    [ X[2],Y[2],Z[2],Origin[2] ],
+                    [    0,   0,   0,       1.0  ]])
 
-            rot=np.array([[1,0,0],[0,np.cos(theta),-1.0*np.sin(theta)],[0,np.sin(theta),np.cos(theta)] ])
+        count = 0
+        while diffBeta > eps or count > 100:
+            if count > 100:
+                raise Exception("count boundary of Chord achieve")
 
 
-            P= np.dot(np.dot(matR,rot),v_r)+ori
-            # fin chord 0
+            count = count + 1
+            idiff = diffBeta
 
+            Salpha = Salpha + alphaincr
+            Salpharad = Salpha * np.pi / 180.0
+            Pplan = np.array([  [r*np.cos(Salpharad)],
+                                [ r*np.sin(Salpharad)],
+                                 [0],
+                                [1]])
+            P = np.dot(T,Pplan)
 
-            Salpha = 0
-            diffBeta = np.abs(beta)
-            alphaincr = beta # in degree
+            P = P[0:3,0]
+            nBone = A-P
 
+            ProjC = np.cross(nBone,np.cross(C-P,nBone))
+            ProjB = np.cross(nBone,np.cross(B-P,nBone))
 
-            # define P research circle in T plan
-            n = np.nan_to_num(np.divide((A-B),AB))
-            O = A - np.dot(n, AO)
-            r = L*np.cos(alpha) #OK
 
+            sens = np.dot(np.cross(ProjC,ProjB).T,nBone)
 
-            # build segment
-            #T = BuildSegment(O,n,P-O,'zyx');
-            Z=np.nan_to_num(np.divide(n,np.linalg.norm(n)))
-            Y=np.nan_to_num(np.divide(np.cross(Z,P-O),np.linalg.norm(np.cross(Z,P-O))))
-            X=np.nan_to_num(np.divide(np.cross(Y,Z),np.linalg.norm(np.cross(Y,Z))))
-            Origin= O
 
-            # erreur ici, il manque les norm
-            T=np.array([[ X[0],Y[0],Z[0],Origin[0] ],
-                        [ X[1],Y[1],Z[1],Origin[1] ],
-                        [ X[2],Y[2],Z[2],Origin[2] ],
-                        [    0,   0,   0,       1.0  ]])
+            Betai = np.nan_to_num(np.divide(sens,np.linalg.norm(sens))) * np.arccos(np.nan_to_num(np.divide(np.dot(ProjC.T,ProjB),
+                                                 np.linalg.norm(ProjC)*np.linalg.norm(ProjB))))*180.0/np.pi
 
-            count = 0
-            while diffBeta > eps or count > 100:
-                if count > 100:
-                    raise Exception("count boundary of Chord achieve")
+            diffBeta = np.abs(beta - Betai)
 
+            if (diffBeta - idiff) > 0:
+                if count == 1:
+                    Salpha = Salpha - alphaincr
+                    alphaincr = -alphaincr
+                else:
+                    alphaincr = -alphaincr / 2.0;
+
+    return P
 
-                count = count + 1
-                idiff = diffBeta
+def chordArray(offset,A1,A2,A3,beta=0.0, epsilon =0.001):
+    """
+        Vectorized modified Chord method over whole trajectories
 
-                Salpha = Salpha + alphaincr
-                Salpharad = Salpha * np.pi / 180.0
-                Pplan = np.array([  [r*np.cos(Salpharad)],
-                                    [ r*np.sin(Salpharad)],
-                                     [0],
-                                    [1]])
-                P = np.dot(T,Pplan)
+        :Parameters:
+            - `offset` (double) - offset to apply from the base point
+            - `A1` (numpy.array(n,3)) - base point trajectory
+            - `A2` (numpy.array(n,3)) - top point trajectory
+            - `A3` (numpy.array(n,3)) - lateral point trajectory
+            - `beta` (double) - angle offset
+            - `epsilon` (double) - tolerance on the angle offset
 
-                P = P[0:3,0]
-                nBone = A-P
+        :Return:
+            - `values` (numpy.array(n,3)) - joint centre trajectory
 
-                ProjC = np.cross(nBone,np.cross(C-P,nBone))
-                ProjB = np.cross(nBone,np.cross(B-P,nBone))
+        .. note:: frames where one of the points is null are returned null. All other frames match `chord`
 
+    """
+    A1 = np.asarray(A1,dtype=float)
+    A2 = np.asarray(A2,dtype=float)
+    A3 = np.asarray(A3,dtype=float)
 
-                sens = np.dot(np.cross(ProjC,ProjB).T,nBone)
+    if (len(A1) != len(A2) or len(A1) != len(A3) or len(A2) != len(A3)):
+        raise Exception ("length of input argument of chord function different")
 
+    mask = np.any(A1!=0,axis=1) & np.any(A2!=0,axis=1) & np.any(A3!=0,axis=1)
+    values = np.zeros(A1.shape)
+    if not np.any(mask):
+        return values
 
-                Betai = np.nan_to_num(np.divide(sens,np.linalg.norm(sens))) * np.arccos(np.nan_to_num(np.divide(np.dot(ProjC.T,ProjB),
-                                                     np.linalg.norm(ProjC)*np.linalg.norm(ProjB))))*180.0/np.pi
+    I = A1[mask]
+    J = A2[mask]
+    K = A3[mask]
 
-                diffBeta = np.abs(beta - Betai)
+    # chord with null beta
+    y=numeric.normalizeArray(J-I)
+    x=numeric.normalizeArray(np.cross(y,K-I))
+    z=np.cross(x,y)
 
-                if (diffBeta - idiff) > 0:
-                    if count == 1:
-                        Salpha = Salpha - alphaincr
-                        alphaincr = -alphaincr
-                    else:
-                        alphaincr = -alphaincr / 2.0;
+    ori=(J+I)/2.0
+    d=np.linalg.norm(I-J,axis=1)
+    theta=np.arcsin(offset/d)*2.0
 
-        returnValues[i,:]=P
+    # matR . rot . [0,-d/2,0]
+    P = (y*np.cos(theta)[:,np.newaxis] + z*np.sin(theta)[:,np.newaxis])*(-d/2.0)[:,np.newaxis] + ori
 
-    if arrayDim ==1:
-        out = returnValues[0,:]
-    else:
-        out = returnValues
+    if beta != 0.0:
+        A=J
+        B=I
+        C=K
+        L=offset
+
+        AB = np.linalg.norm(A-B,axis=1)
+        alpha = np.arcsin(L/AB)
+        AO = np.sqrt(AB*AB-L*L*(1+np.cos(alpha)*np.cos(alpha)))
+
+        # define P research circle in T plan
+        n = np.nan_to_num(np.divide((A-B),AB[:,np.newaxis]))
+        O = A - n*AO[:,np.newaxis]
+        r = L*np.cos(alpha)
+
+        Z=numeric.normalizeArray(n)
+        Y=numeric.normalizeArray(np.cross(Z,P-O))
+        X=numeric.normalizeArray(np.cross(Y,Z))
+
+        nFrames = len(I)
+        Salpha = np.zeros(nFrames)
+        diffBeta = np.ones(nFrames)*np.abs(beta)
+        alphaincr = np.ones(nFrames)*beta
+        count = np.zeros(nFrames,dtype=int)
+
+        active = diffBeta > epsilon
+        while np.any(active):
+            if np.any(count[active] > 100):
+                raise Exception("count boundary of Chord achieve")
+
+            count[active] = count[active] + 1
+            idiff = diffBeta[active]
+
+            Salpha[active] = Salpha[active] + alphaincr[active]
+            Salpharad = Salpha[active] * np.pi / 180.0
+
+            Pa = O[active] + X[active]*(r[active]*np.cos(Salpharad))[:,np.newaxis] + Y[active]*(r[active]*np.sin(Salpharad))[:,np.newaxis]
+            P[active] = Pa
+            nBone = A[active]-Pa
+
+            ProjC = np.cross(nBone,np.cross(C[active]-Pa,nBone))
+            ProjB = np.cross(nBone,np.cross(B[active]-Pa,nBone))
+
+            sens = np.einsum("ij,ij->i",np.cross(ProjC,ProjB),nBone)
+            cosBeta = np.nan_to_num(np.divide(np.einsum("ij,ij->i",ProjC,ProjB),
+                                               np.linalg.norm(ProjC,axis=1)*np.linalg.norm(ProjB,axis=1)))
+            Betai = np.nan_to_num(np.divide(sens,np.abs(sens))) * np.arccos(cosBeta)*180.0/np.pi
 
-    return out
+            newDiff = np.abs(beta - Betai)
+            diffBeta[active] = newDiff
+
+            worse = (newDiff - idiff) > 0
+            first = count[active] == 1
+            indexes = np.where(active)[0]
+
+            flip = indexes[worse & first]
+            Salpha[flip] = Salpha[flip] - alphaincr[flip]
+            alphaincr[flip] = -alphaincr[flip]
+
+            half = indexes[worse & ~first]
+            alphaincr[half] = -alphaincr[half] / 2.0
+
+            active = diffBeta > epsilon
+
+    values[mask] = P
+    return values
 
 def midPoint(acq,lateralMarkerLabel,medialMarkerLabel,offset=0):
 
@@ -321,99 +521,148 @@ def midPoint(acq,lateralMarkerLabel,medialMarkerLabel,offset=0):
 
     return midvalues
 
+def _frameSelection(indexFirstFrame,indexLastFrame):
+    # frames between indexFirstFrame and indexLastFrame ( both included). None or 0 means no bound
+    if indexFirstFrame and indexLastFrame:
+        return slice(indexFirstFrame,indexLastFrame+1)
+    elif  not indexFirstFrame and indexLastFrame:
+        return slice(None,indexLastFrame+1)
+    elif  indexFirstFrame and not indexLastFrame:
+        return slice(indexFirstFrame,None)
+    else:
+        return slice(None)
+
+
+# array decomposition of each sequence and the matrix terms of its angles (returned order):
+# ("atan2",(sign,row,col),(row,col)) for arctan2(sign*M[row,col],M[row,col]) and ("asin",(sign,row,col)) for arcsin(sign*M[row,col])
+_EULER_SEQUENCES = {
+    "XYZ": (euler.euler_xyzArray, [("atan2",(-1,1,2),(2,2)), ("asin",(1,0,2)), ("atan2",(-1,0,1),(0,0))]),
+    "XZY": (euler.euler_xzyArray, [("atan2",(1,2,1),(1,1)), ("asin",(-1,0,1)), ("atan2",(1,0,2),(0,0))]),
+    "YXZ": (euler.euler_yxzArray, [("atan2",(1,0,2),(2,2)), ("asin",(-1,1,2)), ("atan2",(1,1,0),(1,1))]),
+    "YZX": (euler.euler_yzxArray, [("atan2",(-1,2,0),(0,0)), ("asin",(1,1,0)), ("atan2",(-1,1,2),(1,1))]),
+    "ZXY": (euler.euler_zxyArray, [("atan2",(-1,0,1),(1,1)), ("asin",(1,2,1)), ("atan2",(-1,2,0),(2,2))]),
+    "ZYX": (euler.euler_zyxArray, [("atan2",(1,1,0),(0,0)), ("asin",(-1,2,0)), ("atan2",(1,2,1),(2,2))]),
+    }
+
+
+def _eulerAngleDerivative(M,dM,term):
+    # derivative of an euler angle from the derivative dM of the rotation matrices M ( regular configuration)
+    if term[0] == "asin":
+        sign,i,j = term[1]
+        return sign * dM[:,i,j] / np.sqrt(np.maximum(1.0 - M[:,i,j]**2,np.spacing(1)))
+    else:
+        sign,i,j = term[1]
+        k,l = term[2]
+        return sign * (M[:,k,l]*dM[:,i,j] - M[:,i,j]*dM[:,k,l]) / (M[:,i,j]**2 + M[:,k,l]**2)
+
+
 def calibration2Dof(proxMotionRef,distMotionRef,indexFirstFrame,indexLastFrame,jointRange,sequence="YXZ",index=1,flexInd=0):
+    """
+        Rotation offset about the proximal z-axis minimizing the variance of a joint angle ( ie the varus-valgus angle of the knee)
 
-    # onjective function : minimize variance of the knee varus valgus angle
-    def objFun(x, proxMotionRef, distMotionRef,indexFirstFrame,indexLastFrame, sequence,index,jointRange):
-        #nFrames= len(proxMotionRef)
-        frames0 = range(0,len(proxMotionRef))
+        :Parameters:
+            - `proxMotionRef` (pyCGM2.Model.frame.MotionTrajectory) - motion of the proximal referential
+            - `distMotionRef` (pyCGM2.Model.frame.MotionTrajectory) - motion of the distal referential
+            - `indexFirstFrame` (int) - first frame index. None for the first frame
+            - `indexLastFrame` (int) - last frame index. None for the last frame
+            - `jointRange` (list of double) - [optional] flexion range in degree of the frames used
+            - `sequence` (str) - euler sequence of the joint angles
+            - `index` (int) - index of the joint angle whose variance is minimized
+            - `flexInd` (int) - index of the flexion angle
 
-        if indexFirstFrame and indexLastFrame:
-            frames = frames0[indexFirstFrame:indexLastFrame+1]
+        :Return:
+            - `offset` (double) - rotation offset in degree
 
-        elif  not indexFirstFrame and indexLastFrame:
-            frames = frames0[:indexLastFrame+1]
+        .. note:: the relative rotations are computed once. An evaluation of the objective function and
+                  of its analytic jacobian is a few array operations.
 
-        elif  indexFirstFrame and not indexLastFrame:
-            frames = frames0[indexFirstFrame:]
+    """
+    if sequence not in _EULER_SEQUENCES:
+        raise Exception("[pyCGM2] joint sequence unknown ")
+    eulerFunction,terms = _EULER_SEQUENCES[sequence]
 
-        else:
-            frames = frames0
-
-        nFrames = len(frames)
-
-        angle=np.deg2rad(x)
-        rotZ = np.eye(3,3)
-        rotZ[0,0] = np.cos(angle)
-        rotZ[0,1] = - np.sin(angle)
-        rotZ[1,0] = np.sin(angle)
-        rotZ[1,1] = np.cos(angle)
-
-        jointValues = np.zeros((nFrames,3))
-
-        i=0
-        for f in frames:
-            Rprox = np.dot(proxMotionRef[f].getRotation(),rotZ)
-            Rdist = distMotionRef[f].getRotation()
-
-            Rrelative= np.dot(Rprox.T, Rdist)
-
-            if sequence == "XYZ":
-                Euler1,Euler2,Euler3 = euler.euler_xyz(Rrelative)
-            elif sequence == "XZY":
-                Euler1,Euler2,Euler3 = euler.euler_xzy(Rrelative)
-            elif sequence == "YXZ":
-                Euler1,Euler2,Euler3 = euler.euler_yxz(Rrelative)
-            elif sequence == "YZX":
-                Euler1,Euler2,Euler3 = euler.euler_yzx(Rrelative)
-            elif sequence == "ZXY":
-                Euler1,Euler2,Euler3 = euler.euler_zxy(Rrelative)
-            elif sequence == "ZYX":
-                Euler1,Euler2,Euler3 = euler.euler_zyx(Rrelative)
-            else:
-                raise Exception("[pyCGM2] joint sequence unknown ")
+    frames = _frameSelection(indexFirstFrame,indexLastFrame)
+    # relative rotations without offset ( Rprox.T * Rdist)
+    M = np.einsum("nji,njk->nik",proxMotionRef.getRotations()[frames],distMotionRef.getRotations()[frames])
+
+    def relativeRotations(x):
+        # rotZ.T * M, with rotZ the rotation of the offset about z
+        angle=np.deg2rad(x[0])
+        R = M.copy()
+        R[:,0,:] = np.cos(angle)*M[:,0,:] + np.sin(angle)*M[:,1,:]
+        R[:,1,:] = -np.sin(angle)*M[:,0,:] + np.cos(angle)*M[:,1,:]
+        return R
 
-            jointValues[i,0] = Euler1
-            jointValues[i,1] = Euler2
-            jointValues[i,2] = Euler3
-            i+=1
+    def selectedAngles(R):
+        jointValues = eulerFunction(R)
 
         if  jointRange is None:
-            variance = np.var(jointValues[:,index])
+            indexes = slice(None)
         else:
-            flexExt = jointValues[:,flexInd]
-            indexes = np.where(np.logical_and(flexExt>=np.deg2rad(jointRange[0]), flexExt<=np.deg2rad(jointRange[1])))[0].tolist()
+            flexExt = jointValues[flexInd]
+            indexes = np.where(np.logical_and(flexExt>=np.deg2rad(jointRange[0]), flexExt<=np.deg2rad(jointRange[1])))[0]
 
-            if indexes == []:
+            if indexes.size == 0:
                 raise Exception ("[pyCGM2]. Calibration2-dof : There is no frames included in inputed joint limits")
 
-            varVal = jointValues[:,index]
-            varValExtract = varVal[indexes]
+        return jointValues[index][indexes],indexes
 
-            variance = np.var(varValExtract)
+    # onjective function : minimize variance of the knee varus valgus angle
+    def objFun(x):
+        values,indexes = selectedAngles(relativeRotations(x))
+        return np.var(values)
 
+    def jacFun(x):
+        R = relativeRotations(x)
+        values,indexes = selectedAngles(R)
 
+        dR = np.zeros(R.shape)
+        dR[:,0,:] = R[:,1,:]
+        dR[:,1,:] = -R[:,0,:]
+        derivatives = _eulerAngleDerivative(R,dR,terms[index])[indexes]
 
-        return variance
+        return np.array([[2.0*np.mean((values-values.mean())*derivatives)*np.deg2rad(1.0)]])
 
     x0 = 0.0 # deg
-    res = least_squares(objFun, x0, args=(proxMotionRef, distMotionRef,indexFirstFrame,indexLastFrame,sequence,index,jointRange), verbose=2)
+    res = least_squares(objFun, x0, jac=jacFun, verbose=2)
 
     return res.x[0]
 
 
 
 
-def saraCalibration(proxMotionRef,distMotionRef,indexFirstFrame,indexLastFrame, gap = 100, method = "1"):
+def _selectedMotions(proxMotionRef,distMotionRef,indexFirstFrame,indexLastFrame,visibility):
+    # rotations and translations of both referentials over the selected frames
+    frames = np.arange(0,len(proxMotionRef))[_frameSelection(indexFirstFrame,indexLastFrame)]
+    if visibility is not None:
+        frames = frames[np.asarray(visibility,dtype=bool)[frames]]
+
+    if frames.shape[0] == 0:
+        raise Exception ("[pyCGM2] functional calibration : no frame selected")
+
+    return (proxMotionRef.getRotations()[frames],proxMotionRef.getTranslations()[frames],
+            distMotionRef.getRotations()[frames],distMotionRef.getTranslations()[frames])
+
+
+def _localPointResiduals(Rprox,tprox,Rdist,tdist,proxLocal,distLocal):
+    # difference between the global trajectories of a point located in both referentials
+    return (np.einsum("nij,j->ni",Rprox,proxLocal) + tprox) - (np.einsum("nij,j->ni",Rdist,distLocal) + tdist)
+
+
+def saraCalibration(proxMotionRef,distMotionRef,indexFirstFrame,indexLastFrame, gap = 100, method = "1", visibility=None, returnResiduals=False):
     """
 
-        Computation of the hip joint center position from Harrington's regressions.
+        Computation of the functional axis of a joint with the SARA method ( symmetrical axis of rotation approach).
 
         :Parameters:
-            - `proxMotionRef` (list of numpy.array(3,3)) - motion of the proximal referential
-            - `distMotionRef` (list of numpy.array(3,3)) - motion of the distal referential
+            - `proxMotionRef` (pyCGM2.Model.frame.MotionTrajectory) - motion of the proximal referential
+            - `distMotionRef` (pyCGM2.Model.frame.MotionTrajectory) - motion of the distal referential
+            - `indexFirstFrame` (int) - first frame index. None for the first frame
+            - `indexLastFrame` (int) - last frame index. None for the last frame
             - `gap` (double) - distance in mm for positionning an axis limit
             - `method` (int) - affect the objective function (see Ehrig et al.).
+            - `visibility` (numpy.array(n) of bool) - [optional] frames of the motion used for the calibration
+            - `returnResiduals` (bool) - [optional] also return the residual of the origins
 
         :Returns:
             - `prox_origin` (np.array(3)) - position of the origin in the proximal referential
@@ -423,6 +672,8 @@ def saraCalibration(proxMotionRef,distMotionRef,indexFirstFrame,indexLastFrame,
             - `prox_axisNorm` (np.array(3)) - axis in the proximal frame
             - `dist_axisNorm` (np.array(3)) - axis in the proximal frame
             - `coeffDet`     (double) - See about it with morgan
+            - `residuals`     (np.array(k,3)) - [if returnResiduals] difference between the global positions of
+              the proximal and distal origins, for the k frames used for the calibration
 
 
         .. warning ::
@@ -430,38 +681,22 @@ def saraCalibration(proxMotionRef,distMotionRef,indexFirstFrame,indexLastFrame,
             linalg.svd and matlab are different. V from scipy has to be transposed.
             In addition, singular values are returned in a 1d array not a diagonal matrix
 
+        .. note:: the linear system is built from the stacked rotations and translations of the selected frames,
+                  without any loop over the frames.
+
         **Reference**
 
         Ehrig, R., Taylor, W. R., Duda, G., & Heller, M. (2007). A survey of formal methods for determining functional joint axes. Journal of Biomechanics, 40(10), 2150–7.
 
     """
-    frames0 = range(0,len(proxMotionRef))
-
-    if indexFirstFrame and indexLastFrame:
-        frames = frames0[indexFirstFrame:indexLastFrame+1]
-
-    elif  not indexFirstFrame and indexLastFrame:
-        frames = frames0[:indexLastFrame+1]
-
-    elif  indexFirstFrame and not indexLastFrame:
-        frames = frames0[indexFirstFrame:]
-
-    nFrames = len(frames)
+    Rprox,tprox,Rdist,tdist = _selectedMotions(proxMotionRef,distMotionRef,indexFirstFrame,indexLastFrame,visibility)
+    nFrames = Rprox.shape[0]
 
     if method =="1":
 
-        A = np.zeros((nFrames*3,6))
-        b = np.zeros((nFrames*3,1))
-
-        i=0
-        for f in frames:
-            A[i*3:i*3+3,0:3] = proxMotionRef[f].getRotation()
-            A[i*3:i*3+3,3:6] = -1.0 * distMotionRef[f].getRotation()
-            b[i*3:i*3+3,:] = (distMotionRef[f].getTranslation() - proxMotionRef[f].getTranslation()).reshape(3,1)
-            i+=1
-
-
-
+        # rows 3i to 3i+2 : [ Rprox_i , -Rdist_i ] * [cprox, cdist] = tdist_i - tprox_i
+        A = np.concatenate((Rprox.reshape(nFrames*3,3), -1.0 * Rdist.reshape(nFrames*3,3)),axis=1)
+        b = (tdist - tprox).reshape(nFrames*3,1)
 
         U,s,V = np.linalg.svd(A,full_matrices=False)
         V = V.T # beware of V ( there is a difference between numpy and matlab)
@@ -472,38 +707,15 @@ def saraCalibration(proxMotionRef,distMotionRef,indexFirstFrame,indexLastFrame,
         CoR = V.dot(invDiagS).dot(U.T).dot(b)
         AoR = V[:,5]
 
-
-
     elif method =="2": # idem programmation morgan
 
-        SR = np.zeros((3,3))
-        Sd = np.zeros((3,1))
-        SRd = np.zeros((3,1))
-
-        # For each frame compute the transformation matrix of the distal
-        # segment in the proximal reference system
-
-        for f in frames:
-            Rprox = proxMotionRef[f].getRotation()
-            tprox = proxMotionRef[f].getTranslation()
-
-            Rdist = distMotionRef[f].getRotation()
-            tdist = distMotionRef[f].getTranslation()
-
-
-            P = np.concatenate((np.concatenate((Rprox,tprox.reshape(1,3).T),axis=1),np.array([[0,0,0,1]])),axis=0)
-            D = np.concatenate((np.concatenate((Rdist,tdist.reshape(1,3).T),axis=1),np.array([[0,0,0,1]])),axis=0)
-
-            T = np.dot(np.linalg.pinv(P),D)
-            R = T[0:3,0:3 ]
-            d= T[0:3,3].reshape(3,1)
-
-
-            SR = SR + R
-            Sd = Sd + d
-            SRd = SRd + np.dot(R.T,d)
-
+        # transformation of the distal segment in the proximal reference system
+        R = np.einsum("nji,njk->nik",Rprox,Rdist)
+        d = np.einsum("nji,nj->ni",Rprox,tdist-tprox)
 
+        SR = R.sum(axis=0)
+        Sd = d.sum(axis=0).reshape(3,1)
+        SRd = np.einsum("nji,nj->i",R,d).reshape(3,1)
 
         A0 = np.concatenate((nFrames*np.eye(3),-SR),axis=1)
         A1 = np.concatenate((-SR.T,nFrames*np.eye(3)),axis=1)
@@ -522,6 +734,9 @@ def saraCalibration(proxMotionRef,distMotionRef,indexFirstFrame,indexLastFrame,
 
         AoR = V[:,5]
 
+    else:
+        raise Exception ("[pyCGM2] SARA calibration : method (%s) unknown" %(method))
+
     CoR_prox = CoR[0:3]
     CoR_dist = CoR[3:6]
 
@@ -538,7 +753,53 @@ def saraCalibration(proxMotionRef,distMotionRef,indexFirstFrame,indexLastFrame,
     S = diagS[3:6,3:6]
     coeffDet = S[2,2]/(np.trace(S)-S[2,2])
 
-    return prox_origin.reshape(3),prox_axisLim.reshape(3),dist_origin.reshape(3),dist_axisLim.reshape(3),prox_axisNorm,dist_axisNorm,coeffDet
+    outputs = (prox_origin.reshape(3),prox_axisLim.reshape(3),dist_origin.reshape(3),dist_axisLim.reshape(3),prox_axisNorm,dist_axisNorm,coeffDet)
+
+    if returnResiduals:
+        outputs = outputs + (_localPointResiduals(Rprox,tprox,Rdist,tdist,prox_origin.reshape(3),dist_origin.reshape(3)),)
+
+    return outputs
+
+
+def scoreCalibration(proxMotionRef,distMotionRef,indexFirstFrame,indexLastFrame, visibility=None, returnResiduals=False):
+    """
+        Computation of the centre of rotation of a joint with the SCoRE method ( symmetrical centre of rotation estimation)
+
+        :Parameters:
+            - `proxMotionRef` (pyCGM2.Model.frame.MotionTrajectory) - motion of the proximal referential
+            - `distMotionRef` (pyCGM2.Model.frame.MotionTrajectory) - motion of the distal referential
+            - `indexFirstFrame` (int) - first frame index. None for the first frame
+            - `indexLastFrame` (int) - last frame index. None for the last frame
+            - `visibility` (numpy.array(n) of bool) - [optional] frames of the motion used for the calibration
+            - `returnResiduals` (bool) - [optional] also return the residual of the centre
+
+        :Returns:
+            - `prox_centre` (np.array(3)) - position of the centre in the proximal referential
+            - `dist_centre` (np.array(3)) - position of the centre in the distal referential
+            - `residuals`     (np.array(k,3)) - [if returnResiduals] difference between the global positions of
+              the proximal and distal centres, for the k frames used for the calibration
+
+        **Reference**
+
+        Ehrig, R. M., Taylor, W. R., Duda, G. N., & Heller, M. O. (2006). A survey of formal methods for determining the centre of rotation of ball joints. Journal of Biomechanics, 39(15), 2798–2809.
+
+    """
+    Rprox,tprox,Rdist,tdist = _selectedMotions(proxMotionRef,distMotionRef,indexFirstFrame,indexLastFrame,visibility)
+    nFrames = Rprox.shape[0]
+
+    # rows 3i to 3i+2 : [ Rprox_i , -Rdist_i ] * [cprox, cdist] = tdist_i - tprox_i
+    A = np.concatenate((Rprox.reshape(nFrames*3,3), -1.0 * Rdist.reshape(nFrames*3,3)),axis=1)
+    b = (tdist - tprox).reshape(nFrames*3)
+
+    CoR = np.linalg.lstsq(A,b,rcond=None)[0]
+
+    prox_centre = CoR[0:3]
+    dist_centre = CoR[3:6]
+
+    if returnResiduals:
+        return prox_centre,dist_centre,_localPointResiduals(Rprox,tprox,Rdist,tdist,prox_centre,dist_centre)
+
+    return prox_centre,dist_centre
 
 
 
@@ -1417,6 +1678,44 @@ class HipJointCenterDecorator(DecoratorModel):
             # marker
             #btkTools.smartAppendPoint(acq,"LHJC_MRK",RHJCvalues, desc="from marker")
 
+    def score(self,side,**kwargs):
+        """
+            Locate the hip joint centre from a SCoRE functional calibration
+
+            :Parameters:
+                - `side` (str) - lower limb side
+
+            .. note:: optional keyword arguments are `indexFirstFrame`, `indexLastFrame` and `visibility` ( boolean array
+                      of the frames used for the calibration)
+
+            .. warning :: the technical frames of the pelvis and the thigh need a motion
+
+        """
+        self.model.decoratedModel = True
+
+        iff = kwargs["indexFirstFrame"] if "indexFirstFrame" in kwargs else None
+        ilf = kwargs["indexLastFrame"] if "indexLastFrame" in kwargs else None
+        visibility = kwargs["visibility"] if "visibility" in kwargs else None
+
+        if side == "Left":
+            distSegmentlabel = "Left Thigh"
+        elif side == "Right":
+            distSegmentlabel = "Right Thigh"
+        else:
+            raise Exception("[pyCGM2] side doesn t recongnize")
+
+        proxMotion = self.model.getSegment("Pelvis").getReferential("TF").motion
+        distMotion = self.model.getSegment(distSegmentlabel).getReferential("TF").motion
+
+        prox_centre,dist_centre,residuals = scoreCalibration(proxMotion,distMotion,iff,ilf,
+                                                             visibility=visibility, returnResiduals=True)
+        LOGGER.logger.debug( " score rms error : %s " % str(numeric.rms(residuals)))
+
+        if side == "Left":
+            self.custom(position_Left=prox_centre, side="left", methodDesc="score")
+        else:
+            self.custom(position_Right=prox_centre, side="right", methodDesc="score")
+
 class KneeCalibrationDecorator(DecoratorModel):
     """
         Concrete cgm decorator altering the knee joint
@@ -1603,11 +1902,15 @@ class KneeCalibrationDecorator(DecoratorModel):
             :Parameters:
                 - `side` (str) - lower limb side
 
+            .. note:: optional keyword arguments are `indexFirstFrame`, `indexLastFrame` and `visibility` ( boolean array
+                      of the frames used for the calibration)
+
         """
         self.model.decoratedModel = True
 
         iff = kwargs["indexFirstFrame"] if "indexFirstFrame" in kwargs else None
         ilf = kwargs["indexLastFrame"] if "indexLastFrame" in kwargs else None
+        visibility = kwargs["visibility"] if "visibility" in kwargs else None
 
         if side == "Left":
             proxSegmentLabel = "Left Thigh"
@@ -1632,7 +1935,8 @@ class KneeCalibrationDecorator(DecoratorModel):
         distMotion = self.model.getSegment(distSegmentlabel).getReferential("TF").motion
 
         # -- main function -----
-        prox_ori,prox_axisLim,dist_ori,dist_axisLim,axis_prox,axis_dist,quality = saraCalibration(proxMotion,distMotion,iff, ilf, method="2")
+        prox_ori,prox_axisLim,dist_ori,dist_axisLim,axis_prox,axis_dist,quality,ferr = saraCalibration(proxMotion,distMotion,iff, ilf, method="2",
+                                                                                                      visibility=visibility, returnResiduals=True)
         # end function -----
 
 
@@ -1643,11 +1947,7 @@ class KneeCalibrationDecorator(DecoratorModel):
         self.model.getSegment(distSegmentlabel).getReferential("TF").static.addNode("KneeFlexionOri",dist_ori,positionType="Local")
         self.model.getSegment(distSegmentlabel).getReferential("TF").static.addNode("KneeFlexionAxis",dist_axisLim,positionType="Local")
 
-        # compute error
-        xp = self.model.getSegment(proxSegmentLabel).getReferential("TF").getNodeTrajectory("KneeFlexionOri")
-        xd = self.model.getSegment(distSegmentlabel).getReferential("TF").getNodeTrajectory("KneeFlexionOri")
-
-        ferr = xp-xd
+        # error over the calibration frames
         Merr = numeric.rms(ferr)
         LOGGER.logger.debug( " sara rms error : %s " % str(Merr))
 
@@ -119,83 +119,47 @@ class CGMLowerlimbInverseDynamicProcedure(object):
 
         nf = wrenchs[0].GetMoment().GetValues().shape[0]
         momentValues = np.zeros((nf,3))
+        origin = Oi.getTranslations()
 
         for wrIt in wrenchs:
-             Fext = wrIt.GetForce().GetValues()
-             Mext = wrIt.GetMoment().GetValues()
-             posExt = wrIt.GetPosition().GetValues()
+            Fext = wrIt.GetForce().GetValues()
+            Mext = wrIt.GetMoment().GetValues()
+            di = (wrIt.GetPosition().GetValues() - origin)*scaleToMeter
 
-             for i in range(0,nf):
-                 Fext_i = np.matrix(Fext[i,:])
-                 Mext_i = np.matrix(Mext[i,:])
-                 di = posExt[i,:] - Oi[i].getTranslation()
-                 wrMomentValues = (Mext_i.T*scaleToMeter + numeric.skewMatrix(di*scaleToMeter)*Fext_i.T)
-                 momentValues[i,:] = momentValues[i,:] + np.array(wrMomentValues.T)
+            momentValues = momentValues + Mext*scaleToMeter + np.cross(di,Fext)
 
         return momentValues
 
 
-    def _distalMomentContribution(self, wrench, Oi, scaleToMeter, source = "Wrench"):
-
-        nf = wrench.GetMoment().GetValues().shape[0]
-        momentValues = np.zeros((nf,3))
+    def _distalMomentContribution(self, wrench, Oi, scaleToMeter):
+        """
+        return the moment contributions of the distal wrench, its force and its moment, in that order.
+        """
 
         Fext = wrench.GetForce().GetValues()
         Mext = wrench.GetMoment().GetValues()
-        posExt = wrench.GetPosition().GetValues()
-
-        for i in range(0,nf):
-            Fext_i = np.matrix(Fext[i,:])
-            Mext_i = np.matrix(Mext[i,:])
-            di = posExt[i,:] - Oi[i].getTranslation()
+        di = (wrench.GetPosition().GetValues() - Oi.getTranslations())*scaleToMeter
 
-            if source == "Wrench":
-                wrMomentValues = (- 1.0*Mext_i.T*scaleToMeter + - 1.0*numeric.skewMatrix(di*scaleToMeter)*Fext_i.T)
-            elif source == "Force":
-                wrMomentValues = ( - 1.0*numeric.skewMatrix(di*scaleToMeter)*Fext_i.T)
-            elif source == "Moment":
-                wrMomentValues = (- 1.0*Mext_i.T*scaleToMeter)
+        forceContribution = - 1.0*np.cross(di,Fext)
+        momentContribution = - 1.0*Mext*scaleToMeter
 
-            momentValues[i,:] =  np.array(wrMomentValues.T)
-
-        return momentValues
+        return forceContribution + momentContribution, forceContribution, momentContribution
 
     def _forceAccelerationContribution(self,mi,ai,g,scaleToMeter):
 
-        nf = ai.shape[0]
-        g= np.matrix(g)
-        accelerationContribution = np.zeros((nf,3))
-
-        for i in range(0,nf):
-            ai_i = np.matrix(ai[i,:])
-            val = mi * ai_i.T*scaleToMeter - mi*g.T
-            accelerationContribution[i,:] = np.array(val.T)
-
-        return  accelerationContribution
+        return mi * ai*scaleToMeter - mi*np.asarray(g).reshape(3)
 
 
     def _inertialMomentContribution(self,Ii, alphai,omegai, Ti ,scaleToMeter):
         """
         """
-        nf = alphai.shape[0]
+        Ri = Ti.getRotations()
 
-        accelerationContribution = np.zeros((nf,3))
-        coriolisContribution = np.zeros((nf,3))
-
-        Ii = np.matrix(Ii)
-
-
-        for i in range(0,nf):
-            alphai_i = np.matrix(alphai[i,:])
-            omegai_i = np.matrix(omegai[i,:])
-            Ri_i = np.matrix(Ti[i].getRotation())
-
-            accContr_i = Ri_i*(Ii*np.power(scaleToMeter,2))*Ri_i.T * alphai_i.T
-            accelerationContribution[i,:]=np.array(accContr_i.T)
-
-            corCont_i = numeric.skewMatrix(omegai_i) * Ri_i*(Ii*np.power(scaleToMeter,2))*Ri_i.T * omegai_i.T
-            coriolisContribution[i,:] = np.array(corCont_i.T)
+        # inertia tensors expressed in the global frame ( Ri*Ii*Ri.T)
+        Ii_global = np.einsum("nij,jk,nlk->nil",Ri,np.asarray(Ii)*np.power(scaleToMeter,2),Ri)
 
+        accelerationContribution = np.einsum("nij,nj->ni",Ii_global,alphai)
+        coriolisContribution = np.cross(omegai,np.einsum("nij,nj->ni",Ii_global,omegai))
 
         return   accelerationContribution + coriolisContribution
 
@@ -203,38 +167,16 @@ class CGMLowerlimbInverseDynamicProcedure(object):
         """
         SkewMatrix(ai_i*scaleToMeter) *mi * Ri_i*(ci*scaleToMeter
         """
+        ci_global = np.einsum("nij,j->ni",Ti.getRotations(),np.asarray(ci).reshape(3)*scaleToMeter)
 
-        nf = ai.shape[0]
-
-        accelerationContribution = np.zeros((nf,3))
-
-        for i in range(0,nf):
-            ai_i = np.matrix(ai[i,:])
-            Ri_i = np.matrix(Ti[i].getRotation())
-            ci = np.matrix(ci)
-
-            val = -1.0*mi*numeric.skewMatrix(ai_i*scaleToMeter) * Ri_i*(ci.T*scaleToMeter)
-
-            accelerationContribution[i,:] = np.array(val.T)
-
-        return accelerationContribution
+        return -1.0*mi*np.cross(ai*scaleToMeter,ci_global)
 
 
     def _gravityMomentContribution(self, mi,ci, g, Ti, scaleToMeter):
 
-        nf = len(Ti)
-
-        gravityContribution = np.zeros((nf,3))
-
+        ci_global = np.einsum("nij,j->ni",Ti.getRotations(),np.asarray(ci).reshape(3)*scaleToMeter)
 
-        g= np.matrix(g)
-        ci = np.matrix(ci)
-        for i in range(0,nf):
-            Ri_i = np.matrix(Ti[i].getRotation())
-            val = - 1.0 *mi*numeric.skewMatrix(g) * Ri_i*(ci.T*scaleToMeter)
-
-            gravityContribution[i,:] = np.array(val.T)
-        return  gravityContribution
+        return - 1.0 *mi*np.cross(np.asarray(g).reshape(3),ci_global)
 
 
 
@@ -277,10 +219,7 @@ class CGMLowerlimbInverseDynamicProcedure(object):
             distalWrench = model.getSegment(distalSegmentLabel).m_proximalWrench
 
             distSegForce = distalWrench.GetForce().GetValues()
-            distSegMoment = self._distalMomentContribution(distalWrench, Ti, scaleToMeter)
-
-            distSegMoment_forceDistalContribution = self._distalMomentContribution(distalWrench, Ti, scaleToMeter, source ="Force")
-            distSegMoment_momentDistalContribution = self._distalMomentContribution(distalWrench, Ti, scaleToMeter, source ="Moment")
+            distSegMoment,distSegMoment_forceDistalContribution,distSegMoment_momentDistalContribution = self._distalMomentContribution(distalWrench, Ti, scaleToMeter)
 
         # Force
         ai = model.getSegment(segmentLabel).getComAcceleration(btkAcq.GetPointFrequency(), order=4, fc=6 )
@@ -297,8 +236,7 @@ class CGMLowerlimbInverseDynamicProcedure(object):
 
         momentValues = inertieCont + accCont -  grCont - extMoment - distSegMoment
 
-        for i in range(0,N):
-            positionValues[i,:] = Ti[i].getTranslation()
+        positionValues = np.array(Ti.getTranslations())
 
         ForceBtkPoint.SetValues(forceValues)
         MomentBtkPoint.SetValues(momentValues/scaleToMeter)
@@ -540,59 +478,29 @@ class ModelMotionFilter(object):
                 segPicked.getReferential("TF").motion =[]
 
                 if self.m_method == enums.motionMethod.Determinist :
-                    for i in range(0,self.m_aqui.GetPointFrameNumber()):
-
-                        pt1=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][0])).GetValues()[i,:]
-                        pt2=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][1])).GetValues()[i,:]
-                        pt3=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][2])).GetValues()[i,:]
-                        ptOrigin=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][3])).GetValues()[i,:]
-
-                        a1=(pt2-pt1)
-                        a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
+                    pt1=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][0])).GetValues()
+                    pt2=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][1])).GetValues()
+                    pt3=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][2])).GetValues()
+                    ptOrigin=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][3])).GetValues()
 
-                        v=(pt3-pt1)
-                        v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
+                    x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,self.m_procedure.definition[segName]["TF"]['sequence'])
+                    segPicked.getReferential("TF").setMotion(R,ptOrigin)
 
-                        a2=np.cross(a1,v)
-                        a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
 
-                        x,y,z,R=frame.setFrameData(a1,a2,self.m_procedure.definition[segName]["TF"]['sequence'])
-
-                        cframe=frame.Frame()
-                        cframe.m_axisX=x
-                        cframe.m_axisY=y
-                        cframe.m_axisZ=z
-                        cframe.setRotation(R)
-                        cframe.setTranslation(ptOrigin)
+                if self.m_method == enums.motionMethod.Sodervisk :
+                    tms= segPicked.m_tracking_markers
 
-                        segPicked.getReferential("TF").addMotionFrame(copy.deepcopy(cframe) )
+                    # constructuion of the input of sodervisk
+                    arrayStatic = np.array([segPicked.getReferential("TF").static.getNode_byLabel(tm).m_global for tm in tms]).reshape((len(tms),3))
+                    arrayDynamic = btkTools.getMarkerArray(self.m_aqui,tms)
+                    visibility = btkTools.getVisibilityMask(self.m_aqui,tms)
 
+                    Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArray(arrayStatic,arrayDynamic,visibility)
+                    R=np.einsum("nij,jk->nik",Ropt,segPicked.getReferential("TF").static.getRotation())
+                    tOri=np.einsum("nij,j->ni",Ropt,segPicked.getReferential("TF").static.getTranslation())+Lopt
 
-                if self.m_method == enums.motionMethod.Sodervisk :
-                    tms= segPicked.m_tracking_markers
-                    for i in range(0,self.m_aqui.GetPointFrameNumber()):
-                        visibleMarkers = btkTools.getVisibleMarkersAtFrame(self.m_aqui,tms,i)
-
-                        arrayStatic = np.zeros((len(visibleMarkers),3))
-                        arrayDynamic = np.zeros((len(visibleMarkers),3))
-
-                        j=0
-                        for vm in visibleMarkers:
-                            arrayStatic[j,:] = segPicked.getReferential("TF").static.getNode_byLabel(vm).m_global
-                            arrayDynamic[j,:] = self.m_aqui.GetPoint(vm).GetValues()[i,:]
-                            j+=1
-
-                        Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(arrayStatic,arrayDynamic)
-                        R=np.dot(Ropt,segPicked.getReferential("TF").static.getRotation())
-                        tOri=np.dot(Ropt,segPicked.getReferential("TF").static.getTranslation())+Lopt
-
-                        cframe=frame.Frame()
-                        cframe.setRotation(R)
-                        cframe.setTranslation(tOri)
-                        cframe.m_axisX=R[:,0]
-                        cframe.m_axisY=R[:,1]
-                        cframe.m_axisZ=R[:,2]
-                        segPicked.getReferential("TF").addMotionFrame(copy.deepcopy(cframe) )
+                    segPicked.getReferential("TF").setMotion(R,tOri)
+                    segPicked.getReferential("TF").additionalInfos["RMSE"] = RMSE
 
             if not self.m_noAnatomicalMotion:
                 for segName in segments:
@@ -603,11 +511,8 @@ class ModelMotionFilter(object):
                     ndO = str(self.m_procedure.anatomicalDefinition[segName]['labels'][3])
                     ptO = segPicked.getReferential("TF").getNodeTrajectory(ndO)
 
-                    csFrame=frame.Frame()
-                    for i in range(0,self.m_aqui.GetPointFrameNumber()):
-                        R = np.dot(segPicked.getReferential("TF").motion[i].getRotation(), segPicked.getReferential("TF").relativeMatrixAnatomic)
-                        csFrame.update(R,ptO)
-                        segPicked.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+                    R = np.einsum("nij,jk->nik",segPicked.getReferential("TF").motion.getRotations(), segPicked.getReferential("TF").relativeMatrixAnatomic)
+                    segPicked.anatomicalFrame.setMotion(R,ptO)
             else:
                 for segName in self.m_procedure.definition:
                     segPicked=self.m_model.getSegment(segName)
@@ -617,11 +522,8 @@ class ModelMotionFilter(object):
                     ndO = str(self.m_procedure.definition[segName]["TF"]['labels'][3])
                     ptO = segPicked.getReferential("TF").getNodeTrajectory(ndO)
 
-                    csFrame=frame.Frame()
-                    for i in range(0,self.m_aqui.GetPointFrameNumber()):
-                        R = np.dot(segPicked.getReferential("TF").motion[i].getRotation(), segPicked.getReferential("TF").relativeMatrixAnatomic)
-                        csFrame.update(R,ptO)
-                        segPicked.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+                    R = np.einsum("nij,jk->nik",segPicked.getReferential("TF").motion.getRotations(), segPicked.getReferential("TF").relativeMatrixAnatomic)
+                    segPicked.anatomicalFrame.setMotion(R,ptO)
     def compute(self):
         """
             Run the motion filter
@@ -639,62 +541,29 @@ class ModelMotionFilter(object):
                 segPicked.getReferential("TF").motion =[]
 
                 if self.m_method == enums.motionMethod.Determinist :
-                    for i in range(0,self.m_aqui.GetPointFrameNumber()):
-
-                        pt1=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][0])).GetValues()[i,:]
-                        pt2=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][1])).GetValues()[i,:]
-                        pt3=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][2])).GetValues()[i,:]
-                        ptOrigin=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][3])).GetValues()[i,:]
-
-                        a1=(pt2-pt1)
-                        a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-                        v=(pt3-pt1)
-                        v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
+                    pt1=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][0])).GetValues()
+                    pt2=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][1])).GetValues()
+                    pt3=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][2])).GetValues()
+                    ptOrigin=self.m_aqui.GetPoint(str(self.m_procedure.definition[segName]["TF"]['labels'][3])).GetValues()
 
-                        a2=np.cross(a1,v)
-                        a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-                        x,y,z,R=frame.setFrameData(a1,a2,self.m_procedure.definition[segName]["TF"]['sequence'])
-
-                        cframe=frame.Frame()
-                        cframe.m_axisX=x
-                        cframe.m_axisY=y
-                        cframe.m_axisZ=z
-                        cframe.setRotation(R)
-                        cframe.setTranslation(ptOrigin)
-
-                        segPicked.getReferential("TF").addMotionFrame(copy.deepcopy(cframe) )
+                    x,y,z,R=frame.setFrameDataArrayFromPoints(pt1,pt2,pt3,self.m_procedure.definition[segName]["TF"]['sequence'])
+                    segPicked.getReferential("TF").setMotion(R,ptOrigin)
 
                 if self.m_method == enums.motionMethod.Sodervisk :
 
                     tms= segPicked.m_tracking_markers
 
-                    for i in range(0,self.m_aqui.GetPointFrameNumber()):
-                        visibleMarkers = btkTools.getVisibleMarkersAtFrame(self.m_aqui,tms,i)
-
-                        # constructuion of the input of sodervisk
-                        arrayStatic = np.zeros((len(visibleMarkers),3))
-                        arrayDynamic = np.zeros((len(visibleMarkers),3))
+                    # constructuion of the input of sodervisk
+                    arrayStatic = np.array([segPicked.getReferential("TF").static.getNode_byLabel(tm).m_global for tm in tms]).reshape((len(tms),3))
+                    arrayDynamic = btkTools.getMarkerArray(self.m_aqui,tms)
+                    visibility = btkTools.getVisibilityMask(self.m_aqui,tms)
 
-                        j=0
-                        for vm in visibleMarkers:
-                            arrayStatic[j,:] = segPicked.getReferential("TF").static.getNode_byLabel(vm).m_global
-                            arrayDynamic[j,:] = self.m_aqui.GetPoint(vm).GetValues()[i,:]
-                            j+=1
+                    Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquareArray(arrayStatic,arrayDynamic,visibility)
+                    R=np.einsum("nij,jk->nik",Ropt,segPicked.getReferential("TF").static.getRotation())
+                    tOri=np.einsum("nij,j->ni",Ropt,segPicked.getReferential("TF").static.getTranslation())+Lopt
 
-                        Ropt, Lopt, RMSE, Am, Bm=motion.segmentalLeastSquare(arrayStatic,arrayDynamic)
-                        R=np.dot(Ropt,segPicked.getReferential("TF").static.getRotation())
-                        tOri=np.dot(Ropt,segPicked.getReferential("TF").static.getTranslation())+Lopt
-
-                        cframe=frame.Frame()
-                        cframe.setRotation(R)
-                        cframe.setTranslation(tOri)
-                        cframe.m_axisX=R[:,0]
-                        cframe.m_axisY=R[:,1]
-                        cframe.m_axisZ=R[:,2]
-
-                        segPicked.getReferential("TF").addMotionFrame(copy.deepcopy(cframe) )
+                    segPicked.getReferential("TF").setMotion(R,tOri)
+                    segPicked.getReferential("TF").additionalInfos["RMSE"] = RMSE
 
 
 
@@ -707,11 +576,8 @@ class ModelMotionFilter(object):
                     ndO = str(self.m_procedure.anatomicalDefinition[segName]['labels'][3])
                     ptO = segPicked.getReferential("TF").getNodeTrajectory(ndO)
 
-                    csFrame=frame.Frame()
-                    for i in range(0,self.m_aqui.GetPointFrameNumber()):
-                        R = np.dot(segPicked.getReferential("TF").motion[i].getRotation(), segPicked.getReferential("TF").relativeMatrixAnatomic)
-                        csFrame.update(R,ptO[i])
-                        segPicked.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+                    R = np.einsum("nij,jk->nik",segPicked.getReferential("TF").motion.getRotations(), segPicked.getReferential("TF").relativeMatrixAnatomic)
+                    segPicked.anatomicalFrame.setMotion(R,ptO)
             else:
                 for segName in self.m_procedure.definition:
                     segPicked=self.m_model.getSegment(segName)
@@ -720,11 +586,8 @@ class ModelMotionFilter(object):
                     ndO = str(self.m_procedure.definition[segName]["TF"]['labels'][3])
                     ptO = segPicked.getReferential("TF").getNodeTrajectory(ndO)
 
-                    csFrame=frame.Frame()
-                    for i in range(0,self.m_aqui.GetPointFrameNumber()):
-                        R = np.dot(segPicked.getReferential("TF").motion[i].getRotation(), segPicked.getReferential("TF").relativeMatrixAnatomic)
-                        csFrame.update(R,ptO[i])
-                        segPicked.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+                    R = np.einsum("nij,jk->nik",segPicked.getReferential("TF").motion.getRotations(), segPicked.getReferential("TF").relativeMatrixAnatomic)
+                    segPicked.anatomicalFrame.setMotion(R,ptO)
 
 
 
@@ -842,33 +705,27 @@ class ModelJCSFilter(object):
             proxSeg = self.m_model.getSegment(it.m_proximalLabel)
             distSeg = self.m_model.getSegment(it.m_distalLabel)
 
-            jointValues = np.zeros((self.m_aqui.GetPointFrameNumber(),3))
-            for i in range (0, self.m_aqui.GetPointFrameNumber()):
-                Rprox = proxSeg.anatomicalFrame.motion[i].getRotation()
-                Rdist = distSeg.anatomicalFrame.motion[i].getRotation()
-#                Rprox = np.dot(proxSeg.getReferential("TF").motion[i].getRotation(), proxSeg.getReferential("TF").relativeMatrixAnatomic)
-#                Rdist = np.dot(distSeg.getReferential("TF").motion[i].getRotation(), distSeg.getReferential("TF").relativeMatrixAnatomic)
-                Rrelative= np.dot(Rprox.T, Rdist)
-
-
-                if it.m_sequence == "XYZ":
-                    Euler1,Euler2,Euler3 = euler.euler_xyz(Rrelative)
-                elif it.m_sequence == "XZY":
-                    Euler1,Euler2,Euler3 = euler.euler_xzy(Rrelative)
-                elif it.m_sequence == "YXZ":
-                    Euler1,Euler2,Euler3 = euler.euler_yxz(Rrelative)
-                elif it.m_sequence == "YZX":
-                    Euler1,Euler2,Euler3 = euler.euler_yzx(Rrelative)
-                elif it.m_sequence == "ZXY":
-                    Euler1,Euler2,Euler3 = euler.euler_zxy(Rrelative)
-                elif it.m_sequence == "ZYX":
-                    Euler1,Euler2,Euler3 = euler.euler_zyx(Rrelative)
-                else:
-                    raise Exception("[pycga] joint sequence unknown ")
+            nFrames = self.m_aqui.GetPointFrameNumber()
+            Rprox = proxSeg.anatomicalFrame.motion.getRotations()[0:nFrames]
+            Rdist = distSeg.anatomicalFrame.motion.getRotations()[0:nFrames]
+            Rrelative= np.einsum("nji,njk->nik",Rprox, Rdist)
+
+            if it.m_sequence == "XYZ":
+                Euler1,Euler2,Euler3 = euler.euler_xyzArray(Rrelative)
+            elif it.m_sequence == "XZY":
+                Euler1,Euler2,Euler3 = euler.euler_xzyArray(Rrelative)
+            elif it.m_sequence == "YXZ":
+                Euler1,Euler2,Euler3 = euler.euler_yxzArray(Rrelative)
+            elif it.m_sequence == "YZX":
+                Euler1,Euler2,Euler3 = euler.euler_yzxArray(Rrelative)
+            elif it.m_sequence == "ZXY":
+                Euler1,Euler2,Euler3 = euler.euler_zxyArray(Rrelative)
+            elif it.m_sequence == "ZYX":
+                Euler1,Euler2,Euler3 = euler.euler_zyxArray(Rrelative)
+            else:
+                raise Exception("[pycga] joint sequence unknown ")
 
-                jointValues[i,0] = Euler1
-                jointValues[i,1] = Euler2
-                jointValues[i,2] = Euler3
+            jointValues = np.stack((Euler1,Euler2,Euler3),axis=1)
 
 
 
@@ -885,11 +742,7 @@ class ModelJCSFilter(object):
 
             if self.m_fixEuler:
                 dest = np.deg2rad(np.array([0,0,0]))
-                for i in range (0, self.m_aqui.GetPointFrameNumber()):
-                    jointFinalValues[i,:] = euler.wrapEulerTo(np.deg2rad(jointFinalValues[i,:]), dest)
-                    dest = jointFinalValues[i,:]
-
-                jointFinalValues = np.rad2deg(jointFinalValues)
+                jointFinalValues = np.rad2deg(euler.wrapEulerToArray(np.deg2rad(jointFinalValues), dest))
 
             fulljointLabel  = jointLabel + "Angles_" + pointLabelSuffix if pointLabelSuffix is not None else jointLabel+"Angles"
             btkTools.smartAppendPoint(self.m_aqui,
@@ -937,9 +790,6 @@ class ModelAbsoluteAnglesFilter(object):
 
         for index in range (0, len(self.m_segmentLabels)):
 
-            absoluteAngleValues = np.zeros((self.m_aqui.GetPointFrameNumber(),3))
-
-
             if self.m_globalFrameOrientation == "XYZ":
                 if self.m_forwardProgression:
                     pt1=np.array([0,0,0])
@@ -992,41 +842,39 @@ class ModelAbsoluteAnglesFilter(object):
                 #LOGGER.logger.debug( "segment (%s) - sequence doest recognize - sequence Tilt-Obliquity-Rotation used by default" %(seg.name) )
 
 
-            for i in range (0, self.m_aqui.GetPointFrameNumber()):
-                Rseg = seg.anatomicalFrame.motion[i].getRotation()
-                Rrelative= np.dot(Rglobal.T,Rseg)
-
-                if eulerSequence == "TOR":
-                    tilt,obliquity,rotation = euler.euler_yxz(Rrelative)
-                elif eulerSequence == "TRO":
-                    tilt,rotation,obliquity = euler.euler_yzx(Rrelative)
-                elif eulerSequence == "ROT":
-                    rotation,obliquity,tilt = euler.euler_zxy(Rrelative)
-                elif eulerSequence == "RTO":
-                    rotation,tilt,obliquity = euler.euler_zyx(Rrelative)
-                elif eulerSequence == "OTR":
-                    obliquity,tilt,rotation = euler.euler_xyz(Rrelative)
-                elif eulerSequence == "ORT":
-                    obliquity,rotation,tilt = euler.euler_xzy(Rrelative)
-                elif eulerSequence == "YXZ":
-                    tilt,obliquity,rotation = euler.euler_yxz(Rrelative)#,similarOrder = False)
-                elif eulerSequence == "YZX":
-                    tilt,obliquity,rotation = euler.euler_yzx(Rrelative)#,similarOrder = False)
-                elif eulerSequence == "ZXY":
-                    tilt,obliquity,rotation = euler.euler_zxy(Rrelative)#,similarOrder = False)
-                elif eulerSequence == "ZYX":
-                    tilt,obliquity,rotation = euler.euler_zyx(Rrelative)#,similarOrder = False)
-                elif eulerSequence == "XYZ":
-                    tilt,obliquity,rotation = euler.euler_xyz(Rrelative)#,similarOrder = False)
-                elif eulerSequence == "XZY":
-                    tilt,obliquity,rotation = euler.euler_xzy(Rrelative)#,similarOrder = False)
-                else:
-                    LOGGER.logger.debug("no sequence defined for absolute angles. sequence YXZ selected by default" )
-                    tilt,obliquity,rotation = euler.euler_yxz(Rrelative)
+            nFrames = self.m_aqui.GetPointFrameNumber()
+            Rseg = seg.anatomicalFrame.motion.getRotations()[0:nFrames]
+            Rrelative= np.einsum("ji,njk->nik",Rglobal,Rseg)
+
+            if eulerSequence == "TOR":
+                tilt,obliquity,rotation = euler.euler_yxzArray(Rrelative)
+            elif eulerSequence == "TRO":
+                tilt,rotation,obliquity = euler.euler_yzxArray(Rrelative)
+            elif eulerSequence == "ROT":
+                rotation,obliquity,tilt = euler.euler_zxyArray(Rrelative)
+            elif eulerSequence == "RTO":
+                rotation,tilt,obliquity = euler.euler_zyxArray(Rrelative)
+            elif eulerSequence == "OTR":
+                obliquity,tilt,rotation = euler.euler_xyzArray(Rrelative)
+            elif eulerSequence == "ORT":
+                obliquity,rotation,tilt = euler.euler_xzyArray(Rrelative)
+            elif eulerSequence == "YXZ":
+                tilt,obliquity,rotation = euler.euler_yxzArray(Rrelative)#,similarOrder = False)
+            elif eulerSequence == "YZX":
+                tilt,obliquity,rotation = euler.euler_yzxArray(Rrelative)#,similarOrder = False)
+            elif eulerSequence == "ZXY":
+                tilt,obliquity,rotation = euler.euler_zxyArray(Rrelative)#,similarOrder = False)
+            elif eulerSequence == "ZYX":
+                tilt,obliquity,rotation = euler.euler_zyxArray(Rrelative)#,similarOrder = False)
+            elif eulerSequence == "XYZ":
+                tilt,obliquity,rotation = euler.euler_xyzArray(Rrelative)#,similarOrder = False)
+            elif eulerSequence == "XZY":
+                tilt,obliquity,rotation = euler.euler_xzyArray(Rrelative)#,similarOrder = False)
+            else:
+                LOGGER.logger.debug("no sequence defined for absolute angles. sequence YXZ selected by default" )
+                tilt,obliquity,rotation = euler.euler_yxzArray(Rrelative)
 
-                absoluteAngleValues[i,0] = tilt
-                absoluteAngleValues[i,1] = obliquity
-                absoluteAngleValues[i,2] = rotation
+            absoluteAngleValues = np.stack((tilt,obliquity,rotation),axis=1)
 
             segName = self.m_segmentLabels[index]
 
@@ -1042,10 +890,7 @@ class ModelAbsoluteAnglesFilter(object):
                     fullAngleLabel  = self.m_angleLabels[index] + "Angles_" + pointLabelSuffix if pointLabelSuffix is not None else self.m_angleLabels[index]+"Angles"
 
                     dest = np.deg2rad(np.array([0,0,0]))
-                    for i in range (0, self.m_aqui.GetPointFrameNumber()):
-                         absoluteAngleValuesFinal[i,:] = euler.wrapEulerTo(np.deg2rad(absoluteAngleValuesFinal[i,:]), dest)
-                         dest = absoluteAngleValuesFinal[i,:]
-                    absoluteAngleValuesFinal = np.rad2deg(absoluteAngleValuesFinal)
+                    absoluteAngleValuesFinal = np.rad2deg(euler.wrapEulerToArray(np.deg2rad(absoluteAngleValuesFinal), dest))
 
                     btkTools.smartAppendPoint(self.m_aqui, fullAngleLabel,
                                          absoluteAngleValuesFinal,PointType=btk.btkPoint.Angle, desc=description)
@@ -1071,10 +916,7 @@ class ModelAbsoluteAnglesFilter(object):
                     fullAngleLabel  = self.m_angleLabels[index] + "Angles_" + pointLabelSuffix if pointLabelSuffix is not None else self.m_angleLabels[index]+"Angles"
 
                     dest = np.deg2rad(np.array([0,0,0]))
-                    for i in range (0, self.m_aqui.GetPointFrameNumber()):
-                         absoluteAngleValuesFinal[i,:] = euler.wrapEulerTo(np.deg2rad(absoluteAngleValuesFinal[i,:]), dest)
-                         dest = absoluteAngleValuesFinal[i,:]
-                    absoluteAngleValuesFinal = np.rad2deg(absoluteAngleValuesFinal)
+                    absoluteAngleValuesFinal = np.rad2deg(euler.wrapEulerToArray(np.deg2rad(absoluteAngleValuesFinal), dest))
 
 
                     btkTools.smartAppendPoint(self.m_aqui, fullAngleLabel,
@@ -1092,10 +934,7 @@ class ModelAbsoluteAnglesFilter(object):
 
 
                     dest = np.deg2rad(np.array([0,0,0]))
-                    for i in range (0, self.m_aqui.GetPointFrameNumber()):
-                         absoluteAngleValuesFinal[i,:] = euler.wrapEulerTo(np.deg2rad(absoluteAngleValuesFinal[i,:]), dest)
-                         dest = absoluteAngleValuesFinal[i,:]
-                    absoluteAngleValuesFinal = np.rad2deg(absoluteAngleValuesFinal)
+                    absoluteAngleValuesFinal = np.rad2deg(euler.wrapEulerToArray(np.deg2rad(absoluteAngleValuesFinal), dest))
 
 
 
@@ -1114,10 +953,7 @@ class ModelAbsoluteAnglesFilter(object):
                     fullAngleLabel  = "R" + self.m_angleLabels[index] + "Angles_" + pointLabelSuffix if pointLabelSuffix is not None else "R" +self.m_angleLabels[index]+"Angles"
 
                     dest = np.deg2rad(np.array([0,0,0]))
-                    for i in range (0, self.m_aqui.GetPointFrameNumber()):
-                         absoluteAngleValuesFinal[i,:] = euler.wrapEulerTo(np.deg2rad(absoluteAngleValuesFinal[i,:]), dest)
-                         dest = absoluteAngleValuesFinal[i,:]
-                    absoluteAngleValuesFinal = np.rad2deg(absoluteAngleValuesFinal)
+                    absoluteAngleValuesFinal = np.rad2deg(euler.wrapEulerToArray(np.deg2rad(absoluteAngleValuesFinal), dest))
 
                     btkTools.smartAppendPoint(self.m_aqui, fullAngleLabel,
                                          absoluteAngleValuesFinal,PointType=btk.btkPoint.Angle, desc=description)
@@ -1257,9 +1093,13 @@ class InverseDynamicFilter(object):
                - `procedure` (pyCGM2.Model.CGM2.modelFilters.(_Procedure)) - an inverse dynamic procedure
                - `gravityVector` (numpy.array(3,)) - gravity vector
                - `scaleToMeter` (float) - values scaling to meter
-               - `projection` (pyCGM2.enums) - method of moment projection
+               - `projection` (pyCGM2.enums, list or dict) - method(s) of moment projection
                - `exportMomentContributions` (bool) - enable export of moment contribution into the c32
 
+           .. note:: `projection` can be a list of pyCGM2.enums.MomentProjection or a dict associating
+                     each projection with its own label suffix (ex: {enums.MomentProjection.JCS : "JCS"}).
+                     A list uses the projection names as suffixes.
+                     Inverse dynamics is computed once, then every projection is output.
 
         """
         self.m_aqui = btkAcq
@@ -1274,20 +1114,16 @@ class InverseDynamicFilter(object):
 
         self.m_options = options
 
-    def compute(self, pointLabelSuffix = None ):
-        """
-            Run`InverseDynamicFilter`
-
-            .. note:: forces and Moments are stored as btk point
-
-            :Parameters:
-               - `pointLabelSuffix` (str) - suffix ending the force/moment label
-
-        """
-
-        self.m_procedure.compute(self.m_model,self.m_aqui,self.m_gravity,self.m_scaleToMeter)
-
+    def _getProjections(self):
+        """ return a dict of projection associated with their label suffix """
+        if isinstance(self.m_projection,dict):
+            return self.m_projection
+        elif isinstance(self.m_projection,(list,tuple)):
+            return dict((projection,projection.value) for projection in self.m_projection)
+        else:
+            return {self.m_projection : None}
 
+    def _getGlobalRotation(self):
         if self.m_globalFrameOrientation == "XYZ":
             if self.m_forwardProgression:
                 pt1=np.array([0,0,0])
@@ -1303,7 +1139,7 @@ class InverseDynamicFilter(object):
             a2=np.cross(a1,v)
             x,y,z,Rglobal=frame.setFrameData(a1,a2,"XYiZ")
 
-        if self.m_globalFrameOrientation == "YXZ":
+        elif self.m_globalFrameOrientation == "YXZ":
             if self.m_forwardProgression:
 
                 pt1=np.array([0,0,0])
@@ -1318,9 +1154,70 @@ class InverseDynamicFilter(object):
             v=(pt3-pt1)
             a2=np.cross(a1,v)
             x,y,z,Rglobal=frame.setFrameData(a1,a2,"XYiZ")
+        else:
+            raise Exception("[pyCGM2] global frame orientation [%s] not known" %(self.m_globalFrameOrientation))
+
+        return Rglobal
+
+    def _projectWrench(self,force,moment,projection,proxSeg,distSeg,sequence,Rglobal):
+        """
+            project proximal joint force and moment (numpy.array(n,3)) of all frames
+        """
+
+        if projection == enums.MomentProjection.Global:
+            return np.dot(force,Rglobal), np.dot(moment,Rglobal)
+
+        if projection in [enums.MomentProjection.Distal,enums.MomentProjection.Proximal]:
+            seg = distSeg if projection == enums.MomentProjection.Distal else proxSeg
+            R = seg.anatomicalFrame.motion.getRotations()
+            return np.einsum("nji,nj->ni",R,force), np.einsum("nji,nj->ni",R,moment)
+
+        # JCS -  WARNING : I keep X-Y-Z sequence in output
+        order = ["XYZ".index(axis) for axis in sequence]
+        e1 = proxSeg.anatomicalFrame.motion.getRotations()[:,:,order[0]]
+        e3 = distSeg.anatomicalFrame.motion.getRotations()[:,:,order[2]]
+        e2 = numeric.normalizeArray(np.cross(e3,e1))
+
+        forceValues = np.zeros(force.shape)
+        momentValues = np.zeros(moment.shape)
+
+        if projection == enums.MomentProjection.JCS_Dual:
+            e23 = np.cross(e2,e3)
+            e31 = np.cross(e3,e1)
+            e12 = np.cross(e1,e2)
+            det = np.sum(e12*e3,axis=1)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                forceValues[:,order[0]] = np.nan_to_num(np.divide(np.sum(e23*force,axis=1), det))
+                forceValues[:,order[1]] = np.nan_to_num(np.divide(np.sum(e31*force,axis=1), det))
+                forceValues[:,order[2]] = np.nan_to_num(np.divide(np.sum(e12*force,axis=1), det))
+
+                momentValues[:,order[0]] = np.nan_to_num(np.divide(np.sum(e23*moment,axis=1), det))
+                momentValues[:,order[1]] = np.sum(moment*e2,axis=1)
+                momentValues[:,order[2]] = np.nan_to_num(np.divide(np.sum(e12*moment,axis=1), det))
+
+        elif projection == enums.MomentProjection.JCS:
+            for index,axis in zip(order,[e1,e2,e3]):
+                forceValues[:,index] = np.sum(force*axis,axis=1)
+                momentValues[:,index] = np.sum(moment*axis,axis=1)
+
+        return forceValues,momentValues
 
+    def compute(self, pointLabelSuffix = None ):
+        """
+            Run`InverseDynamicFilter`
+
+            .. note:: forces and Moments are stored as btk point
+
+            :Parameters:
+               - `pointLabelSuffix` (str) - suffix ending the force/moment label
 
+        """
+
+        self.m_procedure.compute(self.m_model,self.m_aqui,self.m_gravity,self.m_scaleToMeter)
 
+        projections = self._getProjections()
+        Rglobal = self._getGlobalRotation() if enums.MomentProjection.Global in projections else None
 
         for it in  self.m_model.m_jointCollection:
 
@@ -1330,7 +1227,6 @@ class InverseDynamicFilter(object):
                 LOGGER.logger.debug("distal label :%s" %(it.m_distalLabel))
 
                 jointLabel = it.m_label
-                nFrames = self.m_aqui.GetPointFrameNumber()
 
                 if "viconCGM1compatible" in self.m_options.keys() and self.m_options["viconCGM1compatible"]:
                     if it.m_label == "LAnkle":
@@ -1342,125 +1238,46 @@ class InverseDynamicFilter(object):
                 else:
                     proximalSegLabel = it.m_proximalLabel
 
-                if self.m_model.getSegment(it.m_distalLabel).m_proximalWrench is not None:
-                    if self.m_projection != enums.MomentProjection.JCS and  self.m_projection != enums.MomentProjection.JCS_Dual:
-                        if self.m_projection == enums.MomentProjection.Distal:
-                            mot = self.m_model.getSegment(it.m_distalLabel).anatomicalFrame.motion
-                        elif self.m_projection == enums.MomentProjection.Proximal:
-                            mot = self.m_model.getSegment(proximalSegLabel).anatomicalFrame.motion
-
-                        forceValues = np.zeros((nFrames,3))
-                        momentValues = np.zeros((nFrames,3))
-                        for i in range(0,nFrames ):
-                            if self.m_projection == enums.MomentProjection.Global:
-                                forceValues[i,:] = (1.0 / self.m_model.mp["Bodymass"]) * np.dot(Rglobal.T,
-                                                                                            self.m_model.getSegment(it.m_distalLabel).m_proximalWrench.GetForce().GetValues()[i,:].T)
-                                momentValues[i,:] = (1.0 / self.m_model.mp["Bodymass"]) * np.dot(Rglobal.T,
-                                                                                          self.m_model.getSegment(it.m_distalLabel).m_proximalWrench.GetMoment().GetValues()[i,:].T)
-                            else:
-                                forceValues[i,:] = (1.0 / self.m_model.mp["Bodymass"]) * np.dot(mot[i].getRotation().T,
-                                                                                        self.m_model.getSegment(it.m_distalLabel).m_proximalWrench.GetForce().GetValues()[i,:].T)
-                                momentValues[i,:] = (1.0 / self.m_model.mp["Bodymass"]) * np.dot(mot[i].getRotation().T,
-                                                                                        self.m_model.getSegment(it.m_distalLabel).m_proximalWrench.GetMoment().GetValues()[i,:].T)
-
-
-                    else:
-
-                        F = (1.0 / self.m_model.mp["Bodymass"]) * self.m_model.getSegment(it.m_distalLabel).m_proximalWrench.GetForce().GetValues()
-                        M = (1.0 / self.m_model.mp["Bodymass"]) * self.m_model.getSegment(it.m_distalLabel).m_proximalWrench.GetMoment().GetValues()
+                distSeg = self.m_model.getSegment(it.m_distalLabel)
+                if distSeg.m_proximalWrench is not None:
+                    proxSeg = self.m_model.getSegment(proximalSegLabel)
 
-                        proxSeg = self.m_model.getSegment(proximalSegLabel)
-                        distSeg = self.m_model.getSegment(it.m_distalLabel)
+                    F = (1.0 / self.m_model.mp["Bodymass"]) * distSeg.m_proximalWrench.GetForce().GetValues()
+                    M = (1.0 / self.m_model.mp["Bodymass"]) * distSeg.m_proximalWrench.GetMoment().GetValues()
 
-                        # WARNING : I keep X-Y-Z sequence in output
-                        forceValues = np.zeros((nFrames,3))
-                        momentValues = np.zeros((nFrames,3))
+                    for projection,projectionSuffix in projections.items():
+                        forceValues,momentValues = self._projectWrench(F,M,projection,proxSeg,distSeg,it.m_sequence,Rglobal)
 
-                        for i in range(0,nFrames ):
+                        descriptorForceInfos = self.m_model.getClinicalDescriptor(enums.DataType.Force,jointLabel,projection = projection)
+                        descriptorMomentInfos = self.m_model.getClinicalDescriptor(enums.DataType.Moment,jointLabel,projection = projection)
+                        if descriptorForceInfos:
+                            finalForceValues = np.zeros((forceValues.shape))
+                            finalForceValues[:,0] =  descriptorForceInfos["SaggitalCoeff"] * (forceValues[:,descriptorForceInfos["SaggitalIndex"]] + descriptorForceInfos["SaggitalOffset"])
+                            finalForceValues[:,1] =  descriptorForceInfos["CoronalCoeff"] * (forceValues[:,descriptorForceInfos["CoronalIndex"]] + descriptorForceInfos["CoronalOffset"])
+                            finalForceValues[:,2] =  descriptorForceInfos["TransversalCoeff"] * (forceValues[:,descriptorForceInfos["TransversalIndex"]] + descriptorForceInfos["TransversalOffset"])
+                        else:
+                            finalForceValues = forceValues
 
-                            if it.m_sequence == "XYZ":
-                                e1 = proxSeg.anatomicalFrame.motion[i].m_axisX
-                                e3 = distSeg.anatomicalFrame.motion[i].m_axisZ
-                                order=[0,1,2]
+                        if descriptorMomentInfos:
+                            finalMomentValues = np.zeros((momentValues.shape))
+                            finalMomentValues[:,0] =  descriptorMomentInfos["SaggitalCoeff"] * (momentValues[:,descriptorMomentInfos["SaggitalIndex"]] + descriptorMomentInfos["SaggitalOffset"])
+                            finalMomentValues[:,1] =  descriptorMomentInfos["CoronalCoeff"] * (momentValues[:,descriptorMomentInfos["CoronalIndex"]] + descriptorMomentInfos["CoronalOffset"])
+                            finalMomentValues[:,2] =  descriptorMomentInfos["TransversalCoeff"] * (momentValues[:,descriptorMomentInfos["TransversalIndex"]] + descriptorMomentInfos["TransversalOffset"])
+                        else:
+                            finalMomentValues = momentValues
 
-                            elif it.m_sequence == "XZY":
-                                e1 = proxSeg.anatomicalFrame.motion[i].m_axisX
-                                e3 = distSeg.anatomicalFrame.motion[i].m_axisY
-                                order=[0,2,1]
+                        suffix = "_".join([sfx for sfx in [pointLabelSuffix,projectionSuffix] if sfx is not None])
 
-                            elif it.m_sequence == "YXZ":
-                                e1 = proxSeg.anatomicalFrame.motion[i].m_axisY
-                                e3 = distSeg.anatomicalFrame.motion[i].m_axisZ
-                                order=[1,0,2]
+                        fulljointLabel_force  = jointLabel + "Force_" + suffix if suffix != "" else jointLabel+"Force"
+                        btkTools.smartAppendPoint(self.m_aqui,
+                                         fulljointLabel_force,
+                                         finalForceValues,PointType=btk.btkPoint.Force, desc="")
 
-                            elif it.m_sequence == "YZX":
-                                e1 = proxSeg.anatomicalFrame.motion[i].m_axisY
-                                e3 = distSeg.anatomicalFrame.motion[i].m_axisX
-                                order=[1,2,0]
+                        fulljointLabel_moment  = jointLabel + "Moment_" + suffix if suffix != "" else jointLabel+"Moment"
+                        btkTools.smartAppendPoint(self.m_aqui,
+                                         fulljointLabel_moment,
+                                         finalMomentValues,PointType=btk.btkPoint.Moment, desc="")
 
-                            elif it.m_sequence == "ZXY":
-                                e1 = proxSeg.anatomicalFrame.motion[i].m_axisZ
-                                e3 = distSeg.anatomicalFrame.motion[i].m_axisY
-                                order=[2,0,1]
-
-                            elif it.m_sequence == "ZYX":
-                                e1 = proxSeg.anatomicalFrame.motion[i].m_axisZ
-                                e3 = distSeg.anatomicalFrame.motion[i].m_axisX
-                                order=[2,1,0]
-
-                            e2= np.cross(e3,e1)
-                            e2=np.nan_to_num(np.divide(e2,np.linalg.norm(e2)))
-
-                            if self.m_projection == enums.MomentProjection.JCS_Dual:
-
-                                forceValues[i,order[0]] = np.nan_to_num(np.divide(np.dot(np.cross(e2,e3),F[i]), np.dot(np.cross(e1,e2),e3)))
-                                forceValues[i,order[1]] = np.nan_to_num(np.divide(np.dot(np.cross(e3,e1),F[i]), np.dot(np.cross(e1,e2),e3)))
-                                forceValues[i,order[2]] = np.nan_to_num(np.divide(np.dot(np.cross(e1,e2),F[i]), np.dot(np.cross(e1,e2),e3)))
-
-                                momentValues[i,order[0]] = np.nan_to_num(np.divide(np.dot(np.cross(e2,e3),M[i]), np.dot(np.cross(e1,e2),e3)))
-                                momentValues[i,order[1]] = np.dot(M[i],e2) #np.nan_to_num(np.divide(np.dot(np.cross(e3,e1),M[i]), np.dot(np.cross(e1,e2),e3))
-                                momentValues[i,order[2]] = np.nan_to_num(np.divide(np.dot(np.cross(e1,e2),M[i]), np.dot(np.cross(e1,e2),e3)))
-
-                            if self.m_projection == enums.MomentProjection.JCS:
-
-                                forceValues[i,order[0]] = np.dot(F[i],e1)
-                                forceValues[i,order[1]] = np.dot(F[i],e2)
-                                forceValues[i,order[2]] = np.dot(F[i],e3)
-
-                                momentValues[i,order[0]] = np.dot(M[i],e1)
-                                momentValues[i,order[1]] = np.dot(M[i],e2)
-                                momentValues[i,order[2]] = np.dot(M[i],e3)
-
-
-                    descriptorForceInfos = self.m_model.getClinicalDescriptor(enums.DataType.Force,jointLabel,projection = self.m_projection)
-                    descriptorMomentInfos = self.m_model.getClinicalDescriptor(enums.DataType.Moment,jointLabel,projection = self.m_projection)
-                    if descriptorForceInfos:
-                        finalForceValues = np.zeros((forceValues.shape))
-                        finalForceValues[:,0] =  descriptorForceInfos["SaggitalCoeff"] * (forceValues[:,descriptorForceInfos["SaggitalIndex"]] + descriptorForceInfos["SaggitalOffset"])
-                        finalForceValues[:,1] =  descriptorForceInfos["CoronalCoeff"] * (forceValues[:,descriptorForceInfos["CoronalIndex"]] + descriptorForceInfos["CoronalOffset"])
-                        finalForceValues[:,2] =  descriptorForceInfos["TransversalCoeff"] * (forceValues[:,descriptorForceInfos["TransversalIndex"]] + descriptorForceInfos["TransversalOffset"])
-                    else:
-                        finalForceValues = forceValues
-
-
-                    if descriptorMomentInfos:
-                        finalMomentValues = np.zeros((momentValues.shape))
-                        finalMomentValues[:,0] =  descriptorMomentInfos["SaggitalCoeff"] * (momentValues[:,descriptorMomentInfos["SaggitalIndex"]] + descriptorMomentInfos["SaggitalOffset"])
-                        finalMomentValues[:,1] =  descriptorMomentInfos["CoronalCoeff"] * (momentValues[:,descriptorMomentInfos["CoronalIndex"]] + descriptorMomentInfos["CoronalOffset"])
-                        finalMomentValues[:,2] =  descriptorMomentInfos["TransversalCoeff"] * (momentValues[:,descriptorMomentInfos["TransversalIndex"]] + descriptorMomentInfos["TransversalOffset"])
-                    else:
-                        finalMomentValues = momentValues
-
-                    fulljointLabel_force  = jointLabel + "Force_" + pointLabelSuffix if pointLabelSuffix is not None else jointLabel+"Force"
-
-                    btkTools.smartAppendPoint(self.m_aqui,
-                                     fulljointLabel_force,
-                                     finalForceValues,PointType=btk.btkPoint.Force, desc="")
-
-                    fulljointLabel_moment  = jointLabel + "Moment_" + pointLabelSuffix if pointLabelSuffix is not None else jointLabel+"Moment"
-                    btkTools.smartAppendPoint(self.m_aqui,
-                                     fulljointLabel_moment,
-                                     finalMomentValues,PointType=btk.btkPoint.Moment, desc="")
 
                     # Todo - Validate
                     # if self.m_exportMomentContributions:
@@ -1528,8 +1345,8 @@ class JointPowerFilter(object):
                     relativeOmega = prox_omegai - dist_omegai
 
                     power = np.zeros((nFrames,3))
-                    for i in range(0, nFrames):
-                        power[i,2] = -1.0*(1.0 / self.m_model.mp["Bodymass"]) * self.m_scale * np.dot(self.m_model.getSegment(it.m_distalLabel).m_proximalWrench.GetMoment().GetValues()[i,:] ,relativeOmega[i,:])#
+                    moment = self.m_model.getSegment(it.m_distalLabel).m_proximalWrench.GetMoment().GetValues()
+                    power[:,2] = -1.0*(1.0 / self.m_model.mp["Bodymass"]) * self.m_scale * np.sum(moment*relativeOmega,axis=1)
 
 
                     fulljointLabel  = jointLabel + "Power_" + pointLabelSuffix if pointLabelSuffix is not None else jointLabel+"Power"
@@ -1673,56 +1490,23 @@ class Naim2019ThighMisaligmentCorrectionProcedure(object):
             va = kjc-ajc
             vb = hjc-kjc
 
-            angle = np.zeros((va.shape[0],1))
-
-            for i in range(0,va.shape[0]):
-                angle[i] = np.rad2deg(np.arctan2(np.linalg.norm(np.cross(va[i,:],vb[i,:])), np.dot(va[i,:],vb[i,:])))
+            angle = np.rad2deg(np.arctan2(np.linalg.norm(np.cross(va,vb),axis=1), np.einsum("ij,ij->i",va,vb)))
 
             # extract v> threshold
-            v_sup = list()
-            for i in range(0,va.shape[0]):
-                if angle[i]>self.m_threshold:
-                    v_sup.append(v[i,:])
-            v_sup = np.asarray(v_sup)
+            v_sup = v[angle>self.m_threshold]
 
             # normalized axis
-            v = np.nan_to_num(np.divide(v_sup.mean(axis=0),np.linalg.norm(v.mean(axis =0))))
+            if v_sup.shape[0] != 0:
+                v = np.nan_to_num(np.divide(v_sup.mean(axis=0),np.linalg.norm(v.mean(axis =0))))
+            else:
+                v = np.zeros(3)
 
             # virtual point along the mean axis
-            virtual = np.zeros((len(ajc),3))
-            for i in range(0,len(ajc)):
-                virtual[i,:]= kjc[i,:] + -100 * v if side == "Left" else kjc[i,:] + 100 * v
-
-            # self.m_virtual[side] = virtual
+            virtual = kjc + -100 * v if side == "Left" else kjc + 100 * v
 
             #alteration of the segmental motion
-            seg.anatomicalFrame.motion=[] # erase all previous motion
-
-            csFrame=frame.Frame()
-            for i in range(0,len(ajc)):
-                pt1=kjc[i,:]
-                pt2=hjc[i,:]
-                pt3=virtual[i,:]
-                ptOrigin=hjc[i,:]
-
-                a1=(pt2-pt1)
-                a1=np.nan_to_num(np.divide(a1,np.linalg.norm(a1)))
-
-                v=(pt3-pt1)
-                v=np.nan_to_num(np.divide(v,np.linalg.norm(v)))
-
-                a2=np.cross(a1,v)
-                a2=np.nan_to_num(np.divide(a2,np.linalg.norm(a2)))
-
-                x,y,z,R=frame.setFrameData(a1,a2,sequence)
-
-                csFrame.m_axisX=x
-                csFrame.m_axisY=y
-                csFrame.m_axisZ=z
-                csFrame.setRotation(R)
-                csFrame.setTranslation(ptOrigin)
-
-                seg.anatomicalFrame.addMotionFrame(copy.deepcopy(csFrame))
+            x,y,z,R=frame.setFrameDataArrayFromPoints(kjc,hjc,virtual,sequence)
+            seg.anatomicalFrame.setMotion(R,hjc)
 
 
             LOGGER.logger.warning("[pyCGM2] : %s thigh anatomical frame motion corrected according Naim et al, 2019"%(side))
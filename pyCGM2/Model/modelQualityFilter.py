@@ -46,24 +46,83 @@ class ScoreResidualFilter(object):
         self.acq = acq
 
         self.m_model = scoreProcedure.model
+        self.m_residuals = OrderedDict()
 
     def compute(self):
+        """
+            Compute the SCoRE residual of each node, ie the rms of the distance between
+            the node trajectories from the proximal and the distal technical frames.
 
-        for nodeLabel in self.scoreProcedure.m_scoreDefinition.keys():
-            try:
-                proxLabel = self.scoreProcedure.m_scoreDefinition[nodeLabel]["proximal"]
-                distLabel = self.scoreProcedure.m_scoreDefinition[nodeLabel]["distal"]
-
-                proxNode = self.m_model.getSegment(proxLabel).getReferential('TF').getNodeTrajectory(nodeLabel)
-                distNode = self.m_model.getSegment(distLabel).getReferential('TF').getNodeTrajectory(nodeLabel)
-                score = numeric.rms((proxNode-distNode),axis = 1)
+            The nodes of a technical frame are all computed in one pass over its rotations and origins.
+            The residuals are appended as scalar points (*[node]_Score*)
 
-                scoreValues = np.array([score, np.zeros(self.acq.GetPointFrameNumber()), np.zeros(self.acq.GetPointFrameNumber())]).T
+            :Return:
+                - `residuals` (OrderedDict) - residual of each node (numpy.array(n,))
 
-                btkTools.smartAppendPoint(self.acq, str(nodeLabel+"_Score"),scoreValues, PointType=btk.btkPoint.Scalar,desc="Score")
+        """
+        # nodes grouped by technical frame
+        referentials = OrderedDict()
+        pairs = list()
+        for nodeLabel in self.scoreProcedure.m_scoreDefinition.keys():
+            try:
+                pair = list()
+                for key in ["proximal","distal"]:
+                    segLabel = self.scoreProcedure.m_scoreDefinition[nodeLabel][key]
+                    referential = self.m_model.getSegment(segLabel).getReferential('TF')
+                    local = referential.static.getNode_byLabel(nodeLabel).m_local
+                    pair.append((segLabel,local))
+
+                indexes = list()
+                for segLabel,local in pair:
+                    if segLabel not in referentials:
+                        referentials[segLabel] = (self.m_model.getSegment(segLabel).getReferential('TF'),list())
+                    referentials[segLabel][1].append(local)
+                    indexes.append((segLabel,len(referentials[segLabel][1])-1))
+                pairs.append((nodeLabel,indexes[0],indexes[1]))
             except:
                 LOGGER.logger.error("[pyCGM2] Score residual for node (%s) not computed"%(nodeLabel))
 
+        positions = dict()
+        for segLabel,(referential,localPositions) in referentials.items():
+            positions[segLabel] = np.einsum("nij,kj->kni",referential.motion.getRotations(),np.asarray(localPositions,dtype=float).reshape((len(localPositions),3))) \
+                                    + referential.motion.getTranslations()
+
+        self.m_residuals = OrderedDict()
+        for nodeLabel,(proxLabel,proxIndex),(distLabel,distIndex) in pairs:
+            score = numeric.rms((positions[proxLabel][proxIndex]-positions[distLabel][distIndex]),axis = 1)
+            self.m_residuals[nodeLabel] = score
+
+            scoreValues = np.array([score, np.zeros(score.shape[0]), np.zeros(score.shape[0])]).T
+            btkTools.smartAppendPoint(self.acq, str(nodeLabel+"_Score"),scoreValues, PointType=btk.btkPoint.Scalar,desc="Score")
+
+        return self.m_residuals
+
+    def getResiduals(self):
+        """
+            Return the per-frame residual of each node computed by `compute`
+        """
+        return self.m_residuals
+
+    def _getScore(self,nodeLabel):
+        if nodeLabel in self.m_residuals:
+            return self.m_residuals[nodeLabel]
+        return self.acq.GetPoint(nodeLabel+"_Score").GetValues()[:,0]
+
+    def getResidualStats(self):
+        """
+            Summary statistics of the residual of each node
+
+            :Return:
+                - `stats` (OrderedDict) - Mean, Std, Max and Min of the residual of each node
+        """
+        stats = OrderedDict()
+        for nodeLabel,score in self.m_residuals.items():
+            stats[nodeLabel] = OrderedDict([('Mean', score.mean()),
+                                            ('Std', score.std()),
+                                            ('Max', score.max()),
+                                            ('Min', score.min())])
+        return stats
+
     def getStats(self,ipp,jointLabels,EventContext="Overall",df=None):
 
         series = list()
@@ -71,7 +130,7 @@ class ScoreResidualFilter(object):
         if EventContext == "Overall":
             for jointLabel in jointLabels:
 
-                score = np.concatenate([self.acq.GetPoint("L"+jointLabel+"_Score").GetValues()[:,0],self.acq.GetPoint("R"+jointLabel+"_Score").GetValues()[:,0]])
+                score = np.concatenate([self._getScore("L"+jointLabel),self._getScore("R"+jointLabel)])
 
 
                 iDict = OrderedDict([('Ipp', ipp),
@@ -28,15 +28,67 @@ def segmentalLeastSquare(A, B):
     # translation vector
     L = B.mean(0)  - np.dot(R, A.mean(0))
     # RMSE
-    err = 0
-    for i in range(A.shape[0]):
-        Bp = np.dot(R, A[i, :]) + L
-        err += np.sum((Bp - B[i, :])**2)
-    try:
+    if A.shape[0] != 0:
+        err = np.sum((np.dot(A, R.T) + L - B)**2)
         RMSE = np.sqrt(err/A.shape[0]/3)
-    except:
+    else:
         RMSE =-1
         LOGGER.logger.warning("[pyCGM2] - residual of the least-square optimlization set to -1. gap presence ?")
 
 
     return R, L, RMSE, Am, Bm
+
+
+def segmentalLeastSquareArray(A, B, visibility=None):
+    """
+        Compute the transformation between two coordinate systems using SVD for all frames at once.
+
+        :Parameters:
+            - `A` (numpy.array(m,3) or numpy.array(n,m,3)) - Coordinates [x,y,z] of the m markers, static or frame by frame
+            - `B` (numpy.array(n,m,3)) - Coordinates [x,y,z] of the m markers over n frames
+            - `visibility` (numpy.array(n,m) of bool) - markers to use at each frame. All markers are used if None
+
+        :Return:
+            - `R` (numpy.array(n,3,3)) - Rotation matrices between A and B
+            - `L` (numpy.array(n,3)) - Translation vectors between A and B
+            - `RMSE` (numpy.array(n)) - Root-mean-squared error of each frame. -1 if no marker is visible
+            - `Am` (numpy.array(n,3)) - centroids of A
+            - `Bm` (numpy.array(n,3)) - centroids of B
+
+        .. note:: frame i gives the same result as `segmentalLeastSquare` called with the visible markers of frame i
+
+    """
+    B = np.asarray(B,dtype=float)
+    nFrames,nMarkers = B.shape[0:2]
+    A = np.broadcast_to(np.asarray(A,dtype=float),(nFrames,nMarkers,3))
+
+    if visibility is None:
+        w = np.ones((nFrames,nMarkers))
+    else:
+        w = np.asarray(visibility,dtype=float)
+
+    count = w.sum(axis=1)
+    empty = count == 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Am = np.einsum("nm,nmi->ni",w,A) / count[:,np.newaxis]
+        Bm = np.einsum("nm,nmi->ni",w,B) / count[:,np.newaxis]
+
+    Ac = np.where(empty[:,np.newaxis,np.newaxis], 0.0, A - Am[:,np.newaxis,:])
+    Bc = np.where(empty[:,np.newaxis,np.newaxis], 0.0, B - Bm[:,np.newaxis,:])
+    M = np.einsum("nm,nmi,nmj->nij",w,Bc,Ac)  # considering only rotation
+    # singular value decomposition
+    U, S, Vt = np.linalg.svd(M)
+    # rotation matrix
+    D = np.ones((nFrames,3))
+    D[:,2] = np.linalg.det(np.matmul(U, Vt))
+    R = np.matmul(U*D[:,np.newaxis,:], Vt)
+    # translation vector
+    L = Bm - np.einsum("nij,nj->ni",R,Am)
+    # RMSE
+    err = np.einsum("nm,nmi->n",w,(np.einsum("nij,nmj->nmi",R,A) + L[:,np.newaxis,:] - B)**2)
+    RMSE = np.ones(nFrames)*-1.0
+    RMSE[~empty] = np.sqrt(err[~empty]/count[~empty]/3)
+    if np.any(empty):
+        LOGGER.logger.warning("[pyCGM2] - residual of the least-square optimlization set to -1 for %i frames. gap presence ?"%(np.sum(empty)))
+
+    return R, L, RMSE, Am, Bm
@@ -333,8 +333,23 @@ class GaitAnalysisBuilder(AbstractBuilder):
         self.m_kineticLabelsDict = kineticLabelsDict
         self.m_pointlabelSuffix = pointlabelSuffix
         self.m_emgLabelList = emgLabelList
+        self.m_stpStatsCache = dict()
 
 
+    def _labels(self,labels):
+        return [label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label for label in labels]
+
+    def _getStpStats(self,cycles,context):
+        """
+            descriptive statistics of all spatio-temporal parameters of a cycle set.
+            Statistics are computed once per set of cycles ( acquisition, begin and end frames).
+            A parameter missing in one cycle is not returned ( see `spatioTemporelParameters_descriptiveStats`)
+        """
+        key = (context,tuple((id(cycle.acq),cycle.begin,cycle.end) for cycle in cycles if cycle.enableFlag and cycle.context==context))
+        if key not in self.m_stpStatsCache:
+            self.m_stpStatsCache[key] = CGM2cycle.spatioTemporelParameters_descriptiveStats(cycles,CGM2cycle.GaitCycle.STP_LABELS,context)
+        return self.m_stpStatsCache[key]
+
     def computeSpatioTemporel(self):
 
         """
@@ -352,18 +367,14 @@ class GaitAnalysisBuilder(AbstractBuilder):
             enableLeftComputation = len ([cycle for cycle in self.m_cycles.spatioTemporalCycles if cycle.enableFlag and cycle.context=="Left"])
             enableRightComputation = len ([cycle for cycle in self.m_cycles.spatioTemporalCycles if cycle.enableFlag and cycle.context=="Right"])
 
-            for label in CGM2cycle.GaitCycle.STP_LABELS:
-                if enableLeftComputation:
-                    try:
-                        out[label,"Left"]=CGM2cycle.spatioTemporelParameter_descriptiveStats(self.m_cycles.spatioTemporalCycles,label,"Left")
-                    except KeyError:
-                        LOGGER.logger.warning("the spatio temporal parameter [%s] is not computed for the left context"%(label))
-
-                if enableRightComputation:
-                    try:
-                        out[label,"Right"]=CGM2cycle.spatioTemporelParameter_descriptiveStats(self.m_cycles.spatioTemporalCycles,label,"Right")
-                    except KeyError:
-                        LOGGER.logger.warning("the spatio temporal parameter [%s] is not computed for the right context"%(label))
+            for context,enableComputation in zip(["Left","Right"],[enableLeftComputation,enableRightComputation]):
+                if enableComputation:
+                    stpStats = self._getStpStats(self.m_cycles.spatioTemporalCycles,context)
+                    for label in CGM2cycle.GaitCycle.STP_LABELS:
+                        if label in stpStats:
+                            out[label,context]=stpStats[label]
+                        else:
+                            LOGGER.logger.warning("the spatio temporal parameter [%s] is not computed for the %s context"%(label,context.lower()))
 
             if enableLeftComputation:
                 LOGGER.logger.info("left stp computation---> done")
@@ -388,29 +399,22 @@ class GaitAnalysisBuilder(AbstractBuilder):
 
         LOGGER.logger.info("--kinematic computation--")
         if self.m_cycles.kinematicCycles is not None:
-            if "Left" in self.m_kinematicLabelsDict.keys():
-                for label in self.m_kinematicLabelsDict["Left"]:
-                    labelPlus = label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label
-                    out[labelPlus,"Left"]=CGM2cycle.point_descriptiveStats(self.m_cycles.kinematicCycles,labelPlus,"Left")
-
-                for label in CGM2cycle.GaitCycle.STP_LABELS:
-                    outPst[label,"Left"]=CGM2cycle.spatioTemporelParameter_descriptiveStats(self.m_cycles.kinematicCycles,label,"Left")
-
-                LOGGER.logger.info("left kinematic computation---> done")
-            else:
-                LOGGER.logger.warning("No left Kinematic computation")
-
-            if "Right" in self.m_kinematicLabelsDict.keys():
-                for label in self.m_kinematicLabelsDict["Right"]:
-                    labelPlus = label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label
-                    out[labelPlus,"Right"]=CGM2cycle.point_descriptiveStats(self.m_cycles.kinematicCycles,labelPlus,"Right")
-
-                for label in CGM2cycle.GaitCycle.STP_LABELS:
-                    outPst[label,"Right"]=CGM2cycle.spatioTemporelParameter_descriptiveStats(self.m_cycles.kinematicCycles,label,"Right")
-
-                LOGGER.logger.info("right kinematic computation---> done")
-            else:
-                LOGGER.logger.warning("No right Kinematic computation")
+            acquisitionArrays = dict()
+            for context in ["Left","Right"]:
+                if context in self.m_kinematicLabelsDict.keys():
+                    stats = CGM2cycle.points_descriptiveStats(self.m_cycles.kinematicCycles,self._labels(self.m_kinematicLabelsDict[context]),context,
+                                                              acquisitionArrays=acquisitionArrays)
+                    for labelPlus in stats:
+                        out[labelPlus,context]=stats[labelPlus]
+
+                    # a parameter missing in one cycle raises a KeyError
+                    stpStats = self._getStpStats(self.m_cycles.kinematicCycles,context)
+                    for label in CGM2cycle.GaitCycle.STP_LABELS:
+                        outPst[label,context]=stpStats[label]
+
+                    LOGGER.logger.info("%s kinematic computation---> done"%(context.lower()))
+                else:
+                    LOGGER.logger.warning("No %s Kinematic computation"%(context.lower()))
 
         else:
             LOGGER.logger.warning("No Kinematic computation")
@@ -435,46 +439,33 @@ class GaitAnalysisBuilder(AbstractBuilder):
         LOGGER.logger.info("--kinetic computation--")
         if self.m_cycles.kineticCycles is not None:
 
-           found_context = list()
-           for cycle in self.m_cycles.kineticCycles:
-               found_context.append(cycle.context)
-
-
-           if "Left" in self.m_kineticLabelsDict.keys():
-               if "Left" in found_context:
-                   for label in self.m_kineticLabelsDict["Left"]:
-                       labelPlus = label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label
-                       out[labelPlus,"Left"]=CGM2cycle.point_descriptiveStats(self.m_cycles.kineticCycles,labelPlus,"Left")
-                   for label in CGM2cycle.GaitCycle.STP_LABELS:
-                        outPst[label,"Left"]=CGM2cycle.spatioTemporelParameter_descriptiveStats(self.m_cycles.kineticCycles,label,"Left")
-                   for label in self.m_kinematicLabelsDict["Left"]:
-                       labelPlus = label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label
-                       outOptional[labelPlus,"Left"]=CGM2cycle.point_descriptiveStats(self.m_cycles.kineticCycles,labelPlus,"Left")
-                   LOGGER.logger.info("left kinetic computation---> done")
-               else:
-                   LOGGER.logger.warning("No left Kinetic computation")
-
-
-
-
-           if "Right" in self.m_kineticLabelsDict.keys():
-               if  "Right" in found_context:
-                   for label in self.m_kineticLabelsDict["Right"]:
-                       labelPlus = label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label
-                       out[labelPlus,"Right"]=CGM2cycle.point_descriptiveStats(self.m_cycles.kineticCycles,labelPlus,"Right")
-
-                   for label in CGM2cycle.GaitCycle.STP_LABELS:
-                        outPst[label,"Right"]=CGM2cycle.spatioTemporelParameter_descriptiveStats(self.m_cycles.kineticCycles,label,"Right")
-
-                   for label in self.m_kinematicLabelsDict["Right"]:
-                       labelPlus = label + "_" + self.m_pointlabelSuffix if self.m_pointlabelSuffix is not None else label
-                       outOptional[labelPlus,"Right"]=CGM2cycle.point_descriptiveStats(self.m_cycles.kineticCycles,labelPlus,"Right")
-
-
-                   LOGGER.logger.info("right kinetic computation---> done")
-               else:
-                   LOGGER.logger.warning("No right Kinetic computation")
-
+            found_context = list()
+            for cycle in self.m_cycles.kineticCycles:
+                found_context.append(cycle.context)
+
+            acquisitionArrays = dict()
+            for context in ["Left","Right"]:
+                if context in self.m_kineticLabelsDict.keys():
+                    if context in found_context:
+                        kineticLabels = self._labels(self.m_kineticLabelsDict[context])
+                        kinematicLabels = self._labels(self.m_kinematicLabelsDict[context])
+
+                        # kinetic and kinematic labels of the kinetic cycles in a single pass
+                        stats = CGM2cycle.points_descriptiveStats(self.m_cycles.kineticCycles,list(dict.fromkeys(kineticLabels+kinematicLabels)),context,
+                                                                  acquisitionArrays=acquisitionArrays)
+                        for labelPlus in kineticLabels:
+                            out[labelPlus,context]=stats[labelPlus]
+                        for labelPlus in kinematicLabels:
+                            outOptional[labelPlus,context]=stats[labelPlus]
+
+                        # a parameter missing in one cycle raises a KeyError
+                        stpStats = self._getStpStats(self.m_cycles.kineticCycles,context)
+                        for label in CGM2cycle.GaitCycle.STP_LABELS:
+                            outPst[label,context]=stpStats[label]
+
+                        LOGGER.logger.info("%s kinetic computation---> done"%(context.lower()))
+                    else:
+                        LOGGER.logger.warning("No %s Kinetic computation"%(context.lower()))
 
         else:
             LOGGER.logger.warning("No Kinetic computation")
@@ -501,13 +492,13 @@ class GaitAnalysisBuilder(AbstractBuilder):
                 out[rawLabel,"Left"]=CGM2cycle.analog_descriptiveStats(self.m_cycles.emgCycles,rawLabel,"Left")
                 out[rawLabel,"Right"]=CGM2cycle.analog_descriptiveStats(self.m_cycles.emgCycles,rawLabel,"Right")
 
-
-            for label in CGM2cycle.GaitCycle.STP_LABELS:
-                try:
-                    outPst[label,"Left"]= CGM2cycle.spatioTemporelParameter_descriptiveStats(self.m_cycles.emgCycles,label,"Left")
-                    outPst[label,"Right"]= CGM2cycle.spatioTemporelParameter_descriptiveStats(self.m_cycles.emgCycles,label,"Right")
-                except KeyError:
-                    LOGGER.logger.warning("the spatio temporal parameter [%s] is not computed"%(label))
+            for context in ["Left","Right"]:
+                stpStats = self._getStpStats(self.m_cycles.emgCycles,context)
+                for label in CGM2cycle.GaitCycle.STP_LABELS:
+                    if label in stpStats:
+                        outPst[label,context]= stpStats[label]
+                    else:
+                        LOGGER.logger.warning("the spatio temporal parameter [%s] is not computed"%(label))
 
 
         else:
@@ -39,34 +39,26 @@ class NormativeDataGeneratorFilter(object):
     def generate(self):
 
         cyclesBySide=dict()
-        # cycles : ncycle of array(101,3)
+        # cycles : array(ncycle,101,3)
         for label in self.m_kinematicLabelsDict["Left"]:
-            cyclesBySide[label]=list()
-            for analysisIt in self.m_analyses:
-                cyclesBySide[label] = cyclesBySide[label]+ analysisIt.kinematicStats.data[label,"Left"]["values"]
+            cyclesBySide[label] = np.concatenate([analysisIt.kinematicStats.data[label,"Left"]["values"] for analysisIt in self.m_analyses])
 
         for label in self.m_kinematicLabelsDict["Right"]:
-            cyclesBySide[label]=list()
-            for analysisIt in self.m_analyses:
-                cyclesBySide[label] = cyclesBySide[label]+ analysisIt.kinematicStats.data[label,"Right"]["values"]
+            cyclesBySide[label] = np.concatenate([analysisIt.kinematicStats.data[label,"Right"]["values"] for analysisIt in self.m_analyses])
 
-        # cycles : ncycle of array(101,3)
+        # cycles : array(ncycle,101,3)
         for label in self.m_kineticLabelsDict["Left"]:
-            cyclesBySide[label]=list()
-            for analysisIt in self.m_analyses:
-                cyclesBySide[label] = cyclesBySide[label]+ analysisIt.kineticStats.data[label,"Left"]["values"]
+            cyclesBySide[label] = np.concatenate([analysisIt.kineticStats.data[label,"Left"]["values"] for analysisIt in self.m_analyses])
 
         for label in self.m_kineticLabelsDict["Right"]:
-            cyclesBySide[label]=list()
-            for analysisIt in self.m_analyses:
-                cyclesBySide[label] = cyclesBySide[label]+ analysisIt.kineticStats.data[label,"Right"]["values"]
+            cyclesBySide[label] = np.concatenate([analysisIt.kineticStats.data[label,"Right"]["values"] for analysisIt in self.m_analyses])
 
         # gather both sides
         cycles = dict()
         for key in cyclesBySide.keys():
             new_key = key[1:]
             if new_key in cycles.keys():
-                cycles[new_key] = cycles[new_key] + cyclesBySide[key]
+                cycles[new_key] = np.concatenate((cycles[new_key],cyclesBySide[key]))
             else:
                 cycles[new_key] = cyclesBySide[key]
 
@@ -85,16 +77,9 @@ class NormativeDataGeneratorFilter(object):
             self.__normalCorridor[key]["Y"] = list()
             self.__normalCorridor[key]["Z"] = list()
 
-            X =np.zeros((101,len(cycles[key])))
-            Y =np.zeros((101,len(cycles[key])))
-            Z =np.zeros((101,len(cycles[key])))
-
-            i=0
-            for cycleIt in cycles[key]:
-                X[:,i] = cycleIt[:,0]
-                Y[:,i] = cycleIt[:,1]
-                Z[:,i] = cycleIt[:,2]
-                i+=1
+            X = cycles[key][:,:,0].T
+            Y = cycles[key][:,:,1].T
+            Z = cycles[key][:,:,2].T
 
             meanX_minusSd = np.mean(X,axis=1) - np.std(X,axis=1)
             meanX_plusSd = np.mean(X,axis=1) + np.std(X,axis=1)
@@ -3,6 +3,27 @@
 from pyCGM2.Tools import btkTools
 
 
+def _buildTrials(data_path,filenames,acquisitions):
+    """
+        read a set of c3d ( see `btkTools.buildTrials`). A file is only parsed if it is not already in `acquisitions`
+
+        :Parameters:
+            - `data_path` (str) - folder path
+            - `filenames` (list of str) - filename of the different acquisitions
+            - `acquisitions` (dict) - acquisitions already read, keyed by filename
+
+        .. note:: each returned acquisition is a copy, so modalities sharing a file do not share an acquisition
+    """
+    acqs=[]
+    for filename in filenames:
+        if filename not in acquisitions:
+            acquisitions[filename] = btkTools.smartReader(data_path + filename)
+            btkTools.sortedEvents(acquisitions[filename])
+        acqs.append(acquisitions[filename].Clone())
+
+    return acqs, list(filenames)
+
+
 class C3dManager(object):
     def __init__ (self):
         self.spatioTemporal={"Acqs":None , "Filenames":None}
@@ -58,24 +79,26 @@ class UniqueC3dSetProcedure(object):
 
     def generate(self,c3dManager,spatioTempFlag,kinematicFlag,kineticFlag,emgFlag):
 
+        acquisitions = dict()
 
         #---spatioTemporalTrials
         if spatioTempFlag:
-            c3dManager.spatioTemporal["Acqs"],c3dManager.spatioTemporal["Filenames"] = btkTools.buildTrials(self.m_data_path,self.m_files)
+            c3dManager.spatioTemporal["Acqs"],c3dManager.spatioTemporal["Filenames"] = _buildTrials(self.m_data_path,self.m_files,acquisitions)
 
 
         # ----kinematic trials---
         if kinematicFlag:
-            c3dManager.kinematic["Acqs"],c3dManager.kinematic["Filenames"], = btkTools.buildTrials(self.m_data_path,self.m_files)
+            c3dManager.kinematic["Acqs"],c3dManager.kinematic["Filenames"], = _buildTrials(self.m_data_path,self.m_files,acquisitions)
 
         #---kinetic Trials--- ( check if kinetic events)
         if kineticFlag:
-            c3dManager.kinetic["Acqs"],c3dManager.kinetic["Filenames"],C3dManager.kineticFlag =  btkTools.automaticKineticDetection(self.m_data_path,self.m_files)
+            acqs,filenames = _buildTrials(self.m_data_path,self.m_files,acquisitions)
+            c3dManager.kinetic["Acqs"],c3dManager.kinetic["Filenames"],C3dManager.kineticFlag =  btkTools.automaticKineticDetection(self.m_data_path,filenames,acqs=acqs)
 
 
         #----emgTrials
         if emgFlag:
-            c3dManager.emg["Acqs"],c3dManager.emg["Filenames"], = btkTools.buildTrials(self.m_data_path,self.m_files)
+            c3dManager.emg["Acqs"],c3dManager.emg["Filenames"], = _buildTrials(self.m_data_path,self.m_files,acquisitions)
 
 
 class DistinctC3dSetProcedure(object):
@@ -92,24 +115,26 @@ class DistinctC3dSetProcedure(object):
 
     def generate(self,c3dManager,spatioTempFlag,kinematicFlag,kineticFlag,emgFlag):
 
+        acquisitions = dict()
 
         #---spatioTemporalTrials
         if spatioTempFlag:
-            c3dManager.spatioTemporal["Acqs"],c3dManager.spatioTemporal["Filenames"] = btkTools.buildTrials(self.m_data_path,self.m_files_stp)
+            c3dManager.spatioTemporal["Acqs"],c3dManager.spatioTemporal["Filenames"] = _buildTrials(self.m_data_path,self.m_files_stp,acquisitions)
 
 
         # ----kinematic trials---
         if kinematicFlag:
-            c3dManager.kinematic["Acqs"],c3dManager.kinematic["Filenames"], = btkTools.buildTrials(self.m_data_path,self.m_files_kinematic)
+            c3dManager.kinematic["Acqs"],c3dManager.kinematic["Filenames"], = _buildTrials(self.m_data_path,self.m_files_kinematic,acquisitions)
 
         #---kinetic Trials--- ( check if kinetic events)
         if kineticFlag:
-            c3dManager.kinetic["Acqs"],c3dManager.kinetic["Filenames"],C3dManager.kineticFlag =  btkTools.automaticKineticDetection(self.m_data_path,self.m_files_kinetic)
+            acqs,filenames = _buildTrials(self.m_data_path,self.m_files_kinetic,acquisitions)
+            c3dManager.kinetic["Acqs"],c3dManager.kinetic["Filenames"],C3dManager.kineticFlag =  btkTools.automaticKineticDetection(self.m_data_path,filenames,acqs=acqs)
 
 
         #----emgTrials
         if emgFlag:
-            c3dManager.emg["Acqs"],c3dManager.emg["Filenames"], = btkTools.buildTrials(self.m_data_path,self.m_files_emg)
+            c3dManager.emg["Acqs"],c3dManager.emg["Filenames"], = _buildTrials(self.m_data_path,self.m_files_emg,acquisitions)
 
 
 
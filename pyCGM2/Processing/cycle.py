@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import numpy as np
+import warnings
 import pyCGM2; LOGGER = pyCGM2.LOGGER
 
 from pyCGM2.Processing import progressionFrame
@@ -46,128 +47,178 @@ def spatioTemporelParameter_descriptiveStats(cycles,label,context):
     return outDict
 
 
-def point_descriptiveStats(cycles,label,context):
+def spatioTemporelParameters_descriptiveStats(cycles,labels,context):
+
     """
-        Compute descriptive statistics of point parameters from a `cycles` instance
+        Compute descriptive statistics of several spatio-temporal parameters in a single pass over `cycles`
 
         :Parameters:
              - `cycles` (pyCGM2.Processing.cycle.Cycles) - Cycles instance built fron CycleFilter
-             - `label` (str) - point label
+             - `labels` (list of str) - spatio-temporal labels
              - `context` (str) - cycle side context ( Left, Right)
 
         :Return:
-            - `outDict` (dict)  - dictionnary with descriptive statistics ( mean, std, median).  Addictional Item *values* collects cycle values
+            - `outDict` (dict)  - descriptive statistics of each label ( see `spatioTemporelParameter_descriptiveStats`).
+              A label missing in one cycle is not returned
 
     """
+    selectedCycles = [cycle for cycle in cycles if cycle.enableFlag and cycle.context==context]
 
     outDict=dict()
+    for label in labels:
+        if all(label in cycle.stps for cycle in selectedCycles):
+            val = np.array([cycle.getSpatioTemporalParameter(label) for cycle in selectedCycles],dtype=float)
+            outDict[label] = {'mean':np.mean(val),'std':np.std(val),'median':np.median(val),'values': val}
 
-    n=len([cycle for cycle in cycles if cycle.enableFlag and cycle.context==context]) # list comprehension , get number of enabled cycle
+    return outDict
 
-    x=np.empty((101,n))
-    y=np.empty((101,n))
-    z=np.empty((101,n))
 
-    listOfPointValues=list()
+def _normalizedCycleValues(cycles,label,context,ncol,method):
+    """
+        Stack time-normalized values of the enabled cycles of a context.
+        Values of all cycles are interpolated at once.
+    """
+    selectedCycles = [cycle for cycle in cycles if cycle.enableFlag and cycle.context==context]
 
-    i=0
-    for cycle in cycles:
-        if cycle.enableFlag and cycle.context==context:
-            tmp = cycle.getPointTimeSequenceDataNormalized(label)
-            x[:,i]=tmp[:,0]
-            y[:,i]=tmp[:,1]
-            z[:,i]=tmp[:,2]
+    values = np.zeros((len(selectedCycles),101,ncol))
+    sequences = list()
+    indexes = list()
+    for i,cycle in enumerate(selectedCycles):
+        data = getattr(cycle,method)(label)
+        if data is not None:
+            sequences.append(data[:,0:ncol])
+            indexes.append(i)
 
-            listOfPointValues.append(tmp)
+    if sequences != []:
+        values[indexes] = MathNormalisation.timeSequencesNormalisation(101,sequences)
 
-            i+=1
+    return values
 
-    meanData=np.array(np.zeros((101,3)))
-    stdData=np.array(np.zeros((101,3)))
-    medianData=np.array(np.zeros((101,3)))
 
-    if not np.all(x==0):
-        x[x == 0] = np.nan
-        meanData[:,0] = np.nanmean(x, axis=1)
-        stdData[:,0]=np.nanstd(x,axis=1)
-        medianData[:,0]=np.nanmedian(x,axis=1)
+def _pointStats(values):
+    """
+        descriptive statistics of point values ( numpy.array(n_cycles,101,3)).
+        Zeros are considered as missing values, except for an axis without any data
+    """
+    meanData=np.zeros((101,3))
+    stdData=np.zeros((101,3))
+    medianData=np.zeros((101,3))
 
-    if not np.all(y==0):
-        y[y == 0] = np.nan
-        meanData[:,1] = np.nanmean(y, axis=1)
-        stdData[:,1]=np.nanstd(y,axis=1)
-        medianData[:,1]=np.nanmedian(y,axis=1)
+    axes = ~np.all(values==0,axis=(0,1))
+    if np.any(axes):
+        data = values[:,:,axes]
+        data = np.where(data == 0, np.nan, data)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            meanData[:,axes] = np.nanmean(data, axis=0)
+            stdData[:,axes] = np.nanstd(data, axis=0)
+            medianData[:,axes] = np.nanmedian(data, axis=0)
 
+    return {'mean':meanData, 'median':medianData, 'std':stdData, 'values': values }
 
-    if not np.all(z==0):
-        z[z == 0] = np.nan
-        meanData[:,2] = np.nanmean(z, axis=1)
-        stdData[:,2]=np.nanstd(z,axis=1)
-        medianData[:,2]=np.nanmedian(z,axis=1)
 
+def point_descriptiveStats(cycles,label,context):
+    """
+        Compute descriptive statistics of point parameters from a `cycles` instance
 
-    outDict = {'mean':meanData, 'median':medianData, 'std':stdData, 'values': listOfPointValues }
+        :Parameters:
+             - `cycles` (pyCGM2.Processing.cycle.Cycles) - Cycles instance built fron CycleFilter
+             - `label` (str) - point label
+             - `context` (str) - cycle side context ( Left, Right)
 
+        :Return:
+            - `outDict` (dict)  - dictionnary with descriptive statistics ( mean, std, median).  Addictional Item *values* collects cycle values ( numpy.array(n_cycles,101,3))
 
+    """
 
-    return outDict
+    values = _normalizedCycleValues(cycles,label,context,3,"getPointTimeSequenceData")
 
+    return _pointStats(values)
 
 
-def analog_descriptiveStats(cycles,label,context):
+def points_descriptiveStats(cycles,labels,context,acquisitionArrays=None):
     """
-        Compute descriptive statistics of analog parameters from a `cycles` instance
+        Compute descriptive statistics of several point parameters from a `cycles` instance.
+
+        Values of all labels are sliced from the array representation of each acquisition
+        ( see `btkTools.getAcquisitionArrays`), then all cycles are time-normalized at once.
 
         :Parameters:
              - `cycles` (pyCGM2.Processing.cycle.Cycles) - Cycles instance built fron CycleFilter
-             - `label` (str) - analog label
+             - `labels` (list of str) - point labels
              - `context` (str) - cycle side context ( Left, Right)
+             - `acquisitionArrays` (dict) - [optional] array representations of acquisitions, indexed by id(acq).
+               Pass the same dictionnary to successive calls in order to read each acquisition once
 
         :Return:
-            - `outDict` (dict)  - dictionnary with descriptive statistics ( mean, std, median).  Addictional Item *values* collects cycle values
+            - `outDict` (dict)  - descriptive statistics of each label ( see `point_descriptiveStats`)
 
     """
+    if acquisitionArrays is None:
+        acquisitionArrays = dict()
 
+    selectedCycles = [cycle for cycle in cycles if cycle.enableFlag and cycle.context==context]
 
+    nLabels = len(labels)
+    values = np.zeros((len(selectedCycles),101,nLabels,3))
 
-    outDict=dict()
+    sequences = list()
+    for cycle in selectedCycles:
+        key = id(cycle.acq)
+        if key not in acquisitionArrays:
+            acquisitionArrays[key] = btkTools.getAcquisitionArrays(cycle.acq)
+        arrays = acquisitionArrays[key]
 
+        cycleValues = arrays.m_values[cycle.begin-cycle.firstFrame:cycle.end-cycle.firstFrame+1]
+        data = np.zeros((cycleValues.shape[0],nLabels,3))
+        existing = [j for j,label in enumerate(labels) if label in arrays.m_indexes]
+        if existing != []:
+            data[:,existing,:] = cycleValues[:,[arrays.m_indexes[labels[j]] for j in existing],:]
+        sequences.append(data.reshape((cycleValues.shape[0],nLabels*3)))
 
+    if sequences != [] and nLabels != 0:
+        values[:] = MathNormalisation.timeSequencesNormalisation(101,sequences).reshape((len(selectedCycles),101,nLabels,3))
 
-    n=len([cycle for cycle in cycles if cycle.enableFlag and cycle.context==context]) # list comprehension , get number of enabled cycle
+    outDict = dict()
+    for j,label in enumerate(labels):
+        outDict[label] = _pointStats(np.ascontiguousarray(values[:,:,j,:]))
+
+    return outDict
 
-    listOfPointValues=list()
-    x=np.empty((101,n))
 
-    i=0
-    for cycle in cycles:
-        if cycle.enableFlag and cycle.context==context:
-            tmp = cycle.getAnalogTimeSequenceDataNormalized(label)
-            x[:,i]=tmp[:,0]
-            listOfPointValues.append(tmp)
-            i+=1
 
+def analog_descriptiveStats(cycles,label,context):
+    """
+        Compute descriptive statistics of analog parameters from a `cycles` instance
 
-    meanData=np.array(np.zeros((101,1)))
-    if not np.all(x==0):
-        meanData[:,0]=np.nanmean(x,axis=1)
+        :Parameters:
+             - `cycles` (pyCGM2.Processing.cycle.Cycles) - Cycles instance built fron CycleFilter
+             - `label` (str) - analog label
+             - `context` (str) - cycle side context ( Left, Right)
+
+        :Return:
+            - `outDict` (dict)  - dictionnary with descriptive statistics ( mean, std, median).  Addictional Item *values* collects cycle values ( numpy.array(n_cycles,101,1))
+
+    """
 
-    stdData=np.array(np.zeros((101,1)))
-    if not np.all(x==0):
-        stdData[:,0]=np.nanstd(x,axis=1)
+    values = _normalizedCycleValues(cycles,label,context,1,"getAnalogTimeSequenceData")
 
-    medianData=np.array(np.zeros((101,1)))
-    if not np.all(x==0):
-        medianData[:,0]=np.nanmedian(x,axis=1)
+    meanData=np.zeros((101,1))
+    stdData=np.zeros((101,1))
+    medianData=np.zeros((101,1))
+    if not np.all(values==0):
+        meanData[:,0]=np.nanmean(values[:,:,0],axis=0)
+        stdData[:,0]=np.nanstd(values[:,:,0],axis=0)
+        medianData[:,0]=np.nanmedian(values[:,:,0],axis=0)
 
-    maximalValues = np.max(x,axis=0)
+    maximalValues = np.max(values[:,:,0],axis=1)
 
-    outDict = {'mean':meanData, 'median':medianData, 'std':stdData, 'values': listOfPointValues, 'maxs': maximalValues}
+    outDict = {'mean':meanData, 'median':medianData, 'std':stdData, 'values': values, 'maxs': maximalValues}
 
     return outDict
 
 
-def construcGaitCycle(acq):
+def construcGaitCycle(acq,progression=None):
     gaitCycles=list()
 
     context = "Left"
@@ -178,7 +229,7 @@ def construcGaitCycle(acq):
 
     for i in range(0, len(left_fs_frames)-1):
         gaitCycles.append (GaitCycle(acq, left_fs_frames[i],left_fs_frames[i+1],
-                                       context))
+                                       context, progression=progression))
 
     context = "Right"
     right_fs_frames=list()
@@ -188,7 +239,7 @@ def construcGaitCycle(acq):
 
     for i in range(0, len(right_fs_frames)-1):
         gaitCycles.append (GaitCycle(acq, right_fs_frames[i],right_fs_frames[i+1],
-                                       context))
+                                       context, progression=progression))
 
     return gaitCycles
 
@@ -372,15 +423,17 @@ class GaitCycle(Cycle):
                 "strideWidth", "speed"]
 
 
-    def __init__(self,gaitAcq,startFrame,endFrame,context, enableFlag = True):
+    def __init__(self,gaitAcq,startFrame,endFrame,context, enableFlag = True, progression=None):
         """
         :Parameters:
              - `trial` (openma-trial) - openma from a c3d
              - `startFrame` (double) -  start time of the cycle
              - `endFrame` (double) - end time of the cycle
              - `enableFlag` (bool) - flag the Cycle in order to indicate if we can use it in a analysis process.
+             - `progression` (dict) - [optional] precomputed outputs of a `ProgressionFrameFilter` of the acquisition
 
         """
+        self.m_progression = progression
 
 
 
@@ -445,7 +498,7 @@ class GaitCycle(Cycle):
             if btkTools.isPointExist(self.acq,"LHEE") and btkTools.isPointExist(self.acq,"RHEE") and btkTools.isPointExist(self.acq,"LTOE"):
 
                 pfp = progressionFrame.PointProgressionFrameProcedure(marker="LHEE")
-                pff = progressionFrame.ProgressionFrameFilter(self.acq,pfp)
+                pff = progressionFrame.ProgressionFrameFilter(self.acq,pfp,progression=self.m_progression)
                 pff.compute()
                 progressionAxis =  pff.outputs["progressionAxis"]
                 forwardProgression = pff.outputs["forwardProgression"]
@@ -476,7 +529,7 @@ class GaitCycle(Cycle):
             if btkTools.isPointExist(self.acq,"RHEE") and btkTools.isPointExist(self.acq,"LHEE") and btkTools.isPointExist(self.acq,"RTOE"):
 
                 pfp = progressionFrame.PointProgressionFrameProcedure(marker="RHEE")
-                pff = progressionFrame.ProgressionFrameFilter(self.acq,pfp)
+                pff = progressionFrame.ProgressionFrameFilter(self.acq,pfp,progression=self.m_progression)
                 pff.compute()
                 progressionAxis =  pff.outputs["progressionAxis"]
                 forwardProgression = pff.outputs["forwardProgression"]
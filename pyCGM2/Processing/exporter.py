@@ -684,18 +684,10 @@ class AnalysisExportFilter(object):
                         out[keys[0]][keys[1]]=dict()
                         out[keys[0]][keys[1]]["values"]= {"X":[],"Y":[],"Z":[]}
 
-                    li_X = list()
-                    for cycle in self.analysis.kinematicStats.data[keys]["values"]:
-                        li_X.append(cycle[:,0].tolist())
-
-                    li_Y = list()
-                    for cycle in self.analysis.kinematicStats.data[keys]["values"]:
-                        li_Y.append(cycle[:,1].tolist())
-
-                    li_Z = list()
-                    for cycle in self.analysis.kinematicStats.data[keys]["values"]:
-                        li_Z.append(cycle[:,2].tolist())
-
+                    values = np.asarray(self.analysis.kinematicStats.data[keys]["values"]).reshape((-1,101,3))
+                    li_X = values[:,:,0].tolist()
+                    li_Y = values[:,:,1].tolist()
+                    li_Z = values[:,:,2].tolist()
 
                     out[keys[0]][keys[1]]["values"]["X"] = li_X
                     out[keys[0]][keys[1]]["values"]["Y"] = li_Y
@@ -719,18 +711,10 @@ class AnalysisExportFilter(object):
                         out[keys[0]][keys[1]]=dict()
                         out[keys[0]][keys[1]]["values"]= {"X":[],"Y":[],"Z":[]}
 
-                    li_X = list()
-                    for cycle in self.analysis.kineticStats.data[keys]["values"]:
-                        li_X.append(cycle[:,0].tolist())
-
-                    li_Y = list()
-                    for cycle in self.analysis.kineticStats.data[keys]["values"]:
-                        li_Y.append(cycle[:,1].tolist())
-
-                    li_Z = list()
-                    for cycle in self.analysis.kineticStats.data[keys]["values"]:
-                        li_Z.append(cycle[:,2].tolist())
-
+                    values = np.asarray(self.analysis.kineticStats.data[keys]["values"]).reshape((-1,101,3))
+                    li_X = values[:,:,0].tolist()
+                    li_Y = values[:,:,1].tolist()
+                    li_Z = values[:,:,2].tolist()
 
                     out[keys[0]][keys[1]]["values"]["X"] = li_X
                     out[keys[0]][keys[1]]["values"]["Y"] = li_Y
@@ -754,9 +738,7 @@ class AnalysisExportFilter(object):
                         out[keys[0]][keys[1]]=dict()
                         out[keys[0]][keys[1]]["values"]=[]
 
-                    li = list()
-                    for cycle in self.analysis.emgStats.data[keys]["values"]:
-                        li.append(cycle[:,0].tolist())
+                    li = np.asarray(self.analysis.emgStats.data[keys]["values"]).reshape((-1,101,1))[:,:,0].tolist()
 
                     out[keys[0]][keys[1]]["values"] = li
 
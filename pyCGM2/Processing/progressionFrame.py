@@ -1,23 +1,66 @@
 # -*- coding: utf-8 -*-
 import numpy as np
+from collections import OrderedDict
 
 from pyCGM2.Tools import  btkTools
 import pyCGM2; LOGGER = pyCGM2.LOGGER
 
+_PROGRESSION_CACHE = OrderedDict()
+_PROGRESSION_CACHE_MAXSIZE = 32
+
+
+def _getProcedureKey(procedure):
+    return (procedure.__class__.__name__, repr(sorted(procedure.__dict__.items())))
+
+
+def clearProgressionFrameCache():
+    """
+        Clear cached progression frames
+    """
+    _PROGRESSION_CACHE.clear()
+
+
 class ProgressionFrameFilter(object):
     """
+        Detect the progression frame of an acquisition
+
+        .. note:: outputs are cached per acquisition and procedure type ( with its parameters).
+                  The key is `btkTools.getAcquisitionSignature`, i.e any write of a point
+                  ( filtering, rotation...) invalidates it. Cached entries hold no reference to the acquisition.
     """
 
-    def __init__(self, acq,progressionProcedure):
+    def __init__(self, acq,progressionProcedure, progression=None):
+        """
+            :Parameters:
+               - `acq` (btkAcquisition) - a btk acquisition inctance
+               - `progressionProcedure` (pyCGM2.Processing.progressionFrame.(Procedure)) - a progression frame procedure
+               - `progression` (dict) - [optional] precomputed outputs ( keys: progressionAxis, forwardProgression, globalFrame).
+                 The procedure is not run if specified
+        """
 
         self.m_procedure = progressionProcedure
         self.m_acq = acq
+        self.m_progression = progression
 
         self.outputs = {"progressionAxis": None, "forwardProgression": None, "globalFrame": None}
 
 
     def compute(self):
-        progressionAxis,forwardProgression,globalFrame= self.m_procedure.compute(self.m_acq)
+        if self.m_progression is not None:
+            progressionAxis = self.m_progression["progressionAxis"]
+            forwardProgression = self.m_progression["forwardProgression"]
+            globalFrame = self.m_progression["globalFrame"]
+        else:
+            key = (btkTools.getAcquisitionSignature(self.m_acq),_getProcedureKey(self.m_procedure))
+
+            if key in _PROGRESSION_CACHE:
+                progressionAxis,forwardProgression,globalFrame = _PROGRESSION_CACHE[key]
+                _PROGRESSION_CACHE.move_to_end(key)
+            else:
+                progressionAxis,forwardProgression,globalFrame= self.m_procedure.compute(self.m_acq)
+                _PROGRESSION_CACHE[key] = (progressionAxis,forwardProgression,globalFrame)
+                while len(_PROGRESSION_CACHE) > _PROGRESSION_CACHE_MAXSIZE:
+                    _PROGRESSION_CACHE.popitem(last=False)
 
         self.outputs["progressionAxis"] = progressionAxis
         self.outputs["forwardProgression"] = forwardProgression
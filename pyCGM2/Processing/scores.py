@@ -57,42 +57,16 @@ class CGM1_GPS(object):
         nLeftCycles,nRightCycles = analysis.getKinematicCycleNumbers()
 
         # --- MAP ---
-        # left cycles
+        # rms of all cycles at once ( values : array(ncycle,101,3))
         for label,context in self.matchingNormativeDataLabel.keys():
-            matchingNormativeDataLabel = self.matchingNormativeDataLabel[label,context]
-            if context == "Left":
-                left_rms_local = np.zeros((nLeftCycles,3))
-                for i in range(0,nLeftCycles):
-                    values = analysis.kinematicStats.data[label, context]["values"][i]
-                    valuesNorm = normativeData[matchingNormativeDataLabel]["mean"]
+            nCycles = nLeftCycles if context == "Left" else nRightCycles
+            values = np.asarray(analysis.kinematicStats.data[label, context]["values"])[0:nCycles]
+            valuesNorm = normativeData[self.matchingNormativeDataLabel[label,context]]["mean"]
 
-                    if valuesNorm.shape[0] == 51:
-                        rms = numeric.rms(values[0:101:2]-valuesNorm,axis=0)
-                    else:
-                        rms = numeric.rms(values-valuesNorm,axis=0)
+            if valuesNorm.shape[0] == 51:
+                values = values[:,0:101:2,:]
 
-                    left_rms_local[i,:] = rms
-
-                gvs[label,context]=left_rms_local
-
-
-        # right cycles
-        for label,context in self.matchingNormativeDataLabel.keys():
-            matchingNormativeDataLabel = self.matchingNormativeDataLabel[label,context]
-            if context == "Right":
-                right_rms_local = np.zeros((nRightCycles,3))
-                for i in range(0,nRightCycles):
-                    values = analysis.kinematicStats.data[label, context]["values"][i]
-                    valuesNorm = normativeData[matchingNormativeDataLabel]["mean"]
-
-                    if valuesNorm.shape[0] == 51:
-                        rms = numeric.rms(values[0:101:2]-valuesNorm,axis=0)
-                    else:
-                        rms = numeric.rms(values-valuesNorm,axis=0)
-
-                    right_rms_local[i,:] = rms
-
-                gvs[label,context]=right_rms_local
+            gvs[label,context]= numeric.rms(values-valuesNorm[np.newaxis,:,:],axis=1)
 
 
 
@@ -103,7 +103,7 @@ def descriptivePlot(figAxis,analysisStructureItem,
     flag = False
     for key in analysisStructureItem.data.keys():
         if key[0] == pointLabel and key[1] == contextPointLabel:
-            flag = True if analysisStructureItem.data[pointLabel,contextPointLabel]["values"] != [] else False
+            flag = True if len(analysisStructureItem.data[pointLabel,contextPointLabel]["values"]) != 0 else False
 
 
     # plot
@@ -154,7 +154,7 @@ def consistencyPlot(figAxis,analysisStructureItem,
     for key in analysisStructureItem.data.keys():
         if key[0] == pointLabel and key[1] == contextPointLabel:
             n = len(analysisStructureItem.data[pointLabel,contextPointLabel]["values"])
-            flag = True if analysisStructureItem.data[pointLabel,contextPointLabel]["values"] != [] else False
+            flag = True if len(analysisStructureItem.data[pointLabel,contextPointLabel]["values"]) != 0 else False
 
     # plot
     if flag:
@@ -210,7 +210,7 @@ def meanPlot(figAxis,analysisStructureItem,
     flag = False
     for key in analysisStructureItem.data.keys():
         if key[0] == pointLabel and key[1] == contextPointLabel:
-            flag = True if analysisStructureItem.data[pointLabel,contextPointLabel]["values"] != [] else False
+            flag = True if len(analysisStructureItem.data[pointLabel,contextPointLabel]["values"]) != 0 else False
 
 
     # plot
@@ -260,7 +260,7 @@ def gaitDescriptivePlot(figAxis,analysisStructureItem,
     flag = False
     for key in analysisStructureItem.data.keys():
         if key[0] == pointLabel and key[1] == contextPointLabel:
-            flag = True if analysisStructureItem.data[pointLabel,contextPointLabel]["values"]!=[]  else False
+            flag = True if len(analysisStructureItem.data[pointLabel,contextPointLabel]["values"]) != 0 else False
 
     # plot
     if flag:
@@ -317,7 +317,7 @@ def gaitConsistencyPlot(figAxis,analysisStructureItem,
     for key in analysisStructureItem.data.keys():
         if key[0] == pointLabel and key[1] == contextPointLabel:
             n = len(analysisStructureItem.data[pointLabel,contextPointLabel]["values"])
-            flag = True if analysisStructureItem.data[pointLabel,contextPointLabel]["values"]!=[] else False
+            flag = True if len(analysisStructureItem.data[pointLabel,contextPointLabel]["values"]) != 0 else False
 
     # plot
     if flag:
@@ -382,7 +382,7 @@ def gaitMeanPlot(figAxis,analysisStructureItem,
     flag = False
     for key in analysisStructureItem.data.keys():
         if key[0] == pointLabel and key[1] == contextPointLabel:
-            flag = True if analysisStructureItem.data[pointLabel,contextPointLabel]["values"] != [] else False
+            flag = True if len(analysisStructureItem.data[pointLabel,contextPointLabel]["values"]) != 0 else False
 
 
     # plot
@@ -107,27 +107,7 @@ def detect_cusum(x, threshold=1, drift=0, ending=False, show=True, ax=None):
     # Estimation of when the change ends (offline form)
     if tai.size and ending:
         _, tai2, _, _ = detect_cusum(x[::-1], threshold, drift, show=False)
-        taf = x.size - tai2[::-1] - 1
-        # Eliminate repeated changes, changes that have the same beginning
-        tai, ind = np.unique(tai, return_index=True)
-        ta = ta[ind]
-        # taf = np.unique(taf, return_index=False)  # corect later
-        if tai.size != taf.size:
-            if tai.size < taf.size:
-                taf = taf[[np.argmax(taf >= i) for i in ta]]
-            else:
-                ind = [np.argmax(i >= ta[::-1])-1 for i in taf]
-                ta = ta[ind]
-                tai = tai[ind]
-        # Delete intercalated changes (the ending of the change is after
-        # the beginning of the next change)
-        ind = taf[:-1] - tai[1:] > 0
-        if ind.any():
-            ta = ta[~np.append(False, ind)]
-            tai = tai[~np.append(False, ind)]
-            taf = taf[~np.append(ind, False)]
-        # Amplitude of changes
-        amp = x[taf] - x[tai]
+        ta, tai, taf, amp = _ending(x, ta, tai, tai2)
 
     if show:
         _plot(x, threshold, drift, ending, ax, ta, tai, taf, gp, gn)
@@ -135,6 +115,115 @@ def detect_cusum(x, threshold=1, drift=0, ending=False, show=True, ax=None):
     return ta, tai, taf, amp
 
 
+def _ending(x, ta, tai, tai2):
+    """Estimation of when the changes end, see detect_cusum."""
+
+    taf = x.size - tai2[::-1] - 1
+    # Eliminate repeated changes, changes that have the same beginning
+    tai, ind = np.unique(tai, return_index=True)
+    ta = ta[ind]
+    # taf = np.unique(taf, return_index=False)  # corect later
+    if tai.size != taf.size:
+        if tai.size < taf.size:
+            taf = taf[[np.argmax(taf >= i) for i in ta]]
+        else:
+            ind = [np.argmax(i >= ta[::-1])-1 for i in taf]
+            ta = ta[ind]
+            tai = tai[ind]
+    # Delete intercalated changes (the ending of the change is after
+    # the beginning of the next change)
+    ind = taf[:-1] - tai[1:] > 0
+    if ind.any():
+        ta = ta[~np.append(False, ind)]
+        tai = tai[~np.append(False, ind)]
+        taf = taf[~np.append(ind, False)]
+    # Amplitude of changes
+    amp = x[taf] - x[tai]
+
+    return ta, tai, taf, amp
+
+
+def _online(x, threshold, drift):
+    """Classical CUSUM of x, see detect_cusum.
+
+    The cumulative sums between two alarms are computed at once with
+    g[i] = G[i] - min(0, min(G[:i+1])), G being the cumulative sum of the
+    changes minus the drift. Equal to the online form up to rounding.
+    """
+
+    s = np.diff(x)
+    ta, tai = [], []
+    tap, tan = 0, 0
+    start = 0  # index in s of the first sample after the last alarm
+    while start < s.size:
+        gp = np.cumsum(s[start:] - drift)
+        gn = np.cumsum(-s[start:] - drift)
+        minp = np.minimum(np.minimum.accumulate(gp), 0)
+        minn = np.minimum(np.minimum.accumulate(gn), 0)
+        # cumulative sum set to zero : g[i-1] + s - drift < 0
+        resetp = gp < np.concatenate(([0], minp[:-1]))
+        resetn = gn < np.concatenate(([0], minn[:-1]))
+        gp = gp - minp
+        gn = gn - minn
+
+        alarms = np.nonzero((gp > threshold) | (gn > threshold))[0]
+        last = alarms[0] if alarms.size else s.size - start - 1
+
+        indexes = np.nonzero(resetp[:last+1])[0]
+        if indexes.size:
+            tap = start + indexes[-1] + 1
+        indexes = np.nonzero(resetn[:last+1])[0]
+        if indexes.size:
+            tan = start + indexes[-1] + 1
+
+        if not alarms.size:
+            break
+        ta.append(start + last + 1)
+        tai.append(tap if gp[last] > threshold else tan)
+        start = start + last + 1
+
+    return np.array(ta, dtype=int), np.array(tai, dtype=int)
+
+
+def detect_cusum_array(x, threshold=1, drift=0, ending=False):
+    """Cumulative sum algorithm (CUSUM) applied on each column of a 2D array.
+
+    Same outputs as `detect_cusum` called column by column ( without plot) up to rounding,
+    but the cumulative sums are vectorized between alarms.
+
+    Parameters
+    ----------
+    x : 2D array_like (n, m)
+        data.
+    threshold : positive number or 1D array_like (m), optional (default = 1)
+        amplitude threshold for the change in the data of each column.
+    drift : positive number or 1D array_like (m), optional (default = 0)
+        drift term of each column.
+    ending : bool, optional (default = False)
+        True (1) to estimate when the change ends; False (0) otherwise.
+
+    Returns
+    -------
+    list of (ta, tai, taf, amp) tuples, one per column. See `detect_cusum`.
+    """
+
+    x = np.asarray(x, dtype='float64')
+    x = x.reshape((x.shape[0], -1))
+    threshold = np.broadcast_to(np.asarray(threshold, dtype='float64'), (x.shape[1],))
+    drift = np.broadcast_to(np.asarray(drift, dtype='float64'), (x.shape[1],))
+
+    out = list()
+    for j in range(x.shape[1]):
+        ta, tai = _online(x[:, j], threshold[j], drift[j])
+        if tai.size and ending:
+            _, tai2 = _online(x[::-1, j], threshold[j], drift[j])
+            out.append(_ending(x[:, j], ta, tai, tai2))
+        else:
+            out.append((ta, tai, np.array([], dtype=int), np.array([])))
+
+    return out
+
+
 def _plot(x, threshold, drift, ending, ax, ta, tai, taf, gp, gn):
     """Plot results of the detect_cusum function, see its help."""
 
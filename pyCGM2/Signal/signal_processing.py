@@ -8,25 +8,73 @@ try:
 except:
     LOGGER.logger.info("[pyCGM2] pyCGM2-embedded btk not imported")
     import btk
+from pyCGM2.Tools import btkTools
 
 
 
 # ---- EMG -----
 
-def remove50hz(array,fa):
+def chunkedFiltfilt(b,a,array,chunkSize=None):
+    """
+        Zero-phase filtering along the first axis, optionally chunk by chunk
+
+        :Parameters:
+            - `b` (numpy.array) - numerator of the filter
+            - `a` (numpy.array) - denominator of the filter
+            - `array` (numpy.array(n,m)) - array
+            - `chunkSize` (int) - [optional] number of samples of each chunk. The whole array is filtered if None
+
+        .. note:: chunk by chunk, the forward then the backward pass of filtfilt run with `lfilter`,
+                  the filter state being carried from one chunk to the next. No overlap is needed,
+                  the output matches `scipy.signal.filtfilt` ( odd padding) and only the output array
+                  plus one chunk are held in memory.
+    """
+    nFrames = array.shape[0]
+    padlen = 3*max(len(a),len(b))
+    if chunkSize is None or chunkSize >= nFrames or nFrames <= padlen:
+        return signal.filtfilt(b, a, array, axis=0)
+
+    values = array.reshape(nFrames,-1)
+    zi = signal.lfilter_zi(b,a)[:,np.newaxis]
+
+    # odd extensions, as filtfilt
+    left = 2*values[0] - values[padlen:0:-1]
+    right = 2*values[-1] - values[-2:-padlen-2:-1]
+
+    out = np.empty(values.shape)
+
+    # forward pass
+    y,z = signal.lfilter(b, a, left, axis=0, zi=zi*left[0])
+    for begin in range(0,nFrames,chunkSize):
+        end = min(begin+chunkSize,nFrames)
+        out[begin:end],z = signal.lfilter(b, a, values[begin:end], axis=0, zi=z)
+    y,z = signal.lfilter(b, a, right, axis=0, zi=z)
+
+    # backward pass
+    y,z = signal.lfilter(b, a, y[::-1], axis=0, zi=zi*y[-1])
+    for end in range(nFrames,0,-chunkSize):
+        begin = max(end-chunkSize,0)
+        y,z = signal.lfilter(b, a, out[begin:end][::-1], axis=0, zi=z)
+        out[begin:end] = y[::-1]
+
+    return out.reshape(array.shape)
+
+
+def remove50hz(array,fa,chunkSize=None):
     """
         Remove 50Hz signal
 
         :Parameters:
             - `array` (numpy.array(n,n)) - array
             - `fa` (double) - sample frequency
+            - `chunkSize` (int) - [optional] filter chunk by chunk ( see `chunkedFiltfilt`)
    """
     bEmgStop, aEMGStop = signal.butter(2, np.array([49.9, 50.1]) / ((fa*0.5)), 'bandstop')
-    value= signal.filtfilt(bEmgStop, aEMGStop, array,axis=0  )
+    value= chunkedFiltfilt(bEmgStop, aEMGStop, array, chunkSize=chunkSize)
 
     return value
 
-def highPass(array,lowerFreq,upperFreq,fa):
+def highPass(array,lowerFreq,upperFreq,fa,chunkSize=None):
     """
         High pass filtering
 
@@ -35,9 +83,12 @@ def highPass(array,lowerFreq,upperFreq,fa):
             - `lowerFreq` (double) - lower frequency
             - `upperFreq` (double) - upper frequency
             - `fa` (double) - sample frequency
+            - `chunkSize` (int) - [optional] filter chunk by chunk ( see `chunkedFiltfilt`)
+
+        .. note:: the mean of each column is removed before filtering
    """
     bEmgHighPass, aEmgHighPass = signal.butter(2, np.array([lowerFreq, upperFreq]) / ((fa*0.5)), 'bandpass')
-    value = signal.filtfilt(bEmgHighPass, aEmgHighPass,array-np.mean(array),axis=0  )
+    value = chunkedFiltfilt(bEmgHighPass, aEmgHighPass,array-np.mean(array,axis=0), chunkSize=chunkSize)
 
     return value
 
@@ -51,7 +102,7 @@ def rectify(array):
    """
     return np.abs(array)
 
-def enveloppe(array, fc,fa):
+def enveloppe(array, fc,fa,chunkSize=None):
     """
         Get signal enveloppe from a low pass filter
 
@@ -59,9 +110,10 @@ def enveloppe(array, fc,fa):
             - `array` (numpy.array(n,n)) - array
             - `fc` (double) - cut-off frequency
             - `fa` (double) - sample frequency
+            - `chunkSize` (int) - [optional] filter chunk by chunk ( see `chunkedFiltfilt`)
    """
     bEmgEnv, aEMGEnv = signal.butter(2, fc / (fa*0.5) , btype='lowpass')
-    value = signal.filtfilt(bEmgEnv, aEMGEnv, array ,axis=0  )
+    value = chunkedFiltfilt(bEmgEnv, aEMGEnv, array, chunkSize=chunkSize)
     return value
 
 
@@ -77,60 +129,28 @@ def markerFiltering(btkAcq,markers,order=2, fc=6,zerosFiltering=True):
             - `btkAcq` (btkAcquisition) - btk acquisition instance
             - `fc` (double) - cut-off frequency
             - `order` (double) - order of the low-pass filter
-    """
-
-    def filterZeros(array,b,a):
-
-
-        N = len(array)
-        indexes = list(range(0,N))
-
-        for i in range(0,N):
-            if array[i] == 0:
-                indexes[i] = -1
-
-
-        splitdata = [x[x!=0] for x in np.split(array, np.where(array==0)[0]) if len(x[x!=0])]
-        splitIndexes = [x[x!=-1] for x in np.split(indexes, np.where(indexes==-1)[0]) if len(x[x!=-1])]
-
-
-        filtValues_section=list()
-        for data in splitdata:
-            padlen = 3 * max(len(a), len(b)) # default as defined in https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.filtfilt.html
-            if len(data) <= padlen:
-                padlen = len(data) - 1
-            filtValues_section.append(signal.filtfilt(b, a, data ,padlen=padlen,axis=0))
-
-        indexes = np.concatenate(splitIndexes) if splitIndexes != [] else []
-        values = np.concatenate(filtValues_section) if filtValues_section != [] else []
-
-        out = np.zeros((N))
-        j = 0
-        for i in indexes:
-            out[i] = values[j]
-            j+=1
-        return out
+            - `zerosFiltering` (bool) - filter each run of non-zero values separately ( zeros are gaps)
 
+        .. note:: the selected markers are filtered together as a single numpy.array(n,3m).
+                  Values are read from btk ( see `btkTools.getAcquisitionArrays`)
+    """
 
-    fp=btkAcq.GetPointFrequency()
-    bPoint, aPoint = signal.butter(order, fc / (fp*0.5) , btype='lowpass')
+    points = [pointIt for pointIt in btk.Iterate(btkAcq.GetPoints())
+                if pointIt.GetType() == btk.btkPoint.Marker and pointIt.GetLabel() in markers]
+    labels = [pointIt.GetLabel() for pointIt in points]
 
-    for pointIt in btk.Iterate(btkAcq.GetPoints()):
-        if pointIt.GetType() == btk.btkPoint.Marker and pointIt.GetLabel() in markers:
-            label = pointIt.GetLabel()
-            if zerosFiltering:
-                x = filterZeros(pointIt.GetValues()[:,0],bPoint,aPoint)
-                y = filterZeros(pointIt.GetValues()[:,1],bPoint,aPoint)
-                z = filterZeros(pointIt.GetValues()[:,2],bPoint,aPoint)
-            else:
-                x=signal.filtfilt(bPoint, aPoint, pointIt.GetValues()[:,0],axis=0  )
-                y=signal.filtfilt(bPoint, aPoint, pointIt.GetValues()[:,1],axis=0  )
-                z=signal.filtfilt(bPoint, aPoint, pointIt.GetValues()[:,2],axis=0  )
+    if labels != []:
+        values = np.stack([pointIt.GetValues() for pointIt in points],axis=1)
+        nFrames = values.shape[0]
 
-            btkAcq.GetPoint(label).SetValues(np.array( [x,y,z] ).transpose())
+        filtValues = arrayLowPassFiltering(values.reshape((nFrames,3*len(labels))), btkAcq.GetPointFrequency(),
+                                           order=order, fc=fc, zerosFiltering=zerosFiltering)
+        filtValues = filtValues.reshape((nFrames,len(labels),3))
 
+        for j,label in enumerate(labels):
+            btkAcq.GetPoint(label).SetValues(filtValues[:,j,:])
 
-            # pointIt.SetValues(np.array( [x,y,z] ).transpose())
+    btkTools.clearAcquisitionArrays(btkAcq)
 
 
 def forcePlateFiltering(btkAcq,order=4, fc =5):
@@ -170,7 +190,31 @@ def forcePlateFiltering(btkAcq,order=4, fc =5):
                 LOGGER.logger.error("[pyCGM2] filtering of the force place %i impossible - label %s not found"%(i,label))
 
 # ----- methods ---------
-def arrayLowPassFiltering(valuesArray, freq, order=2, fc =6):
+def nonZeroRuns(valuesArray):
+    """
+        Find runs of consecutive non-zero values of each column
+
+        :Parameters:
+            - `valuesArray` (numpy.array(n,m)) - array
+
+        :Return:
+            - `runs` (dict) - column indexes ( list) of each run ( tuple(begin,end), end excluded)
+    """
+    valid = (valuesArray != 0).astype(np.int8)
+    padding = np.zeros((1,valid.shape[1]),dtype=np.int8)
+    edges = np.diff(np.concatenate((padding,valid,padding),axis=0),axis=0)
+
+    # np.nonzero sorts by column then frame, so begins and ends are paired
+    beginColumns,begins = np.nonzero(edges.T == 1)
+    ends = np.nonzero(edges.T == -1)[1]
+
+    runs = dict()
+    for column,begin,end in zip(beginColumns,begins,ends):
+        runs.setdefault((begin,end),list()).append(column)
+    return runs
+
+
+def arrayLowPassFiltering(valuesArray, freq, order=2, fc =6, zerosFiltering=False):
     """
         low-pass filtering of an numpy array
 
@@ -178,12 +222,20 @@ def arrayLowPassFiltering(valuesArray, freq, order=2, fc =6):
              - `valuesArray` (numpy.array(n,n)) - array
             - `fc` (double) - cut-off frequency
             - `order` (double) - order of the low-pass filter
+            - `zerosFiltering` (bool) - filter each run of non-zero values separately. Zeros are kept.
+
+        .. note:: columns sharing the same run are filtered with a single call to filtfilt
     """
     b, a = signal.butter(order, fc / (freq*0.5) , btype='lowpass')
 
+    if not zerosFiltering:
+        return signal.filtfilt(b, a, valuesArray, axis=0)
+
     out = np.zeros(valuesArray.shape)
-    for i in range(0, valuesArray.shape[1]):
-        out[:,i] = signal.filtfilt(b, a, valuesArray[:,i] )
+    padlen = 3 * max(len(a), len(b)) # default as defined in https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.filtfilt.html
+    for (begin,end),columns in nonZeroRuns(valuesArray).items():
+        out[begin:end,columns] = signal.filtfilt(b, a, valuesArray[begin:end,columns],
+                                                 padlen=min(padlen,end-begin-1),axis=0)
 
     return out
 
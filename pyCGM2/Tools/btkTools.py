@@ -1,6 +1,9 @@
 # coding: utf-8
+import os
+import threading
 import numpy as np
 from scipy import spatial
+from collections import OrderedDict
 import pyCGM2; LOGGER = pyCGM2.LOGGER
 
 try:
@@ -12,15 +15,230 @@ except:
 
 
 
+# --- acquisition array cache -----
+
+_ACQUISITION_ARRAYS = OrderedDict()
+_ACQUISITION_ARRAYS_MAXSIZE = 4
+_ACQUISITION_ARRAYS_LOCK = threading.RLock()
+
+
+def _getPointTimestamps(acq):
+    # btk increments the timestamp of a point on every write ( SetValues, SetResiduals, SetLabel...)
+    return [it.GetTimestamp() for it in btk.Iterate(acq.GetPoints())]
+
+
+class AcquisitionArrays(object):
+    """
+        Point values and residuals of an acquisition stored as contiguous arrays
+
+        Values are a numpy.array(n,p,3) and residuals a numpy.array(n,p),
+        with n the number of frames and p the number of points.
+
+        .. note:: use `getAcquisitionArrays` instead of constructing this object.
+    """
+
+    def __init__(self,acq):
+        """
+            :Parameters:
+                - `acq` (btkAcquisition) - a btk acquisition inctance
+        """
+        self.m_acq = acq
+        self.m_version = 0
+        self.m_pointNumber = acq.GetPointNumber()
+        self.m_frameNumber = acq.GetPointFrameNumber()
+
+        self.m_labels = list()
+        self.m_timestamps = list()
+        values = list()
+        residuals = list()
+        for it in btk.Iterate(acq.GetPoints()):
+            self.m_labels.append(it.GetLabel())
+            self.m_timestamps.append(it.GetTimestamp())
+            values.append(it.GetValues())
+            residuals.append(it.GetResiduals().reshape(self.m_frameNumber))
+
+        self.m_indexes = dict((label,j) for j,label in enumerate(self.m_labels))
+        if self.m_labels != []:
+            self.m_values = np.ascontiguousarray(np.stack(values,axis=1))
+            self.m_residuals = np.ascontiguousarray(np.stack(residuals,axis=1))
+        else:
+            self.m_values = np.zeros((self.m_frameNumber,0,3))
+            self.m_residuals = np.zeros((self.m_frameNumber,0))
+
+    def isUpToDate(self):
+        """ check no point of the acquisition has been written, added or removed since the arrays were built """
+        return self.m_pointNumber == self.m_acq.GetPointNumber() and \
+               self.m_frameNumber == self.m_acq.GetPointFrameNumber() and \
+               self.m_timestamps == _getPointTimestamps(self.m_acq)
+
+    def getIndexes(self,labels):
+        """
+            Get column indexes of points
+
+            :Parameters:
+                - `labels` (list of str) - point labels
+        """
+        try:
+            return [self.m_indexes[label] for label in labels]
+        except KeyError as e:
+            raise Exception("[pyCGM2] point (%s) not found" %(e.args[0]))
+
+    def getValues(self,labels):
+        """ return a copy of point values ( numpy.array(n,m,3)) """
+        return self.m_values[:,self.getIndexes(labels),:]
+
+    def getResiduals(self,labels):
+        """ return a copy of point residuals ( numpy.array(n,m)) """
+        return self.m_residuals[:,self.getIndexes(labels)]
+
+    def getFrameResiduals(self,labels,index):
+        """ return point residuals at a single frame ( numpy.array(m)) """
+        return self.m_residuals[index,self.getIndexes(labels)]
+
+    def update(self,label,values,residuals):
+        """
+            Update values and residuals of a point. A new point is appended.
+            The attribute `m_version` is incremented after each update
+
+            :Return:
+                - `flag` (bool) - False if arrays cannot be updated
+        """
+        if values.shape[0] != self.m_frameNumber:
+            return False
+
+        residuals = np.asarray(residuals).reshape(self.m_frameNumber)
+        timestamp = self.m_acq.GetPoint(label).GetTimestamp()
+        if label in self.m_indexes:
+            j = self.m_indexes[label]
+            self.m_values[:,j,:] = values
+            self.m_residuals[:,j] = residuals
+            self.m_timestamps[j] = timestamp
+        else:
+            if self.m_pointNumber+1 != self.m_acq.GetPointNumber():
+                return False
+            self.m_indexes[label] = len(self.m_labels)
+            self.m_labels.append(label)
+            self.m_timestamps.append(timestamp)
+            self.m_values = np.concatenate((self.m_values,values.reshape((self.m_frameNumber,1,3))),axis=1)
+            self.m_residuals = np.concatenate((self.m_residuals,residuals.reshape((self.m_frameNumber,1))),axis=1)
+            self.m_pointNumber+=1
+        self.m_version+=1
+        return True
+
+
+def _getAcquisitionKey(acq):
+    # several swig proxies can wrap the same btk acquisition
+    try:
+        return int(acq.this)
+    except (AttributeError,TypeError):
+        return id(acq)
+
+
+def getAcquisitionSignature(acq):
+    """
+        Get a hashable signature of the points of an acquisition, without reading point values
+
+        :Parameters:
+            - `acq` (btkAcquisition) - a btk acquisition inctance
+
+        .. note:: the signature changes if a point is written ( btk timestamps), added or removed,
+                  or if the frame number changes. It holds no reference to the acquisition.
+    """
+    return (_getAcquisitionKey(acq),acq.GetPointFrameNumber(),tuple(_getPointTimestamps(acq)))
+
+
+def getAcquisitionArrays(acq,labels=None):
+    """
+        Get the cached array representation of the points of an acquisition
+
+        :Parameters:
+            - `acq` (btkAcquisition) - a btk acquisition inctance
+            - `labels` (list of str) - [optional] point labels which must be stored
+
+        :Return:
+            - `arrays` (pyCGM2.Tools.btkTools.AcquisitionArrays) - cached arrays
+
+        .. note:: The cache is rebuilt if a point of the acquisition has been written through btk
+                  ( checked with the btk timestamps of the points), or if the point or frame number changed.
+                  `smartAppendPoint` keeps it up to date.
+                  A new `AcquisitionArrays` instance is built after each invalidation.
+                  Functions writing back the points they read ( marker filtering, gap filling) read them from btk,
+                  since their writes would invalidate the arrays.
+    """
+    key = _getAcquisitionKey(acq)
+
+    with _ACQUISITION_ARRAYS_LOCK:
+        arrays = _ACQUISITION_ARRAYS.get(key)
+        if arrays is None or not arrays.isUpToDate() or \
+            (labels is not None and not all(label in arrays.m_indexes for label in labels)):
+            arrays = AcquisitionArrays(acq)
+            _ACQUISITION_ARRAYS[key] = arrays
+
+        _ACQUISITION_ARRAYS.move_to_end(key)
+        while len(_ACQUISITION_ARRAYS) > _ACQUISITION_ARRAYS_MAXSIZE:
+            _ACQUISITION_ARRAYS.popitem(last=False)
+
+    return arrays
+
+
+def clearAcquisitionArrays(acq=None):
+    """
+        Invalidate the cached point arrays
+
+        :Parameters:
+            - `acq` (btkAcquisition) - [optional] a btk acquisition inctance. All acquisitions if None
+    """
+    with _ACQUISITION_ARRAYS_LOCK:
+        if acq is None:
+            _ACQUISITION_ARRAYS.clear()
+        else:
+            _ACQUISITION_ARRAYS.pop(_getAcquisitionKey(acq),None)
+
+
+# --- c3d cache -----
+
+_C3D_CACHE = OrderedDict()
+_C3D_CACHE_MAXSIZE = 32
+
+
+def _getC3dKey(filename,translators):
+    stat = os.stat(filename)
+    translatorKey = None if translators is None else repr(sorted(translators.items()))
+    return (os.path.normcase(os.path.abspath(filename)), stat.st_mtime_ns, stat.st_size, translatorKey)
+
+
+def clearC3dCache():
+    """
+        Clear acquisitions cached by `smartReader`
+    """
+    _C3D_CACHE.clear()
+
+
 # --- acquisition -----
-def smartReader(filename,translators=None):
+def smartReader(filename,translators=None,cached=False):
     """
         Convenient function to read a c3d with Btk
 
         :Parameters:
             - `filename` (str) - path and filename of the c3d
             - `translators` (str) - marker translators
+            - `cached` (bool) - return the acquisition already read from the same file
+              ( same path, modification time and size) instead of parsing it again
+
+        .. note:: a cached acquisition is shared by all callers. Use `cached=False` if the acquisition
+                  is going to be modified without being saved, or call `clearC3dCache`
     """
+    if cached:
+        key = _getC3dKey(filename,translators)
+        if key in _C3D_CACHE:
+            _C3D_CACHE.move_to_end(key)
+            return _C3D_CACHE[key]
+        acq = smartReader(filename,translators=translators)
+        _C3D_CACHE[key] = acq
+        while len(_C3D_CACHE) > _C3D_CACHE_MAXSIZE:
+            _C3D_CACHE.popitem(last=False)
+        return acq
+
     reader = btk.btkAcquisitionFileReader()
     reader.SetFilename(filename)
     reader.Update()
@@ -89,6 +307,38 @@ def findNearestMarker(acq,i,marker,markerNames=None):
     return markerNames[index],dist
 
 
+def findNearestMarkers(acq,i,markerNames=None):
+    """
+        Find the nearest marker of several markers with a single KD-tree
+
+        :Parameters:
+            - `acq` (btkAcquisition) - a btk acquisition inctance
+            - `i` (int) - frame index
+            - `markerNames` (list of str) - [optional] marker labels. All markers if None
+
+        :Return:
+            - `nearest` (list of str) - nearest marker of each marker
+            - `dists` (numpy.array(m)) - distance to the nearest marker
+
+        .. note:: markers are searched among the other markers of `markerNames`
+    """
+    if markerNames is None:
+        markerNames = GetMarkerNames(acq)
+
+    out = getAcquisitionArrays(acq,markerNames).getValues(markerNames)[i,:,:]
+
+    tree = spatial.KDTree(out)
+    dists,indexes = tree.query(out,k=2)
+
+    nearest = list()
+    nearestDists = np.zeros(len(markerNames))
+    for j in range(0,len(markerNames)):
+        # the marker itself is one of its two nearest points
+        k = 0 if indexes[j,0] != j else 1
+        nearest.append(markerNames[indexes[j,k]])
+        nearestDists[j] = dists[j,k]
+
+    return nearest,nearestDists
 
 
 def GetAnalogNames(acq):
@@ -187,12 +437,7 @@ def smartAppendPoint(acq,label,values, PointType=btk.btkPoint.Marker,desc="",res
     values = np.nan_to_num(values)
 
     if residuals is None:
-        residuals = np.zeros((values.shape[0]))
-        for i in range(0, values.shape[0]):
-            if np.all(values[i,:] == np.zeros((3))):
-                residuals[i] = -1
-            else:
-                residuals[i] = 0
+        residuals = np.where(np.all(values == 0, axis=1), -1.0, 0.0)
 
     if isPointExist(acq,label):
         acq.GetPoint(label).SetValues(values)
@@ -208,6 +453,11 @@ def smartAppendPoint(acq,label,values, PointType=btk.btkPoint.Marker,desc="",res
         new_btkPoint.SetResiduals(residuals)
         acq.AppendPoint(new_btkPoint)
 
+    with _ACQUISITION_ARRAYS_LOCK:
+        arrays = _ACQUISITION_ARRAYS.get(_getAcquisitionKey(acq))
+        if arrays is not None and not arrays.update(label,values,residuals):
+            clearAcquisitionArrays(acq)
+
 def clearPoints(acq, pointlabelList):
     """
         Clear points
@@ -228,7 +478,7 @@ def clearPoints(acq, pointlabelList):
             i.incr()
             LOGGER.logger.debug( label + " found")
 
-
+    clearAcquisitionArrays(acq)
 
     return acq
 
@@ -268,14 +518,8 @@ def isPhantom(acq,label):
 def getValidFrames(acq,markerLabels,frameBounds=None):
     ff = acq.GetFirstFrame()
 
-    flag = list()
-    for i in range(0,acq.GetPointFrameNumber()):
-        flag_index=True
-        for marker in markerLabels:
-            if not acq.GetPoint(marker).GetResidual(i) >= 0 :
-                flag_index = False
-
-        flag.append(flag_index)
+    residuals = getAcquisitionArrays(acq,markerLabels).getResiduals(markerLabels)
+    flag = np.all(residuals >= 0,axis=1).tolist()
 
     if frameBounds is not None:
         begin = frameBounds[0] - ff
@@ -337,23 +581,13 @@ def applyOnValidFrames(acq,validFrames):
                     it.SetValue(i,1,0)
                     it.SetValue(i,2,0)
 
+    clearAcquisitionArrays(acq)
 
 
 def findValidFrames(acq,markerLabels):
 
-    flag = list()
-    for i in range(0,acq.GetPointFrameNumber()):
-        pointFlag=list()
-        for marker in markerLabels:
-            if acq.GetPoint(marker).GetResidual(i) >= 0 :
-                pointFlag.append(1)
-            else:
-                pointFlag.append(0)
-
-        if all(pointFlag)==1:
-            flag.append(1)
-        else:
-            flag.append(0)
+    residuals = getAcquisitionArrays(acq,markerLabels).getResiduals(markerLabels)
+    flag = np.all(residuals >= 0,axis=1).astype(int).tolist()
 
     firstValidFrame = flag.index(1)
     lastValidFrame = len(flag) - flag[::-1].index(1) - 1
@@ -545,11 +779,46 @@ def hasChild(md,mdLabel):
 
 
 def getVisibleMarkersAtFrame(acq,markers,index):
-    visibleMarkers=[]
-    for marker in markers:
-        if acq.GetPoint(marker).GetResidual(index) !=-1:
-            visibleMarkers.append(marker)
-    return visibleMarkers
+    """
+        Get the markers visible at a frame
+
+        :Parameters:
+            - `acq` (btkAcquisition) - a btk acquisition inctance
+            - `markers` (list of str) - marker labels
+            - `index` (int) - frame index
+
+        .. note:: use `getVisibilityMask` once instead of calling this function in a loop over frames
+    """
+    residuals = getAcquisitionArrays(acq,markers).getFrameResiduals(markers,index)
+    return [marker for marker,residual in zip(markers,residuals) if residual != -1]
+
+def getVisibilityMask(acq,markers):
+    """
+        Get the visibility of markers over all frames
+
+        :Parameters:
+            - `acq` (btkAcquisition) - a btk acquisition inctance
+            - `markers` (list of str) - marker labels
+
+        :Return:
+            - `mask` (numpy.array(n,m) of bool) - True if the marker is visible ( residual different from -1)
+
+        .. note:: column j matches `getVisibleMarkersAtFrame` for marker j
+    """
+    return getAcquisitionArrays(acq,markers).getResiduals(markers) != -1
+
+def getMarkerArray(acq,markers):
+    """
+        Get trajectories of several markers as a single array
+
+        :Parameters:
+            - `acq` (btkAcquisition) - a btk acquisition inctance
+            - `markers` (list of str) - marker labels
+
+        :Return:
+            - `values` (numpy.array(n,m,3)) - trajectories
+    """
+    return getAcquisitionArrays(acq,markers).getValues(markers)
 
 
 
@@ -598,6 +867,7 @@ def markerUnitConverter(acq,unitOffset):
         if it.GetType() == btk.btkPoint.Marker:
             values = it.GetValues()
             it.SetValues(values*unitOffset)
+    clearAcquisitionArrays(acq)
 
 def constructMarker(acq,label,markers,numpyMethod=np.mean,desc=""):
     nFrames = acq.GetPointFrameNumber()
@@ -793,14 +1063,22 @@ def sortedEvents(acq):
 
 #------------------- FROM trials TOOLS------------------------------------------
 
-def buildTrials(dataPath,filenames):
+def buildTrials(dataPath,filenames,cached=False):
+    """
+        read a set of c3d
 
+        :Parameters:
+            - `dataPath` (str) - folder path
+            - `filenames` (list of str) - filename of the different acquisitions
+            - `cached` (bool) - [optional] use the c3d cache of `smartReader`.
+              Acquisitions are then shared with other callers and must not be modified
+    """
     acqs=[]
     acqFilenames =[]
     for filename in filenames:
         LOGGER.logger.debug( dataPath)
         LOGGER.logger.debug( filename)
-        acq = smartReader(dataPath + filename)
+        acq = smartReader(dataPath + filename,cached=cached)
         sortedEvents(acq)
 
         acqs.append(acq)
@@ -843,24 +1121,25 @@ def isKineticFlag(acq):
     else:
         return True,kineticEvent_frames,kineticEvent_frames_left,kineticEvent_frames_right
 
-def automaticKineticDetection(dataPath,filenames,acqs=None):
+def automaticKineticDetection(dataPath,filenames,acqs=None,cached=False):
     """
         convenient method for detecting correct kinetic in a filename set
 
         :Parameters:
             - `dataPath` (str) - folder path
             - `filenames` (list of str) - filename of the different acquisitions
+            - `acqs` (list of btkAcquisition) - [optional] acquisitions of the filenames
+            - `cached` (bool) - [optional] use the c3d cache of `smartReader` ( see `buildTrials`)
     """
     kineticAcqs=[]
     kineticFilenames=[]
 
-    i=0
-    for filename in filenames:
+    for i,filename in enumerate(filenames):
         if filename in kineticFilenames:
             LOGGER.logger.debug("[pyCGM2] : filename %s duplicated in the input list" %(filename))
         else:
             if acqs is None:
-                acq = smartReader(dataPath + filename)
+                acq = smartReader(dataPath + filename,cached=cached)
 
             else:
                 acq = acqs[i]
@@ -871,7 +1150,6 @@ def automaticKineticDetection(dataPath,filenames,acqs=None):
             if flag_kinetics:
                 kineticFilenames.append(filename)
                 kineticAcqs.append(acq)
-    i+=1
 
     kineticAcqs = None if kineticAcqs ==[] else kineticAcqs
     flag_kinetics = False if kineticAcqs ==[] else True
@@ -916,6 +1194,8 @@ def applyRotation(btkAcq,markers,globalFrameOrientation,forwardProgression):
 
     	btkAcq.GetPoint(marker).SetValues(valuesRot)
 
+    clearAcquisitionArrays(btkAcq)
+
 
 def smartGetEvents(acq,label,context):
     evs = acq.GetEvents()
@@ -938,3 +1218,5 @@ def cleanAcq(acq):
             if np.all(values == np.zeros(3)) or np.all(values==np.array([180,0,180])):
                 LOGGER.logger.debug ( "point %s remove from acquisition"%(it.GetLabel()))
                 acq.RemovePoint(it.GetLabel())
+
+    clearAcquisitionArrays(acq)
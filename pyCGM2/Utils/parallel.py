@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+import pyCGM2; LOGGER = pyCGM2.LOGGER
+import logging
+import pickle
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+# object shared by all jobs of a worker process ( unpickled once per worker )
+_SHARED_OBJECT = None
+
+
+class _RecordHandler(logging.Handler):
+    """ collect log records of a job in order to replay them in the main process """
+
+    def __init__(self):
+        super(_RecordHandler, self).__init__()
+        self.records = list()
+
+    def emit(self, record):
+        # make the record picklable
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        self.records.append(record)
+
+
+def _initWorker(pickledObject):
+    global _SHARED_OBJECT
+    _SHARED_OBJECT = pickle.loads(pickledObject)
+
+
+def _runJob(function, job):
+    logger = LOGGER.logger
+    handlers = logger.handlers[:]
+    for handler in handlers:
+        logger.removeHandler(handler)
+    recordHandler = _RecordHandler()
+    logger.addHandler(recordHandler)
+
+    result = None
+    error = None
+    try:
+        result = function(_SHARED_OBJECT, **job)
+    except Exception as e:
+        error = (e, traceback.format_exc())
+    finally:
+        logger.removeHandler(recordHandler)
+        for handler in handlers:
+            logger.addHandler(handler)
+
+    return result, recordHandler.records, error
+
+
+def runJobs(function, jobs, nJobs=1, sharedObject=None):
+    """
+        Run a function on a list of jobs, optionally with a pool of processes
+
+        :Parameters:
+            - `function` (function) - a module-level function called as `function(sharedObject, **job)`
+            - `jobs` (list of dict) - keyword arguments of each job
+            - `nJobs` (int) - number of processes. Jobs run sequentially in the current process if nJobs <= 1
+            - `sharedObject` (object) - object passed to every job ( ie, a calibrated model ).
+              It is pickled once and loaded once per process.
+
+        :Return:
+            - `results` (list) - outputs of the function, in the order of `jobs`
+
+        .. note:: log messages of each job are replayed in the main process, in the order of `jobs`.
+                  Therefore, the log file matches the one of a sequential run
+
+    """
+    if nJobs is None or nJobs <= 1 or len(jobs) <= 1:
+        return [function(sharedObject, **job) for job in jobs]
+
+    nJobs = min(nJobs, len(jobs))
+    LOGGER.logger.info("[pyCGM2] %i jobs run with %i processes" % (len(jobs), nJobs))
+
+    results = list()
+    with ProcessPoolExecutor(max_workers=nJobs,
+                             initializer=_initWorker,
+                             initargs=(pickle.dumps(sharedObject),)) as executor:
+        outputs = executor.map(_runJob, [function]*len(jobs), jobs)
+
+        for result, records, error in outputs:
+            for record in records:
+                LOGGER.logger.handle(record)
+            if error is not None:
+                LOGGER.logger.error(error[1])
+                raise error[0]
+            results.append(result)
+
+    return results